@@ -11,15 +11,33 @@
 
 import sys
 import logging
-from typing import Optional, Any
+import importlib.util
+from typing import Optional, Any, List, Union
 
 from dragonchain_sdk import dragonchain_client
+from dragonchain_sdk import bulk_writer
+from dragonchain_sdk import request
+from dragonchain_sdk import retry
+from dragonchain_sdk import rate_limit
+from dragonchain_sdk import codec
+from dragonchain_sdk import transports
+from dragonchain_sdk import timeouts
+from dragonchain_sdk import endpoint_pool
+from dragonchain_sdk import cache
 
 __author__ = "Dragonchain, Inc."
 __version__ = "4.3.0"
 
 ASYNC_SUPPORT = False
 
+BulkWriter = bulk_writer.BulkWriter
+RetryPolicy = retry.RetryPolicy
+RateLimiter = rate_limit.RateLimiter
+Timeout = timeouts.Timeout
+Deadline = timeouts.Deadline
+EndpointPool = endpoint_pool.EndpointPool
+ResponseCache = cache.ResponseCache
+
 
 def set_stream_logger(name: str = "dragonchain_sdk", level: int = logging.DEBUG, format_string: Optional[str] = None) -> None:
     """Set a stream logger for a module. You can set name to ``''`` to log everything.
@@ -48,9 +66,18 @@ def create_client(
     dragonchain_id: Optional[str] = None,
     auth_key_id: Optional[str] = None,
     auth_key: Optional[str] = None,
-    endpoint: Optional[str] = None,
+    endpoint: Union[None, str, List[str], endpoint_pool.EndpointPool] = None,
     verify: bool = True,
     algorithm: str = "SHA256",
+    pool_connections: int = request.DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = request.DEFAULT_POOL_MAXSIZE,
+    retry_policy: Optional[retry.RetryPolicy] = None,
+    rate_limiter: Optional[rate_limit.RateLimiter] = None,
+    json_codec: Optional[codec.JsonCodec] = None,
+    transport: Optional[transports.Transport] = None,
+    timeout: Union[None, float, timeouts.Timeout] = None,
+    lazy: bool = False,
+    response_cache: Optional[cache.ResponseCache] = None,
 ) -> dragonchain_client.Client:
     """Construct a new ``Client`` object
 
@@ -58,30 +85,79 @@ def create_client(
         dragonchain_id (str, optional): The ID of the chain to connect to.
         auth_key_id (str, optional): The authorization key ID
         auth_key (str, optional): The authorization key
-        endpoint (str, optional): The endpoint of the Dragonchain
+        endpoint (str, list or EndpointPool, optional): The endpoint of the Dragonchain, or several endpoints to balance requests between
         verify (bool, optional): Verify the TLS cert of the Dragonchain
         algorithm (str, optional): The hashing algorithm used for HMAC authentication
+        pool_connections (int, optional): The number of per-host connection pools to keep cached
+        pool_maxsize (int, optional): The maximum number of keep-alive connections to keep open per host
+        retry_policy (RetryPolicy, optional): The policy for retrying failed requests (defaults to retrying GET, HEAD and DELETE requests)
+        rate_limiter (RateLimiter, optional): A rate limiter (which may be shared with other clients) to space out requests with
+        json_codec (JsonCodec, optional): The codec to encode request bodies and decode responses with (defaults to the fastest available)
+        transport (Transport, optional): The HTTP stack to send requests with (defaults to a RequestsTransport using the pool options above)
+        timeout (float or Timeout, optional): The default timeout for requests (a single number is used for both the connect and read timeouts)
+        lazy (bool, optional): Defer discovering the credentials and endpoint (which may read files or contact matchmaking)
+            until the first request, or until ``client.warm()`` is called
+        response_cache (ResponseCache, optional): A cache (which may be shared with other clients) for responses which will never change,
+            such as transactions which are in a block, and blocks (nothing is cached if not provided)
 
     Returns:
         A new Dragonchain client.
     """
-    return dragonchain_client.Client(dragonchain_id, auth_key_id, auth_key, endpoint, verify, algorithm)
+    return dragonchain_client.Client(
+        dragonchain_id,
+        auth_key_id,
+        auth_key,
+        endpoint,
+        verify,
+        algorithm,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        retry_policy=retry_policy,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        transport=transport,
+        timeout=timeout,
+        lazy=lazy,
+        response_cache=response_cache,
+    )
 
 
 logging.getLogger("dragonchain_sdk").addHandler(logging.NullHandler())
 
-# Must be running python 3.5.3 or later and have aiohttp installed to support async functionality
+# Must be running python 3.5.3 or later and have aiohttp installed to support async functionality.
+# aiohttp is only looked for here, and not imported until async functionality is first used, since it is slow to import
 if sys.version_info[:3] >= (3, 5, 3):
-    try:
-        from dragonchain_sdk import async_helpers
+    ASYNC_SUPPORT = importlib.util.find_spec("aiohttp") is not None
 
-        ASYNC_SUPPORT = True
-    except ImportError:
-        # aiohttp is not installed. No async support
-        pass
+# Attributes of this module which are loaded from async_helpers on first access
+_ASYNC_ATTRIBUTES = frozenset(["AsyncClient", "AsyncBulkWriter"])
 
 if ASYNC_SUPPORT:
-    create_aio_client = async_helpers.create_aio_client
+
+    def create_aio_client(*args: Any, **kwargs: Any) -> Any:
+        """Construct a new ``AsyncClient`` object (must be awaited)
+
+        Refer to dragonchain_sdk.async_helpers.create_aio_client for arguments
+        """
+        from dragonchain_sdk import async_helpers
+
+        return async_helpers.create_aio_client(*args, **kwargs)
+
+    if sys.version_info[:2] >= (3, 7):
+
+        def __getattr__(name: str) -> Any:
+            if name in _ASYNC_ATTRIBUTES:
+                from dragonchain_sdk import async_helpers
+
+                return getattr(async_helpers, name)
+            raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    else:
+        # Module level __getattr__ isn't supported before python 3.7, so these have to be loaded now
+        from dragonchain_sdk import async_helpers
+
+        AsyncClient = async_helpers.AsyncClient
+        AsyncBulkWriter = async_helpers.AsyncBulkWriter
 else:
 
     def create_aio_client(*args: Any, **kwargs: Any) -> Any:
@@ -11,85 +11,1209 @@
 
 # This module should never be imported on python <3.5, as it contains syntax that is not valid before 3.5
 
-import types
-import logging
+import time
 import asyncio
-from typing import cast, Optional, Dict, Any, TYPE_CHECKING
+import logging
+import collections
+import concurrent.futures
+from typing import cast, Awaitable, BinaryIO, Callable, Iterable, Iterator, Optional, Dict, List, Any, Union, Tuple, TYPE_CHECKING
 
 import aiohttp
 
-import dragonchain_sdk
+from dragonchain_sdk import retry
+from dragonchain_sdk import rate_limit
+from dragonchain_sdk import codec
+from dragonchain_sdk import streaming
+from dragonchain_sdk import pagination
+from dragonchain_sdk import request
+from dragonchain_sdk import transports
+from dragonchain_sdk import timeouts
+from dragonchain_sdk import endpoint_pool
+from dragonchain_sdk import credentials
 from dragonchain_sdk import exceptions
+from dragonchain_sdk import cache
+from dragonchain_sdk import bulk_writer
+from dragonchain_sdk import dragonchain_client
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from dragonchain_sdk import request
-    from dragonchain_sdk import dragonchain_client
     from dragonchain_sdk.types import request_response
 
+# Defaults for the aiohttp connector of each AsyncRequest object (these match aiohttp's own defaults)
+DEFAULT_CONNECTOR_LIMIT = 100
+DEFAULT_CONNECTOR_LIMIT_PER_HOST = 0
+DEFAULT_TTL_DNS_CACHE = 10
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+# Request bodies (estimated to be) at least this many bytes are encoded and hashed off of the event loop
+DEFAULT_OFFLOAD_THRESHOLD = 64 * 1024
+
 
-async def create_aio_client(*args: Any, **kwargs: Any) -> "dragonchain_client.Client":
-    """Construct a new async ``Client`` object
+async def create_aio_client(
+    dragonchain_id: Optional[str] = None,
+    auth_key_id: Optional[str] = None,
+    auth_key: Optional[str] = None,
+    endpoint: Union[None, str, List[str], endpoint_pool.EndpointPool] = None,
+    verify: bool = True,
+    algorithm: str = "SHA256",
+    limit: int = DEFAULT_CONNECTOR_LIMIT,
+    limit_per_host: int = DEFAULT_CONNECTOR_LIMIT_PER_HOST,
+    ttl_dns_cache: Optional[int] = DEFAULT_TTL_DNS_CACHE,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    session: Optional[aiohttp.ClientSession] = None,
+    retry_policy: Optional[retry.RetryPolicy] = None,
+    rate_limiter: Optional[rate_limit.RateLimiter] = None,
+    json_codec: Optional[codec.JsonCodec] = None,
+    transport: Optional["AsyncTransport"] = None,
+    timeout: Union[None, float, timeouts.Timeout] = None,
+    lazy: bool = False,
+    offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    offload_executor: Optional[concurrent.futures.Executor] = None,
+    response_cache: Optional[cache.ResponseCache] = None,
+) -> "AsyncClient":
+    """Construct a new ``AsyncClient`` object
 
     Args:
-        Refer to dragonchain_sdk.create_client for arguments
+        Refer to dragonchain_sdk.create_client for the common arguments
+        limit (int, optional): The total number of simultaneous connections to allow (0 for unlimited)
+        limit_per_host (int, optional): The number of simultaneous connections to allow to the same endpoint (0 for unlimited)
+        ttl_dns_cache (int, optional): Seconds to cache DNS resolutions for (None to cache forever)
+        keepalive_timeout (float, optional): Seconds to keep idle connections open for reuse
+        session (aiohttp.ClientSession, optional): An externally owned session to use. When provided, the connector options are ignored
+            and the session will not be closed when this client is closed
+        retry_policy (RetryPolicy, optional): The policy for retrying failed requests (defaults to retrying GET, HEAD and DELETE requests)
+        rate_limiter (RateLimiter, optional): A rate limiter (which may be shared with other clients) to space out requests with
+        json_codec (JsonCodec, optional): The codec to encode request bodies and decode responses with (defaults to the fastest available)
+        transport (AsyncTransport, optional): The HTTP stack to send requests with (defaults to an AiohttpTransport using the options above)
+        timeout (float or Timeout, optional): The default timeout for requests (a single number is used for both the connect and read timeouts)
+        lazy (bool, optional): Defer discovering the credentials and endpoint until ``await client.warm()``, which must be awaited
+            before the client is used (discovery may block, so it is run in an executor rather than on the event loop)
+        offload_threshold (int, optional): Size in bytes from which request bodies are encoded and hashed in offload_executor instead of on the event loop
+        offload_executor (Executor, optional): The executor to encode and hash large bodies in (defaults to the event loop's default executor).
+            Hashing releases the GIL, but encoding JSON does not, so only a ProcessPoolExecutor keeps encoding from stalling the event loop
+        response_cache (ResponseCache, optional): A cache (which may be shared with other clients) for responses which will never change
 
     Returns:
         A new Dragonchain client which makes async requests.
     """
-    client = dragonchain_sdk.create_client(*args, **kwargs)
-    # Change out the client's request internals to become async-capable with aiohttp
-    client.request.session = aiohttp.ClientSession(loop=asyncio.get_event_loop())
-    client.request._make_request = types.MethodType(_make_request, client.request)  # type: ignore
-    # Add close function to the client for aiohttp cleanup
-    client.close = types.MethodType(client_close, client)  # type: ignore
+    client = AsyncClient(
+        dragonchain_id,
+        auth_key_id,
+        auth_key,
+        endpoint,
+        verify,
+        algorithm,
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=ttl_dns_cache,
+        keepalive_timeout=keepalive_timeout,
+        session=session,
+        retry_policy=retry_policy,
+        rate_limiter=rate_limiter,
+        json_codec=json_codec,
+        transport=transport,
+        timeout=timeout,
+        lazy=lazy,
+        offload_threshold=offload_threshold,
+        offload_executor=offload_executor,
+        response_cache=response_cache,
+    )
+    # Create the session now that we're guaranteed to be running in an event loop (a lazy client creates it on its first request instead)
+    if not lazy:
+        cast(AsyncRequest, client.request).get_session()
     return client
 
 
-async def client_close(self: "dragonchain_client.Client") -> None:
+def _encode_and_hash(json_codec: codec.JsonCodec, hash_method: Callable[..., Any], json_content: Dict[Any, Any]) -> Tuple[bytes, bytes]:
+    """Encode a JSON body and hash it for signing (module level so that it can be pickled for a ProcessPoolExecutor)"""
+    content = json_codec.dumps(json_content)
+    return content, credentials.hash_content(hash_method, content)
+
+
+class AsyncStreamedTransportResponse(object):
+    """The response to a request sent by an async transport, whose body is read incrementally. Refer to transports.StreamedTransportResponse
+
+    The chunks of the body are iterated with ``async for``
+
+    Args:
+        status (int): The HTTP status code of the response
+        read_chunk (callable): Coroutine function which reads the next chunk of the body, returning empty bytes at the end of the body
+        headers (dict, optional): The headers of the response (should be case-insensitive if possible)
+        release (callable, optional): Function to call to release the connection once the body is read (or abandoned)
     """
-    Close any aiohttp sessions associated with an instantiated async client
+
+    def __init__(
+        self,
+        status: int,
+        read_chunk: Callable[[], Awaitable[bytes]],
+        headers: Optional[Dict[str, str]] = None,
+        release: Optional[Callable[[], Any]] = None,
+    ):
+        self.status = status
+        self.headers = headers if headers is not None else {}
+        self._read_chunk = read_chunk
+        self._release = release
+
+    async def read_chunk(self) -> bytes:
+        """Read the next chunk of the body
+
+        Returns:
+            The next non-empty chunk, or empty bytes at the end of the body
+        """
+        return await self._read_chunk()
+
+    async def read(self) -> bytes:
+        """Read the rest of the body and release the connection
+
+        Returns:
+            The remaining bytes of the body
+        """
+        chunks = []  # type: List[bytes]
+        try:
+            while True:
+                chunk = await self._read_chunk()
+                if not chunk:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the connection of the response (safe to call more than once)"""
+        if self._release is not None:
+            release = self._release
+            self._release = None
+            release()
+
+    def __aiter__(self) -> "AsyncStreamedTransportResponse":
+        return self
+
+    async def __anext__(self) -> bytes:
+        try:
+            chunk = await self._read_chunk()
+        except BaseException:
+            self.close()
+            raise
+        if not chunk:
+            self.close()
+            raise StopAsyncIteration
+        return chunk
+
+    async def __aenter__(self) -> "AsyncStreamedTransportResponse":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncResultStream(object):
+    """The items of an array in a JSON response as they are received, to iterate with ``async for``. Refer to streaming.ResultStream
+
+    Args:
+        response (AsyncStreamedTransportResponse): The response to read
+        parser (JsonArrayParser): The parser for the body of the response
     """
-    await self.request.session.close()
 
+    def __init__(self, response: AsyncStreamedTransportResponse, parser: streaming.JsonArrayParser):
+        self.response = response
+        self.parser = parser
+        self._pending = collections.deque()  # type: collections.deque[Any]
+        self._done = False
 
-async def _make_request(
-    self: "request.Request",
-    http_verb: str,
-    path: str,
-    json_content: Optional[Dict[Any, Any]] = None,
-    timeout: int = 30,
-    verify: bool = True,
-    parse_response: bool = True,
-    additional_headers: Optional[Dict[str, str]] = None,
-) -> "request_response":
+    @property
+    def members(self) -> Dict[str, Any]:
+        """The members of the response other than the array (only complete once the stream has been fully iterated)"""
+        return self.parser.members
+
+    @property
+    def total(self) -> Optional[int]:
+        """The total number of results of the query (if the chain returned it, and it has been received)"""
+        return self.parser.members.get("total")
+
+    def __aiter__(self) -> "AsyncResultStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self._pending:
+            if self._done:
+                raise StopAsyncIteration
+            try:
+                chunk = await self.response.read_chunk()
+                if chunk:
+                    self._pending.extend(self.parser.feed(chunk))
+                else:
+                    self._done = True
+                    self.close()
+                    self.parser.close()
+            except BaseException:
+                self._done = True
+                self.close()
+                raise
+        return self._pending.popleft()
+
+    def close(self) -> None:
+        """Release the connection of the response, abandoning any items which haven't been read yet"""
+        self.response.close()
+
+    async def __aenter__(self) -> "AsyncResultStream":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncPageIterator(pagination.PageIterator):
+    """The results of a query across as many pages as it takes, to iterate with ``async for``. Refer to pagination.PageIterator
+
+    The next page is fetched in a task while the current page is iterated (if prefetch is enabled). fetch_page is a coroutine function
     """
-    Make an async http request to a dragonchain with the given information
-    Should take and handle exactly like dragonchain_sdk.request.Request._make_request, but asynchronous
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._results = collections.deque()  # type: collections.deque[Any]
+        self._page = None  # type: Optional[Tuple[int, int]]
+        self._task = None  # type: Optional[asyncio.Future[Tuple[request_response, float]]]
+        self._started = False
+
+    def __iter__(self) -> Iterator[Any]:
+        raise TypeError('AsyncPageIterator must be iterated with "async for" rather than "for"')
+
+    def __aiter__(self) -> "AsyncPageIterator":
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self._results:
+            if not self._started:
+                self._started = True
+                self._next_page()
+            if self._page is None:
+                raise StopAsyncIteration
+            try:
+                response, elapsed = await (self._task if self._task is not None else self._fetch_async(self._page))
+                results = self.paginator.page_received(self._page, response, elapsed)
+            except BaseException:
+                self._page = None
+                self.close()
+                raise
+            self._next_page()
+            self._results.extend(results)
+        return self._results.popleft()
+
+    async def fetch_all(self, concurrency: int = pagination.DEFAULT_FETCH_CONCURRENCY) -> List[Any]:  # type: ignore  # Intentionally async override
+        """Fetch every result at once, with the remaining pages requested concurrently once the total is known.
+        Refer to dragonchain_sdk.pagination.PageIterator.fetch_all
+        """
+        pagination._validate_fetch_all(self.paginator, concurrency)
+        self._started = True
+        page = self.paginator.next_page()
+        if page is None:
+            return []
+        results = self.paginator.page_received(page, *(await self._fetch_async(page)))
+        if self.paginator.total is None:
+            self._next_page()
+            async for result in self:
+                results.append(result)
+            return results
+        pages = self.paginator.remaining_pages()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(page: Tuple[int, int]) -> "request_response":
+            async with semaphore:
+                return cast("request_response", await self.fetch_page(*page))
+
+        tasks = [asyncio.ensure_future(fetch_page(page)) for page in pages]
+        try:
+            for page, response in zip(pages, await asyncio.gather(*tasks)):
+                results.extend(self.paginator.check_page(page, response))
+        finally:
+            for task in tasks:
+                task.cancel()
+        return results
+
+    def close(self) -> None:
+        """Stop iterating, cancelling the prefetch of the next page if it is in progress"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._page = None
+        self._results.clear()
+
+    async def __aenter__(self) -> "AsyncPageIterator":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
+
+    def _next_page(self) -> None:
+        """Reserve the next page, starting to fetch it in a task if prefetching is enabled"""
+        self._page = self.paginator.next_page()
+        self._task = None
+        if self.prefetch and self._page is not None:
+            self._task = asyncio.ensure_future(self._fetch_async(self._page))
+
+    async def _fetch_async(self, page: Tuple[int, int]) -> Tuple["request_response", float]:
+        """Fetch a page, timing how long it takes"""
+        start = time.monotonic()
+        response = await self.fetch_page(*page)
+        return response, time.monotonic() - start
+
+
+class AsyncRangeScanIterator(pagination.RangeScanIterator):
+    """The results of a keyset scan, to iterate with ``async for``. Refer to pagination.RangeScanIterator
+
+    fetch_page is a coroutine function
     """
-    full_url, content, header_dict = self._generate_request_data(
-        http_verb=http_verb, path=path, json_content=json_content, additional_headers=additional_headers
-    )
 
-    # Make request with appropriate data
-    try:
-        logger.debug("Making request. Verify SSL: {}, Timeout: {}".format(verify, timeout))
-        async with self.session.request(
-            method=http_verb, url=full_url, data=content, headers=header_dict, ssl=verify, timeout=aiohttp.ClientTimeout(total=timeout)
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._results = collections.deque()  # type: collections.deque[Any]
+        self._started = False
+
+    def __iter__(self) -> Iterator[Any]:
+        raise TypeError('AsyncRangeScanIterator must be iterated with "async for" rather than "for"')
+
+    def __aiter__(self) -> "AsyncRangeScanIterator":
+        return self
+
+    async def __anext__(self) -> Any:
+        if not self._started:
+            self._started = True
+            bound = self.scan.bound_query()
+            while bound is not None:
+                self.scan.bound_received(await self.fetch_page(bound[0], 0, 1, bound[1]))
+                bound = self.scan.bound_query()
+        while not self._results:
+            query = self.scan.next_query()
+            if query is None:
+                raise StopAsyncIteration
+            self._results.extend(self.scan.page_received(await self.fetch_page(query[0], 0, query[1], self.scan.ascending)))
+        return self._results.popleft()
+
+
+class AsyncTransport(transports.Transport):
+    """Base class for the HTTP stack used by an ``AsyncRequest``, where ``send``, ``send_stream`` and ``close`` are coroutines"""
+
+    async def send(  # type: ignore  # Intentionally async override
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> transports.TransportResponse:
+        raise NotImplementedError
+
+    async def send_stream(  # type: ignore  # Intentionally async override
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> AsyncStreamedTransportResponse:
+        r = await self.send(http_verb, full_url, body, headers, timeout, verify)
+        chunks = [r.body]
+
+        async def read_chunk() -> bytes:
+            return chunks.pop() if chunks else b""
+
+        return AsyncStreamedTransportResponse(r.status, read_chunk, cast(Dict[str, str], r.headers))
+
+    async def close(self) -> None:  # type: ignore  # Intentionally async override
+        pass
+
+
+class AiohttpTransport(AsyncTransport):
+    """Transport which sends requests with an aiohttp session
+
+    Args:
+        limit (int, optional): The total number of simultaneous connections to allow (0 for unlimited)
+        limit_per_host (int, optional): The number of simultaneous connections to allow to the same endpoint (0 for unlimited)
+        ttl_dns_cache (int, optional): Seconds to cache DNS resolutions for (None to cache forever)
+        keepalive_timeout (float, optional): Seconds to keep idle connections open for reuse
+        session (aiohttp.ClientSession, optional): An externally owned session to use instead of creating one
+
+    Raises:
+        TypeError: with bad parameter types
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_CONNECTOR_LIMIT,
+        limit_per_host: int = DEFAULT_CONNECTOR_LIMIT_PER_HOST,
+        ttl_dns_cache: Optional[int] = DEFAULT_TTL_DNS_CACHE,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        if not isinstance(limit, int):
+            raise TypeError('Parameter "limit" must be of type int.')
+        if not isinstance(limit_per_host, int):
+            raise TypeError('Parameter "limit_per_host" must be of type int.')
+        if ttl_dns_cache is not None and not isinstance(ttl_dns_cache, int):
+            raise TypeError('Parameter "ttl_dns_cache" must be of type int.')
+        if not isinstance(keepalive_timeout, (int, float)):
+            raise TypeError('Parameter "keepalive_timeout" must be of type float.')
+        if session is not None and not isinstance(session, aiohttp.ClientSession):
+            raise TypeError('Parameter "session" must be of type aiohttp.ClientSession.')
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.session = session
+        # Only close sessions that this object created itself
+        self.owns_session = session is None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp session for this transport, creating it with a tuned connector if it doesn't exist yet
+
+        Returns:
+            The aiohttp ClientSession used to make requests
+        """
+        if self.session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host, ttl_dns_cache=self.ttl_dns_cache, keepalive_timeout=self.keepalive_timeout
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def send(  # type: ignore  # Intentionally async override
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> transports.TransportResponse:
+        # aiohttp reads file-like payloads in the default executor, so a body spooled to disk doesn't block the event loop
+        data = body if isinstance(body, bytes) else aiohttp.payload.IOBasePayload(cast(Any, body), content_type="application/json")  # type: Any
+        async with self.get_session().request(
+            method=http_verb,
+            url=full_url,
+            data=data,
+            headers=headers,
+            ssl=verify,
+            timeout=aiohttp.ClientTimeout(total=timeout.total, sock_connect=timeout.connect, sock_read=timeout.read),
         ) as r:
+            return transports.TransportResponse(r.status, await r.read(), r.headers)
+        # Can get here if the context manager suppresses an exception raised while reading the response
+        raise exceptions.UnexpectedResponseException("Unkown error processing result from dragonchain")
+
+    async def send_stream(  # type: ignore  # Intentionally async override
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> AsyncStreamedTransportResponse:
+        data = body if isinstance(body, bytes) else aiohttp.payload.IOBasePayload(cast(Any, body), content_type="application/json")  # type: Any
+        r = await self.get_session().request(
+            method=http_verb,
+            url=full_url,
+            data=data,
+            headers=headers,
+            ssl=verify,
+            timeout=aiohttp.ClientTimeout(total=timeout.total, sock_connect=timeout.connect, sock_read=timeout.read),
+        )
+        return AsyncStreamedTransportResponse(
+            r.status, lambda: r.content.read(transports.STREAM_CHUNK_SIZE), cast(Dict[str, str], r.headers), r.release
+        )
+
+    async def close(self) -> None:  # type: ignore  # Intentionally async override
+        """Close the aiohttp session (and its connections) if it was created by this object"""
+        if self.session is not None and self.owns_session:
+            await self.session.close()
+            self.session = None
+
+
+class AsyncLoopbackTransport(AsyncTransport):
+    """In-memory async transport which never touches the network. Refer to dragonchain_sdk.transports.LoopbackTransport for arguments"""
+
+    def __init__(
+        self,
+        handler: Optional[Callable[[str, str, bytes, Dict[str, str]], transports.TransportResponse]] = None,
+        status: int = 200,
+        body: bytes = b"{}",
+    ):
+        self.loopback = transports.LoopbackTransport(handler, status, body)
+
+    @property
+    def request_count(self) -> int:
+        return self.loopback.request_count
+
+    async def send(  # type: ignore  # Intentionally async override
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> transports.TransportResponse:
+        return self.loopback.send(http_verb, full_url, body, headers, timeout, verify)
+
+
+class AsyncRequest(request.Request):
+    """Construct a new `AsyncRequest` object, which makes its requests asynchronously (with aiohttp by default)
+
+    Args:
+        credentials_obj (Credentials): The credentials for the chain to associate with requests
+        endpoint (str, list or EndpointPool, optional): The URL for the endpoint of the chain, or several endpoints to balance requests between
+        verify (bool, optional): Boolean indicating whether to validate the SSL certificate of the endpoint when making requests
+        limit (int, optional): The total number of simultaneous connections to allow (0 for unlimited)
+        limit_per_host (int, optional): The number of simultaneous connections to allow to the same endpoint (0 for unlimited)
+        ttl_dns_cache (int, optional): Seconds to cache DNS resolutions for (None to cache forever)
+        keepalive_timeout (float, optional): Seconds to keep idle connections open for reuse
+        session (aiohttp.ClientSession, optional): An externally owned session to use instead of creating one
+        retry_policy (RetryPolicy, optional): The policy for retrying failed requests (defaults to retrying GET, HEAD and DELETE requests)
+        rate_limiter (RateLimiter, optional): A rate limiter (which may be shared with other clients) to space out requests with
+        json_codec (JsonCodec, optional): The codec to encode request bodies and decode responses with (defaults to the fastest available)
+        transport (AsyncTransport, optional): The HTTP stack to send requests with. When provided, the connector and session options are ignored
+        timeout (float or Timeout, optional): The default timeout for requests (a single number is used for both the connect and read timeouts)
+        offload_threshold (int, optional): Size in bytes from which request bodies are encoded and hashed in offload_executor instead of on the event loop
+        offload_executor (Executor, optional): The executor to encode and hash large bodies in (defaults to the event loop's default executor)
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        A new AsyncRequest object.
+    """
+
+    def __init__(
+        self,
+        credentials_obj: credentials.Credentials,
+        endpoint: Union[None, str, List[str], endpoint_pool.EndpointPool] = None,
+        verify: bool = True,
+        limit: int = DEFAULT_CONNECTOR_LIMIT,
+        limit_per_host: int = DEFAULT_CONNECTOR_LIMIT_PER_HOST,
+        ttl_dns_cache: Optional[int] = DEFAULT_TTL_DNS_CACHE,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        session: Optional[aiohttp.ClientSession] = None,
+        retry_policy: Optional[retry.RetryPolicy] = None,
+        rate_limiter: Optional[rate_limit.RateLimiter] = None,
+        json_codec: Optional[codec.JsonCodec] = None,
+        transport: Optional[AsyncTransport] = None,
+        timeout: Union[None, float, timeouts.Timeout] = None,
+        offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+        offload_executor: Optional[concurrent.futures.Executor] = None,
+    ):
+        if not isinstance(offload_threshold, int):
+            raise TypeError('Parameter "offload_threshold" must be of type int.')
+        if offload_executor is not None and not isinstance(offload_executor, concurrent.futures.Executor):
+            raise TypeError('Parameter "offload_executor" must be of type Executor.')
+        if transport is None:
+            transport = AiohttpTransport(
+                limit=limit, limit_per_host=limit_per_host, ttl_dns_cache=ttl_dns_cache, keepalive_timeout=keepalive_timeout, session=session
+            )
+        elif not isinstance(transport, AsyncTransport):
+            raise TypeError('Parameter "transport" must be of type AsyncTransport.')
+        super().__init__(
+            credentials_obj,
+            endpoint,
+            verify,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+            transport=transport,
+            timeout=timeout,
+        )
+        self.offload_threshold = offload_threshold
+        self.offload_executor = offload_executor
+
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        """The aiohttp session of the transport (if it uses one)"""
+        if isinstance(self.transport, AiohttpTransport):
+            return self.transport.session
+        return None
+
+    def get_session(self) -> Optional[aiohttp.ClientSession]:
+        """Get the aiohttp session of the transport, creating it if it doesn't exist yet
+
+        Returns:
+            The aiohttp ClientSession used to make requests, or None if the transport doesn't use aiohttp
+        """
+        if isinstance(self.transport, AiohttpTransport):
+            return self.transport.get_session()
+        return None
+
+    async def close(self) -> None:  # type: ignore  # Intentionally async override
+        """Close the transport (and its connections)"""
+        await cast(AsyncTransport, self.transport).close()
+
+    def _start_probe(self, endpoint: endpoint_pool.Endpoint) -> None:
+        asyncio.ensure_future(self._probe_endpoint(endpoint))
+
+    async def _probe_endpoint(self, endpoint: endpoint_pool.Endpoint) -> None:  # type: ignore  # Intentionally async override
+        healthy = False
+        try:
+            _, content, header_dict = self._generate_request_data(http_verb="GET", path=request.PROBE_PATH)
+            r = await cast(AsyncTransport, self.transport).send(
+                "GET", endpoint.url + request.PROBE_PATH, content, header_dict, request.PROBE_TIMEOUT, self.verify
+            )
+            healthy = r.status < 500
+        except Exception as e:
+            logger.debug("Probe of endpoint {} failed: {}".format(endpoint.url, e))
+        cast(endpoint_pool.EndpointPool, self.endpoint_pool).probe_finished(endpoint, healthy)
+
+    async def get_results_stream(  # type: ignore  # Intentionally async override
+        self, path: str, key: str = "results", fields: Optional[List[str]] = None
+    ) -> "request_response":
+        """Make a GET request, streaming the items of an array in its JSON response. Refer to dragonchain_sdk.request.Request.get_results_stream
+
+        The response is an AsyncResultStream, to iterate with ``async for``
+        """
+        parser = streaming.JsonArrayParser(self.json_codec, key, fields)
+        response = await self._make_request(http_verb="GET", path=path, verify=self.verify, stream=True)
+        if response["ok"]:
+            response["response"] = AsyncResultStream(cast(AsyncStreamedTransportResponse, response["response"]), parser)
+        return response
+
+    async def get_stream(self, path: str) -> "request_response":  # type: ignore  # Intentionally async override
+        """Make a GET request, returning as soon as the headers of the response are received. Refer to dragonchain_sdk.request.Request.get_stream
+
+        The response is an AsyncStreamedTransportResponse, to iterate with ``async for``
+        """
+        return await self._make_request(http_verb="GET", path=path, verify=self.verify, stream=True)
+
+    async def post_stream(  # type: ignore  # Intentionally async override
+        self, path: str, items: Iterable[Any], parse_response: bool = True, spool_size: int = streaming.DEFAULT_SPOOL_SIZE
+    ) -> "request_response":
+        """Make a POST request with a JSON array body which is encoded one item at a time. Refer to dragonchain_sdk.request.Request.post_stream
+
+        The body is encoded in the event loop's default executor (items may be a generator, so they can't be sent to a process pool)
+        """
+        loop = asyncio.get_event_loop()
+        body = await loop.run_in_executor(None, streaming.encode_json_array, items, self.json_codec, self.credentials.hash_method, spool_size)
+        try:
+            return await self._make_request(http_verb="POST", path=path, verify=self.verify, parse_response=parse_response, streamed_body=body)
+        finally:
+            body.close()
+
+    async def _encode_body(self, json_content: Dict[Any, Any]) -> Tuple[bytes, bytes]:
+        """Encode a JSON body and hash it for signing, in the offload executor if it is large
+
+        Args:
+            json_content (dict): The body to encode
+
+        Returns:
+            Tuple of the encoded body and its hash (as accepted by _generate_request_data)
+        """
+        loop = asyncio.get_event_loop()
+        hash_method = self.credentials.hash_method
+        # Estimate first, since encoding a large body on the event loop is what this is avoiding
+        if codec.estimate_size(json_content) >= self.offload_threshold:
+            return await loop.run_in_executor(self.offload_executor, _encode_and_hash, self.json_codec, hash_method, json_content)
+        content = self.json_codec.dumps(json_content)
+        return content, await self._hash_body(content)
+
+    async def _hash_body(self, content: bytes) -> bytes:
+        """Hash an encoded body for signing, in the offload executor if it is large
+
+        Args:
+            content (bytes): The encoded body
+
+        Returns:
+            The hash of the body (as accepted by _generate_request_data)
+        """
+        if len(content) >= self.offload_threshold:
+            return await asyncio.get_event_loop().run_in_executor(
+                self.offload_executor, credentials.hash_content, self.credentials.hash_method, content
+            )
+        return credentials.hash_content(self.credentials.hash_method, content)
+
+    async def _make_request(  # type: ignore  # Intentionally async override
+        self,
+        http_verb: str,
+        path: str,
+        json_content: Optional[Dict[Any, Any]] = None,
+        timeout: Union[None, float, timeouts.Timeout] = None,
+        verify: bool = True,
+        parse_response: bool = True,
+        additional_headers: Optional[Dict[str, str]] = None,
+        streamed_body: Optional[streaming.SpooledBody] = None,
+        stream: bool = False,
+        raw: bool = False,
+        encoded_body: Optional[bytes] = None,
+    ) -> "request_response":
+        """
+        Make an async http request to a dragonchain with the given information
+        Should take and handle exactly like dragonchain_sdk.request.Request._make_request, but asynchronous
+        """
+        if self.endpoint_invalidated:
+            self.endpoint_invalidated = False
+            # Discovery may contact matchmaking, so it is run in the default executor to avoid blocking the event loop
+            await asyncio.get_event_loop().run_in_executor(None, self._discover_endpoint_again)
+        request_timeout = self.timeout if timeout is None else timeouts.get_timeout(timeout)
+        started = time.monotonic()
+        # The body is only encoded and hashed once, no matter how many attempts are made
+        body = None  # type: Optional[Tuple[Union[bytes, streaming.SpooledBody], bytes]]
+        if streamed_body is not None:
+            body = (streamed_body, cast(bytes, streamed_body.content_hash))
+        elif encoded_body is not None:
+            body = (encoded_body, await self._hash_body(encoded_body))
+        elif json_content:
+            body = await self._encode_body(json_content)
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                wait = self._get_rate_limit_wait(path)
+                if wait:
+                    logger.debug("Rate limited, waiting {} seconds".format(wait))
+                    await asyncio.sleep(wait)
+            attempt_timeout = self._get_attempt_timeout(request_timeout)
+            # The timestamp and signature are regenerated for every attempt
+            full_url, content, header_dict = self._generate_request_data(
+                http_verb=http_verb, path=path, json_content=json_content, additional_headers=additional_headers, body=body
+            )
+
+            # Make request with appropriate data
+            endpoint = None
             try:
-                return_dict = {}
-                return_dict["status"] = r.status
-                logger.debug("Response status code: {}".format(r.status))
-                return_dict["ok"] = r.status // 100 == 2
-                return_dict["response"] = await r.json() if parse_response else await r.text()
-                return cast("request_response", return_dict)
+                if http_verb.upper() not in request.supported_http:
+                    raise ValueError(http_verb + " is an unsupported http operation.")
+                endpoint, full_url = self._acquire_endpoint(full_url, path)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Making request. Verify SSL: {}, Timeout: {}".format(verify, attempt_timeout))
+                start = time.monotonic()
+                transport = cast(AsyncTransport, self.transport)
+                if stream:
+                    r = await transport.send_stream(
+                        http_verb, full_url, content, header_dict, attempt_timeout, verify
+                    )  # type: Union[transports.TransportResponse, AsyncStreamedTransportResponse]
+                else:
+                    r = await transport.send(http_verb, full_url, content, header_dict, attempt_timeout, verify)
+            except exceptions.UnexpectedResponseException:
+                self._release_endpoint(endpoint, healthy=False)
+                raise
             except Exception as e:
-                raise exceptions.UnexpectedResponseException("Unexpected response from Dragonchain. Error: {}".format(e))
-    except exceptions.UnexpectedResponseException:
-        raise
-    except Exception as e:
-        raise exceptions.ConnectionException("Error while communicating with the Dragonchain: {}".format(e))
-    # Can get here if context manager doesn't throw exceptions.UnexpectedResponseException which could have been raised
-    raise exceptions.UnexpectedResponseException("Unkown error processing result from dragonchain")
+                self._release_endpoint(endpoint, healthy=False)
+                delay = self._get_retry_delay(http_verb, attempt)
+                if delay is None:
+                    self._log_request(http_verb, path, None, content, b"", started, attempt)
+                    raise self._connection_exception(e)
+                logger.debug("Retrying request in {} seconds after error: {}".format(delay, e))
+                await asyncio.sleep(delay)
+                continue
+            self._release_endpoint(endpoint, time.monotonic() - start, r.status < 500)
+            delay = self._get_retry_delay(http_verb, attempt, r.status, r.headers.get("Retry-After"))
+            if delay is None:
+                if isinstance(r, AsyncStreamedTransportResponse):
+                    self._log_request(http_verb, path, r.status, content, b"", started, attempt)
+                    return self._parse_stream_response(r, await r.read() if r.status // 100 != 2 else None)
+                self._log_request(http_verb, path, r.status, content, r.body, started, attempt)
+                return self._parse_response(r, parse_response, raw)
+            if isinstance(r, AsyncStreamedTransportResponse):
+                r.close()
+            logger.debug("Retrying request in {} seconds after status code {}".format(delay, r.status))
+            await asyncio.sleep(delay)
+
+
+class AsyncClient(dragonchain_client.Client):
+    """A Dragonchain client which makes its requests asynchronously with aiohttp
+
+    Every function which makes a request to the chain has an identical signature to the regular ``Client``, but must be awaited.
+    The client should be closed with ``await client.close()`` (or used with ``async with``) when it is no longer needed.
+
+    Args:
+        Refer to dragonchain_sdk.async_helpers.create_aio_client for arguments
+    """
+
+    def __init__(
+        self,
+        dragonchain_id: Optional[str] = None,
+        auth_key_id: Optional[str] = None,
+        auth_key: Optional[str] = None,
+        endpoint: Union[None, str, List[str], endpoint_pool.EndpointPool] = None,
+        verify: bool = True,
+        algorithm: str = "SHA256",
+        limit: int = DEFAULT_CONNECTOR_LIMIT,
+        limit_per_host: int = DEFAULT_CONNECTOR_LIMIT_PER_HOST,
+        ttl_dns_cache: Optional[int] = DEFAULT_TTL_DNS_CACHE,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        session: Optional[aiohttp.ClientSession] = None,
+        retry_policy: Optional[retry.RetryPolicy] = None,
+        rate_limiter: Optional[rate_limit.RateLimiter] = None,
+        json_codec: Optional[codec.JsonCodec] = None,
+        transport: Optional[AsyncTransport] = None,
+        timeout: Union[None, float, timeouts.Timeout] = None,
+        lazy: bool = False,
+        offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+        offload_executor: Optional[concurrent.futures.Executor] = None,
+        response_cache: Optional[cache.ResponseCache] = None,
+    ):
+        def initialize() -> Tuple[credentials.Credentials, request.Request]:
+            credentials_obj = credentials.Credentials(dragonchain_id, auth_key, auth_key_id, algorithm)
+            return credentials_obj, AsyncRequest(
+                credentials_obj,
+                endpoint,
+                verify,
+                limit=limit,
+                limit_per_host=limit_per_host,
+                ttl_dns_cache=ttl_dns_cache,
+                keepalive_timeout=keepalive_timeout,
+                session=session,
+                retry_policy=retry_policy,
+                rate_limiter=rate_limiter,
+                json_codec=json_codec,
+                transport=transport,
+                timeout=timeout,
+                offload_threshold=offload_threshold,
+                offload_executor=offload_executor,
+            )
+
+        self._set_initializer(initialize, lazy)
+        self._set_response_cache(response_cache)
+        logger.debug("Async client finished initialization")
+
+    async def warm(self) -> None:  # type: ignore  # Intentionally async override
+        """Discover the credentials and endpoint of a client created with lazy=True now, rather than on its first request
+
+        Discovery reads files and may contact the matchmaking service, so it is run in the default executor to avoid blocking the event loop
+
+        This must be awaited before a lazy client is used. Unlike the regular ``Client``, a lazy ``AsyncClient`` doesn't discover
+        on its first request, since discovery would block the event loop (and any other task waiting for it to finish)
+
+        Raises:
+            DragonchainIdentityNotFound: if the credentials or endpoint can't be found
+            TypeError: with bad parameter types passed when creating the client
+
+        Returns:
+            None, the result is kept for every following request
+        """
+        await asyncio.get_event_loop().run_in_executor(None, self._initialize)
+
+    @property
+    def credentials(self) -> "credentials.Credentials":
+        """The credentials of this client
+
+        Raises:
+            RuntimeError: if the client is lazy and hasn't been warmed yet
+        """
+        self._check_warm()
+        return cast(credentials.Credentials, self._credentials)
+
+    @credentials.setter
+    def credentials(self, value: "credentials.Credentials") -> None:
+        self._credentials = value
+
+    @property
+    def request(self) -> "request.Request":
+        """The request object of this client
+
+        Raises:
+            RuntimeError: if the client is lazy and hasn't been warmed yet
+        """
+        self._check_warm()
+        return cast(request.Request, self._request)
+
+    @request.setter
+    def request(self, value: "request.Request") -> None:
+        self._request = value
+
+    def _check_warm(self) -> None:
+        """Raise if this is a lazy client which hasn't been warmed, rather than discovering (and blocking the event loop) here"""
+        if self._initializer is not None:
+            raise RuntimeError('A lazy AsyncClient must be warmed with "await client.warm()" before it is used')
+
+    async def close(self) -> None:  # type: ignore  # Intentionally async override
+        """Close any aiohttp sessions associated with this client"""
+        if self._request is not None:
+            await cast(AsyncRequest, self._request).close()
+
+    def __enter__(self) -> "AsyncClient":
+        raise TypeError('AsyncClient must be used with "async with" rather than "with"')
+
+    async def __aenter__(self) -> "AsyncClient":
+        if self._request is not None:
+            cast(AsyncRequest, self._request).get_session()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def create_bulk_transaction(  # type: ignore  # Intentionally async override
+        self,
+        transaction_list: List[Dict[Any, Any]],
+        chunk_size: Optional[int] = None,
+        max_chunk_bytes: Optional[int] = None,
+        concurrency: int = 1,
+        stream: bool = False,
+    ) -> "request_response":
+        """Post many transactions to a chain at once. Refer to dragonchain_sdk.dragonchain_client.Client.create_bulk_transaction for arguments"""
+        if not isinstance(stream, bool):
+            raise TypeError('Parameter "stream" must be of type bool.')
+        dragonchain_client._validate_bulk_chunking(chunk_size, max_chunk_bytes, concurrency)
+        if chunk_size is None and max_chunk_bytes is None:
+            if stream:
+                return await self.request.post_stream(  # type: ignore
+                    "/v1/transaction_bulk", dragonchain_client._iter_bulk_transaction_list(transaction_list)
+                )
+            return await self.request.post("/v1/transaction_bulk", dragonchain_client._build_bulk_transaction_list(transaction_list))  # type: ignore
+
+        post_data = dragonchain_client._build_bulk_transaction_list(transaction_list)
+        chunks = dragonchain_client._chunk_bulk_transaction_list(post_data, self.request.json_codec, chunk_size, max_chunk_bytes)
+        logger.debug("Sending {} transactions in {} bulk requests".format(len(post_data), len(chunks)))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def post_chunk(content: bytes) -> Union["request_response", exceptions.DragonchainException]:
+            async with semaphore:
+                try:
+                    return await self.request.post_encoded("/v1/transaction_bulk", content)  # type: ignore
+                except exceptions.DragonchainException as e:
+                    return e
+
+        responses = await asyncio.gather(*[post_chunk(content) for _, content in chunks])
+        return dragonchain_client._merge_bulk_responses([transactions for transactions, _ in chunks], list(responses))
+
+    async def _get_many(  # type: ignore  # Intentionally async override
+        self, get: Callable[[str], Awaitable["request_response"]], ids: List[str], concurrency: int
+    ) -> List[Union["request_response", exceptions.DragonchainException]]:
+        """Await get once for each distinct id, with at most concurrency at once. Refer to dragonchain_sdk.dragonchain_client.Client._get_many"""
+        unique_ids = list(collections.OrderedDict.fromkeys(ids))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_one(item_id: str) -> Union["request_response", exceptions.DragonchainException]:
+            async with semaphore:
+                try:
+                    return await get(item_id)
+                except exceptions.DragonchainException as e:
+                    return e
+
+        results = dict(zip(unique_ids, await asyncio.gather(*[get_one(item_id) for item_id in unique_ids])))
+        return [results[item_id] for item_id in ids]
+
+    async def _get_cached(  # type: ignore  # Intentionally async override
+        self, path: str, is_final: Callable[[Any, Any], bool], pending_path: Optional[str] = None
+    ) -> "request_response":
+        """Make a GET request, using the response cache for responses which will never change. Refer to dragonchain_sdk.dragonchain_client.Client._get_cached"""
+        if self.response_cache is None:
+            return await self.request.get(path)  # type: ignore
+        key = (self.credentials.dragonchain_id, path)
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            return self.request._parse_response(cached, True)
+        raw_response = await self.request.get(path, raw=True)  # type: ignore
+        r = transports.TransportResponse(raw_response["status"], raw_response["response"])
+        response = self.request._parse_response(r, True)
+        final = False
+        if response["ok"]:
+            try:
+                pending = await self.request.get(pending_path) if pending_path is not None else None  # type: ignore
+            except exceptions.DragonchainException as e:
+                logger.debug("Not caching {}, unable to check whether it is final: {}".format(path, e))
+                return response
+            final = dragonchain_client._check_final(is_final, response, pending)
+        dragonchain_client._cache_response(self.response_cache, key, r, final)
+        return response
+
+    def _scan_query(self, fetch_page: Callable[[str, int, int, bool], "request_response"], scan: pagination.RangeScan) -> AsyncRangeScanIterator:
+        """Create the async iterator for a keyset scan. Refer to dragonchain_sdk.dragonchain_client.Client._scan_query"""
+        return AsyncRangeScanIterator(fetch_page, scan)
+
+    def _iter_query(
+        self, path: str, query_dict: Dict[str, Any], offset: int, max_results: Optional[int], page_size: int, max_page_size: int, prefetch: bool
+    ) -> AsyncPageIterator:
+        """Create the async page iterator for a query. Refer to dragonchain_sdk.dragonchain_client.Client._iter_query"""
+
+        async def fetch_page(page_offset: int, limit: int) -> "request_response":
+            page_query = dict(query_dict, offset=page_offset, limit=limit)
+            return await self.request.get("{}{}".format(path, self.request.generate_query_string(page_query)))  # type: ignore
+
+        return AsyncPageIterator(fetch_page, offset, max_results, page_size, max_page_size, prefetch)
+
+    async def download_smart_contract_object(  # type: ignore  # Intentionally async override
+        self, key: str, destination: Union[str, BinaryIO], smart_contract_id: Optional[str] = None
+    ) -> "request_response":
+        """Write data from the object storage of a smart contract to a file as it is received.
+        Refer to dragonchain_sdk.dragonchain_client.Client.download_smart_contract_object for arguments
+
+        Chunks are written to the destination from the event loop as they are received
+        """
+        download = streaming.Download(destination)
+        response = await cast(AsyncRequest, self.request).get_stream(dragonchain_client._get_smart_contract_object_path(key, smart_contract_id))
+        if response["ok"]:
+            body = cast(AsyncStreamedTransportResponse, response["response"])
+            async with body:
+                with download:
+                    async for chunk in body:
+                        download.write(chunk)
+            response["response"] = download.size
+        return response
+
+
+class AsyncBulkWriter(object):
+    """Construct a new `AsyncBulkWriter`, which buffers transactions and posts them to a chain as bulk requests from a background task
+
+    This must be constructed and used from within the event loop that the client runs on. The background task is started with the
+    first submitted transaction. The writer should be closed with ``await writer.close()`` (or used with ``async with``) to send
+    anything left in the buffer.
+
+    Args:
+        client (AsyncClient): The async client to post transactions with
+        Refer to dragonchain_sdk.bulk_writer.BulkWriter for the other arguments
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+
+    Returns:
+        A new AsyncBulkWriter object.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        max_count: int = dragonchain_client.MAX_BULK_TRANSACTIONS,
+        max_bytes: Optional[int] = None,
+        linger: float = bulk_writer.DEFAULT_LINGER,
+        max_pending: int = bulk_writer.DEFAULT_MAX_PENDING,
+    ):
+        bulk_writer._validate_writer_params(max_count, max_bytes, linger, max_pending)
+        self.client = client
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.linger = linger
+        self.max_pending = max_pending
+        self._buffer = []  # type: List[Tuple[Dict[str, Any], bytes, float, "asyncio.Future[str]"]]
+        self._buffer_bytes = 0
+        self._flush_requested = False
+        self._sending = False
+        self._closed = False
+        # The event loop is single threaded, so events are enough to signal between the submitters and the background task
+        self._wakeup = asyncio.Event()
+        self._room = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._task = None  # type: Optional[asyncio.Future[None]]
+
+    async def submit(self, transaction_type: str, payload: Union[str, Dict[Any, Any]], tag: Optional[str] = None) -> "asyncio.Future[str]":
+        """Add a transaction to the buffer to be posted with the next bulk request, waiting for room in the buffer if it is full
+
+        Args:
+            transaction_type (str): Type of transaction
+            payload (dict or string): The payload of the transaction
+            tag (str, optional): A tag string to search on
+
+        Raises:
+            TypeError: with bad parameter types
+            RuntimeError: if the writer has been closed
+
+        Returns:
+            A future which resolves to the transaction id, or raises BulkTransactionFailure if the chain rejected the transaction
+        """
+        body = dragonchain_client._build_transaction_dict(transaction_type, payload, tag)
+        encoded = self.client.request.json_codec.dumps(body)
+        while not self._closed and len(self._buffer) >= self.max_pending:
+            self._room.clear()
+            await self._room.wait()
+        if self._closed:
+            raise RuntimeError("Cannot submit transactions to a closed AsyncBulkWriter")
+        future = asyncio.get_event_loop().create_future()
+        self._buffer.append((body, encoded, time.monotonic(), future))
+        self._buffer_bytes += bulk_writer._item_size(encoded)
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        self._wakeup.set()
+        return future
+
+    async def flush(self) -> None:
+        """Send everything currently in the buffer without waiting for the linger time, and wait for it to be sent
+
+        Returns:
+            None, all transactions submitted before calling flush will have their futures resolved
+        """
+        self._flush_requested = True
+        self._wakeup.set()
+        while (self._buffer or self._sending) and self._task is not None and not self._task.done():
+            self._drained.clear()
+            await self._drained.wait()
+        self._flush_requested = False
+
+    async def close(self) -> None:
+        """Flush any buffered transactions and stop the background task. No more transactions can be submitted after closing
+
+        Returns:
+            None, all submitted transactions will have their futures resolved
+        """
+        self._closed = True
+        self._wakeup.set()
+        self._room.set()
+        if self._task is not None:
+            await self._task
+
+    async def __aenter__(self) -> "AsyncBulkWriter":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _run(self) -> None:
+        """Background task which takes batches from the buffer and posts them"""
+        try:
+            while True:
+                while not (self._closed or self._buffer):
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                if not self._buffer:
+                    # Closed with nothing left to send
+                    return
+                # Wait for a full batch, the linger time of the oldest transaction, or a flush/close
+                while not (
+                    self._closed or self._flush_requested or bulk_writer._batch_full(self._buffer, self._buffer_bytes, self.max_count, self.max_bytes)
+                ):
+                    remaining = self._buffer[0][2] + self.linger - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+                batch = bulk_writer._take_batch(self._buffer, self.max_count, self.max_bytes)
+                self._buffer_bytes -= sum(bulk_writer._item_size(item[1]) for item in batch)
+                self._sending = True
+                self._room.set()
+                try:
+                    await self._send(batch)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    # A failed batch must not stop the writer, or nothing else in the buffer would ever be sent
+                    logger.exception("Bulk writer failed to resolve a batch")
+                finally:
+                    self._sending = False
+                    self._drained.set()
+        finally:
+            # Never leave a submitter or flush waiting on a task that has stopped
+            self._room.set()
+            self._drained.set()
+
+    async def _send(self, batch: List[Tuple[Dict[str, Any], bytes, float, "asyncio.Future[str]"]]) -> None:
+        """Post a batch of transactions and resolve their futures (skipping any which were cancelled, i.e. by asyncio.wait_for)"""
+        batch = [item for item in batch if not item[3].done()]
+        if not batch:
+            return
+        bodies = [item[0] for item in batch]
+        futures = [item[3] for item in batch]
+        try:
+            content = dragonchain_client._join_json_array([item[1] for item in batch])
+            response = await self.client.request.post_encoded("/v1/transaction_bulk", content)  # type: ignore
+        except Exception as e:
+            logger.debug("Bulk writer request failed: {}".format(e))
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, result in zip(futures, bulk_writer._correlate_bulk_response(bodies, response)):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
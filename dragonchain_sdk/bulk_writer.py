@@ -0,0 +1,265 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import logging
+import threading
+import concurrent.futures
+from typing import cast, Any, Dict, List, Optional, Union, Tuple, TYPE_CHECKING
+
+from dragonchain_sdk import exceptions
+from dragonchain_sdk import dragonchain_client
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from dragonchain_sdk.types import request_response  # noqa: F401 used by typing
+
+DEFAULT_LINGER = 0.05
+DEFAULT_MAX_PENDING = 10000
+
+
+class BulkWriter(object):
+    """Construct a new `BulkWriter`, which buffers transactions and posts them to a chain as bulk requests from a background thread
+
+    Args:
+        client (Client): The (sync) client to post transactions with
+        max_count (int, optional): Maximum number of transactions to send per bulk request (default 250, the chain's bulk limit)
+        max_bytes (int, optional): Maximum size in bytes of the encoded body of each bulk request
+        linger (float, optional): Maximum number of seconds a transaction will wait in the buffer before it is sent (default 0.05)
+        max_pending (int, optional): Maximum number of transactions to buffer before submit blocks (default 10000)
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+
+    Returns:
+        A new BulkWriter object.
+    """
+
+    def __init__(
+        self,
+        client: "dragonchain_client.Client",
+        max_count: int = dragonchain_client.MAX_BULK_TRANSACTIONS,
+        max_bytes: Optional[int] = None,
+        linger: float = DEFAULT_LINGER,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        _validate_writer_params(max_count, max_bytes, linger, max_pending)
+        self.client = client
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.linger = linger
+        self.max_pending = max_pending
+        # Each transaction is buffered as its body, its encoding (which is what is sent), when it was submitted, and its future
+        self._buffer = []  # type: List[Tuple[Dict[str, Any], bytes, float, "concurrent.futures.Future[str]"]]
+        self._buffer_bytes = 0
+        self._flush_requested = False
+        self._sending = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="dragonchain-bulk-writer", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self, transaction_type: str, payload: Union[str, Dict[Any, Any]], tag: Optional[str] = None, timeout: Optional[float] = None
+    ) -> "concurrent.futures.Future[str]":
+        """Add a transaction to the buffer to be posted with the next bulk request
+
+        Args:
+            transaction_type (str): Type of transaction
+            payload (dict or string): The payload of the transaction
+            tag (str, optional): A tag string to search on
+            timeout (float, optional): Maximum seconds to wait for room in the buffer if it is full (waits forever by default)
+
+        Raises:
+            TypeError: with bad parameter types
+            RuntimeError: if the writer has been closed (or its background thread has stopped)
+            TimeoutError: if there is still no room in the buffer after the timeout
+
+        Returns:
+            A future which resolves to the transaction id, or raises BulkTransactionFailure if the chain rejected the transaction
+        """
+        body = dragonchain_client._build_transaction_dict(transaction_type, payload, tag)
+        encoded = self.client.request.json_codec.dumps(body)
+        future = concurrent.futures.Future()  # type: concurrent.futures.Future[str]
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._closed or len(self._buffer) < self.max_pending, timeout):
+                raise TimeoutError("Timed out waiting for room in the bulk writer buffer")
+            if self._closed:
+                raise RuntimeError("Cannot submit transactions to a closed BulkWriter")
+            if not self._thread.is_alive():
+                raise RuntimeError("Cannot submit transactions to a BulkWriter whose background thread has stopped")
+            self._buffer.append((body, encoded, time.monotonic(), future))
+            self._buffer_bytes += _item_size(encoded)
+            self._condition.notify_all()
+        return future
+
+    def flush(self) -> None:
+        """Send everything currently in the buffer without waiting for the linger time, and wait for it to be sent
+
+        Returns:
+            None, all transactions submitted before calling flush will have their futures resolved
+        """
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            # Also wait for the last batch taken from the buffer, which may still be in flight
+            self._condition.wait_for(lambda: (not self._buffer and not self._sending) or not self._thread.is_alive())
+            self._flush_requested = False
+
+    def close(self) -> None:
+        """Flush any buffered transactions and stop the background thread. No more transactions can be submitted after closing
+
+        Returns:
+            None, all submitted transactions will have their futures resolved
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def __enter__(self) -> "BulkWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """Background loop which takes batches from the buffer and posts them"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed or bool(self._buffer))
+                if not self._buffer:
+                    # Closed with nothing left to send
+                    return
+                # Wait for a full batch, the linger time of the oldest transaction, or a flush/close
+                while not (self._closed or self._flush_requested or _batch_full(self._buffer, self._buffer_bytes, self.max_count, self.max_bytes)):
+                    remaining = self._buffer[0][2] + self.linger - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = _take_batch(self._buffer, self.max_count, self.max_bytes)
+                self._buffer_bytes -= sum(_item_size(item[1]) for item in batch)
+                self._sending = True
+                # Wake up any submitters waiting on room in the buffer
+                self._condition.notify_all()
+            try:
+                self._send(batch)
+            finally:
+                with self._condition:
+                    self._sending = False
+                    self._condition.notify_all()
+
+    def _send(self, batch: List[Tuple[Dict[str, Any], bytes, float, "concurrent.futures.Future[str]"]]) -> None:
+        """Post a batch of transactions and resolve their futures"""
+        # Transactions whose futures were cancelled while they were buffered aren't sent, and the rest can no longer be cancelled
+        batch = [item for item in batch if item[3].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        bodies = [item[0] for item in batch]
+        futures = [item[3] for item in batch]
+        try:
+            response = self.client.request.post_encoded("/v1/transaction_bulk", dragonchain_client._join_json_array([item[1] for item in batch]))
+        except Exception as e:
+            logger.debug("Bulk writer request failed: {}".format(e))
+            for future in futures:
+                future.set_exception(e)
+            return
+        for future, result in zip(futures, _correlate_bulk_response(bodies, response)):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def _validate_writer_params(max_count: int, max_bytes: Optional[int], linger: float, max_pending: int) -> None:
+    """Validate the parameters of a bulk writer
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+    """
+    if not isinstance(max_count, int):
+        raise TypeError('Parameter "max_count" must be of type int.')
+    if max_count < 1 or max_count > dragonchain_client.MAX_BULK_TRANSACTIONS:
+        raise ValueError('Parameter "max_count" must be between 1 and {}.'.format(dragonchain_client.MAX_BULK_TRANSACTIONS))
+    if max_bytes is not None:
+        if not isinstance(max_bytes, int):
+            raise TypeError('Parameter "max_bytes" must be of type int.')
+        if max_bytes < 1:
+            raise ValueError('Parameter "max_bytes" must be greater than 0.')
+    if not isinstance(linger, (int, float)):
+        raise TypeError('Parameter "linger" must be of type float.')
+    if linger < 0:
+        raise ValueError('Parameter "linger" must not be negative.')
+    if not isinstance(max_pending, int):
+        raise TypeError('Parameter "max_pending" must be of type int.')
+    if max_pending < 1:
+        raise ValueError('Parameter "max_pending" must be greater than 0.')
+
+
+def _item_size(encoded: bytes) -> int:
+    """Get the number of bytes an encoded transaction adds to the body of a bulk request (including its separating comma)"""
+    return len(encoded) + 1
+
+
+def _batch_full(buffer: List[Any], buffer_bytes: int, max_count: int, max_bytes: Optional[int]) -> bool:
+    """Check if the buffer holds enough to send a full batch"""
+    return len(buffer) >= max_count or (max_bytes is not None and buffer_bytes + 2 >= max_bytes)
+
+
+def _take_batch(buffer: List[Any], max_count: int, max_bytes: Optional[int]) -> List[Any]:
+    """Remove and return the next batch from the front of the buffer, bounded by count and encoded size"""
+    count = 0
+    batch_bytes = 2  # Enclosing brackets of the json array
+    for item in buffer:
+        if count >= max_count or (count and max_bytes is not None and batch_bytes + _item_size(item[1]) > max_bytes):
+            break
+        batch_bytes += _item_size(item[1])
+        count += 1
+    batch = buffer[:count]
+    del buffer[:count]
+    return batch
+
+
+def _correlate_bulk_response(bodies: List[Dict[str, Any]], response: "request_response") -> List[Union[str, Exception]]:
+    """Match the results of a bulk transaction request back to the transactions that were sent
+
+    The chain returns the ids of accepted transactions and the bodies of failed transactions, each in the order they were sent,
+    so walking the sent bodies in order recovers the result of each one
+
+    Args:
+        bodies (list): The transaction bodies that were sent, in order
+        response (dict): The response from the bulk transaction request
+
+    Returns:
+        List in the same order as bodies, with the transaction id for accepted transactions, or an exception for failed ones
+    """
+    body = cast(Any, response["response"])
+    if not response["ok"] or not isinstance(body, dict):
+        error = exceptions.BulkTransactionFailure("Bulk request was rejected with status {}: {}".format(response["status"], body))
+        return [error] * len(bodies)
+    ids = cast(List[str], body.get("201") or [])
+    failed = cast(List[Any], body.get("400") or [])
+    results = []  # type: List[Union[str, Exception]]
+    id_index = 0
+    failed_index = 0
+    for transaction in bodies:
+        if failed_index < len(failed) and failed[failed_index] == transaction:
+            failed_index += 1
+            results.append(exceptions.BulkTransactionFailure("Transaction was rejected by the chain: {}".format(transaction)))
+        elif id_index < len(ids):
+            results.append(ids[id_index])
+            id_index += 1
+        else:
+            results.append(exceptions.BulkTransactionFailure("No transaction id was returned for transaction: {}".format(transaction)))
+    return results
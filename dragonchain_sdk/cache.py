@@ -0,0 +1,147 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import threading
+import collections
+from typing import Any, Dict, Hashable, Optional, Tuple  # noqa: F401 used by typing
+
+from dragonchain_sdk import transports
+
+# Defaults for the total size of the bodies kept in a cache, and how long results which may still change are kept for
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_NEGATIVE_TTL = 5.0
+
+
+class ResponseCache(object):
+    """Construct a new `ResponseCache`, a size-bounded LRU cache for responses from the chain which will never change
+
+    Responses are kept as the raw bytes received from the chain, so the size of the cache is the total size of those bodies,
+    and every hit is decoded into a new object which the caller is free to modify.
+    Responses known to be immutable (i.e. a transaction which is in a block) are kept until they are evicted for space.
+    Responses which may still change (i.e. a pending transaction, or one which doesn't exist yet) are only kept for negative_ttl seconds,
+    so that repeatedly polling for them doesn't make a request every time.
+
+    A single ResponseCache can be given to several clients (sync or async), since entries are kept per chain.
+
+    Args:
+        max_bytes (int, optional): Maximum total size in bytes of the response bodies to keep (default 64MiB)
+        negative_ttl (float, optional): Seconds to keep responses which may still change (0 to not keep them at all)
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+
+    Returns:
+        A new ResponseCache object.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, negative_ttl: float = DEFAULT_NEGATIVE_TTL):
+        if not isinstance(max_bytes, int):
+            raise TypeError('Parameter "max_bytes" must be of type int.')
+        if max_bytes < 1:
+            raise ValueError('Parameter "max_bytes" must be greater than 0.')
+        if not isinstance(negative_ttl, (int, float)):
+            raise TypeError('Parameter "negative_ttl" must be of type float.')
+        if negative_ttl < 0:
+            raise ValueError('Parameter "negative_ttl" must not be negative.')
+        self.max_bytes = max_bytes
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        # Entries are (response, expiry), where expiry is None for immutable responses, in order of least to most recently used
+        self._entries = collections.OrderedDict()  # type: collections.OrderedDict[Hashable, Tuple[transports.TransportResponse, Optional[float]]]
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[transports.TransportResponse]:
+        """Get a cached response, counting it as a hit or miss
+
+        Args:
+            key (hashable): The key of the response
+
+        Returns:
+            The cached response, or None if there is no unexpired entry for the key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, response: transports.TransportResponse, immutable: bool) -> None:
+        """Cache a response, evicting the least recently used entries to make room for it
+
+        Args:
+            key (hashable): The key of the response
+            response (TransportResponse): The raw response from the chain
+            immutable (bool): Whether the response will never change. Otherwise it is only kept for negative_ttl seconds
+        """
+        if not immutable and self.negative_ttl == 0:
+            return
+        # A response which would take up the whole cache isn't worth evicting everything else for
+        if len(response.body) > self.max_bytes:
+            return
+        expiry = None if immutable else time.monotonic() + self.negative_ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (response, expiry)
+            self.size += len(response.body)
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove the entry for a key, if there is one
+
+        Args:
+            key (hashable): The key of the response
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every entry (the statistics are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get statistics about the use of the cache
+
+        Returns:
+            Dictionary of hits, misses, hit_rate (0 if there have been no lookups), evictions (for space),
+            entries (the number of responses cached) and bytes (their total size)
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.size,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry which exists. Must be called with the lock held"""
+        response, _ = self._entries.pop(key)
+        self.size -= len(response.body)
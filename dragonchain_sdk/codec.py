@@ -0,0 +1,155 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# orjson decodes integers outside of 64 bits as floats, so runs of digits which could be one are decoded with the standard library
+_LONG_INTEGER = re.compile(rb"(?<![.\d])\d{19,}")
+
+
+class JsonCodec(object):
+    """Base class for the JSON encoder/decoder used for request and response bodies
+
+    Request bodies are signed by hashing the exact bytes returned by ``dumps``, so a codec only needs to be deterministic
+    to produce valid signatures. Custom codecs can be used by subclassing this and implementing ``dumps`` and ``loads``.
+    """
+
+    name = "base"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as compact JSON
+
+        Args:
+            obj (Any): The object to encode
+
+        Returns:
+            The UTF-8 encoded JSON bytes
+        """
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON
+
+        Args:
+            data (bytes): The UTF-8 encoded JSON to decode
+
+        Returns:
+            The decoded object
+        """
+        raise NotImplementedError
+
+
+class StandardJsonCodec(JsonCodec):
+    """JSON codec using the python standard library"""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf8")
+
+    def loads(self, data: bytes) -> Any:
+        # json.loads only accepts bytes from python 3.6
+        return json.loads(data.decode("utf8"))
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using orjson, which is significantly faster than the standard library for large bodies
+
+    Encoded bytes are identical to ``StandardJsonCodec`` for everything except floats written in exponent notation and NaN/Infinity.
+    Anything orjson would encode differently as non-ASCII (the standard library escapes it), or refuses to encode at all
+    (non-string dictionary keys, integers larger than 64 bits, etc), is encoded with the standard library instead.
+    Note that orjson also encodes some types which the standard library rejects (datetime, date, UUID, dataclass and numpy
+    objects), so bodies containing those only encode when orjson is installed.
+
+    Decoding gives the same result as the standard library: bodies which may contain integers larger than 64 bits (which orjson
+    would decode as floats), or which orjson can't decode (NaN, Infinity, or numbers out of the range of a float), are decoded with
+    the standard library instead.
+
+    Raises:
+        RuntimeError: if orjson is not installed
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise RuntimeError("orjson is not installed")
+        self._fallback = StandardJsonCodec()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            data = orjson.dumps(obj)
+        except TypeError:
+            return self._fallback.dumps(obj)
+        if not _is_ascii(data):
+            return self._fallback.dumps(obj)
+        return data
+
+    def loads(self, data: bytes) -> Any:
+        if _LONG_INTEGER.search(data):
+            return self._fallback.loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return self._fallback.loads(data)
+
+
+def _is_ascii(data: bytes) -> bool:
+    """Check if bytes are entirely ASCII"""
+    try:
+        data.decode("ascii")
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def estimate_size(obj: Any) -> int:
+    """Cheaply estimate the size of the JSON encoding of an object, without encoding it
+
+    Every item of a list is assumed to be about the size of the first one, so long lists are estimated in constant time.
+    The estimate is only meant for deciding how to encode a body, not for anything that needs to be exact
+
+    Args:
+        obj (Any): The object which would be encoded
+
+    Returns:
+        The estimated number of bytes in the encoding
+    """
+    if isinstance(obj, str):
+        return len(obj) + 2
+    if isinstance(obj, dict):
+        # Each item is counted with its quotes, colon and separating comma (which the last item doesn't have)
+        return 1 + sum(len(str(key)) + 4 + estimate_size(value) for key, value in obj.items()) if obj else 2
+    if isinstance(obj, (list, tuple)):
+        return 1 + len(obj) * (estimate_size(obj[0]) + 1) if obj else 2
+    # Numbers, booleans and null
+    return 8
+
+
+def get_default_codec() -> JsonCodec:
+    """Get the fastest JSON codec available in this environment
+
+    Returns:
+        An OrjsonCodec if orjson is installed, otherwise a StandardJsonCodec
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    return StandardJsonCodec()
@@ -11,16 +11,64 @@
 
 import os
 import logging
+import threading
 import configparser
-from typing import cast, Tuple
-
-import requests
+from typing import cast, Dict, Optional, Tuple  # noqa: F401 used by typing
 
 from dragonchain_sdk import exceptions
+from dragonchain_sdk import endpoint_cache
 
 
 logger = logging.getLogger(__name__)
 
+_endpoint_cache = None  # type: Optional[endpoint_cache.EndpointCache]
+
+
+class ConfigStore(object):
+    """Construct a new `ConfigStore`, which parses an ini configuration file once and keeps its sections in memory
+
+    The file is only parsed again when its modification time or size changes (or a different file is read),
+    so creating many clients doesn't repeatedly read the same file.
+
+    Returns:
+        A new ConfigStore object.
+    """
+
+    def __init__(self) -> None:
+        self._path = None  # type: Optional[str]
+        self._signature = None  # type: Optional[Tuple[int, int]]
+        self._sections = {}  # type: Dict[str, Dict[str, str]]
+        self._lock = threading.Lock()
+
+    def read(self, path: str) -> Dict[str, Dict[str, str]]:
+        """Get the sections of a configuration file, parsing it only if it has changed since it was last read
+
+        Args:
+            path (str): The path of the configuration file
+
+        Returns:
+            Dictionary of section name (i.e. dragonchain_id) to a dictionary of the options in that section. Empty if the file doesn't exist
+        """
+        try:
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)  # type: Optional[Tuple[int, int]]
+        except OSError:
+            signature = None
+        with self._lock:
+            if path != self._path or signature != self._signature:
+                logger.debug("Parsing configuration file {}".format(path))
+                # Values are read as is, since interpolating every section up front would let one stray "%" break every lookup
+                config = configparser.ConfigParser(interpolation=None)
+                if signature is not None:
+                    config.read(path)
+                self._sections = {section: dict(config.items(section)) for section in config.sections()}
+                self._path = path
+                self._signature = signature
+            return self._sections
+
+
+_config_store = ConfigStore()
+
 
 def get_dragonchain_id() -> str:
     """Get the dragonchain id if not provided. First checks environment, then configuration files
@@ -37,16 +85,15 @@ def get_dragonchain_id() -> str:
         logger.debug("dragonchain_id isn't in the environment, trying to load default from ini config file")
         try:
             # Check config ini file if ID isn't provided explicitly or in environment
-            config = configparser.ConfigParser()
-            config.read(_get_config_file_path())
-            dragonchain_id = config.get("default", "dragonchain_id")
-        except (configparser.NoSectionError, configparser.NoOptionError):
+            dragonchain_id = _read_config_file()["default"]["dragonchain_id"]
+        except KeyError:
             raise exceptions.DragonchainIdentityNotFound("Could not locate dragonchain_id.")
     return dragonchain_id
 
 
 def get_endpoint(dragonchain_id: str) -> str:
     """Get an endpoint for a dragonchain. First checks environment, then configuration files, then a remote service
+    Endpoints from the remote service are cached (see get_endpoint_cache), so it is only contacted when the cached endpoint expires
 
     Args:
         dragonchain_id (str): The dragonchain id to fetch the endpoint for
@@ -64,13 +111,53 @@ def get_endpoint(dragonchain_id: str) -> str:
     endpoint = _get_endpoint_from_file(dragonchain_id)
     if endpoint:
         return endpoint
-    logger.debug("Endpoint isn't in config file, trying to load from remote service")
+    logger.debug("Endpoint isn't in config file, trying to load from cache or remote service")
     try:
-        return _get_endpoint_from_remote(dragonchain_id)
+        return get_endpoint_cache().get(dragonchain_id, _get_endpoint_from_remote)
     except exceptions.MatchmakingException:
         raise exceptions.DragonchainIdentityNotFound("Unable to locate dragonchain endpoint")
 
 
+def invalidate_endpoint(dragonchain_id: str, endpoint: str) -> None:
+    """Forget the endpoint resolved from the remote service for a dragonchain after failing to connect to it,
+    so that it is resolved again the next time get_endpoint is called rather than being used until it expires
+
+    Args:
+        dragonchain_id (str): The dragonchain id the endpoint was fetched for
+        endpoint (str): The endpoint which couldn't be connected to (the cached endpoint is kept if it has changed since)
+    """
+    logger.debug("Invalidating cached endpoint {} for {}".format(endpoint, dragonchain_id))
+    get_endpoint_cache().invalidate(dragonchain_id, endpoint)
+
+
+def get_endpoint_cache() -> endpoint_cache.EndpointCache:
+    """Get the cache of endpoints resolved from the remote service, shared by every client in this process
+    By default, it is persisted next to the credentials file, or to the file in the DRAGONCHAIN_ENDPOINT_CACHE_FILE environment variable
+
+    Returns:
+        The EndpointCache used by get_endpoint
+    """
+    global _endpoint_cache
+    if _endpoint_cache is None:
+        _endpoint_cache = endpoint_cache.EndpointCache(path=_get_endpoint_cache_path())
+    return _endpoint_cache
+
+
+def set_endpoint_cache(cache: endpoint_cache.EndpointCache) -> None:
+    """Replace the cache of endpoints resolved from the remote service (i.e. to change its TTLs, or to keep it only in memory)
+
+    Args:
+        cache (EndpointCache): The cache to use for all future calls to get_endpoint
+
+    Raises:
+        TypeError: with bad parameter types
+    """
+    global _endpoint_cache
+    if not isinstance(cache, endpoint_cache.EndpointCache):
+        raise TypeError('Parameter "cache" must be of type EndpointCache.')
+    _endpoint_cache = cache
+
+
 def get_credentials(dragonchain_id: str) -> Tuple[str, str]:
     """Get an auth_key/auth_key_id pair if not provided. First checks environment, then configuration files, then smart contract location
 
@@ -118,10 +205,8 @@ def _get_endpoint_from_file(dragonchain_id: str) -> str:
     """
     try:
         # If both keys aren't in environment variables, check config file
-        config = configparser.ConfigParser()
-        config.read(_get_config_file_path())
-        return config.get(dragonchain_id, "endpoint")
-    except (configparser.NoSectionError, configparser.NoOptionError):
+        return _read_config_file()[dragonchain_id]["endpoint"]
+    except KeyError:
         return ""
 
 
@@ -137,6 +222,9 @@ def _get_endpoint_from_remote(dragonchain_id: str) -> str:
     Returns:
         String of endpoint from remote service if found
     """
+    # Imported here so that importing the SDK doesn't have to load requests
+    import requests
+
     try:
         r = requests.get("https://matchmaking.api.dragonchain.com/registration/{}".format(dragonchain_id), timeout=30)
     except (requests.exceptions.Timeout, requests.exceptions.ConnectionError, requests.exceptions.ConnectTimeout):
@@ -175,10 +263,9 @@ def _get_credentials_from_file(dragonchain_id: str) -> Tuple[str, str]:
         Tuple of auth_key_id/auth_key of credentials from environment. Empty strings in tuple if not found
     """
     try:
-        config = configparser.ConfigParser()
-        config.read(_get_config_file_path())
-        return config.get(dragonchain_id, "auth_key_id"), config.get(dragonchain_id, "auth_key")
-    except (configparser.NoSectionError, configparser.NoOptionError):
+        section = _read_config_file()[dragonchain_id]
+        return section["auth_key_id"], section["auth_key"]
+    except KeyError:
         return "", ""
 
 
@@ -197,6 +284,24 @@ def _get_credentials_as_smart_contract() -> Tuple[str, str]:
         return "", ""
 
 
+def _read_config_file() -> Dict[str, Dict[str, str]]:
+    """Get the sections of the credentials file, which is only parsed again when it changes
+
+    Returns:
+        Dictionary of section name to a dictionary of the options in that section
+    """
+    return _config_store.read(_get_config_file_path())
+
+
+def _get_endpoint_cache_path() -> str:
+    """Get the path for the endpoint cache file, which is kept next to the credentials file unless overridden by the environment
+
+    Returns:
+        Python string of the file path for the endpoint cache
+    """
+    return os.environ.get("DRAGONCHAIN_ENDPOINT_CACHE_FILE") or os.path.join(os.path.dirname(_get_config_file_path()), "endpoint_cache.json")
+
+
 def _get_config_file_path() -> str:
     """Get the path for the credential file depending on the OS
 
@@ -14,13 +14,110 @@ import hmac
 import sys
 import base64
 import logging
-from typing import cast, Any, Optional, Union, Callable
+from typing import cast, Any, Optional, Union, Callable, Tuple  # noqa: F401 used by typing
 
 from dragonchain_sdk import configuration
 
 logger = logging.getLogger(__name__)
 
 
+def hash_content(hash_method: Callable[..., Any], content: bytes) -> bytes:
+    """Hash the body of a request for its HMAC message
+
+    Args:
+        hash_method (callable): The hashlib constructor for the algorithm
+        content (bytes): The body of the request
+
+    Returns:
+        Bytes of the base64 encoded hash
+    """
+    return base64.b64encode(hash_method(content).digest())
+
+
+class HmacSigner(object):
+    """Construct a new `HmacSigner`, which creates authorization headers for a single auth key and algorithm
+
+    The HMAC is keyed once, and its state is copied for each signature rather than keyed again.
+    The message is assembled directly as bytes, and the content hash of an empty body is computed up front.
+
+    Args:
+        dragonchain_id (str): The dragonchain ID which requests are signed for
+        auth_key (str): The auth_key to sign with
+        auth_key_id (str): The auth_key_id associated with the auth_key
+        algorithm (str): The name of the hash algorithm (SHA256 | BLAKE2b512 | SHA3-256)
+        hash_method (callable): The hashlib constructor for the algorithm
+
+    Returns:
+        A new HmacSigner object.
+    """
+
+    def __init__(self, dragonchain_id: str, auth_key: str, auth_key_id: str, algorithm: str, hash_method: Callable[..., Any]):
+        self.key = (dragonchain_id, auth_key, auth_key_id, algorithm)
+        self.hash_method = hash_method
+        self.keyed_hmac = hmac.new(auth_key.encode("utf-8"), digestmod=hash_method)
+        self.dragonchain_id = dragonchain_id.encode("utf-8")
+        self.empty_content_hash = hash_content(hash_method, b"")
+        self.header_prefix = "DC1-HMAC-{} {}:".format(algorithm, auth_key_id)
+
+    def hash_content(self, content: bytes) -> bytes:
+        """Hash the body of a request for its HMAC message
+
+        Args:
+            content (bytes): body of the request
+
+        Returns:
+            Bytes of the base64 encoded hash
+        """
+        return hash_content(self.hash_method, content) if content else self.empty_content_hash
+
+    def message(self, http_verb: str, path: str, timestamp: str, content_type: str, content: bytes, content_hash: Optional[bytes] = None) -> bytes:
+        """Assemble the message to sign for a request
+
+        Args:
+            http_verb (str): HTTP verb of the request
+            path (str): Full path of the request after the FQDN (including any query parameters)
+            timestamp (str): timestamp of the request (must match timestamp header)
+            content_type (str): content-type header of the request (if it exists)
+            content (bytes): body of the request (if it exists)
+            content_hash (bytes, optional): hash_content of the body, if it has already been computed
+
+        Returns:
+            Bytes of the message to use in HMAC generation
+        """
+        if content_hash is None:
+            content_hash = self.hash_content(content)
+        return b"\n".join(
+            (
+                http_verb.upper().encode("utf-8"),
+                path.encode("utf-8"),
+                self.dragonchain_id,
+                timestamp.encode("utf-8"),
+                content_type.encode("utf-8"),
+                content_hash,
+            )
+        )
+
+    def sign(
+        self, http_verb: str, path: str, timestamp: str, content_type: str = "", content: bytes = b"", content_hash: Optional[bytes] = None
+    ) -> str:
+        """Create an authorization header for a request
+
+        Args:
+            http_verb (str): HTTP verb of the request
+            path (str): Full path of the request after the FQDN (including any query parameters)
+            timestamp (str): timestamp of the request (must match timestamp header)
+            content_type (str): content-type header of the request (if it exists)
+            content (bytes): body of the request (if it exists)
+            content_hash (bytes, optional): hash_content of the body, if it has already been computed
+
+        Returns:
+            String of the authorization header
+        """
+        mac = self.keyed_hmac.copy()
+        mac.update(self.message(http_verb, path, timestamp, content_type, content, content_hash))
+        return self.header_prefix + base64.b64encode(mac.digest()).decode("ascii")
+
+
 class Credentials(object):
     """Construct a new `Credentials` object
 
@@ -40,6 +137,7 @@ class Credentials(object):
     def __init__(
         self, dragonchain_id: Optional[str] = None, auth_key: Optional[str] = None, auth_key_id: Optional[str] = None, algorithm: str = "SHA256"
     ):
+        self._signer = None  # type: Optional[HmacSigner]
         if dragonchain_id is None:
             self.dragonchain_id = configuration.get_dragonchain_id()
         else:
@@ -207,7 +305,15 @@ class Credentials(object):
             http_verb.upper(), path, self.dragonchain_id, timestamp, content_type, self.bytes_to_b64_str(self.hash_input(content))
         )
 
-    def get_authorization(self, http_verb: str, path: str, timestamp: str, content_type: str = "", content: Union[bytes, str] = "") -> str:
+    def get_authorization(
+        self,
+        http_verb: str,
+        path: str,
+        timestamp: str,
+        content_type: str = "",
+        content: Union[bytes, str] = "",
+        content_hash: Optional[bytes] = None,
+    ) -> str:
         """Create an authorization header for making requests to a Dragonchain
 
         Args:
@@ -216,13 +322,32 @@ class Credentials(object):
             timestamp (str): timestamp of the request (must match timestamp header)
             content_type (str): content-type header of the request (if it exists)
             content (str or bytes): byte object of the body of the request (if it exists)
+            content_hash (bytes, optional): base64 encoded hash of the content, if it has already been computed (i.e. with hash_content)
 
         Returns:
             String of generated authorization header
         """
-        logger.debug("Creating Authorization header for request {} {}".format(http_verb, path))
-        message_string = self.hmac_message_string(http_verb, path, timestamp, content_type, content)
-        logger.debug("HMAC message string:\n{}".format(message_string))
-        hmac = self.bytes_to_b64_str(self.create_hmac(self.auth_key, message_string))
-        logger.debug("Generated Base64 HMAC string: {}".format(hmac))
-        return "DC1-HMAC-{} {}:{}".format(self.algorithm, self.auth_key_id, hmac)
+        signer = self.get_signer()
+        body = self.bytes_from_input(content)
+        # Hash the body here (if it wasn't already), so that the logged message uses the same hash as the signature
+        if content_hash is None:
+            content_hash = signer.hash_content(body)
+        authorization = signer.sign(http_verb, path, timestamp, content_type, body, content_hash)
+        # Signing happens for every request, so only build the log messages when they will be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating Authorization header for request {} {}".format(http_verb, path))
+            message = signer.message(http_verb, path, timestamp, content_type, body, content_hash)
+            logger.debug("HMAC message string:\n{}".format(message.decode("utf-8")))
+            logger.debug("Generated Base64 HMAC string: {}".format(authorization.rsplit(":", 1)[1]))
+        return authorization
+
+    def get_signer(self) -> HmacSigner:
+        """Get the signer for the current dragonchain_id, keys and algorithm of these credentials, creating it if they have changed
+
+        Returns:
+            HmacSigner to create authorization headers with
+        """
+        key = (self.dragonchain_id, self.auth_key, self.auth_key_id, self.algorithm)  # type: Tuple[str, str, str, str]
+        if self._signer is None or self._signer.key != key:
+            self._signer = HmacSigner(self.dragonchain_id, self.auth_key, self.auth_key_id, self.algorithm, self.hash_method)
+        return self._signer
@@ -10,17 +10,36 @@
 # limitations under the License.
 
 import os
+import copy
 import logging
-from typing import cast, Any, Dict, Optional, Union, List, Iterable, TYPE_CHECKING
+import threading
+import collections
+import concurrent.futures
+from typing import cast, Any, BinaryIO, Callable, Dict, Optional, Union, List, Iterable, Iterator, Tuple, TYPE_CHECKING
 
 from dragonchain_sdk import request
+from dragonchain_sdk import retry
+from dragonchain_sdk import rate_limit
+from dragonchain_sdk import codec
+from dragonchain_sdk import transports
+from dragonchain_sdk import streaming
+from dragonchain_sdk import pagination
+from dragonchain_sdk import timeouts
+from dragonchain_sdk import endpoint_pool
 from dragonchain_sdk import credentials
+from dragonchain_sdk import exceptions
+from dragonchain_sdk import cache
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from dragonchain_sdk.types import request_response, custom_index_fields_type, permissions_doc  # noqa: F401 used by typing
 
+# Maximum number of transactions that a chain will accept in a single bulk request
+MAX_BULK_TRANSACTIONS = 250
+# Number of requests to make at once when getting many transactions or blocks by id
+DEFAULT_GET_CONCURRENCY = 8
+
 
 class Client(object):
     def __init__(
@@ -28,14 +47,142 @@ class Client(object):
         dragonchain_id: Optional[str],
         auth_key_id: Optional[str],
         auth_key: Optional[str],
-        endpoint: Optional[str],
+        endpoint: Union[None, str, List[str], endpoint_pool.EndpointPool],
         verify: bool,
         algorithm: str,
+        pool_connections: int = request.DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = request.DEFAULT_POOL_MAXSIZE,
+        retry_policy: Optional[retry.RetryPolicy] = None,
+        rate_limiter: Optional[rate_limit.RateLimiter] = None,
+        json_codec: Optional[codec.JsonCodec] = None,
+        transport: Optional[transports.Transport] = None,
+        timeout: Union[None, float, timeouts.Timeout] = None,
+        lazy: bool = False,
+        response_cache: Optional[cache.ResponseCache] = None,
     ):
-        self.credentials = credentials.Credentials(dragonchain_id, auth_key, auth_key_id, algorithm)
-        self.request = request.Request(self.credentials, endpoint, verify)
+        def initialize() -> Tuple[credentials.Credentials, request.Request]:
+            credentials_obj = credentials.Credentials(dragonchain_id, auth_key, auth_key_id, algorithm)
+            return credentials_obj, request.Request(
+                credentials_obj,
+                endpoint,
+                verify,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                retry_policy=retry_policy,
+                rate_limiter=rate_limiter,
+                json_codec=json_codec,
+                transport=transport,
+                timeout=timeout,
+            )
+
+        self._set_initializer(initialize, lazy)
+        self._set_response_cache(response_cache)
         logger.debug("Client finished initialization")
 
+    def _set_initializer(self, initializer: Callable[[], Tuple[credentials.Credentials, request.Request]], lazy: bool) -> None:
+        """Set the function which discovers credentials and the endpoint, and run it now unless lazy
+
+        Args:
+            initializer (callable): Function which creates the credentials and request objects of the client
+            lazy (bool): Whether to defer running the initializer until the client is first used
+        """
+        if not isinstance(lazy, bool):
+            raise TypeError('Parameter "lazy" must be of type bool.')
+        self._credentials = None  # type: Optional[credentials.Credentials]
+        self._request = None  # type: Optional[request.Request]
+        self._initializer = initializer  # type: Optional[Callable[[], Tuple[credentials.Credentials, request.Request]]]
+        self._initialize_lock = threading.Lock()
+        if not lazy:
+            self._initialize()
+
+    def _set_response_cache(self, response_cache: Optional[cache.ResponseCache]) -> None:
+        """Set the cache for responses which will never change (i.e. transactions in a block, and blocks)
+
+        Args:
+            response_cache (ResponseCache, optional): The cache to use, or None to not cache responses
+        """
+        if response_cache is not None and not isinstance(response_cache, cache.ResponseCache):
+            raise TypeError('Parameter "response_cache" must be of type ResponseCache.')
+        self.response_cache = response_cache
+
+    def _initialize(self) -> None:
+        """Run the initializer if it hasn't successfully run yet (only once, even when called from several threads at once)"""
+        if self._initializer is not None:
+            with self._initialize_lock:
+                if self._initializer is not None:
+                    self._credentials, self._request = self._initializer()
+                    self._initializer = None
+
+    def warm(self) -> None:
+        """Discover the credentials and endpoint of a client created with lazy=True now, rather than on its first request
+
+        Raises:
+            DragonchainIdentityNotFound: if the credentials or endpoint can't be found
+            TypeError: with bad parameter types passed when creating the client
+
+        Returns:
+            None, the result is kept for every following request
+        """
+        self._initialize()
+
+    @property
+    def credentials(self) -> "credentials.Credentials":
+        """The credentials of this client (discovering them first if the client is lazy)"""
+        self._initialize()
+        return cast(credentials.Credentials, self._credentials)
+
+    @credentials.setter
+    def credentials(self, value: "credentials.Credentials") -> None:
+        self._credentials = value
+
+    @property
+    def request(self) -> "request.Request":
+        """The request object of this client (discovering the credentials and endpoint first if the client is lazy)"""
+        self._initialize()
+        return cast(request.Request, self._request)
+
+    @request.setter
+    def request(self, value: "request.Request") -> None:
+        self._request = value
+
+    def close(self) -> None:
+        """Close any persistent network connections held by this client
+
+        Returns:
+            None, the client should not be used after being closed
+        """
+        # A lazy client which was never used has no connections, so don't run discovery just to close it
+        if self._request is not None:
+            self._request.close()
+
+    def with_options(self, timeout: Union[None, float, timeouts.Timeout] = None, deadline: Union[None, float, timeouts.Deadline] = None) -> "Client":
+        """Get a view of this client which makes its requests with a different timeout and/or deadline
+
+        The view shares its connections with this client, so it is cheap to create for a single call or operation.
+        A deadline applies to every request made through the view, including all of the requests made by composite operations,
+        i.e. ``client.with_options(deadline=10).create_bulk_transaction(transactions, chunk_size=250)``
+
+        Args:
+            timeout (float or Timeout, optional): The timeout for each request (a single number is used for both the connect and read timeouts)
+            deadline (float or Deadline, optional): A deadline (or seconds from now) which every request made through the view must finish by
+
+        Raises:
+            TypeError: with bad parameter types
+
+        Returns:
+            A new client sharing the connections of this client (closing either closes both)
+        """
+        view_request = self.request.with_options(timeout=timeout, deadline=deadline)
+        client = copy.copy(self)
+        client.request = view_request
+        return client
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     def get_smart_contract_secret(self, secret_name: str) -> str:
         """Gets secrets for smart contracts
 
@@ -339,6 +486,8 @@ class Client(object):
         sort_by: str = "",
         sort_ascending: bool = True,
         ids_only: bool = False,
+        stream: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> "request_response":
         """Perform a query on a chain's transactions
 
@@ -351,41 +500,120 @@ class Client(object):
             sort_by (str, optional): The name of the field to sort by
             sort_ascending (bool, optional): If sort_by is set, this sorts the results by field in ascending order (descending if false)
             ids_only (bool, optional): If true, rather than an array of transaction objects, it will return an array of transaction id strings instead
+            stream (bool, optional): If true, the response is a ResultStream which yields each result as it is received (AsyncResultStream
+                for the async client), and the total is available from it once fully iterated. Memory use doesn't grow with limit
+            fields (list, optional): When streaming, dotted paths of the fields to keep from each transaction (i.e. ``["header.txn_id"]``).
+                Other fields are skipped over without being decoded
 
         Returns:
             The results of the query
         """
-        if not transaction_type or not isinstance(transaction_type, str):
-            raise TypeError('Parameter "transaction_type" must be of type str.')
-        if not redisearch_query or not isinstance(redisearch_query, str):
-            raise TypeError('Parameter "redisearch_query" must be of type str.')
-        if not isinstance(verbatim, bool):
-            raise TypeError('Parameter "verbatim" must be of type bool.')
+        query_dict = _build_transaction_query(transaction_type, redisearch_query, verbatim, sort_by, sort_ascending, ids_only)
         if not isinstance(offset, int):
             raise TypeError('Parameter "offset" must be of type int.')
         if not isinstance(limit, int):
             raise TypeError('Parameter "limit" must be of type int.')
-        if not isinstance(sort_by, str):
-            raise TypeError('Parameter "sort_by" must be of type str.')
-        if not isinstance(sort_ascending, bool):
-            raise TypeError('Parameter "sort_ascending" must be of type bool.')
-        if not isinstance(ids_only, bool):
-            raise TypeError('Parameter "ids_only" must be of type bool.')
-        query_dict = cast(
-            Dict[str, Any],
-            {
-                "transaction_type": transaction_type,
-                "q": redisearch_query,
-                "verbatim": verbatim,
-                "offset": offset,
-                "limit": limit,
-                "id_only": ids_only,
-            },
-        )
-        if sort_by:
-            query_dict["sort_by"] = sort_by
-            query_dict["sort_asc"] = sort_ascending
-        return self.request.get("/v1/transaction{}".format(self.request.generate_query_string(query_dict)))
+        _validate_stream_params(stream, fields)
+        query_dict["offset"] = offset
+        query_dict["limit"] = limit
+        path = "/v1/transaction{}".format(self.request.generate_query_string(query_dict))
+        if stream:
+            return self.request.get_results_stream(path, fields=fields)
+        return self.request.get(path)
+
+    def iter_transactions(
+        self,
+        transaction_type: str,
+        redisearch_query: str,
+        verbatim: bool = False,
+        sort_by: str = "",
+        sort_ascending: bool = True,
+        ids_only: bool = False,
+        offset: int = 0,
+        max_results: Optional[int] = None,
+        page_size: int = pagination.DEFAULT_PAGE_SIZE,
+        max_page_size: int = pagination.DEFAULT_MAX_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> "pagination.PageIterator":
+        """Iterate every result of a query on a chain's transactions, requesting as many pages as it takes
+
+        The next page is requested while the results of the current page are being iterated, and the number of results
+        requested per page adapts to the size and latency of the pages received so far.
+
+        Args:
+            transaction_type (str): The single transaction type to query
+            redisearch_query (str): Redisearch query syntax string to search with
+            verbatim (bool, optional): Whether or not to use redisearch's VERBATIM (if true, no stemming occurs on the query)
+            sort_by (str, optional): The name of the field to sort by
+            sort_ascending (bool, optional): If sort_by is set, this sorts the results by field in ascending order (descending if false)
+            ids_only (bool, optional): If true, iterate transaction id strings rather than transaction objects
+            offset (int, optional): Offset of the first result (default 0)
+            max_results (int, optional): Maximum number of results to iterate (all of them if not provided)
+            page_size (int, optional): Number of results to request for the first page (default 100)
+            max_page_size (int, optional): Maximum number of results to request per page (default 1000)
+            prefetch (bool, optional): Whether to request the next page while the current page is iterated (default True)
+
+        Raises:
+            TypeError: with bad parameter types
+            ValueError: with bad parameter values
+
+        Returns:
+            An iterable of the results (with the total number of results of the query available from its total once a page has
+            been received). Iterating it raises DragonchainServiceException if the query for a page fails.
+            The AsyncClient returns an AsyncPageIterator instead, to iterate with ``async for``
+        """
+        query_dict = _build_transaction_query(transaction_type, redisearch_query, verbatim, sort_by, sort_ascending, ids_only)
+        return self._iter_query("/v1/transaction", query_dict, offset, max_results, page_size, max_page_size, prefetch)
+
+    def scan_transactions(
+        self,
+        transaction_type: str,
+        redisearch_query: str = "*",
+        key: str = "timestamp",
+        start: Union[None, int, float] = None,
+        end: Union[None, int, float] = None,
+        ascending: bool = True,
+        window: Union[None, int, float] = None,
+        page_size: int = pagination.DEFAULT_PAGE_SIZE,
+        max_results: Optional[int] = None,
+        verbatim: bool = False,
+    ) -> "pagination.RangeScanIterator":
+        """Iterate the results of a query on a chain's transactions in order of their timestamp or block_id, without deep offsets
+
+        Each page is queried with a range predicate starting at the value of the last transaction seen, rather than with an
+        offset, so that every page takes about as long as the first, no matter how far into the results it is.
+
+        Args:
+            transaction_type (str): The single transaction type to query
+            redisearch_query (str, optional): Redisearch query syntax string to search with (default "*", every transaction)
+            key (str, optional): The field to scan by, either "timestamp" (default) or "block_id"
+            start (int or float, optional): The lowest value of key to scan from (inclusive)
+            end (int or float, optional): The highest value of key to scan to (inclusive)
+            ascending (bool, optional): Whether to scan in ascending order of key (default True)
+            window (int or float, optional): Split the range into windows of this many key values (i.e. 3600 seconds of timestamps)
+                which are queried in turn, so that each query only has to sort the transactions in one window. A missing start or
+                end is looked up first, and transactions added past it while scanning are not included
+            page_size (int, optional): Number of transactions to request per page (default 100)
+            max_results (int, optional): Maximum number of transactions to iterate (all of them if not provided)
+            verbatim (bool, optional): Whether or not to use redisearch's VERBATIM (if true, no stemming occurs on the query)
+
+        Raises:
+            TypeError: with bad parameter types
+            ValueError: with bad parameter values
+
+        Returns:
+            An iterable of the transactions. Iterating it raises DragonchainServiceException if the query for a page fails.
+            The AsyncClient returns an AsyncRangeScanIterator instead, to iterate with ``async for``
+        """
+        _build_transaction_query(transaction_type, redisearch_query, verbatim, "", True, False)
+        scan = pagination.RangeScan(redisearch_query, key, "txn_id", start, end, ascending, page_size, window, max_results)
+
+        def fetch_page(query: str, offset: int, limit: int, sort_ascending: bool) -> "request_response":
+            return self.query_transactions(
+                transaction_type, query, verbatim=verbatim, offset=offset, limit=limit, sort_by=key, sort_ascending=sort_ascending
+            )
+
+        return self._scan_query(fetch_page, scan)
 
     def get_transaction(self, transaction_id: str) -> "request_response":
         """Get a specific transaction by id
@@ -397,11 +625,32 @@ class Client(object):
             TypeError: with bad parameter types
 
         Returns:
-            The transaction searched for
+            The transaction searched for. With a response cache, it is cached once it is in a block
         """
         if not isinstance(transaction_id, str):
             raise TypeError('Parameter "transaction_id" must be of type str.')
-        return self.request.get("/v1/transaction/{}".format(transaction_id))
+        return self._get_cached("/v1/transaction/{}".format(transaction_id), _is_transaction_final)
+
+    def get_transactions(
+        self, transaction_ids: List[str], concurrency: int = DEFAULT_GET_CONCURRENCY
+    ) -> List[Union["request_response", exceptions.DragonchainException]]:
+        """Get many transactions by id, with several requests in flight at once
+
+        Args:
+            transaction_ids (list): IDs of the transactions to get. Each distinct ID is only requested once
+            concurrency (int, optional): Maximum number of requests to make at once (default 8)
+
+        Raises:
+            TypeError: with bad parameter types
+            ValueError: with bad parameter values
+
+        Returns:
+            List in the same order as transaction_ids, with the response for each ID (as returned by get_transaction, so a
+            transaction which doesn't exist has a response which isn't ok), or the exception raised while getting it
+            (i.e. ConnectionException), so that one failure doesn't fail the whole batch
+        """
+        _validate_batch_get(transaction_ids, "transaction_ids", concurrency)
+        return self._get_many(self.get_transaction, transaction_ids, concurrency)
 
     def create_transaction(
         self, transaction_type: str, payload: Union[str, Dict[Any, Any]], tag: Optional[str] = None, callback_url: Optional[str] = None
@@ -422,34 +671,72 @@ class Client(object):
 
         return self.request.post("/v1/transaction", _build_transaction_dict(transaction_type, payload, tag), additional_headers=headers)
 
-    def create_bulk_transaction(self, transaction_list: List[Dict[Any, Any]]) -> "request_response":
+    def create_bulk_transaction(
+        self,
+        transaction_list: List[Dict[Any, Any]],
+        chunk_size: Optional[int] = None,
+        max_chunk_bytes: Optional[int] = None,
+        concurrency: int = 1,
+        stream: bool = False,
+    ) -> "request_response":
         """Post many transactions to a chain at once, over a single connnection
 
+        If chunk_size or max_chunk_bytes is provided, the transactions are split into multiple bulk requests (sent concurrently
+        if concurrency is greater than 1), and the results are merged into a single response which preserves the input order.
+        A chunk which is rejected, or whose request fails (i.e. ConnectionException or DeadlineExceeded), has all of its transactions
+        in the failed list, so the ids of the chunks which were accepted are never lost.
+        When chunking, each transaction is encoded once (with the client's JSON codec) to measure the chunks, and each request body
+        is joined from those bytes. Otherwise, if stream is True, the request body is encoded and hashed one transaction at a time
+        and spooled to a temporary file once it is large, rather than being built in memory, so very large batches can be sent with little memory
+
         Args:
             transaction_list (list): List of transaction dictionaries. Schema: ``{'transaction_type': 'str', 'payload': 'str or dict', 'tag': 'str (optional)'}``
+            chunk_size (int, optional): Maximum number of transactions to send per bulk request (the chain accepts at most 250)
+            max_chunk_bytes (int, optional): Maximum size in bytes of the encoded body of each bulk request
+            concurrency (int, optional): Number of bulk requests to have in flight at once when chunking (default 1)
+            stream (bool, optional): Encode the request body incrementally into a spooled temporary file when not chunking (default False)
 
         Raises:
             TypeError: with bad parameter types
+            ValueError: with bad parameter values
+            DragonchainException: if the request fails, or when chunking, if the request for every chunk fails
 
         Returns:
             List of succeeded transaction id's and list of failed transactions
         """
-        if not isinstance(transaction_list, list):
-            raise TypeError('Parameter "transaction_list" must be of type list.')
-
-        post_data = []
-
-        for transaction in transaction_list:
-            if not isinstance(transaction, dict):
-                raise TypeError('All items in parameter "transaction_list" must be of type dict.')
-            post_data.append(
-                _build_transaction_dict(transaction.get("transaction_type") or "", transaction.get("payload") or "", transaction.get("tag") or "")
-            )
-
-        return self.request.post("/v1/transaction_bulk", post_data)
+        if not isinstance(stream, bool):
+            raise TypeError('Parameter "stream" must be of type bool.')
+        _validate_bulk_chunking(chunk_size, max_chunk_bytes, concurrency)
+        if chunk_size is None and max_chunk_bytes is None:
+            if stream:
+                # Build each transaction body as it is encoded, rather than building the whole list first
+                return self.request.post_stream("/v1/transaction_bulk", _iter_bulk_transaction_list(transaction_list))
+            return self.request.post("/v1/transaction_bulk", _build_bulk_transaction_list(transaction_list))
+
+        post_data = _build_bulk_transaction_list(transaction_list)
+        chunks = _chunk_bulk_transaction_list(post_data, self.request.json_codec, chunk_size, max_chunk_bytes)
+        logger.debug("Sending {} transactions in {} bulk requests".format(len(post_data), len(chunks)))
+
+        def post_chunk(chunk: Tuple[List[Dict[str, Any]], bytes]) -> Union["request_response", exceptions.DragonchainException]:
+            try:
+                return self.request.post_encoded("/v1/transaction_bulk", chunk[1])
+            except exceptions.DragonchainException as e:
+                return e
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            responses = list(executor.map(post_chunk, chunks))
+        return _merge_bulk_responses([transactions for transactions, _ in chunks], responses)
 
     def query_blocks(
-        self, redisearch_query: str, offset: int = 0, limit: int = 10, sort_by: str = "", sort_ascending: bool = True, ids_only: bool = False
+        self,
+        redisearch_query: str,
+        offset: int = 0,
+        limit: int = 10,
+        sort_by: str = "",
+        sort_ascending: bool = True,
+        ids_only: bool = False,
+        stream: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> "request_response":
         """Perform a query on a chain's blocks
 
@@ -460,27 +747,114 @@ class Client(object):
             sort_by (str, optional): The name of the field to sort by
             sort_ascending (bool, optional): If sort_by is set, this sorts the results by field in ascending order (descending if false)
             ids_only (bool, optional): If true, rather than an array of block objects, it will return an array of block id strings instead
+            stream (bool, optional): If true, the response is a ResultStream which yields each result as it is received. Refer to query_transactions
+            fields (list, optional): When streaming, dotted paths of the fields to keep from each block (i.e. ``["header.block_id"]``)
 
         Returns:
             The results of the query
         """
-        if not redisearch_query or not isinstance(redisearch_query, str):
-            raise TypeError('Parameter "redisearch_query" must be of type str.')
+        query_dict = _build_block_query(redisearch_query, sort_by, sort_ascending, ids_only)
         if not isinstance(offset, int):
             raise TypeError('Parameter "offset" must be of type int.')
         if not isinstance(limit, int):
             raise TypeError('Parameter "limit" must be of type int.')
-        if not isinstance(sort_by, str):
-            raise TypeError('Parameter "sort_by" must be of type str.')
-        if not isinstance(sort_ascending, bool):
-            raise TypeError('Parameter "sort_ascending" must be of type bool.')
-        if not isinstance(ids_only, bool):
-            raise TypeError('Parameter "ids_only" must be of type bool.')
-        query_dict = cast(Dict[str, Any], {"q": redisearch_query, "offset": offset, "limit": limit, "id_only": ids_only})
-        if sort_by:
-            query_dict["sort_by"] = sort_by
-            query_dict["sort_asc"] = sort_ascending
-        return self.request.get("/v1/block{}".format(self.request.generate_query_string(query_dict)))
+        _validate_stream_params(stream, fields)
+        query_dict["offset"] = offset
+        query_dict["limit"] = limit
+        path = "/v1/block{}".format(self.request.generate_query_string(query_dict))
+        if stream:
+            return self.request.get_results_stream(path, fields=fields)
+        return self.request.get(path)
+
+    def iter_blocks(
+        self,
+        redisearch_query: str,
+        sort_by: str = "",
+        sort_ascending: bool = True,
+        ids_only: bool = False,
+        offset: int = 0,
+        max_results: Optional[int] = None,
+        page_size: int = pagination.DEFAULT_PAGE_SIZE,
+        max_page_size: int = pagination.DEFAULT_MAX_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> "pagination.PageIterator":
+        """Iterate every result of a query on a chain's blocks, requesting as many pages as it takes. Refer to iter_transactions
+
+        Args:
+            redisearch_query (str): Redisearch query syntax string to search with
+            sort_by (str, optional): The name of the field to sort by
+            sort_ascending (bool, optional): If sort_by is set, this sorts the results by field in ascending order (descending if false)
+            ids_only (bool, optional): If true, iterate block id strings rather than block objects
+            offset (int, optional): Offset of the first result (default 0)
+            max_results (int, optional): Maximum number of results to iterate (all of them if not provided)
+            page_size (int, optional): Number of results to request for the first page (default 100)
+            max_page_size (int, optional): Maximum number of results to request per page (default 1000)
+            prefetch (bool, optional): Whether to request the next page while the current page is iterated (default True)
+
+        Raises:
+            TypeError: with bad parameter types
+            ValueError: with bad parameter values
+
+        Returns:
+            An iterable of the results. Refer to iter_transactions
+        """
+        query_dict = _build_block_query(redisearch_query, sort_by, sort_ascending, ids_only)
+        return self._iter_query("/v1/block", query_dict, offset, max_results, page_size, max_page_size, prefetch)
+
+    def scan_blocks(
+        self,
+        redisearch_query: str = "*",
+        key: str = "block_id",
+        start: Union[None, int, float] = None,
+        end: Union[None, int, float] = None,
+        ascending: bool = True,
+        window: Union[None, int, float] = None,
+        page_size: int = pagination.DEFAULT_PAGE_SIZE,
+        max_results: Optional[int] = None,
+    ) -> "pagination.RangeScanIterator":
+        """Iterate the results of a query on a chain's blocks in order of their block_id or timestamp, without deep offsets.
+        Refer to scan_transactions
+
+        Args:
+            redisearch_query (str, optional): Redisearch query syntax string to search with (default "*", every block)
+            key (str, optional): The field to scan by, either "block_id" (default) or "timestamp"
+            start (int or float, optional): The lowest value of key to scan from (inclusive)
+            end (int or float, optional): The highest value of key to scan to (inclusive)
+            ascending (bool, optional): Whether to scan in ascending order of key (default True)
+            window (int or float, optional): Split the range into windows of this many key values which are queried in turn
+            page_size (int, optional): Number of blocks to request per page (default 100)
+            max_results (int, optional): Maximum number of blocks to iterate (all of them if not provided)
+
+        Raises:
+            TypeError: with bad parameter types
+            ValueError: with bad parameter values
+
+        Returns:
+            An iterable of the blocks. Refer to scan_transactions
+        """
+        scan = pagination.RangeScan(redisearch_query, key, "block_id", start, end, ascending, page_size, window, max_results)
+
+        def fetch_page(query: str, offset: int, limit: int, sort_ascending: bool) -> "request_response":
+            return self.query_blocks(query, offset=offset, limit=limit, sort_by=key, sort_ascending=sort_ascending)
+
+        return self._scan_query(fetch_page, scan)
+
+    def _scan_query(
+        self, fetch_page: Callable[[str, int, int, bool], "request_response"], scan: "pagination.RangeScan"
+    ) -> "pagination.RangeScanIterator":
+        """Create the iterator for a keyset scan"""
+        return pagination.RangeScanIterator(fetch_page, scan)
+
+    def _iter_query(
+        self, path: str, query_dict: Dict[str, Any], offset: int, max_results: Optional[int], page_size: int, max_page_size: int, prefetch: bool
+    ) -> "pagination.PageIterator":
+        """Create the page iterator for a query, which requests each page with the offset and limit added to the query"""
+
+        def fetch_page(page_offset: int, limit: int) -> "request_response":
+            page_query = dict(query_dict, offset=page_offset, limit=limit)
+            return self.request.get("{}{}".format(path, self.request.generate_query_string(page_query)))
+
+        return pagination.PageIterator(fetch_page, offset, max_results, page_size, max_page_size, prefetch)
 
     def get_block(self, block_id: str) -> "request_response":
         """Get a specific block by id
@@ -492,11 +866,82 @@ class Client(object):
             TypeError: with bad parameter types
 
         Returns:
-            The block which was retrieved from the chain
+            The block which was retrieved from the chain. With a response cache, it is cached
         """
         if not isinstance(block_id, str):
             raise TypeError('Parameter "block_id" must be of type str.')
-        return self.request.get("/v1/block/{}".format(block_id))
+        return self._get_cached("/v1/block/{}".format(block_id), _is_block_final)
+
+    def get_blocks(
+        self, block_ids: List[str], concurrency: int = DEFAULT_GET_CONCURRENCY
+    ) -> List[Union["request_response", exceptions.DragonchainException]]:
+        """Get many blocks by id, with several requests in flight at once. Refer to get_transactions
+
+        Args:
+            block_ids (list): IDs of the blocks to get. Each distinct ID is only requested once
+            concurrency (int, optional): Maximum number of requests to make at once (default 8)
+
+        Raises:
+            TypeError: with bad parameter types
+            ValueError: with bad parameter values
+
+        Returns:
+            List in the same order as block_ids, with the response for each ID, or the exception raised while getting it
+        """
+        _validate_batch_get(block_ids, "block_ids", concurrency)
+        return self._get_many(self.get_block, block_ids, concurrency)
+
+    def _get_many(
+        self, get: Callable[[str], "request_response"], ids: List[str], concurrency: int
+    ) -> List[Union["request_response", exceptions.DragonchainException]]:
+        """Call get once for each distinct id, concurrently, returning the results in the order of ids (refer to get_transactions)"""
+        unique_ids = list(collections.OrderedDict.fromkeys(ids))
+        if not unique_ids:
+            return []
+
+        def get_one(item_id: str) -> Union["request_response", exceptions.DragonchainException]:
+            try:
+                return get(item_id)
+            except exceptions.DragonchainException as e:
+                return e
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(concurrency, len(unique_ids))) as executor:
+            results = dict(zip(unique_ids, executor.map(get_one, unique_ids)))
+        return [results[item_id] for item_id in ids]
+
+    def _get_cached(self, path: str, is_final: Callable[[Any, Any], bool], pending_path: Optional[str] = None) -> "request_response":
+        """Make a GET request, using the response cache (if there is one) for responses which will never change
+
+        Args:
+            path (str): Path of the request (the cache key, along with the dragonchain_id)
+            is_final (callable): Function called with the body of a successful response, and the body of the response from pending_path
+                (or None), returning whether the response will never change. Other successful responses, and 404s, are cached briefly
+            pending_path (str, optional): Path to also get when a successful response isn't cached, to tell whether it is final.
+                If that request fails, the response is returned without being cached
+
+        Returns:
+            The response of the GET request
+        """
+        if self.response_cache is None:
+            return self.request.get(path)
+        key = (self.credentials.dragonchain_id, path)
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            return self.request._parse_response(cached, True)
+        raw_response = self.request.get(path, raw=True)
+        r = transports.TransportResponse(raw_response["status"], cast(bytes, raw_response["response"]))
+        response = self.request._parse_response(r, True)
+        final = False
+        if response["ok"]:
+            try:
+                pending = self.request.get(pending_path) if pending_path is not None else None
+            except exceptions.DragonchainException as e:
+                # The response itself succeeded, so it is still returned, just without knowing whether it can be cached
+                logger.debug("Not caching {}, unable to check whether it is final: {}".format(path, e))
+                return response
+            final = _check_final(is_final, response, pending)
+        _cache_response(self.response_cache, key, r, final)
+        return response
 
     def get_pending_verifications(self, block_id: str) -> "request_response":
         """Get chain ids for pending and/or scheduled verifications
@@ -522,17 +967,20 @@ class Client(object):
             TypeError: with bad parameter types
 
         Returns:
-            Higher level block verifications
+            Higher level block verifications. With a response cache, they are cached once the level (or every level) is final,
+            meaning it has verifications and none still pending. Whenever the verifications aren't already cached, this is checked
+            with an extra request to get_pending_verifications (if that request fails, the verifications are returned uncached)
         """
         if not isinstance(block_id, str):
             raise TypeError('Parameter "block_id" must be of type str.')
+        pending_path = "/v1/verifications/pending/{}".format(block_id)
         if level is not None:
             if not isinstance(level, int):
                 raise TypeError('Parameter "level" must be of int.')
             if level not in [2, 3, 4, 5]:
                 raise ValueError('Parameter "level" must be between 2 and 5 inclusive.')
-            return self.request.get("/v1/verifications/{}?level={}".format(block_id, level))
-        return self.request.get("/v1/verifications/{}".format(block_id))
+            return self._get_cached("/v1/verifications/{}?level={}".format(block_id, level), _verifications_final_check(level), pending_path)
+        return self._get_cached("/v1/verifications/{}".format(block_id), _verifications_final_check(None), pending_path)
 
     def get_api_key(self, key_id: str) -> "request_response":
         """Get information about an HMAC API key
@@ -620,13 +1068,14 @@ class Client(object):
             body["permissions_document"] = permissions_document
         return self.request.put("/v1/api-key/{}".format(key_id), body)
 
-    def get_smart_contract_object(self, key: str, smart_contract_id: Optional[str] = None) -> "request_response":
+    def get_smart_contract_object(self, key: str, smart_contract_id: Optional[str] = None, raw: bool = False) -> "request_response":
         """Retrieve data from the object storage of a smart contract
         Note: When ran in an actual smart contract, smart_contract_id will be pulled automatically from the environment if not explicitly provided
 
         Args:
             key (str): The key stored in the heap to retrieve
             smart_contract_id (str, optional): The ID of the smart contract, optional if called from within a smart contract
+            raw (bool, optional): Return the value as bytes, exactly as it is stored, rather than decoding it as text (i.e. for binary objects)
 
         Raises:
             TypeError: with bad parameter types
@@ -634,13 +1083,54 @@ class Client(object):
         Returns:
             The value of the object in the heap
         """
-        if not isinstance(key, str):
-            raise TypeError('Parameter "key" must be of type str.')
-        if smart_contract_id is None:
-            smart_contract_id = os.environ.get("SMART_CONTRACT_ID")
-        if not isinstance(smart_contract_id, str):
-            raise TypeError('Parameter "smart_contract_id" must be of type str.')
-        return self.request.get("/v1/get/{}/{}".format(smart_contract_id, key), parse_response=False)
+        if not isinstance(raw, bool):
+            raise TypeError('Parameter "raw" must be of type bool.')
+        return self.request.get(_get_smart_contract_object_path(key, smart_contract_id), parse_response=False, raw=raw)
+
+    def stream_smart_contract_object(self, key: str, smart_contract_id: Optional[str] = None) -> "request_response":
+        """Retrieve data from the object storage of a smart contract as it is received, rather than reading it all into memory first
+        Note: When ran in an actual smart contract, smart_contract_id will be pulled automatically from the environment if not explicitly provided
+
+        Args:
+            key (str): The key stored in the heap to retrieve
+            smart_contract_id (str, optional): The ID of the smart contract, optional if called from within a smart contract
+
+        Raises:
+            TypeError: with bad parameter types
+
+        Returns:
+            If successful, response is an iterable of the chunks (bytes) of the object, which releases its connection once fully
+            iterated, and can be used with ``with`` to release it early. Otherwise response is the error from the chain
+        """
+        return self.request.get_stream(_get_smart_contract_object_path(key, smart_contract_id))
+
+    def download_smart_contract_object(
+        self, key: str, destination: Union[str, BinaryIO], smart_contract_id: Optional[str] = None
+    ) -> "request_response":
+        """Write data from the object storage of a smart contract to a file as it is received
+        Note: When ran in an actual smart contract, smart_contract_id will be pulled automatically from the environment if not explicitly provided
+
+        Args:
+            key (str): The key stored in the heap to retrieve
+            destination (str or file-like): The path of the file to write (which is only replaced once the whole object has been received),
+                or a writable binary file-like object
+            smart_contract_id (str, optional): The ID of the smart contract, optional if called from within a smart contract
+
+        Raises:
+            TypeError: with bad parameter types
+
+        Returns:
+            If successful, response is the number of bytes written. Otherwise response is the error from the chain, and nothing is written
+        """
+        download = streaming.Download(destination)
+        response = self.request.get_stream(_get_smart_contract_object_path(key, smart_contract_id))
+        if response["ok"]:
+            body = cast(transports.StreamedTransportResponse, response["response"])
+            with body, download:
+                for chunk in body:
+                    download.write(chunk)
+            response["response"] = download.size
+        return response
 
     def list_smart_contract_objects(self, prefix_key: Optional[str] = None, smart_contract_id: Optional[str] = None) -> "request_response":
         """Lists all objects stored in a smart contracts heap
@@ -1298,6 +1788,45 @@ class Client(object):
         return self.request.get("/v1/public-blockchain-address")
 
 
+def _is_transaction_final(transaction: Any, pending: Any) -> bool:
+    """Check whether a transaction is in a block (until then, it is pending and may be changed)"""
+    return isinstance(transaction, dict) and isinstance(transaction.get("header"), dict) and bool(transaction["header"].get("block_id"))
+
+
+def _is_block_final(block: Any, pending: Any) -> bool:
+    """Check whether a block is final (blocks are never changed once they exist)"""
+    return True
+
+
+def _verifications_final_check(level: Optional[int]) -> Callable[[Any, Any], bool]:
+    """Get the function which checks whether the verifications of a block at a level (or every level if None) are final"""
+    levels = [str(level)] if level is not None else ["2", "3", "4", "5"]
+
+    def is_final(verifications: Any, pending: Any) -> bool:
+        # Verifications for a single level are a list, otherwise they are a dictionary of level to list (as are pending verifications)
+        received = {levels[0]: verifications} if level is not None else verifications
+        if not isinstance(received, dict) or not isinstance(pending, dict):
+            return False
+        return all(received.get(check_level) and not pending.get(check_level) for check_level in levels)
+
+    return is_final
+
+
+def _check_final(is_final: Callable[[Any, Any], bool], response: "request_response", pending: Optional["request_response"]) -> bool:
+    """Call is_final for a successful response and the response from its pending path (treated as not final if that request failed)"""
+    if pending is not None and not pending["ok"]:
+        return False
+    return is_final(response["response"], pending["response"] if pending is not None else None)
+
+
+def _cache_response(response_cache: cache.ResponseCache, key: Tuple[str, str], r: transports.TransportResponse, final: bool) -> None:
+    """Cache a response which is final, or briefly cache one which may still change (successful responses, and 404s)"""
+    if final:
+        response_cache.put(key, r, immutable=True)
+    elif r.status // 100 == 2 or r.status == 404:
+        response_cache.put(key, r, immutable=False)
+
+
 def _validate_and_build_custom_index_fields_array(  # noqa: C901
     custom_index_fields: Iterable["custom_index_fields_type"],
 ) -> List["custom_index_fields_type"]:
@@ -1398,6 +1927,282 @@ def _build_transaction_dict(transaction_type: str, payload: Union[str, Dict[Any,
     return body
 
 
+def _build_bulk_transaction_list(transaction_list: List[Dict[Any, Any]]) -> List[Dict[str, Any]]:
+    """Build the list of transaction bodies to send as a bulk transaction
+
+    Args:
+        transaction_list (list): List of transaction dictionaries. Schema: ``{'transaction_type': 'str', 'payload': 'str or dict', 'tag': 'str (optional)'}``
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        List of dictionary bodies to use for sending as a bulk transaction
+    """
+    return list(_iter_bulk_transaction_list(transaction_list))
+
+
+def _iter_bulk_transaction_list(transaction_list: List[Dict[Any, Any]]) -> Iterator[Dict[str, Any]]:
+    """Lazily build each transaction body to send as a bulk transaction
+
+    Args:
+        transaction_list (list): List of transaction dictionaries. Schema: ``{'transaction_type': 'str', 'payload': 'str or dict', 'tag': 'str (optional)'}``
+
+    Raises:
+        TypeError: with bad parameter types (immediately for transaction_list, or when iterating for its items)
+
+    Returns:
+        Iterator of dictionary bodies to use for sending as a bulk transaction
+    """
+    if not isinstance(transaction_list, list):
+        raise TypeError('Parameter "transaction_list" must be of type list.')
+    return (_build_bulk_transaction_item(transaction) for transaction in transaction_list)
+
+
+def _build_bulk_transaction_item(transaction: Dict[Any, Any]) -> Dict[str, Any]:
+    """Build the body of a single transaction in a bulk transaction
+
+    Args:
+        transaction (dict): Transaction dictionary. Schema: ``{'transaction_type': 'str', 'payload': 'str or dict', 'tag': 'str (optional)'}``
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        Dictionary body of the transaction
+    """
+    if not isinstance(transaction, dict):
+        raise TypeError('All items in parameter "transaction_list" must be of type dict.')
+    return _build_transaction_dict(transaction.get("transaction_type") or "", transaction.get("payload") or "", transaction.get("tag") or "")
+
+
+def _get_smart_contract_object_path(key: str, smart_contract_id: Optional[str]) -> str:
+    """Build the path of an object in the heap of a smart contract
+
+    Args:
+        key (str): The key stored in the heap
+        smart_contract_id (str, optional): The ID of the smart contract, pulled from the environment if not provided
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        The path of the object
+    """
+    if not isinstance(key, str):
+        raise TypeError('Parameter "key" must be of type str.')
+    if smart_contract_id is None:
+        smart_contract_id = os.environ.get("SMART_CONTRACT_ID")
+    if not isinstance(smart_contract_id, str):
+        raise TypeError('Parameter "smart_contract_id" must be of type str.')
+    return "/v1/get/{}/{}".format(smart_contract_id, key)
+
+
+def _build_transaction_query(
+    transaction_type: str, redisearch_query: str, verbatim: bool, sort_by: str, sort_ascending: bool, ids_only: bool
+) -> Dict[str, Any]:
+    """Validate the parameters of a transaction query, and build its query parameters (other than offset and limit)
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        Dictionary of query parameters
+    """
+    if not transaction_type or not isinstance(transaction_type, str):
+        raise TypeError('Parameter "transaction_type" must be of type str.')
+    if not isinstance(verbatim, bool):
+        raise TypeError('Parameter "verbatim" must be of type bool.')
+    query_dict = _build_block_query(redisearch_query, sort_by, sort_ascending, ids_only)
+    query_dict["transaction_type"] = transaction_type
+    query_dict["verbatim"] = verbatim
+    return query_dict
+
+
+def _build_block_query(redisearch_query: str, sort_by: str, sort_ascending: bool, ids_only: bool) -> Dict[str, Any]:
+    """Validate the parameters of a block query, and build its query parameters (other than offset and limit)
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        Dictionary of query parameters
+    """
+    if not redisearch_query or not isinstance(redisearch_query, str):
+        raise TypeError('Parameter "redisearch_query" must be of type str.')
+    if not isinstance(sort_by, str):
+        raise TypeError('Parameter "sort_by" must be of type str.')
+    if not isinstance(sort_ascending, bool):
+        raise TypeError('Parameter "sort_ascending" must be of type bool.')
+    if not isinstance(ids_only, bool):
+        raise TypeError('Parameter "ids_only" must be of type bool.')
+    query_dict = {"q": redisearch_query, "id_only": ids_only}  # type: Dict[str, Any]
+    if sort_by:
+        query_dict["sort_by"] = sort_by
+        query_dict["sort_asc"] = sort_ascending
+    return query_dict
+
+
+def _validate_stream_params(stream: bool, fields: Optional[List[str]]) -> None:
+    """Validate the parameters for streaming query results
+
+    Args:
+        stream (bool): Whether to stream the results
+        fields (list, optional): Dotted paths of the fields to keep from each result
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: if fields are provided without streaming
+    """
+    if not isinstance(stream, bool):
+        raise TypeError('Parameter "stream" must be of type bool.')
+    if fields is not None:
+        if not isinstance(fields, list) or not all(isinstance(field, str) for field in fields):
+            raise TypeError('Parameter "fields" must be of type list of str.')
+        if not stream:
+            raise ValueError('Parameter "fields" can only be used with stream=True.')
+
+
+def _validate_batch_get(ids: List[str], name: str, concurrency: int) -> None:
+    """Validate the parameters for getting many transactions or blocks by id
+
+    Args:
+        ids (list): The IDs to get
+        name (str): The name of the ids parameter, for error messages
+        concurrency (int): Maximum number of requests to make at once
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+    """
+    if not isinstance(ids, list) or not all(isinstance(item_id, str) for item_id in ids):
+        raise TypeError('Parameter "{}" must be of type list of str.'.format(name))
+    if not isinstance(concurrency, int):
+        raise TypeError('Parameter "concurrency" must be of type int.')
+    if concurrency < 1:
+        raise ValueError('Parameter "concurrency" must be at least 1.')
+
+
+def _validate_bulk_chunking(chunk_size: Optional[int], max_chunk_bytes: Optional[int], concurrency: int) -> None:
+    """Validate the chunking parameters for a bulk transaction
+
+    Args:
+        chunk_size (int, optional): Maximum number of transactions per bulk request
+        max_chunk_bytes (int, optional): Maximum size in bytes of each bulk request body
+        concurrency (int): Number of bulk requests to have in flight at once
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+    """
+    if chunk_size is not None:
+        if not isinstance(chunk_size, int):
+            raise TypeError('Parameter "chunk_size" must be of type int.')
+        if chunk_size < 1 or chunk_size > MAX_BULK_TRANSACTIONS:
+            raise ValueError('Parameter "chunk_size" must be between 1 and {}.'.format(MAX_BULK_TRANSACTIONS))
+    if max_chunk_bytes is not None:
+        if not isinstance(max_chunk_bytes, int):
+            raise TypeError('Parameter "max_chunk_bytes" must be of type int.')
+        if max_chunk_bytes < 1:
+            raise ValueError('Parameter "max_chunk_bytes" must be greater than 0.')
+    if not isinstance(concurrency, int):
+        raise TypeError('Parameter "concurrency" must be of type int.')
+    if concurrency < 1:
+        raise ValueError('Parameter "concurrency" must be greater than 0.')
+
+
+def _chunk_bulk_transaction_list(
+    post_data: List[Dict[str, Any]], json_codec: codec.JsonCodec, chunk_size: Optional[int] = None, max_chunk_bytes: Optional[int] = None
+) -> List[Tuple[List[Dict[str, Any]], bytes]]:
+    """Split a list of transaction bodies into chunks by count and by encoded size, preserving order
+
+    Each transaction is encoded exactly once, and the body of each chunk is joined from those bytes, so the size
+    that is checked is the size that is sent
+
+    Args:
+        post_data (list): List of transaction bodies to split
+        json_codec (JsonCodec): The codec to encode the transactions with (which must encode compactly)
+        chunk_size (int, optional): Maximum number of transactions per chunk (defaults to the chain's bulk limit)
+        max_chunk_bytes (int, optional): Maximum size in bytes of each encoded chunk. A single transaction larger than this gets its own chunk
+
+    Returns:
+        List of chunks, each a tuple of the list of transaction bodies and the encoded JSON array of them
+    """
+    if chunk_size is None:
+        chunk_size = MAX_BULK_TRANSACTIONS
+    chunks = []
+    current = []  # type: List[Dict[str, Any]]
+    encoded = []  # type: List[bytes]
+    current_bytes = 2  # Enclosing brackets of the json array
+    for transaction in post_data:
+        item = json_codec.dumps(transaction)
+        # Size of the item plus its separating comma
+        item_bytes = len(item) + 1
+        if current and (len(current) >= chunk_size or (max_chunk_bytes and current_bytes + item_bytes > max_chunk_bytes)):
+            chunks.append((current, _join_json_array(encoded)))
+            current, encoded = [], []
+            current_bytes = 2
+        current.append(transaction)
+        encoded.append(item)
+        current_bytes += item_bytes
+    if current:
+        chunks.append((current, _join_json_array(encoded)))
+    return chunks
+
+
+def _join_json_array(items: List[bytes]) -> bytes:
+    """Join items which have each been encoded as compact JSON into the encoded JSON array of them"""
+    return b"[" + b",".join(items) + b"]"
+
+
+def _merge_bulk_responses(
+    chunks: List[List[Dict[str, Any]]], results: List[Union["request_response", exceptions.DragonchainException]]
+) -> "request_response":
+    """Merge the responses of several bulk transaction requests into one, keeping the order of the chunks
+
+    Args:
+        chunks (list): The chunks of transaction bodies that were sent
+        results (list): The response for each chunk, or the exception raised while sending it, in the same order as chunks
+
+    Raises:
+        DragonchainException: the first exception, if sending every chunk raised one (so there is nothing to merge)
+
+    Returns:
+        Merged response where the 201 list has all succeeded transaction ids and the 400 list has all failed transactions.
+        If sending any chunk raised an exception, the status is 207 and ok is False
+    """
+    errors = [result for result in results if isinstance(result, exceptions.DragonchainException)]
+    if errors and len(errors) == len(results):
+        raise errors[0]
+    succeeded = []  # type: List[Any]
+    failed = []  # type: List[Any]
+    responses = []  # type: List[request_response]
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, exceptions.DragonchainException):
+            logger.warning("Bulk transaction chunk of {} transactions failed to send: {}".format(len(chunk), result))
+            failed.extend(chunk)
+            continue
+        response = result
+        responses.append(response)
+        body = response["response"]
+        if response["ok"] and isinstance(body, dict):
+            succeeded.extend(body.get("201") or [])
+            failed.extend(body.get("400") or [])
+        else:
+            # The whole chunk was rejected, so every transaction in it failed
+            logger.debug("Bulk transaction chunk failed with status {}".format(response["status"]))
+            failed.extend(chunk)
+    statuses = {response["status"] for response in responses}
+    return cast(
+        "request_response",
+        {
+            "status": statuses.pop() if len(statuses) == 1 and not errors else 207,
+            "ok": not errors and all(response["ok"] for response in responses),
+            "response": {"201": succeeded, "400": failed},
+        },
+    )
+
+
 def _build_ethereum_transaction_body(
     to: str, value: str, data: Optional[str] = None, gas_price: Optional[str] = None, gas: Optional[str] = None, nonce: Optional[str] = None
 ) -> Dict[str, Any]:
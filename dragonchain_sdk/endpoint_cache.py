@@ -0,0 +1,177 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional, Set, cast  # noqa: F401 used by typing
+
+logger = logging.getLogger(__name__)
+
+# Chain registrations rarely change, so resolved endpoints are fresh for a day, and can be used (while being refreshed) for a week after that
+DEFAULT_TTL = 24 * 60 * 60.0
+DEFAULT_STALE_TTL = 7 * 24 * 60 * 60.0
+
+
+class EndpointCache(object):
+    """Construct a new `EndpointCache`, which remembers the endpoints resolved for chains (by dragonchain_id)
+
+    Entries are kept in memory, and optionally persisted to a JSON file so that they are shared between processes.
+    An entry is used as is for ttl seconds after it was resolved. For stale_ttl seconds after that, it is still used,
+    but is refreshed in the background (once at a time per chain). Entries older than that are resolved again before being used.
+
+    Args:
+        path (str, optional): The file to persist entries to (entries are only kept in memory if not provided)
+        ttl (float, optional): Seconds that a resolved endpoint is fresh for
+        stale_ttl (float, optional): Seconds after becoming stale that an endpoint can still be used while it is refreshed
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with a negative ttl or stale_ttl
+
+    Returns:
+        A new EndpointCache object.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL, stale_ttl: float = DEFAULT_STALE_TTL):
+        if path is not None and not isinstance(path, str):
+            raise TypeError('Parameter "path" must be of type str.')
+        if not isinstance(ttl, (int, float)):
+            raise TypeError('Parameter "ttl" must be of type float.')
+        if not isinstance(stale_ttl, (int, float)):
+            raise TypeError('Parameter "stale_ttl" must be of type float.')
+        if ttl < 0:
+            raise ValueError('Parameter "ttl" must not be negative.')
+        if stale_ttl < 0:
+            raise ValueError('Parameter "stale_ttl" must not be negative.')
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries = {}  # type: Dict[str, Dict[str, Any]]
+        self._refreshing = set()  # type: Set[str]
+        self._lock = threading.Lock()
+
+    def get(self, dragonchain_id: str, resolve: Callable[[str], str]) -> str:
+        """Get the endpoint for a chain, resolving it if there is no usable entry
+
+        Args:
+            dragonchain_id (str): The ID of the chain
+            resolve (callable): Function which resolves the endpoint of a chain from its dragonchain_id
+
+        Raises:
+            Any exception raised by resolve when there is no usable entry
+
+        Returns:
+            The endpoint of the chain
+        """
+        entry = self._get_entry(dragonchain_id)
+        if entry is not None:
+            age = time.time() - entry["resolved_at"]
+            if age < self.ttl:
+                return cast(str, entry["url"])
+            if age < self.ttl + self.stale_ttl:
+                self._start_refresh(dragonchain_id, resolve)
+                return cast(str, entry["url"])
+        url = resolve(dragonchain_id)
+        self.put(dragonchain_id, url)
+        return url
+
+    def put(self, dragonchain_id: str, url: str) -> None:
+        """Store the endpoint resolved for a chain
+
+        Args:
+            dragonchain_id (str): The ID of the chain
+            url (str): The endpoint of the chain
+        """
+        with self._lock:
+            # Merge entries resolved by other processes first, so that they aren't overwritten
+            self._load()
+            self._entries[dragonchain_id] = {"url": url, "resolved_at": time.time()}
+            self._save()
+
+    def invalidate(self, dragonchain_id: str, url: Optional[str] = None) -> None:
+        """Remove the entry for a chain, so that it is resolved again the next time it is needed
+
+        Args:
+            dragonchain_id (str): The ID of the chain
+            url (str, optional): Only remove the entry if it is still for this endpoint (so one resolved again since isn't removed)
+        """
+        with self._lock:
+            self._load()
+            entry = self._entries.get(dragonchain_id)
+            if entry is not None and (url is None or entry["url"] == url):
+                del self._entries[dragonchain_id]
+                self._save()
+
+    def _get_entry(self, dragonchain_id: str) -> Optional[Dict[str, Any]]:
+        """Get the entry for a chain from memory, or from the file if another process may have resolved it"""
+        with self._lock:
+            if dragonchain_id not in self._entries:
+                self._load()
+            return self._entries.get(dragonchain_id)
+
+    def _start_refresh(self, dragonchain_id: str, resolve: Callable[[str], str]) -> None:
+        """Refresh the entry for a chain in a background thread, unless it is already being refreshed"""
+        with self._lock:
+            if dragonchain_id in self._refreshing:
+                return
+            self._refreshing.add(dragonchain_id)
+        threading.Thread(target=self._refresh, args=(dragonchain_id, resolve), daemon=True).start()
+
+    def _refresh(self, dragonchain_id: str, resolve: Callable[[str], str]) -> None:
+        """Resolve the endpoint for a chain again, keeping the stale entry if that fails"""
+        try:
+            self.put(dragonchain_id, resolve(dragonchain_id))
+        except Exception as e:
+            logger.warning("Failed to refresh endpoint for {}, continuing to use the cached endpoint: {}".format(dragonchain_id, e))
+        finally:
+            with self._lock:
+                self._refreshing.discard(dragonchain_id)
+
+    def _load(self) -> None:
+        """Merge the entries from the file into memory (keeping whichever is newest). Must be called with the lock held"""
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(entries, dict):
+            return
+        for dragonchain_id, entry in entries.items():
+            if not isinstance(entry, dict) or not isinstance(entry.get("url"), str) or not isinstance(entry.get("resolved_at"), (int, float)):
+                continue
+            current = self._entries.get(dragonchain_id)
+            if current is None or current["resolved_at"] < entry["resolved_at"]:
+                self._entries[dragonchain_id] = entry
+
+    def _save(self) -> None:
+        """Atomically write the entries in memory to the file. Must be called with the lock held"""
+        if self.path is None:
+            return
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".endpoint_cache")
+        except OSError as e:
+            logger.debug("Unable to persist endpoint cache to {}: {}".format(self.path, e))
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            os.remove(temp_path)
+            logger.debug("Unable to persist endpoint cache to {}: {}".format(self.path, e))
@@ -0,0 +1,183 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import logging
+import threading
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+ROUND_ROBIN = "round_robin"
+LEAST_OUTSTANDING = "least_outstanding"
+EWMA = "ewma"
+STRATEGIES = frozenset([ROUND_ROBIN, LEAST_OUTSTANDING, EWMA])
+
+DEFAULT_EJECT_DURATION = 30.0
+# Weight given to each new latency sample in the moving average
+DEFAULT_EWMA_ALPHA = 0.3
+
+
+class Endpoint(object):
+    """The state of a single endpoint in an `EndpointPool`
+
+    Args:
+        url (str): The URL of the endpoint
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.outstanding = 0
+        self.latency = None  # type: Optional[float]
+        self.ejected_until = None  # type: Optional[float]
+        self.probing = False
+
+    def is_ejected(self, now: float) -> bool:
+        """Check if the endpoint is currently ejected from the pool
+
+        Args:
+            now (float): The current time from time.monotonic
+
+        Returns:
+            Boolean if the endpoint is ejected
+        """
+        return self.ejected_until is not None and (self.probing or now < self.ejected_until)
+
+
+class EndpointPool(object):
+    """Construct a new `EndpointPool`, which balances requests between several endpoints for the same chain
+
+    Endpoints which fail to respond, or respond with a 5XX status code, are ejected from the pool for eject_duration seconds.
+    After that they are re-probed in the background with a status request (triggered by the next request to the pool),
+    and only put back into rotation once a probe succeeds. If every endpoint is ejected, requests are sent to whichever
+    endpoint is due to be re-probed soonest rather than failing outright.
+
+    Args:
+        endpoints (list): The URLs of the endpoints
+        strategy (str, optional): How to choose an endpoint for each request. One of:
+            ``round_robin`` (the default) to cycle through the endpoints,
+            ``least_outstanding`` to choose the endpoint with the fewest requests in flight, or
+            ``ewma`` to choose the endpoint with the lowest moving average of latency (weighted by requests in flight)
+        eject_duration (float, optional): Seconds to wait before re-probing an endpoint after it fails
+        ewma_alpha (float, optional): Weight (between 0 and 1) given to each new latency sample when using the ``ewma`` strategy
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+
+    Returns:
+        A new EndpointPool object.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[str],
+        strategy: str = ROUND_ROBIN,
+        eject_duration: float = DEFAULT_EJECT_DURATION,
+        ewma_alpha: float = DEFAULT_EWMA_ALPHA,
+    ):
+        if not isinstance(endpoints, list) or not all(isinstance(endpoint, str) for endpoint in endpoints):
+            raise TypeError('Parameter "endpoints" must be of type list of str.')
+        if not endpoints:
+            raise ValueError('Parameter "endpoints" must not be empty.')
+        if strategy not in STRATEGIES:
+            raise ValueError('Parameter "strategy" must be one of {}.'.format(", ".join(sorted(STRATEGIES))))
+        if not isinstance(eject_duration, (int, float)):
+            raise TypeError('Parameter "eject_duration" must be of type float.')
+        if not isinstance(ewma_alpha, (int, float)):
+            raise TypeError('Parameter "ewma_alpha" must be of type float.')
+        if not 0 < ewma_alpha <= 1:
+            raise ValueError('Parameter "ewma_alpha" must be greater than 0 and at most 1.')
+        self.endpoints = [Endpoint(url) for url in endpoints]
+        self.strategy = strategy
+        self.eject_duration = eject_duration
+        self.ewma_alpha = ewma_alpha
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @property
+    def urls(self) -> List[str]:
+        """The URLs of all of the endpoints in the pool"""
+        return [endpoint.url for endpoint in self.endpoints]
+
+    def acquire(self) -> Endpoint:
+        """Choose an endpoint for a request, and count it as in flight until it is released
+
+        Returns:
+            The chosen Endpoint
+        """
+        with self._lock:
+            now = time.monotonic()
+            candidates = [endpoint for endpoint in self.endpoints if not endpoint.is_ejected(now)]
+            if not candidates:
+                endpoint = min(self.endpoints, key=lambda e: e.ejected_until or 0.0)
+            else:
+                # Rotate the candidates so that ties are broken in round robin order
+                start = self._next % len(candidates)
+                self._next += 1
+                candidates = candidates[start:] + candidates[:start]
+                if self.strategy == LEAST_OUTSTANDING:
+                    endpoint = min(candidates, key=lambda e: e.outstanding)
+                elif self.strategy == EWMA:
+                    endpoint = min(candidates, key=lambda e: (e.latency or 0.0) * (e.outstanding + 1))
+                else:
+                    endpoint = candidates[0]
+            endpoint.outstanding += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint, latency: Optional[float] = None, healthy: bool = True) -> None:
+        """Record the outcome of a request which was sent to an endpoint from acquire
+
+        Args:
+            endpoint (Endpoint): The endpoint that the request was sent to
+            latency (float, optional): Seconds the request took
+            healthy (bool, optional): False if the endpoint failed to respond, or responded with a 5XX status code
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            if not healthy:
+                self._eject(endpoint)
+            elif latency is not None:
+                endpoint.latency = latency if endpoint.latency is None else endpoint.latency + self.ewma_alpha * (latency - endpoint.latency)
+
+    def take_due_probes(self) -> List[Endpoint]:
+        """Get the ejected endpoints which are due to be re-probed, marking them as being probed
+
+        Returns:
+            List of endpoints which the caller must probe, then report with probe_finished
+        """
+        with self._lock:
+            now = time.monotonic()
+            due = [e for e in self.endpoints if e.ejected_until is not None and not e.probing and now >= e.ejected_until]
+            for endpoint in due:
+                endpoint.probing = True
+            return due
+
+    def probe_finished(self, endpoint: Endpoint, healthy: bool) -> None:
+        """Record the result of probing an endpoint from take_due_probes
+
+        Args:
+            endpoint (Endpoint): The endpoint that was probed
+            healthy (bool): Whether the probe succeeded
+        """
+        with self._lock:
+            endpoint.probing = False
+            if healthy:
+                logger.info("Endpoint {} is healthy again".format(endpoint.url))
+                endpoint.ejected_until = None
+            else:
+                self._eject(endpoint)
+
+    def _eject(self, endpoint: Endpoint) -> None:
+        """Eject an endpoint until it is due to be probed again. Must be called with the lock held"""
+        if endpoint.ejected_until is None:
+            logger.warning("Ejecting unhealthy endpoint {} for {} seconds".format(endpoint.url, self.eject_duration))
+        endpoint.ejected_until = time.monotonic() + self.eject_duration
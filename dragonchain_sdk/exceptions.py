@@ -40,3 +40,15 @@ class ConnectionException(DragonchainException):
 
 class UnexpectedResponseException(DragonchainException):
     """Raised when the Dragonchain responded with an unexpected response"""
+
+
+class BulkTransactionFailure(DragonchainException):
+    """Raised when a transaction sent as part of a bulk request was not accepted by the Dragonchain"""
+
+
+class DeadlineExceeded(ConnectionException):
+    """Raised when a request could not be completed before the deadline of the operation it was made for"""
+
+
+class QueryResultsChanged(DragonchainException):
+    """Raised when the results of a query changed while its pages were being fetched, so the pages may overlap or have gaps"""
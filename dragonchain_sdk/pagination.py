@@ -0,0 +1,607 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import logging
+import concurrent.futures
+from typing import cast, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union, TYPE_CHECKING  # noqa: F401 used by typing
+
+from dragonchain_sdk import codec
+from dragonchain_sdk import exceptions
+
+if TYPE_CHECKING:
+    from dragonchain_sdk.types import request_response  # noqa: F401 used by typing
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_PAGE_SIZE = 1000
+# Pages never shrink below this many results (or the initial page size, if that is smaller)
+DEFAULT_MIN_PAGE_SIZE = 10
+# Pages grow while they take less than half of this many seconds, and shrink once they take more than twice as long
+DEFAULT_TARGET_PAGE_TIME = 0.5
+# Pages are kept under about this many bytes of results
+DEFAULT_MAX_PAGE_BYTES = 4 * 1024 * 1024
+# Number of pages to request at once when fetching every result
+DEFAULT_FETCH_CONCURRENCY = 4
+# The (numeric, sortable) header fields that results can be scanned by
+SCAN_KEYS = ("block_id", "timestamp")
+
+
+class PageSizer(object):
+    """Construct a new `PageSizer`, which adapts the number of results requested per page to the observed size and latency of pages
+
+    The page size doubles while pages are received in under half of the target time, and halves when they take more than twice
+    the target time. It is also capped so that a page of results is estimated to stay under max_page_bytes.
+
+    Args:
+        page_size (int, optional): The number of results to request for the first page
+        max_page_size (int, optional): The maximum number of results to request per page
+        target_time (float, optional): The number of seconds that a page should take to be received
+        max_page_bytes (int, optional): The (estimated) maximum number of bytes of results per page
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+
+    Returns:
+        A new PageSizer object.
+    """
+
+    def __init__(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_page_size: int = DEFAULT_MAX_PAGE_SIZE,
+        target_time: float = DEFAULT_TARGET_PAGE_TIME,
+        max_page_bytes: int = DEFAULT_MAX_PAGE_BYTES,
+    ):
+        if not isinstance(page_size, int):
+            raise TypeError('Parameter "page_size" must be of type int.')
+        if not isinstance(max_page_size, int):
+            raise TypeError('Parameter "max_page_size" must be of type int.')
+        if not isinstance(target_time, (int, float)):
+            raise TypeError('Parameter "target_time" must be of type float.')
+        if not isinstance(max_page_bytes, int):
+            raise TypeError('Parameter "max_page_bytes" must be of type int.')
+        if page_size < 1 or max_page_size < page_size:
+            raise ValueError('Parameter "page_size" must be at least 1 and at most max_page_size.')
+        if target_time <= 0 or max_page_bytes < 1:
+            raise ValueError('Parameters "target_time" and "max_page_bytes" must be positive.')
+        self.page_size = page_size
+        self.min_page_size = min(page_size, DEFAULT_MIN_PAGE_SIZE)
+        self.max_page_size = max_page_size
+        self.target_time = target_time
+        self.max_page_bytes = max_page_bytes
+
+    def record(self, count: int, elapsed: float, size: int) -> None:
+        """Adapt the page size to a page that was received
+
+        Args:
+            count (int): The number of results in the page
+            elapsed (float): The number of seconds the page took to be received
+            size (int): The (estimated) size in bytes of the results in the page
+        """
+        if count == 0:
+            return
+        page_size = self.page_size
+        if elapsed < self.target_time / 2 and count >= page_size:
+            page_size *= 2
+        elif elapsed > self.target_time * 2:
+            page_size //= 2
+        page_size = min(page_size, self.max_page_bytes * count // max(size, 1))
+        page_size = max(self.min_page_size, min(page_size, self.max_page_size))
+        if page_size != self.page_size and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Adjusting page size from {} to {} after a page of {} results in {:.3f}s".format(self.page_size, page_size, count, elapsed))
+        self.page_size = page_size
+
+
+class Paginator(object):
+    """The state of an offset/limit pagination through the results of a query, shared by the sync and async page iterators
+
+    Args:
+        sizer (PageSizer): The sizer which decides the number of results to request per page
+        offset (int, optional): The offset of the first result
+        max_results (int, optional): The maximum number of results to read (all of them if not provided)
+    """
+
+    def __init__(self, sizer: PageSizer, offset: int = 0, max_results: Optional[int] = None):
+        self.sizer = sizer
+        self.offset = offset
+        self.remaining = max_results
+        self.total = None  # type: Optional[int]
+        self.started = False
+        self.done = False
+
+    def next_page(self) -> Optional[Tuple[int, int]]:
+        """Reserve the next page to request
+
+        Returns:
+            Tuple of the offset and limit of the next page, or None if there are no more pages
+        """
+        self.started = True
+        limit = self.sizer.page_size
+        if self.remaining is not None:
+            limit = min(limit, self.remaining)
+        if self.total is not None:
+            limit = min(limit, self.total - self.offset)
+        if self.done or limit <= 0:
+            self.done = True
+            return None
+        page = (self.offset, limit)
+        self.offset += limit
+        if self.remaining is not None:
+            self.remaining -= limit
+        return page
+
+    def page_received(self, page: Tuple[int, int], response: "request_response", elapsed: float) -> List[Any]:
+        """Process the response for a page
+
+        Args:
+            page (tuple): The offset and limit of the page (as returned by next_page)
+            response (dict): The response of the query for the page
+            elapsed (float): The number of seconds the page took to be received
+
+        Raises:
+            DragonchainServiceException: when the query was not successful
+            UnexpectedResponseException: when the response doesn't contain a list of results
+
+        Returns:
+            The results in the page
+        """
+        results, total = _parse_page(page, response)
+        if total is not None:
+            self.total = total
+        if len(results) < page[1]:
+            self.done = True
+        self.sizer.record(len(results), elapsed, codec.estimate_size(results))
+        return results
+
+    def remaining_pages(self) -> List[Tuple[int, int]]:
+        """Reserve every remaining page at the current page size. Must only be called once the total is known
+
+        Returns:
+            List of the offset and limit of each remaining page, in order
+        """
+        pages = []
+        page = self.next_page()
+        while page is not None:
+            pages.append(page)
+            page = self.next_page()
+        return pages
+
+    def check_page(self, page: Tuple[int, int], response: "request_response") -> List[Any]:
+        """Process the response for one of the remaining pages, which are fetched concurrently once the total is known
+
+        Args:
+            page (tuple): The offset and limit of the page (as returned by remaining_pages)
+            response (dict): The response of the query for the page
+
+        Raises:
+            DragonchainServiceException: when the query was not successful
+            UnexpectedResponseException: when the response doesn't contain a list of results
+            QueryResultsChanged: when the total changed, or the page isn't full, since the offsets of the results may have shifted
+
+        Returns:
+            The results in the page
+        """
+        results, total = _parse_page(page, response)
+        if total != self.total or len(results) != page[1]:
+            raise exceptions.QueryResultsChanged(
+                "Results of the query changed while fetching pages: expected {} results at offset {} of {}, but got {} of {}".format(
+                    page[1], page[0], self.total, len(results), total
+                )
+            )
+        return results
+
+
+def _parse_page(page: Tuple[int, int], response: "request_response") -> Tuple[List[Any], Optional[int]]:
+    """Get the results and total (if it has one) from the response for a page, raising if the query was not successful"""
+    body = cast(Any, response["response"])
+    if not response["ok"]:
+        raise exceptions.DragonchainServiceException(
+            "Query for page at offset {} failed with status {}: {}".format(page[0], response["status"], body)
+        )
+    results = body.get("results") if isinstance(body, dict) else None
+    if not isinstance(results, list):
+        raise exceptions.UnexpectedResponseException("Expected a list of results from the Dragonchain. Response: {}".format(body))
+    return results, _get_total(body)
+
+
+def _get_total(body: Dict[str, Any]) -> Optional[int]:
+    """Get the total number of results from the body of a query response, if it has one"""
+    total = body.get("total")
+    return total if isinstance(total, int) and not isinstance(total, bool) else None
+
+
+class PageIterator(object):
+    """Construct a new `PageIterator`, which iterates the results of a query across as many pages as it takes
+
+    While the results of one page are being iterated, the next page is fetched in the background (if prefetch is enabled), so
+    reading a large result set takes about one round trip per page less than requesting each page in turn. The size of each
+    page adapts to the observed size and latency of the pages before it.
+
+    Args:
+        fetch_page (callable): Function called with (offset, limit) which makes the query for a page
+        offset (int, optional): The offset of the first result (default 0)
+        max_results (int, optional): The maximum number of results to iterate (all of them if not provided)
+        page_size (int, optional): The number of results to request for the first page (default 100)
+        max_page_size (int, optional): The maximum number of results to request per page (default 1000)
+        prefetch (bool, optional): Whether to fetch the next page while the current page is iterated (default True)
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+
+    Returns:
+        A new PageIterator object.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int, int], Any],
+        offset: int = 0,
+        max_results: Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_page_size: int = DEFAULT_MAX_PAGE_SIZE,
+        prefetch: bool = True,
+    ):
+        if not isinstance(offset, int):
+            raise TypeError('Parameter "offset" must be of type int.')
+        if max_results is not None and not isinstance(max_results, int):
+            raise TypeError('Parameter "max_results" must be of type int.')
+        if not isinstance(prefetch, bool):
+            raise TypeError('Parameter "prefetch" must be of type bool.')
+        if offset < 0 or (max_results is not None and max_results < 0):
+            raise ValueError('Parameters "offset" and "max_results" must not be negative.')
+        self.fetch_page = fetch_page
+        self.paginator = Paginator(PageSizer(page_size, max_page_size), offset, max_results)
+        self.prefetch = prefetch
+
+    @property
+    def total(self) -> Optional[int]:
+        """The total number of results of the query (if the chain returned it, and a page has been received)"""
+        return self.paginator.total
+
+    def __iter__(self) -> Iterator[Any]:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        page = self.paginator.next_page()
+        future = self._start_fetch(executor, page)
+        try:
+            while page is not None:
+                response, elapsed = future.result() if future is not None else self._fetch(page)
+                results = self.paginator.page_received(page, response, elapsed)
+                page = self.paginator.next_page()
+                future = self._start_fetch(executor, page)
+                for result in results:
+                    yield result
+        finally:
+            if future is not None:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def fetch_all(self, concurrency: int = DEFAULT_FETCH_CONCURRENCY) -> List[Any]:
+        """Fetch every result at once, rather than iterating them
+
+        The first page is fetched on its own. Once it has reported the total number of results, the offsets of the remaining
+        pages are known, so they are fetched concurrently and reassembled in order. If the chain doesn't report a total, the
+        remaining pages are fetched one at a time instead.
+
+        Args:
+            concurrency (int, optional): Maximum number of pages to request at once (default 4)
+
+        Raises:
+            TypeError: with bad parameter types
+            ValueError: with bad parameter values, or if iteration has already started
+            DragonchainServiceException: when the query for a page was not successful
+            QueryResultsChanged: when the total number of results changed while the pages were being fetched
+
+        Returns:
+            List of every result, in order
+        """
+        _validate_fetch_all(self.paginator, concurrency)
+        page = self.paginator.next_page()
+        if page is None:
+            return []
+        results = self.paginator.page_received(page, *self._fetch(page))
+        if self.paginator.total is None:
+            results.extend(self)
+            return results
+        pages = self.paginator.remaining_pages()
+        if pages:
+            logger.debug("Fetching {} remaining pages with concurrency {}".format(len(pages), concurrency))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(self.fetch_page, *page) for page in pages]
+            try:
+                for page, future in zip(pages, futures):
+                    results.extend(self.paginator.check_page(page, future.result()))
+            finally:
+                for future in futures:
+                    future.cancel()
+        return results
+
+    def _start_fetch(
+        self, executor: Optional[concurrent.futures.ThreadPoolExecutor], page: Optional[Tuple[int, int]]
+    ) -> "Optional[concurrent.futures.Future[Tuple[request_response, float]]]":
+        """Start fetching a page in the background, if prefetching is enabled and there is a page to fetch"""
+        if executor is None or page is None:
+            return None
+        return executor.submit(self._fetch, page)
+
+    def _fetch(self, page: Tuple[int, int]) -> Tuple["request_response", float]:
+        """Fetch a page, timing how long it takes"""
+        start = time.monotonic()
+        response = self.fetch_page(*page)
+        return response, time.monotonic() - start
+
+
+def _validate_fetch_all(paginator: Paginator, concurrency: int) -> None:
+    """Validate the parameters for fetching every result of a query
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values, or if the pagination has already started
+    """
+    if not isinstance(concurrency, int):
+        raise TypeError('Parameter "concurrency" must be of type int.')
+    if concurrency < 1:
+        raise ValueError('Parameter "concurrency" must be at least 1.')
+    if paginator.started:
+        raise ValueError("fetch_all can't be used once iteration has started.")
+
+
+class RangeScan(object):
+    """The state of a keyset scan through the results of a query in order of a numeric field, shared by the sync and async scan iterators
+
+    Rather than skipping over every result before an offset, each page is queried with a range predicate which starts at the
+    value of the last result seen, so the cost of a page doesn't grow the further into the results it is. Since several results
+    can have the same value, and Redisearch doesn't return them in a stable order, each page is requested from the start of the
+    last value with room for the results already seen with that value as well as a full page of new ones, and those already seen
+    are dropped by id. If window is set, the range is split into windows of that size which are scanned in turn,
+    so that each query only has to sort the results within one window.
+
+    Args:
+        redisearch_query (str): Redisearch query syntax string to search with (a range predicate on key is added to it)
+        key (str): The field to scan by, either "block_id" or "timestamp"
+        id_field (str): The field in the header of each result which uniquely identifies it
+        start (int or float, optional): The lowest value of key to scan from (inclusive, the lowest value if not provided)
+        end (int or float, optional): The highest value of key to scan to (inclusive, the highest value if not provided)
+        ascending (bool, optional): Whether to scan in ascending order of key (default True)
+        page_size (int, optional): The number of results to request per page (default 100)
+        window (int or float, optional): The size of the range of key values to query at once (the whole range if not provided)
+        max_results (int, optional): The maximum number of results to scan (all of them if not provided)
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+    """
+
+    def __init__(
+        self,
+        redisearch_query: str,
+        key: str,
+        id_field: str,
+        start: Union[None, int, float] = None,
+        end: Union[None, int, float] = None,
+        ascending: bool = True,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        window: Union[None, int, float] = None,
+        max_results: Optional[int] = None,
+    ):
+        if not redisearch_query or not isinstance(redisearch_query, str):
+            raise TypeError('Parameter "redisearch_query" must be of type str.')
+        if key not in SCAN_KEYS:
+            raise ValueError('Parameter "key" must be one of {}.'.format(", ".join(SCAN_KEYS)))
+        for name, value in (("start", start), ("end", end), ("window", window)):
+            if value is not None and (not isinstance(value, (int, float)) or isinstance(value, bool)):
+                raise TypeError('Parameter "{}" must be of type int or float.'.format(name))
+        if not isinstance(ascending, bool):
+            raise TypeError('Parameter "ascending" must be of type bool.')
+        if not isinstance(page_size, int):
+            raise TypeError('Parameter "page_size" must be of type int.')
+        if max_results is not None and not isinstance(max_results, int):
+            raise TypeError('Parameter "max_results" must be of type int.')
+        if page_size < 1 or (window is not None and window <= 0) or (max_results is not None and max_results < 0):
+            raise ValueError('Parameters "page_size" and "window" must be positive, and "max_results" must not be negative.')
+        self.redisearch_query = redisearch_query
+        self.key = key
+        self.id_field = id_field
+        self.start = start
+        self.end = end
+        self.ascending = ascending
+        self.page_size = page_size
+        self.window = window
+        self.remaining = max_results
+        self.done = max_results == 0
+        self.cursor = None  # type: Union[None, int, float]
+        self.seen = set()  # type: Set[Any]
+        self._limit = page_size
+        self._range = None  # type: Optional[Tuple[Union[None, int, float], bool, Union[None, int, float], bool]]
+        self._last_window = False
+
+    def bound_query(self) -> Optional[Tuple[str, bool]]:
+        """The query for the first result past a bound which hasn't been provided, which must be known before the range can be split into windows
+
+        Returns:
+            Tuple of the query and whether to sort it in ascending order (to request with a limit of 1), or None if no bounds are missing
+        """
+        if self.window is None or self.done:
+            return None
+        if self.start is None:
+            return self._range_query(None, False, self.end, False), True
+        if self.end is None:
+            return self._range_query(self.start, False, None, False), False
+        return None
+
+    def bound_received(self, response: "request_response") -> None:
+        """Process the response for the query from bound_query
+
+        Args:
+            response (dict): The response of the query
+
+        Raises:
+            DragonchainServiceException: when the query was not successful
+            UnexpectedResponseException: when the response doesn't contain a list of results with the key
+        """
+        results = _parse_page((0, 1), response)[0]
+        if not results:
+            self.done = True
+        elif self.start is None:
+            self.start = self._get_value(results[0])
+        else:
+            self.end = self._get_value(results[0])
+
+    def next_query(self) -> Optional[Tuple[str, int]]:
+        """Build the query for the next page
+
+        Returns:
+            Tuple of the query and limit of the next page (to request from offset 0, sorted by key), or None if the scan is done
+        """
+        if not self.done and self._range is None:
+            self._start_window(self.start if self.ascending else self.end)
+        if self.done or self._range is None:
+            return None
+        low, low_exclusive, high, high_exclusive = self._range
+        if self.cursor is not None:
+            if self.ascending:
+                low, low_exclusive = self.cursor, False
+            else:
+                high, high_exclusive = self.cursor, False
+        # Results with the cursor value may come back in any order, so leave room for all of those already seen
+        self._limit = self.page_size + len(self.seen)
+        return self._range_query(low, low_exclusive, high, high_exclusive), self._limit
+
+    def page_received(self, response: "request_response") -> List[Any]:
+        """Process the response for the query from next_query
+
+        Args:
+            response (dict): The response of the query
+
+        Raises:
+            DragonchainServiceException: when the query was not successful
+            UnexpectedResponseException: when the response doesn't contain a list of results with the key and id
+            QueryResultsChanged: when a full page only contained results which were already seen, so the scan can't make progress
+
+        Returns:
+            The results in the page which weren't already seen
+        """
+        results = _parse_page((0, self._limit), response)[0]
+        new_results = []
+        for result in results:
+            value = self._get_value(result)
+            result_id = _get_header(result).get(self.id_field)
+            if value != self.cursor:
+                self.cursor = value
+                self.seen = set()
+            if result_id in self.seen:
+                continue
+            self.seen.add(result_id)
+            new_results.append(result)
+        if len(results) < self._limit:
+            self._next_window()
+        elif not new_results:
+            raise exceptions.QueryResultsChanged("Results of the query changed while scanning: a full page had no new results")
+        if self.remaining is not None:
+            new_results = new_results[: self.remaining]
+            self.remaining -= len(new_results)
+            self.done = self.done or self.remaining == 0
+        return new_results
+
+    def _start_window(self, edge: Union[None, int, float]) -> None:
+        """Start scanning the window which begins at edge (the lowest value when ascending, or the highest when descending)"""
+        self.cursor = None
+        self.seen = set()
+        if self.window is None:
+            self._range = (self.start, False, self.end, False)
+            self._last_window = True
+            return
+        start, end, edge = cast(float, self.start), cast(float, self.end), cast(float, edge)
+        if start > end:
+            self.done = True
+        elif self.ascending:
+            self._last_window = edge + self.window > end
+            self._range = (edge, False, end, False) if self._last_window else (edge, False, edge + self.window, True)
+        else:
+            self._last_window = edge - self.window < start
+            self._range = (start, False, edge, False) if self._last_window else (edge - self.window, True, edge, False)
+
+    def _next_window(self) -> None:
+        """Move on to the next window once the current one has been fully scanned"""
+        if self._last_window or self._range is None:
+            self.done = True
+        else:
+            self._start_window(self._range[2] if self.ascending else self._range[0])
+
+    def _range_query(self, low: Union[None, int, float], low_exclusive: bool, high: Union[None, int, float], high_exclusive: bool) -> str:
+        """Add a range predicate on key to the query"""
+        predicate = "@{}:[{}{} {}{}]".format(
+            self.key,
+            "(" if low_exclusive else "",
+            "-inf" if low is None else low,
+            "(" if high_exclusive else "",
+            "+inf" if high is None else high,
+        )
+        if self.redisearch_query.strip() == "*":
+            return predicate
+        return "({}) {}".format(self.redisearch_query, predicate)
+
+    def _get_value(self, result: Any) -> Union[int, float]:
+        """Get the (numeric) value of key from the header of a result (where it is usually a string)"""
+        value = _get_header(result).get(self.key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                try:
+                    return float(value)
+                except ValueError:
+                    pass
+        raise exceptions.UnexpectedResponseException("Expected a numeric {} in the header of each result. Result: {}".format(self.key, result))
+
+
+def _get_header(result: Any) -> Dict[str, Any]:
+    """Get the header of a result, which holds the fields it can be scanned by"""
+    header = result.get("header") if isinstance(result, dict) else None
+    if not isinstance(header, dict):
+        raise exceptions.UnexpectedResponseException("Expected a header in each result. Result: {}".format(result))
+    return header
+
+
+class RangeScanIterator(object):
+    """Construct a new `RangeScanIterator`, which iterates the results of a keyset scan (refer to RangeScan)
+
+    Each page depends on the last result of the page before it, so pages are requested one at a time.
+
+    Args:
+        fetch_page (callable): Function called with (redisearch_query, offset, limit, sort_ascending) which makes the query for a page,
+            sorted by the key of the scan
+        scan (RangeScan): The state of the scan
+
+    Returns:
+        A new RangeScanIterator object.
+    """
+
+    def __init__(self, fetch_page: Callable[[str, int, int, bool], Any], scan: RangeScan):
+        self.fetch_page = fetch_page
+        self.scan = scan
+
+    def __iter__(self) -> Iterator[Any]:
+        bound = self.scan.bound_query()
+        while bound is not None:
+            self.scan.bound_received(self.fetch_page(bound[0], 0, 1, bound[1]))
+            bound = self.scan.bound_query()
+        query = self.scan.next_query()
+        while query is not None:
+            for result in self.scan.page_received(self.fetch_page(query[0], 0, query[1], self.scan.ascending)):
+                yield result
+            query = self.scan.next_query()
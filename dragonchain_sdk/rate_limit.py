@@ -0,0 +1,140 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import threading
+from typing import Dict, Optional, Tuple
+
+
+class TokenBucket(object):
+    """Construct a new `TokenBucket`, which allows requests at a steady rate with bursts up to a given size
+
+    Tokens are reserved rather than waited for, so that the same bucket can be shared between threads and coroutines.
+    Every reservation returns how long the caller must wait before using its token, and the caller does the waiting.
+
+    Args:
+        rate (float): Number of tokens added to the bucket per second
+        burst (int, optional): Maximum number of tokens the bucket can hold (defaults to the rate, with a minimum of 1)
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+
+    Returns:
+        A new TokenBucket object.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if not isinstance(rate, (int, float)):
+            raise TypeError('Parameter "rate" must be of type float.')
+        if rate <= 0:
+            raise ValueError('Parameter "rate" must be greater than 0.')
+        if burst is None:
+            burst = max(1, int(rate))
+        if not isinstance(burst, int):
+            raise TypeError('Parameter "burst" must be of type int.')
+        if burst < 1:
+            raise ValueError('Parameter "burst" must be greater than 0.')
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token from the bucket, going into debt if it is empty
+
+        Returns:
+            Seconds the caller must wait before using the token (0 if one was available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def cancel(self) -> None:
+        """Give back a token which was reserved but won't be used"""
+        with self._lock:
+            self._tokens = min(float(self.burst), self._tokens + 1)
+
+
+class RateLimiter(object):
+    """Construct a new `RateLimiter`, which spaces out requests to stay under a budget for a whole client and for specific paths
+
+    A single RateLimiter can be given to several clients (sync or async) which point at the same chain,
+    so that the whole process stays under one budget.
+
+    Args:
+        rate (float, optional): Requests per second allowed across all paths (unlimited if not set)
+        burst (int, optional): Number of requests which can be made at once before the rate applies
+        path_rates (dict, optional): Additional limits for specific path templates, as a dictionary of
+            path template to (rate, burst), i.e. ``{"/v1/transaction": (10, 20)}``. A path template applies to that exact path,
+            and any path below it, regardless of query string. When multiple templates apply, the longest one is used
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+
+    Returns:
+        A new RateLimiter object.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None, path_rates: Optional[Dict[str, Tuple[float, int]]] = None):
+        if path_rates is None:
+            path_rates = {}
+        if not isinstance(path_rates, dict):
+            raise TypeError('Parameter "path_rates" must be of type dict.')
+        self.bucket = TokenBucket(rate, burst) if rate is not None else None
+        self.path_buckets = {}  # type: Dict[str, TokenBucket]
+        for template, (path_rate, path_burst) in path_rates.items():
+            if not isinstance(template, str) or not template.startswith("/"):
+                raise ValueError('Keys of parameter "path_rates" must be paths starting with "/".')
+            self.path_buckets[template.rstrip("/")] = TokenBucket(path_rate, path_burst)
+
+    def reserve(self, path: str) -> float:
+        """Reserve the right to make a request to a path
+
+        Args:
+            path (str): The path of the request (including query string if any)
+
+        Returns:
+            Seconds the caller must wait before making the request
+        """
+        delay = self.bucket.reserve() if self.bucket is not None else 0.0
+        path_bucket = self._get_path_bucket(path)
+        if path_bucket is not None:
+            delay = max(delay, path_bucket.reserve())
+        return delay
+
+    def cancel(self, path: str) -> None:
+        """Give back a reservation for a request to a path which won't be made
+
+        Args:
+            path (str): The path the reservation was made for
+        """
+        if self.bucket is not None:
+            self.bucket.cancel()
+        path_bucket = self._get_path_bucket(path)
+        if path_bucket is not None:
+            path_bucket.cancel()
+
+    def _get_path_bucket(self, path: str) -> Optional[TokenBucket]:
+        """Get the bucket of the longest path template which applies to a path"""
+        path = path.split("?", 1)[0].rstrip("/")
+        while path:
+            if path in self.path_buckets:
+                return self.path_buckets[path]
+            path = path.rsplit("/", 1)[0]
+        return None
@@ -9,36 +9,62 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+import copy
+import time
 import datetime
 import logging
-import json
+import threading
 import urllib.parse
-from typing import cast, Any, Callable, Optional, Dict, Tuple, TYPE_CHECKING
-
-import requests
-
+from typing import cast, Any, Callable, Iterable, Optional, Dict, List, Tuple, Union, TYPE_CHECKING
+
+from dragonchain_sdk import transports
+from dragonchain_sdk import timeouts
+from dragonchain_sdk import endpoint_pool
+from dragonchain_sdk import retry
+from dragonchain_sdk import rate_limit
+from dragonchain_sdk import codec
+from dragonchain_sdk import streaming
 from dragonchain_sdk import configuration
 from dragonchain_sdk import credentials
 from dragonchain_sdk import exceptions
 
 logger = logging.getLogger(__name__)
+# Logger for one compact record per request, which is only built when this logger is enabled for INFO
+access_logger = logging.getLogger("dragonchain_sdk.access")
 
 if TYPE_CHECKING:
-    import aiohttp  # noqa: F401 used by typing
+    import requests  # noqa: F401 used by typing
+    from dragonchain_sdk import async_helpers  # noqa: F401 used by typing
     from dragonchain_sdk.types import request_response
 
-supported_http = cast(
-    Dict[str, Callable[..., requests.Response]],
-    {
-        "GET": requests.get,
-        "POST": requests.post,
-        "PUT": requests.put,
-        "PATCH": requests.patch,
-        "DELETE": requests.delete,
-        "HEAD": requests.head,
-        "OPTIONS": requests.options,
-    },
-)
+supported_http = frozenset(["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"])
+
+# Defaults for the keep-alive connection pool of each Request object
+DEFAULT_POOL_CONNECTIONS = transports.DEFAULT_POOL_CONNECTIONS
+DEFAULT_POOL_MAXSIZE = transports.DEFAULT_POOL_MAXSIZE
+
+# Request used to check if an ejected endpoint is healthy again
+PROBE_PATH = "/v1/status"
+PROBE_TIMEOUT = timeouts.Timeout(connect=5.0, read=5.0)
+
+# Maximum number of bytes of a request body to include in debug logs
+MAX_LOGGED_BODY = 1024
+# Path segments which are kept in path templates (any other segment is treated as an ID)
+_STATIC_PATH_SEGMENT = re.compile(r"^(v[0-9]+|[a-z_-]+)$")
+
+
+def get_path_template(path: str) -> str:
+    """Get a low cardinality template of a request path for logging, i.e. /v1/transaction/{} for /v1/transaction/<id>
+
+    Args:
+        path (str): The path of a request (including query string if any)
+
+    Returns:
+        The path without its query string, and with any segment that looks like an ID replaced with {}
+    """
+    segments = path.split("?", 1)[0].split("/")
+    return "/".join(segment if not segment or _STATIC_PATH_SEGMENT.match(segment) else "{}" for segment in segments)
 
 
 class Request(object):
@@ -46,8 +72,15 @@ class Request(object):
 
     Args:
         credentials_obj (Credentials): The credentials for the chain to associate with requests
-        endpoint (str, optional): The URL for the endpoint of the chain
+        endpoint (str, list or EndpointPool, optional): The URL for the endpoint of the chain, or several endpoints to balance requests between
         verify (bool, optional): Boolean indicating whether to validate the SSL certificate of the endpoint when making requests
+        pool_connections (int, optional): The number of per-host connection pools to keep cached (for the default transport)
+        pool_maxsize (int, optional): The maximum number of keep-alive connections to keep open per host (for the default transport)
+        retry_policy (RetryPolicy, optional): The policy for retrying failed requests (defaults to retrying GET, HEAD and DELETE requests)
+        rate_limiter (RateLimiter, optional): A rate limiter (which may be shared with other clients) to space out requests with
+        json_codec (JsonCodec, optional): The codec to encode request bodies and decode responses with (defaults to the fastest available)
+        transport (Transport, optional): The HTTP stack to send requests with (defaults to a RequestsTransport)
+        timeout (float or Timeout, optional): The default timeout for requests (a single number is used for both the connect and read timeouts)
 
     Raises:
         TypeError: with bad parameter types
@@ -56,7 +89,19 @@ class Request(object):
         A new Request object.
     """
 
-    def __init__(self, credentials_obj: credentials.Credentials, endpoint: Optional[str] = None, verify: bool = True):
+    def __init__(
+        self,
+        credentials_obj: credentials.Credentials,
+        endpoint: Union[None, str, List[str], endpoint_pool.EndpointPool] = None,
+        verify: bool = True,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        retry_policy: Optional[retry.RetryPolicy] = None,
+        rate_limiter: Optional[rate_limit.RateLimiter] = None,
+        json_codec: Optional[codec.JsonCodec] = None,
+        transport: Optional[transports.Transport] = None,
+        timeout: Union[None, float, timeouts.Timeout] = None,
+    ):
         if isinstance(credentials_obj, credentials.Credentials):
             self.credentials = credentials_obj
         else:
@@ -68,16 +113,34 @@ class Request(object):
         else:
             raise TypeError('Parameter "verify" must be of type bool.')
 
+        if not isinstance(pool_connections, int):
+            raise TypeError('Parameter "pool_connections" must be of type int.')
+        if not isinstance(pool_maxsize, int):
+            raise TypeError('Parameter "pool_maxsize" must be of type int.')
+        if retry_policy is not None and not isinstance(retry_policy, retry.RetryPolicy):
+            raise TypeError('Parameter "retry_policy" must be of type RetryPolicy.')
+        if rate_limiter is not None and not isinstance(rate_limiter, rate_limit.RateLimiter):
+            raise TypeError('Parameter "rate_limiter" must be of type RateLimiter.')
+        if json_codec is not None and not isinstance(json_codec, codec.JsonCodec):
+            raise TypeError('Parameter "json_codec" must be of type JsonCodec.')
+        if transport is not None and not isinstance(transport, transports.Transport):
+            raise TypeError('Parameter "transport" must be of type Transport.')
+
+        self.timeout = timeouts.get_timeout(timeout)
+        self.deadline = None  # type: Optional[timeouts.Deadline]
+        self.retry_policy = retry_policy or retry.RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.json_codec = json_codec or codec.get_default_codec()
         self.update_endpoint(endpoint)
+        # The default transport keeps a persistent session, so that connections (and their TLS handshakes) are reused between requests
+        self.transport = transport or transports.RequestsTransport(pool_connections, pool_maxsize)
 
-        # This is assigned if/when creating an async client
-        self.session = cast("aiohttp.ClientSession", None)
-
-    def update_endpoint(self, endpoint: Optional[str] = None) -> None:
+    def update_endpoint(self, endpoint: Union[None, str, List[str], endpoint_pool.EndpointPool] = None) -> None:
         """Update endpoint for this request object
 
         Args:
-            endpoint (str, optional): Endpoint to set. Will auto-generate based on credentials dragonchain_id if not provided
+            endpoint (str, list or EndpointPool, optional): Endpoint to set, or several endpoints to balance requests between
+                (a list is balanced round robin). Will auto-generate based on credentials dragonchain_id if not provided
 
         Raises:
             TypeError: with bad parameter types
@@ -85,25 +148,102 @@ class Request(object):
         Returns:
             None, sets the endpoint of this Request instance
         """
+        self.endpoint_pool = None  # type: Optional[endpoint_pool.EndpointPool]
+        # A discovered endpoint may have been resolved by (and cached from) matchmaking, so it is invalidated if it can't be reached
+        self.discovered_endpoint = endpoint is None
+        self.endpoint_invalidated = False
         if endpoint is None:
             self.endpoint = configuration.get_endpoint(self.credentials.dragonchain_id)
         elif isinstance(endpoint, str):
             self.endpoint = endpoint
+        elif isinstance(endpoint, (list, endpoint_pool.EndpointPool)):
+            self.endpoint_pool = endpoint if isinstance(endpoint, endpoint_pool.EndpointPool) else endpoint_pool.EndpointPool(endpoint)
+            self.endpoint = self.endpoint_pool.urls[0]
         else:
-            raise TypeError('Parameter "endpoint" must be of type str.')
-        logger.info("Target endpoint updated to {}".format(self.endpoint))
+            raise TypeError('Parameter "endpoint" must be of type str, list or EndpointPool.')
+        logger.info("Target endpoint updated to {}".format(self.endpoint_pool.urls if self.endpoint_pool is not None else self.endpoint))
+
+    def with_options(self, timeout: Union[None, float, timeouts.Timeout] = None, deadline: Union[None, float, timeouts.Deadline] = None) -> "Request":
+        """Get a copy of this request object which makes its requests with a different timeout and/or deadline
+
+        The copy shares its transport (and therefore its connections) with this object
+
+        Args:
+            timeout (float or Timeout, optional): The timeout for requests (unchanged if not provided)
+            deadline (float or Deadline, optional): A deadline (or seconds from now) which every request must finish by (unchanged if not provided)
+
+        Raises:
+            TypeError: with bad parameter types
+
+        Returns:
+            A new Request object.
+        """
+        request = copy.copy(self)
+        if timeout is not None:
+            request.timeout = timeouts.get_timeout(timeout)
+        if deadline is not None:
+            request.deadline = timeouts.get_deadline(deadline)
+        return request
+
+    def close(self) -> None:
+        """Close any pooled connections held by this request object
+
+        Returns:
+            None, releases the underlying connection pool
+        """
+        self.transport.close()
+
+    def __enter__(self) -> "Request":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
 
-    def get(self, path: str, parse_response: bool = True) -> "request_response":
+    def get(self, path: str, parse_response: bool = True, raw: bool = False) -> "request_response":
         """Make a GET request to a chain
 
         Args:
             path (str): Path of the request (including any path query parameters)
             parse_response (bool, optional): Decides whether the return from the chain should be parsed as json (default True)
+            raw (bool, optional): Return the body of the response as bytes, exactly as it was received (overrides parse_response)
 
         Returns:
             The response of the GET operation.
         """
-        return self._make_request(http_verb="GET", path=path, verify=self.verify, parse_response=parse_response)
+        return self._make_request(http_verb="GET", path=path, verify=self.verify, parse_response=parse_response, raw=raw)
+
+    def get_stream(self, path: str) -> "request_response":
+        """Make a GET request to a chain, returning as soon as the headers of the response are received rather than reading the whole body
+
+        Args:
+            path (str): Path of the request (including any path query parameters)
+
+        Returns:
+            The response of the GET operation, where response is the StreamedTransportResponse, to iterate for the chunks of the body,
+            if the request succeeded (otherwise it is the parsed error from the chain, as usual). It must be read or closed once done with
+        """
+        return self._make_request(http_verb="GET", path=path, verify=self.verify, stream=True)
+
+    def get_results_stream(self, path: str, key: str = "results", fields: Optional[List[str]] = None) -> "request_response":
+        """Make a GET request to a chain, streaming the items of an array in its JSON response rather than reading the whole body first
+
+        Args:
+            path (str): Path of the request (including any path query parameters)
+            key (str, optional): The key of the array in the response to stream (default "results")
+            fields (list, optional): Dotted paths of the fields to keep from each item (i.e. ``["header.txn_id"]``), skipping everything else
+
+        Raises:
+            TypeError: with bad parameter types
+
+        Returns:
+            The response of the GET operation, where response is a ResultStream of the items if the request succeeded
+            (otherwise it is the parsed error from the chain, as usual)
+        """
+        parser = streaming.JsonArrayParser(self.json_codec, key, fields)
+        response = self._make_request(http_verb="GET", path=path, verify=self.verify, stream=True)
+        if response["ok"]:
+            response["response"] = streaming.ResultStream(cast(transports.StreamedTransportResponse, response["response"]), parser)
+        return response
 
     def post(self, path: str, body: Any, parse_response: bool = True, additional_headers: Optional[Dict[str, str]] = None) -> "request_response":
         """Make a POST request to a chain
@@ -122,6 +262,39 @@ class Request(object):
             http_verb="POST", path=path, verify=self.verify, json_content=body, parse_response=parse_response, additional_headers=additional_headers
         )
 
+    def post_encoded(self, path: str, content: bytes, parse_response: bool = True) -> "request_response":
+        """Make a POST request to a chain with a JSON body which has already been encoded (i.e. from items encoded with json_codec)
+
+        Args:
+            path (str): Path of the request (including any path query parameters)
+            content (bytes): The encoded JSON body to post, which is sent exactly as is
+            parse_response (bool, optional): Decides whether the return from the chain should be parsed as json (default True)
+
+        Returns:
+            The response of the POST operation.
+        """
+        return self._make_request(http_verb="POST", path=path, verify=self.verify, parse_response=parse_response, encoded_body=content)
+
+    def post_stream(
+        self, path: str, items: Iterable[Any], parse_response: bool = True, spool_size: int = streaming.DEFAULT_SPOOL_SIZE
+    ) -> "request_response":
+        """Make a POST request to a chain with a JSON array body which is encoded one item at a time
+
+        The body is spooled to a temporary file once it is larger than spool_size bytes, so posting a large array never needs
+        more than spool_size bytes of memory beyond the items themselves (which may be a generator)
+
+        Args:
+            path (str): Path of the request (including any path query parameters)
+            items (iterable): The JSON-encodable items of the array to post
+            parse_response (bool, optional): Decides whether the return from the chain should be parsed as json (default True)
+            spool_size (int, optional): Bytes of the body to keep in memory before spooling to a temporary file
+
+        Returns:
+            The response of the POST operation.
+        """
+        with streaming.encode_json_array(items, self.json_codec, self.credentials.hash_method, spool_size) as body:
+            return self._make_request(http_verb="POST", path=path, verify=self.verify, parse_response=parse_response, streamed_body=body)
+
     def put(self, path: str, body: Any, parse_response: bool = True) -> "request_response":
         """Make a PUT request to a chain
 
@@ -160,8 +333,8 @@ class Request(object):
         """
         return self._make_request(http_verb="DELETE", path=path, verify=self.verify, parse_response=parsed_response)
 
-    def get_requests_method(self, http_verb: str) -> Callable[..., requests.Response]:
-        """Get the appropriate requests method for a given http_verb
+    def get_requests_method(self, http_verb: str) -> Callable[..., "requests.Response"]:
+        """Get the appropriate pooled session method for a given http_verb
 
         Args:
             http_verb (str): the type of http request to make (GET, POST, etc)
@@ -171,14 +344,17 @@ class Request(object):
             ValueError: with bad parameter values
 
         Returns:
-            appropriate requests http method
+            appropriate http method of this object's requests session (or of the requests module when not using a RequestsTransport)
         """
         if not isinstance(http_verb, str):
             raise TypeError('Parameter "http_verb" must be of type str.')
-        request_method = supported_http.get(http_verb.upper())
-        if not request_method:
+        if http_verb.upper() not in supported_http:
             raise ValueError(http_verb + " is an unsupported http operation.")
-        return request_method
+        if isinstance(self.transport, transports.RequestsTransport):
+            return cast(Callable[..., "requests.Response"], getattr(self.transport.session, http_verb.lower()))
+        import requests
+
+        return cast(Callable[..., "requests.Response"], getattr(requests, http_verb.lower()))
 
     def generate_query_string(self, query_dict: Dict[str, str]) -> str:
         """Generate an http query string from a dictionary
@@ -229,8 +405,13 @@ class Request(object):
         return header_dict
 
     def _generate_request_data(
-        self, http_verb: str, path: str, json_content: Optional[Dict[Any, Any]] = None, additional_headers: Optional[Dict[str, str]] = None
-    ) -> Tuple[str, bytes, Dict[str, str]]:
+        self,
+        http_verb: str,
+        path: str,
+        json_content: Optional[Dict[Any, Any]] = None,
+        additional_headers: Optional[Dict[str, str]] = None,
+        body: Optional[Tuple[Union[bytes, streaming.SpooledBody], bytes]] = None,
+    ) -> Tuple[str, Union[bytes, streaming.SpooledBody], Dict[str, str]]:
         """Generate all of the data needed to pass into an http request to a dragonchain
 
         Args:
@@ -238,13 +419,14 @@ class Request(object):
             path (str): the full path to make the request (including query params if any) starting with a '/'
             json_content (dict, optional): dictionary object to send as json (automatically sets content-type to application/json)
             additional_headers (dict, optional): dictionary of additional headers to add to the request
+            body (tuple, optional): json_content already encoded, as a tuple of the encoded bytes (or a finished SpooledBody) and their hash
 
         Raises:
             TypeError: with bad parameter types
             ValueError: with bad parameter values
 
         Returns:
-            Tuple where index 0 is the full URL, index 1 is the bytes of the request body, and index 2 is a dictionary of headers
+            Tuple where index 0 is the full URL, index 1 is the bytes (or SpooledBody) of the request body, and index 2 is a dictionary of headers
         """
         if additional_headers is None:
             additional_headers = {}
@@ -253,24 +435,44 @@ class Request(object):
         if not path.startswith("/"):
             raise ValueError("Parameter \"path\" must start with a '/'.")
 
-        logger.debug("Creating request {} {}".format(http_verb, path))
-        if json_content:
+        content_hash = None  # type: Optional[bytes]
+        content = b""  # type: Union[bytes, streaming.SpooledBody]
+        if body is not None:
             content_type = "application/json"
-            content = json.dumps(json_content, separators=(",", ":")).encode("utf8")
+            content, content_hash = body
+        elif json_content:
+            content_type = "application/json"
+            content = self.json_codec.dumps(json_content)
         else:
             content_type = ""
-            content = b""
         # Add the 'Z' manually to indicate UTC (not added by isoformat)
         timestamp = datetime.datetime.utcnow().isoformat() + "Z"
-        authorization = self.credentials.get_authorization(http_verb, path, timestamp, content_type, content)
+        if isinstance(content, streaming.SpooledBody):
+            # Only the hash of the content is signed, and a streamed body is only ever read when it is sent
+            content.rewind()
+            authorization = self.credentials.get_authorization(http_verb, path, timestamp, content_type, b"", content_hash=content_hash)
+        elif content_hash is None:
+            authorization = self.credentials.get_authorization(http_verb, path, timestamp, content_type, content)
+        else:
+            authorization = self.credentials.get_authorization(http_verb, path, timestamp, content_type, content, content_hash=content_hash)
 
         header_dict = self._make_headers(timestamp, authorization, content_type)
+        if isinstance(content, streaming.SpooledBody):
+            # Send the length up front, rather than letting the HTTP library fall back to a chunked upload
+            header_dict["Content-Length"] = str(len(content))
         additional_headers.update(header_dict)
         full_url = self.endpoint + path
 
-        logger.debug("{} {}".format(http_verb, full_url))
-        logger.debug("Headers: {}".format(header_dict))
-        logger.debug("Data: {!r}".format(content))
+        # Only build the log messages when they will be emitted, since they copy headers and the (possibly large) body
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("{} {}".format(http_verb, full_url))
+            logger.debug("Headers: {}".format(header_dict))
+            if isinstance(content, streaming.SpooledBody):
+                logger.debug("Data: <streamed body> ({} bytes)".format(len(content)))
+            elif len(content) > MAX_LOGGED_BODY:
+                logger.debug("Data: {!r}... ({} bytes)".format(content[:MAX_LOGGED_BODY], len(content)))
+            else:
+                logger.debug("Data: {!r}".format(content))
         return full_url, content, additional_headers
 
     def _make_request(
@@ -278,10 +480,14 @@ class Request(object):
         http_verb: str,
         path: str,
         json_content: Optional[Dict[Any, Any]] = None,
-        timeout: int = 30,
+        timeout: Union[None, float, timeouts.Timeout] = None,
         verify: bool = True,
         parse_response: bool = True,
         additional_headers: Optional[Dict[str, str]] = None,
+        streamed_body: Optional[streaming.SpooledBody] = None,
+        stream: bool = False,
+        raw: bool = False,
+        encoded_body: Optional[bytes] = None,
     ) -> "request_response":
         """Make an http request to a dragonchain with the given information
 
@@ -289,13 +495,19 @@ class Request(object):
             http_verb (str): the type of http request to make (GET, POST, etc)
             path (str): the full path to make the request (including query params if any) starting with a '/'
             json_content (dict, optional): dictionary object to send as json (automatically sets content-type to application/json)
-            timeout (int, optional): the timeout to wait for the dragonchain to respond (defaults to 30 seconds if not set)
+            timeout (float or Timeout, optional): the timeout to wait for the dragonchain to respond (defaults to the timeout of this object)
             verify (bool, optional): specify if the SSL cert of the chain should be verified
             parse_response (bool, optional): if the return from the chain should be parsed as json
             additional_headers (dict, optional): dictionary of additional headers to add to the request
+            streamed_body (SpooledBody, optional): a finished JSON body to send instead of json_content
+            stream (bool, optional): return as soon as the headers of a successful response are received, with the StreamedTransportResponse
+                as the response, rather than reading and parsing the body (which the caller must then read or close)
+            raw (bool, optional): return the body of the response as bytes rather than parsing or decoding it
+            encoded_body (bytes, optional): a JSON body which has already been encoded, to send instead of json_content
 
         Raises:
-            ConnectionException: when unable to communicate with the dragonchain
+            ConnectionException: when unable to communicate with the dragonchain (after any retries allowed by the retry policy)
+            DeadlineExceeded: when the deadline of this object passes before the request could be completed
             UnexpectedResponseException: when the dragonchain responds with an unexpected payload
 
         Returns:
@@ -303,27 +515,256 @@ class Request(object):
             {
                 'status': int (http response code from chain)
                 'ok': boolean (if http response code is 200-299)
-                'response': dict if parse_response, else str (actual response body from chain)
+                'response': bytes if raw, dict if parse_response, else str (actual response body from chain)
             }
         """
-        full_url, content, header_dict = self._generate_request_data(
-            http_verb=http_verb, path=path, json_content=json_content, additional_headers=additional_headers
+        if self.endpoint_invalidated:
+            self.endpoint_invalidated = False
+            self._discover_endpoint_again()
+        request_timeout = self.timeout if timeout is None else timeouts.get_timeout(timeout)
+        started = time.monotonic()
+        body = None  # type: Optional[Tuple[Union[bytes, streaming.SpooledBody], bytes]]
+        if streamed_body is not None:
+            body = (streamed_body, cast(bytes, streamed_body.content_hash))
+        elif encoded_body is not None:
+            body = (encoded_body, credentials.hash_content(self.credentials.hash_method, encoded_body))
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                wait = self._get_rate_limit_wait(path)
+                if wait:
+                    logger.debug("Rate limited, waiting {} seconds".format(wait))
+                    time.sleep(wait)
+            attempt_timeout = self._get_attempt_timeout(request_timeout)
+            # The timestamp and signature are regenerated for every attempt
+            full_url, content, header_dict = self._generate_request_data(
+                http_verb=http_verb, path=path, json_content=json_content, additional_headers=additional_headers, body=body
+            )
+
+            # Make request with appropriate data
+            endpoint = None
+            try:
+                if http_verb.upper() not in supported_http:
+                    raise ValueError(http_verb + " is an unsupported http operation.")
+                endpoint, full_url = self._acquire_endpoint(full_url, path)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Making request. Verify SSL: {}, Timeout: {}".format(verify, attempt_timeout))
+                start = time.monotonic()
+                if stream:
+                    r = self.transport.send_stream(
+                        http_verb, full_url, content, header_dict, attempt_timeout, verify
+                    )  # type: Union[transports.TransportResponse, transports.StreamedTransportResponse]
+                else:
+                    r = self.transport.send(http_verb, full_url, content, header_dict, attempt_timeout, verify)
+            except Exception as e:
+                self._release_endpoint(endpoint, healthy=False)
+                delay = self._get_retry_delay(http_verb, attempt)
+                if delay is None:
+                    self._log_request(http_verb, path, None, content, b"", started, attempt)
+                    raise self._connection_exception(e)
+                logger.debug("Retrying request in {} seconds after error: {}".format(delay, e))
+                time.sleep(delay)
+                continue
+            self._release_endpoint(endpoint, time.monotonic() - start, r.status < 500)
+            delay = self._get_retry_delay(http_verb, attempt, r.status, r.headers.get("Retry-After"))
+            if delay is None:
+                if isinstance(r, transports.StreamedTransportResponse):
+                    # The size of a streamed response isn't known until the caller has read it
+                    self._log_request(http_verb, path, r.status, content, b"", started, attempt)
+                    return self._parse_stream_response(r, r.read() if r.status // 100 != 2 else None)
+                self._log_request(http_verb, path, r.status, content, r.body, started, attempt)
+                return self._parse_response(r, parse_response, raw)
+            if isinstance(r, transports.StreamedTransportResponse):
+                r.close()
+            logger.debug("Retrying request in {} seconds after status code {}".format(delay, r.status))
+            time.sleep(delay)
+
+    def _log_request(
+        self,
+        http_verb: str,
+        path: str,
+        status: Optional[int],
+        request_body: Union[bytes, streaming.SpooledBody],
+        response_body: bytes,
+        started: float,
+        attempts: int,
+    ) -> None:
+        """Emit one compact record for a finished request to the access logger, if it is enabled
+
+        The fields are also attached to the log record as attributes (http_verb, path_template, status, request_bytes,
+        response_bytes, latency and attempts), so that they can be output by a structured (i.e. JSON) formatter
+
+        Args:
+            http_verb (str): The HTTP verb of the request
+            path (str): The path of the request
+            status (int): The status code of the final response (None if no response was received)
+            request_body (bytes or SpooledBody): The body of the request
+            response_body (bytes): The body of the final response
+            started (float): time.monotonic when the request started (including any retries and waits)
+            attempts (int): Number of attempts made
+        """
+        if not access_logger.isEnabledFor(logging.INFO):
+            return
+        fields = {
+            "http_verb": http_verb,
+            "path_template": get_path_template(path),
+            "status": status,
+            "request_bytes": len(request_body),
+            "response_bytes": len(response_body),
+            "latency": time.monotonic() - started,
+            "attempts": attempts,
+        }  # type: Dict[str, Any]
+        access_logger.info(
+            "{} {} {} {}B/{}B {:.1f}ms".format(
+                http_verb,
+                fields["path_template"],
+                "-" if status is None else status,
+                fields["request_bytes"],
+                fields["response_bytes"],
+                fields["latency"] * 1000,
+            ),
+            extra=fields,
         )
 
-        # Make request with appropriate data
+    def _acquire_endpoint(self, full_url: str, path: str) -> Tuple[Optional[endpoint_pool.Endpoint], str]:
+        """Choose the endpoint for an attempt at a request from the endpoint pool (if any), and start probes of any ejected endpoints which are due
+
+        Args:
+            full_url (str): The full URL of the request for the endpoint of this object
+            path (str): The path of the request
+
+        Returns:
+            Tuple where index 0 is the chosen endpoint (None without an endpoint pool) and index 1 is the full URL to send the request to
+        """
+        if self.endpoint_pool is None:
+            return None, full_url
+        for ejected in self.endpoint_pool.take_due_probes():
+            self._start_probe(ejected)
+        endpoint = self.endpoint_pool.acquire()
+        return endpoint, endpoint.url + path
+
+    def _release_endpoint(self, endpoint: Optional[endpoint_pool.Endpoint], latency: Optional[float] = None, healthy: bool = True) -> None:
+        """Record the outcome of an attempt at a request with the endpoint pool (if the attempt used one)"""
+        if endpoint is not None:
+            cast(endpoint_pool.EndpointPool, self.endpoint_pool).release(endpoint, latency, healthy)
+
+    def _start_probe(self, endpoint: endpoint_pool.Endpoint) -> None:
+        """Probe an ejected endpoint in the background"""
+        threading.Thread(target=self._probe_endpoint, args=(endpoint,), daemon=True).start()
+
+    def _probe_endpoint(self, endpoint: endpoint_pool.Endpoint) -> None:
+        """Check if an ejected endpoint is healthy again with a status request, and report the result to the endpoint pool"""
+        healthy = False
         try:
-            requests_method = self.get_requests_method(http_verb)
-            logger.debug("Making request. Verify SSL: {}, Timeout: {}".format(verify, timeout))
-            r = requests_method(url=full_url, data=content, headers=header_dict, timeout=timeout, verify=verify)
+            _, content, header_dict = self._generate_request_data(http_verb="GET", path=PROBE_PATH)
+            r = self.transport.send("GET", endpoint.url + PROBE_PATH, content, header_dict, PROBE_TIMEOUT, self.verify)
+            healthy = r.status < 500
         except Exception as e:
-            raise exceptions.ConnectionException("Error while communicating with the Dragonchain: {}".format(e))
-        return_dict = {}
+            logger.debug("Probe of endpoint {} failed: {}".format(endpoint.url, e))
+        cast(endpoint_pool.EndpointPool, self.endpoint_pool).probe_finished(endpoint, healthy)
+
+    def _discover_endpoint_again(self) -> None:
+        """Discover the endpoint again after it couldn't be reached, continuing to use the old endpoint if that fails"""
+        try:
+            self.update_endpoint()
+        except exceptions.DragonchainException as e:
+            logger.warning("Failed to discover the endpoint again, continuing to use {}: {}".format(self.endpoint, e))
+
+    def _get_rate_limit_wait(self, path: str) -> float:
+        """Reserve the right to make a request from the rate limiter
+
+        Raises:
+            DeadlineExceeded: if the request would have to wait until after the deadline (the reservation is given back)
+
+        Returns:
+            Seconds to wait before making the request
+        """
+        rate_limiter = cast(rate_limit.RateLimiter, self.rate_limiter)
+        wait = rate_limiter.reserve(path)
+        if self.deadline is not None and wait >= self.deadline.remaining():
+            # The request won't be made, so its token shouldn't delay other requests sharing the rate limiter
+            rate_limiter.cancel(path)
+            raise exceptions.DeadlineExceeded("Deadline exceeded while waiting for the rate limiter")
+        return wait
+
+    def _get_attempt_timeout(self, timeout: timeouts.Timeout) -> timeouts.Timeout:
+        """Get the timeout for an attempt at a request, limited by the time remaining before the deadline (if any)
+
+        Raises:
+            DeadlineExceeded: if the deadline has already passed
+
+        Returns:
+            The timeout to give to the transport
+        """
+        if self.deadline is None:
+            return timeout
+        return timeout.clamp(self.deadline.check())
+
+    def _get_retry_delay(self, http_verb: str, attempt: int, status: Optional[int] = None, retry_after: Optional[str] = None) -> Optional[float]:
+        """Get the delay before retrying a request from the retry policy, unless the retry could not start before the deadline
+
+        Returns:
+            Seconds to wait before retrying, or None if the request should not be retried
+        """
+        delay = self.retry_policy.get_retry_delay(http_verb, attempt, status, retry_after)
+        if delay is not None and self.deadline is not None and delay >= self.deadline.remaining():
+            logger.debug("Not retrying request as the deadline would pass first")
+            return None
+        return delay
+
+    def _connection_exception(self, error: Exception) -> exceptions.ConnectionException:
+        """Get the exception to raise after failing to communicate with the chain"""
+        if self.deadline is not None and self.deadline.expired:
+            return exceptions.DeadlineExceeded("Deadline exceeded while communicating with the Dragonchain: {}".format(error))
+        if self.discovered_endpoint:
+            # Forget the endpoint, and discover it again before the next request
+            configuration.invalidate_endpoint(self.credentials.dragonchain_id, self.endpoint)
+            self.endpoint_invalidated = True
+        return exceptions.ConnectionException("Error while communicating with the Dragonchain: {}".format(error))
+
+    def _parse_response(self, r: transports.TransportResponse, parse_response: bool, raw: bool = False) -> "request_response":
+        """Build the response dictionary returned to callers from the raw response of a transport
+
+        Args:
+            r (TransportResponse): the response from the transport
+            parse_response (bool): if the body of the response should be parsed as json
+            raw (bool, optional): if the body of the response should be returned as is, without parsing or decoding it
+
+        Raises:
+            UnexpectedResponseException: when the body of the response can't be parsed
+
+        Returns:
+            Dictionary where status is the HTTP status code, response is the return body from the chain, and ok is a boolean if the status code was in the 2XX range
+        """
+        return_dict = {}  # type: Dict[str, Any]
         # Generate the return dictionary
         try:
-            return_dict["status"] = r.status_code
-            logger.debug("Response status code: {}".format(r.status_code))
-            return_dict["ok"] = r.status_code // 100 == 2
-            return_dict["response"] = r.json() if parse_response else r.text
+            return_dict["status"] = r.status
+            return_dict["ok"] = r.status // 100 == 2
+            if raw:
+                return_dict["response"] = r.body
+            else:
+                return_dict["response"] = self.json_codec.loads(r.body) if parse_response else r.text
             return cast("request_response", return_dict)
         except Exception as e:
             raise exceptions.UnexpectedResponseException("Unexpected response from Dragonchain. Response: {} | Error: {}".format(r.text, e))
+
+    def _parse_stream_response(
+        self, r: Union[transports.StreamedTransportResponse, "async_helpers.AsyncStreamedTransportResponse"], error_body: Optional[bytes]
+    ) -> "request_response":
+        """Build the response dictionary returned to callers from a streamed response of a transport
+
+        Args:
+            r (StreamedTransportResponse or AsyncStreamedTransportResponse): the response from the transport
+            error_body (bytes, optional): the body of the response, which has already been read if it was unsuccessful
+
+        Raises:
+            UnexpectedResponseException: when the body of an unsuccessful response can't be parsed
+
+        Returns:
+            Dictionary where response is the StreamedTransportResponse if the status code was in the 2XX range, otherwise the parsed body
+        """
+        if error_body is None:
+            return cast("request_response", {"status": r.status, "ok": True, "response": r})
+        return self._parse_response(transports.TransportResponse(r.status, error_body, r.headers), True)
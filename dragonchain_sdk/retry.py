@@ -0,0 +1,130 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import random
+import logging
+import email.utils
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Methods which can be safely repeated without creating duplicate resources on the chain
+DEFAULT_RETRY_METHODS = frozenset(["GET", "HEAD", "DELETE"])
+DEFAULT_RETRY_STATUSES = frozenset([429, 502, 503, 504])
+
+
+class RetryPolicy(object):
+    """Construct a new `RetryPolicy`, which decides if and when a failed request should be attempted again
+
+    Delays between attempts use exponential backoff with full jitter, so many clients failing at once don't retry in lockstep.
+    POST (and other non-idempotent methods) are not retried unless explicitly added to methods, as a retried
+    request whose response was lost could create a duplicate resource on the chain.
+
+    Args:
+        max_attempts (int, optional): Maximum number of attempts per request, including the first (1 disables retries)
+        backoff_base (float, optional): Seconds of backoff for the first retry, doubling with each subsequent retry
+        backoff_cap (float, optional): Maximum seconds to wait between attempts
+        statuses (iterable, optional): HTTP status codes which should be retried
+        methods (iterable, optional): HTTP verbs which are allowed to be retried (defaults to GET, HEAD and DELETE)
+        respect_retry_after (bool, optional): Whether to wait for the time given by a Retry-After response header when present.
+            If it asks for longer than backoff_cap, the response is returned rather than retried
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+
+    Returns:
+        A new RetryPolicy object.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.1,
+        backoff_cap: float = 10.0,
+        statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        methods: Iterable[str] = DEFAULT_RETRY_METHODS,
+        respect_retry_after: bool = True,
+    ):
+        if not isinstance(max_attempts, int):
+            raise TypeError('Parameter "max_attempts" must be of type int.')
+        if max_attempts < 1:
+            raise ValueError('Parameter "max_attempts" must be greater than 0.')
+        if not isinstance(backoff_base, (int, float)):
+            raise TypeError('Parameter "backoff_base" must be of type float.')
+        if not isinstance(backoff_cap, (int, float)):
+            raise TypeError('Parameter "backoff_cap" must be of type float.')
+        if backoff_base < 0 or backoff_cap < 0:
+            raise ValueError('Parameters "backoff_base" and "backoff_cap" must not be negative.')
+        if not isinstance(respect_retry_after, bool):
+            raise TypeError('Parameter "respect_retry_after" must be of type bool.')
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.respect_retry_after = respect_retry_after
+
+    def get_backoff(self, attempt: int) -> float:
+        """Get a randomized number of seconds to wait after a failed attempt
+
+        Args:
+            attempt (int): The number of the attempt which failed, starting at 1
+
+        Returns:
+            Seconds to wait, chosen uniformly between 0 and the capped exponential backoff for this attempt
+        """
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
+
+    def get_retry_delay(self, http_verb: str, attempt: int, status: Optional[int] = None, retry_after: Optional[str] = None) -> Optional[float]:
+        """Decide whether a request should be attempted again
+
+        Args:
+            http_verb (str): The HTTP verb of the request
+            attempt (int): The number of the attempt which just finished, starting at 1
+            status (int, optional): The status code of the response, or None if the request failed without a response
+            retry_after (str, optional): The value of the Retry-After header of the response, if any
+
+        Returns:
+            Seconds to wait before the next attempt, or None if the request should not be retried
+        """
+        if attempt >= self.max_attempts or http_verb.upper() not in self.methods:
+            return None
+        if status is not None and status not in self.statuses:
+            return None
+        if retry_after is not None and self.respect_retry_after:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                if delay > self.backoff_cap:
+                    logger.debug("Not retrying, Retry-After of {} seconds is longer than the backoff cap".format(delay))
+                    return None
+                return delay
+        return self.get_backoff(attempt)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _parse_retry_after(retry_after: str) -> Optional[float]:
+    """Parse the value of a Retry-After header, which can be either a number of seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (never negative), or None if the value could not be parsed
+    """
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    parsed = email.utils.parsedate_tz(retry_after)
+    if parsed is None:
+        return None
+    return max(0.0, email.utils.mktime_tz(parsed) - time.time())
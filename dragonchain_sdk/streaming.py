@@ -0,0 +1,478 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import base64
+import logging
+import tempfile
+from typing import cast, Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING  # noqa: F401 used by typing
+
+from dragonchain_sdk import codec
+from dragonchain_sdk import exceptions
+
+if TYPE_CHECKING:
+    from dragonchain_sdk import transports  # noqa: F401 used by typing
+
+logger = logging.getLogger(__name__)
+
+# Bodies are kept in memory up to this many bytes before being spooled to a temporary file
+DEFAULT_SPOOL_SIZE = 1024 * 1024
+# Encoded items are buffered into writes (and hash updates) of about this many bytes
+WRITE_SIZE = 64 * 1024
+
+
+class SpooledBody(object):
+    """Construct a new `SpooledBody`, a request body which is written incrementally and hashed as it is written
+
+    The body is kept in memory until it grows past spool_size bytes, after which it is moved to a temporary file, so the
+    memory used by a body doesn't grow with its size. Once finished, it is read like a file, and must be rewound before
+    each time it is sent.
+
+    Args:
+        hash_method (callable): The hashlib constructor to hash the body with (i.e. the hash_method of the credentials signing it)
+        spool_size (int, optional): Bytes to keep in memory before spooling to a temporary file
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        A new SpooledBody object.
+    """
+
+    def __init__(self, hash_method: Callable[..., Any], spool_size: int = DEFAULT_SPOOL_SIZE):
+        if not isinstance(spool_size, int):
+            raise TypeError('Parameter "spool_size" must be of type int.')
+        self.file = tempfile.SpooledTemporaryFile(max_size=spool_size)
+        self.size = 0
+        self.content_hash = None  # type: Optional[bytes]
+        self._hasher = hash_method()
+
+    def write(self, data: bytes) -> None:
+        """Append data to the body
+
+        Args:
+            data (bytes): The data to append
+        """
+        self.file.write(data)
+        self._hasher.update(data)
+        self.size += len(data)
+
+    def finish(self) -> None:
+        """Finish writing the body, computing its content_hash and rewinding it for reading"""
+        self.content_hash = base64.b64encode(self._hasher.digest())
+        self.rewind()
+
+    def rewind(self) -> None:
+        """Seek back to the start of the body, so that it can be sent (again)"""
+        self.file.seek(0)
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the body
+
+        Args:
+            size (int, optional): The maximum number of bytes to read (everything remaining if negative)
+
+        Returns:
+            The bytes read, which is empty at the end of the body
+        """
+        return self.file.read(size)
+
+    def close(self) -> None:
+        """Close the body, deleting its temporary file if it has one"""
+        self.file.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            data = self.read(WRITE_SIZE)
+            if not data:
+                return
+            yield data
+
+    def __enter__(self) -> "SpooledBody":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def encode_json_array(
+    items: Iterable[Any], json_codec: codec.JsonCodec, hash_method: Callable[..., Any], spool_size: int = DEFAULT_SPOOL_SIZE
+) -> SpooledBody:
+    """Encode items as a JSON array one at a time into a SpooledBody
+
+    The result is byte for byte identical to encoding a list of the items with json_codec (which must encode compactly),
+    but neither the list nor its full encoding is ever held in memory.
+
+    Args:
+        items (iterable): The JSON-encodable items of the array, which may be a generator
+        json_codec (JsonCodec): The codec to encode each item with
+        hash_method (callable): The hashlib constructor to hash the body with
+        spool_size (int, optional): Bytes to keep in memory before spooling to a temporary file
+
+    Returns:
+        The finished SpooledBody
+    """
+    body = SpooledBody(hash_method, spool_size)
+    try:
+        buffer = bytearray(b"[")
+        first = True
+        for item in items:
+            if not first:
+                buffer += b","
+            first = False
+            buffer += json_codec.dumps(item)
+            if len(buffer) >= WRITE_SIZE:
+                body.write(bytes(buffer))
+                buffer = bytearray()
+        buffer += b"]"
+        body.write(bytes(buffer))
+    except BaseException:
+        body.close()
+        raise
+    body.finish()
+    return body
+
+
+# Strings (which may contain any other token) and structural characters. A lone quote is a string which hasn't been fully received yet
+_JSON_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|["{}\[\]:,]', re.DOTALL)
+_QUOTE, _OPEN_OBJECT, _CLOSE_OBJECT, _OPEN_ARRAY, _CLOSE_ARRAY, _COLON, _COMMA = b'"{}[]:,'
+
+
+def get_projection(fields: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+    """Build the tree of fields to keep from a list of dotted field paths
+
+    Args:
+        fields (list, optional): Paths of the fields to keep, with nested fields separated by dots (i.e. ``["header.txn_id", "payload"]``)
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        Dictionary where each key is a field to keep, and each value is None to keep the whole field, or the tree of its fields to keep
+    """
+    if fields is None:
+        return None
+    if not isinstance(fields, list) or not all(isinstance(field, str) for field in fields):
+        raise TypeError('Parameter "fields" must be of type list of str.')
+    tree = {}  # type: Dict[str, Any]
+    for field in fields:
+        node = tree
+        *parents, name = field.split(".")
+        for parent in parents:
+            if parent in node and node[parent] is None:
+                break  # The whole parent is already kept
+            node = node.setdefault(parent, {})
+        else:
+            node[name] = None
+    return tree
+
+
+class JsonArrayParser(object):
+    """Construct a new `JsonArrayParser`, which incrementally parses the items of an array in a JSON object as its bytes are received
+
+    Each item is decoded as soon as it is complete, and its bytes discarded, so memory use only depends on the size of the
+    largest item, not on the number of items. Every other member of the object is decoded as a whole once complete.
+
+    Args:
+        json_codec (JsonCodec): The codec to decode items and members with
+        key (str, optional): The key of the array in the object (default "results")
+        fields (list, optional): Dotted paths of the fields to keep from each item (which must be objects). Other fields are skipped
+            over without being decoded. By default every item is decoded in full
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        A new JsonArrayParser object.
+    """
+
+    def __init__(self, json_codec: codec.JsonCodec, key: str = "results", fields: Optional[List[str]] = None):
+        if not isinstance(key, str):
+            raise TypeError('Parameter "key" must be of type str.')
+        self.json_codec = json_codec
+        self.key = key
+        self.projection = get_projection(fields)
+        self.members = {}  # type: Dict[str, Any]
+        self._buffer = bytearray()
+        self._position = 0
+        self._depth = 0
+        self._finished = False
+        self._expect_key = False
+        self._member_key = None  # type: Optional[str]
+        # Offsets into the buffer where the current member value and array item started (if one is in progress)
+        self._value_start = None  # type: Optional[int]
+        self._item_start = None  # type: Optional[int]
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Parse the next bytes of the object
+
+        Args:
+            data (bytes): The bytes received
+
+        Raises:
+            UnexpectedResponseException: if the bytes aren't a JSON object
+
+        Returns:
+            List of the items of the array which were completed by these bytes
+        """
+        buffer = self._buffer
+        buffer += data
+        items = []  # type: List[Any]
+        for match in _JSON_TOKEN.finditer(buffer, self._position):
+            start, end = match.span()
+            token = buffer[start]
+            if token == _QUOTE and end - start == 1:
+                # The rest of the string hasn't been received yet, so scan it again next time
+                self._position = start
+                break
+            self._position = end
+            if self._finished:
+                raise exceptions.UnexpectedResponseException("Unexpected data after the end of the JSON response")
+            if self._depth == 0:
+                if token != _OPEN_OBJECT:
+                    raise exceptions.UnexpectedResponseException("Expected the JSON response to be an object")
+                self._depth = 1
+                self._expect_key = True
+            elif self._depth == 1:
+                self._parse_member_token(token, start, end)
+            elif token == _OPEN_OBJECT or token == _OPEN_ARRAY:
+                self._depth += 1
+            elif token == _CLOSE_OBJECT or token == _CLOSE_ARRAY:
+                self._depth -= 1
+                if self._depth == 1 and self._item_start is not None:
+                    # The end of the array
+                    self._finish_item(start, items)
+                    self._item_start = None
+            elif token == _COMMA and self._depth == 2 and self._item_start is not None:
+                self._finish_item(start, items)
+                self._item_start = end
+        self._discard_parsed()
+        return items
+
+    def close(self) -> Dict[str, Any]:
+        """Finish parsing once every byte has been received
+
+        Raises:
+            UnexpectedResponseException: if the object is incomplete
+
+        Returns:
+            Dictionary of the members of the object other than the array
+        """
+        if not self._finished:
+            raise exceptions.UnexpectedResponseException("The JSON response ended unexpectedly")
+        return self.members
+
+    def decode_item(self, data: bytes) -> Any:
+        """Decode a single complete item, keeping only the projected fields
+
+        Args:
+            data (bytes): The JSON of the item
+
+        Returns:
+            The decoded item
+        """
+        if self.projection is None:
+            return self.json_codec.loads(data)
+        return self._project(data, self.projection)
+
+    def _parse_member_token(self, token: int, start: int, end: int) -> None:
+        """Handle a token directly in the object (outside of any member values)"""
+        if token == _QUOTE:
+            if self._expect_key:
+                self._member_key = self.json_codec.loads(bytes(self._buffer[start:end]))
+                self._expect_key = False
+        elif token == _COLON:
+            self._value_start = end
+        elif token == _OPEN_ARRAY and self._member_key == self.key and not self._buffer[cast(int, self._value_start) : start].strip():
+            self._depth = 2
+            self._item_start = end
+            self._value_start = None
+        elif token == _OPEN_OBJECT or token == _OPEN_ARRAY:
+            self._depth += 1
+        elif token == _COMMA or token == _CLOSE_OBJECT:
+            if self._value_start is not None:
+                self.members[cast(str, self._member_key)] = self.json_codec.loads(bytes(self._buffer[self._value_start : start]))
+                self._value_start = None
+            self._expect_key = True
+            if token == _CLOSE_OBJECT:
+                self._depth = 0
+                self._finished = True
+        else:
+            raise exceptions.UnexpectedResponseException("Unexpected character in the JSON response")
+
+    def _finish_item(self, end: int, items: List[Any]) -> None:
+        """Decode the array item which ends at an offset in the buffer"""
+        data = bytes(self._buffer[cast(int, self._item_start) : end])
+        if data.strip():
+            items.append(self.decode_item(data))
+
+    def _discard_parsed(self) -> None:
+        """Remove the bytes which are no longer needed from the start of the buffer"""
+        keep = min(offset for offset in (self._position, self._value_start, self._item_start) if offset is not None)
+        if keep:
+            del self._buffer[:keep]
+            self._position -= keep
+            if self._value_start is not None:
+                self._value_start -= keep
+            if self._item_start is not None:
+                self._item_start -= keep
+
+    def _project(self, data: bytes, projection: Dict[str, Any]) -> Any:
+        """Decode only the projected fields of an object (anything other than an object is decoded in full)"""
+        if not data.lstrip().startswith(b"{"):
+            return self.json_codec.loads(data)
+        result = {}
+        for key, value in _iter_members(data, self.json_codec):
+            if key in projection:
+                subprojection = projection[key]
+                result[key] = self.json_codec.loads(value) if subprojection is None else self._project(value, subprojection)
+        return result
+
+
+def _iter_members(data: bytes, json_codec: codec.JsonCodec) -> Iterator[Tuple[str, bytes]]:
+    """Split a complete JSON object into the keys and (still encoded) values of its members"""
+    depth = 0
+    expect_key = False
+    key = ""
+    value_start = 0
+    for match in _JSON_TOKEN.finditer(data):
+        start, end = match.span()
+        token = data[start]
+        if token == _OPEN_OBJECT or token == _OPEN_ARRAY:
+            depth += 1
+            expect_key = depth == 1
+        elif depth != 1:
+            if token == _CLOSE_OBJECT or token == _CLOSE_ARRAY:
+                depth -= 1
+        elif token == _QUOTE and expect_key:
+            key = json_codec.loads(data[start:end])
+            expect_key = False
+        elif token == _COLON:
+            value_start = end
+        elif token == _COMMA or token == _CLOSE_OBJECT:
+            if not expect_key:
+                yield key, data[value_start:start]
+            expect_key = True
+            if token == _CLOSE_OBJECT:
+                return
+    raise exceptions.UnexpectedResponseException("Incomplete JSON object in the response")
+
+
+class ResultStream(object):
+    """Construct a new `ResultStream`, which yields the items of an array in a JSON response as they are received
+
+    The stream can only be iterated once, and holds a connection until it has been fully iterated or closed.
+    Once fully iterated, the other members of the response (i.e. ``total``) are available from ``members``.
+
+    Args:
+        response (StreamedTransportResponse): The response to read
+        parser (JsonArrayParser): The parser for the body of the response
+
+    Returns:
+        A new ResultStream object.
+    """
+
+    def __init__(self, response: "transports.StreamedTransportResponse", parser: JsonArrayParser):
+        self.response = response
+        self.parser = parser
+
+    @property
+    def members(self) -> Dict[str, Any]:
+        """The members of the response other than the array (only complete once the stream has been fully iterated)"""
+        return self.parser.members
+
+    @property
+    def total(self) -> Optional[int]:
+        """The total number of results of the query (if the chain returned it, and it has been received)"""
+        return self.parser.members.get("total")
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            while True:
+                chunk = self.response.read_chunk()
+                if not chunk:
+                    self.parser.close()
+                    return
+                for item in self.parser.feed(chunk):
+                    yield item
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the connection of the response, abandoning any items which haven't been read yet"""
+        self.response.close()
+
+    def __enter__(self) -> "ResultStream":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class Download(object):
+    """Construct a new `Download`, the destination that a streamed response body is written to one chunk at a time
+
+    When the destination is a path, the body is written to a temporary file next to it, which only replaces the path once the
+    whole body has been written, so an interrupted download never leaves a partial file behind. A file-like object is written
+    to as is, and is left open.
+
+    Args:
+        destination (str or file-like): The path of the file to write, or a writable binary file-like object
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        A new Download object, to be used with ``with``
+    """
+
+    def __init__(self, destination: Union[str, BinaryIO]):
+        if not isinstance(destination, str) and not callable(getattr(destination, "write", None)):
+            raise TypeError('Parameter "destination" must be of type str or a writable file-like object.')
+        self.destination = destination
+        self.size = 0
+        self._file = None  # type: Optional[BinaryIO]
+        self._temp_path = None  # type: Optional[str]
+
+    def __enter__(self) -> "Download":
+        if isinstance(self.destination, str):
+            directory, name = os.path.split(os.path.abspath(self.destination))
+            fd, self._temp_path = tempfile.mkstemp(dir=directory, prefix=".{}.".format(name))
+            self._file = cast(BinaryIO, os.fdopen(fd, "wb"))
+        else:
+            self._file = self.destination
+        return self
+
+    def write(self, chunk: bytes) -> None:
+        """Write the next chunk of the body
+
+        Args:
+            chunk (bytes): The chunk to write
+        """
+        cast(BinaryIO, self._file).write(chunk)
+        self.size += len(chunk)
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        if self._temp_path is None:
+            return
+        temp_path = self._temp_path
+        self._temp_path = None
+        try:
+            cast(BinaryIO, self._file).close()
+            if exc_type is None:
+                os.replace(temp_path, cast(str, self.destination))
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,160 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Any, Optional, Union
+
+from dragonchain_sdk import exceptions
+
+# These match the single 30 second timeout which was previously used for both connecting and reading
+DEFAULT_CONNECT_TIMEOUT = 30.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+
+class Timeout(object):
+    """Construct a new `Timeout`, with separate limits for connecting to a chain and for waiting on its response
+
+    Args:
+        connect (float, optional): Seconds to wait for a connection to be established (None to wait forever)
+        read (float, optional): Seconds to wait for the chain to send data after connecting (None to wait forever)
+        total (float, optional): Seconds allowed for the entire request. This is set automatically when a deadline applies,
+            and is enforced by every transport except the RequestsTransport (which only enforces the connect and read timeouts)
+
+    Raises:
+        TypeError: with bad parameter types
+        ValueError: with bad parameter values
+
+    Returns:
+        A new Timeout object.
+    """
+
+    def __init__(
+        self, connect: Optional[float] = DEFAULT_CONNECT_TIMEOUT, read: Optional[float] = DEFAULT_READ_TIMEOUT, total: Optional[float] = None
+    ):
+        for name, value in (("connect", connect), ("read", read), ("total", total)):
+            if value is not None and not isinstance(value, (int, float)):
+                raise TypeError('Parameter "{}" must be of type float.'.format(name))
+            if value is not None and value < 0:
+                raise ValueError('Parameter "{}" must not be negative.'.format(name))
+        self.connect = connect
+        self.read = read
+        self.total = total
+
+    def clamp(self, limit: float) -> "Timeout":
+        """Get a copy of this timeout where no part of the request can take longer than a limit
+
+        Args:
+            limit (float): Maximum seconds for the request
+
+        Returns:
+            A new Timeout object.
+        """
+        return Timeout(_min(self.connect, limit), _min(self.read, limit), _min(self.total, limit))
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Timeout) and (self.connect, self.read, self.total) == (other.connect, other.read, other.total)
+
+    def __repr__(self) -> str:
+        return "Timeout(connect={}, read={}, total={})".format(self.connect, self.read, self.total)
+
+
+class Deadline(object):
+    """Construct a new `Deadline`, a latency budget shared by every request made on behalf of one operation
+
+    Each request made before the deadline has its timeouts limited to the time remaining, retries are not attempted if they
+    could not start before the deadline, and requests made after the deadline fail immediately with ``DeadlineExceeded``.
+
+    Args:
+        seconds (float): Seconds from now until the deadline
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        A new Deadline object.
+    """
+
+    def __init__(self, seconds: float):
+        if not isinstance(seconds, (int, float)):
+            raise TypeError('Parameter "seconds" must be of type float.')
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Get the time remaining before the deadline
+
+        Returns:
+            Seconds until the deadline (0 if it has passed)
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed"""
+        return self.remaining() <= 0
+
+    def check(self) -> float:
+        """Check that the deadline has not passed
+
+        Raises:
+            DeadlineExceeded: if the deadline has passed
+
+        Returns:
+            Seconds until the deadline
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise exceptions.DeadlineExceeded("Deadline exceeded")
+        return remaining
+
+
+def get_timeout(timeout: Union[None, float, Timeout]) -> Timeout:
+    """Get a Timeout object from a timeout parameter
+
+    Args:
+        timeout (float or Timeout, optional): A Timeout, or a number of seconds to use for both the connect and read timeouts
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        The Timeout (the defaults if timeout is None)
+    """
+    if timeout is None:
+        return Timeout()
+    if isinstance(timeout, Timeout):
+        return timeout
+    if isinstance(timeout, (int, float)):
+        return Timeout(timeout, timeout)
+    raise TypeError('Parameter "timeout" must be of type Timeout or float.')
+
+
+def get_deadline(deadline: Union[None, float, Deadline]) -> Optional[Deadline]:
+    """Get a Deadline object from a deadline parameter
+
+    Args:
+        deadline (float or Deadline, optional): A Deadline, or a number of seconds from now
+
+    Raises:
+        TypeError: with bad parameter types
+
+    Returns:
+        The Deadline, or None if deadline is None
+    """
+    if deadline is None or isinstance(deadline, Deadline):
+        return deadline
+    if isinstance(deadline, (int, float)):
+        return Deadline(deadline)
+    raise TypeError('Parameter "deadline" must be of type Deadline or float.')
+
+
+def _min(value: Optional[float], limit: float) -> float:
+    """Get the smaller of an optional value and a limit"""
+    return limit if value is None else min(value, limit)
@@ -0,0 +1,365 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Union, TYPE_CHECKING  # noqa: F401 used by typing
+
+from dragonchain_sdk import timeouts
+from dragonchain_sdk import streaming
+
+logger = logging.getLogger(__name__)
+
+# The HTTP libraries are only imported when a transport which uses them is created, so that importing the SDK stays fast
+if TYPE_CHECKING:
+    import urllib3  # noqa: F401 used by typing
+
+# Defaults for the keep-alive connection pool of each transport
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+# Bytes to read at a time from a streamed response
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class TransportResponse(object):
+    """The raw response to a request sent by a transport
+
+    Args:
+        status (int): The HTTP status code of the response
+        body (bytes): The raw body of the response
+        headers (dict, optional): The headers of the response (should be case-insensitive if possible)
+    """
+
+    def __init__(self, status: int, body: bytes, headers: Optional[Mapping[str, str]] = None):
+        self.status = status
+        self.body = body
+        self.headers = headers if headers is not None else {}
+
+    @property
+    def text(self) -> str:
+        """The body of the response decoded as text"""
+        return self.body.decode("utf8", errors="replace")
+
+
+class StreamedTransportResponse(object):
+    """The response to a request sent by a transport, whose body is read incrementally rather than all at once
+
+    Iterating the response yields the non-empty chunks of the body, and releases the connection once they have all been read.
+
+    Args:
+        status (int): The HTTP status code of the response
+        chunks (iterable): The chunks of the raw body of the response, as they are received
+        headers (dict, optional): The headers of the response (should be case-insensitive if possible)
+        release (callable, optional): Function to call to release the connection once the body is read (or abandoned)
+    """
+
+    def __init__(
+        self, status: int, chunks: Iterable[bytes], headers: Optional[Mapping[str, str]] = None, release: Optional[Callable[[], Any]] = None
+    ):
+        self.status = status
+        self.headers = headers if headers is not None else {}
+        self._chunks = iter(chunks)
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            while True:
+                chunk = self.read_chunk()
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            self.close()
+
+    def read_chunk(self) -> bytes:
+        """Read the next chunk of the body
+
+        Returns:
+            The next non-empty chunk, or empty bytes at the end of the body
+        """
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+    def read(self) -> bytes:
+        """Read the rest of the body and release the connection
+
+        Returns:
+            The remaining bytes of the body
+        """
+        try:
+            return b"".join(self._chunks)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the connection of the response (safe to call more than once)"""
+        if self._release is not None:
+            release = self._release
+            self._release = None
+            release()
+
+    def __enter__(self) -> "StreamedTransportResponse":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class Transport(object):
+    """Base class for the HTTP stack used to send requests which have already been signed
+
+    A transport only has to send exactly what it is given and return the status, headers and raw body of the response.
+    Any exception raised by ``send`` is treated as a failure to communicate with the chain.
+    """
+
+    def send(
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> TransportResponse:
+        """Send a request
+
+        Args:
+            http_verb (str): The HTTP verb of the request
+            full_url (str): The full URL to send the request to
+            body (bytes or SpooledBody): The body of the request. A SpooledBody is a rewound file-like object, with its length in the headers
+            headers (dict): The headers of the request (including authorization)
+            timeout (Timeout): The connect, read and total timeouts for the request
+            verify (bool): Whether to verify the TLS certificate of the endpoint
+
+        Returns:
+            The response from the chain
+        """
+        raise NotImplementedError
+
+    def send_stream(
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> StreamedTransportResponse:
+        """Send a request, returning as soon as the headers of the response are received, so that the body can be read incrementally
+
+        Transports which can't stream fall back to this implementation, which reads the whole body with ``send``
+
+        Args:
+            Refer to send for arguments
+
+        Returns:
+            The response from the chain, which must be read or closed to release its connection
+        """
+        r = self.send(http_verb, full_url, body, headers, timeout, verify)
+        return StreamedTransportResponse(r.status, [r.body], r.headers)
+
+    def close(self) -> None:
+        """Release any connections held by this transport"""
+        pass
+
+
+class RequestsTransport(Transport):
+    """Transport which sends requests with a keep-alive ``requests`` session
+
+    Args:
+        pool_connections (int, optional): The number of per-host connection pools to keep cached
+        pool_maxsize (int, optional): The maximum number of keep-alive connections to keep open per host
+    """
+
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE):
+        if not isinstance(pool_connections, int):
+            raise TypeError('Parameter "pool_connections" must be of type int.')
+        if not isinstance(pool_maxsize, int):
+            raise TypeError('Parameter "pool_maxsize" must be of type int.')
+        import requests
+        import requests.adapters
+
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def send(
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> TransportResponse:
+        r = self.session.request(http_verb, full_url, data=body, headers=headers, timeout=(timeout.connect, timeout.read), verify=verify)
+        return TransportResponse(r.status_code, r.content, r.headers)
+
+    def send_stream(
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> StreamedTransportResponse:
+        r = self.session.request(http_verb, full_url, data=body, headers=headers, timeout=(timeout.connect, timeout.read), verify=verify, stream=True)
+        return StreamedTransportResponse(r.status_code, r.iter_content(STREAM_CHUNK_SIZE), r.headers, r.close)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Urllib3Transport(Transport):
+    """Transport which sends requests directly with urllib3, skipping the overhead of ``requests``
+
+    Args:
+        pool_connections (int, optional): The number of per-host connection pools to keep cached
+        pool_maxsize (int, optional): The maximum number of keep-alive connections to keep open per host
+    """
+
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE):
+        if not isinstance(pool_connections, int):
+            raise TypeError('Parameter "pool_connections" must be of type int.')
+        if not isinstance(pool_maxsize, int):
+            raise TypeError('Parameter "pool_maxsize" must be of type int.')
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        # Certificate verification is configured per pool manager, so keep one for each setting
+        self.pool_managers = {}  # type: Dict[bool, urllib3.PoolManager]
+
+    def get_pool_manager(self, verify: bool) -> "urllib3.PoolManager":
+        """Get the urllib3 pool manager for a certificate verification setting, creating it if it doesn't exist yet
+
+        Args:
+            verify (bool): Whether the pool manager should verify TLS certificates
+
+        Returns:
+            The urllib3 PoolManager
+        """
+        if verify not in self.pool_managers:
+            import urllib3
+
+            kwargs = {"num_pools": self.pool_connections, "maxsize": self.pool_maxsize}  # type: Dict[str, Any]
+            if verify:
+                kwargs["cert_reqs"] = "CERT_REQUIRED"
+                # Use the same certificate bundle as requests if it's available
+                try:
+                    import certifi
+
+                    kwargs["ca_certs"] = certifi.where()
+                except ImportError:
+                    pass
+            else:
+                kwargs["cert_reqs"] = "CERT_NONE"
+            self.pool_managers[verify] = urllib3.PoolManager(**kwargs)
+        return self.pool_managers[verify]
+
+    def send(
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> TransportResponse:
+        r = self._request(http_verb, full_url, body, headers, timeout, verify, True)
+        return TransportResponse(r.status, r.data, r.headers)
+
+    def send_stream(
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> StreamedTransportResponse:
+        r = self._request(http_verb, full_url, body, headers, timeout, verify, False)
+        return StreamedTransportResponse(r.status, r.stream(STREAM_CHUNK_SIZE), r.headers, lambda: _release_urllib3_response(r))
+
+    def _request(
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+        preload_content: bool,
+    ) -> Any:
+        """Send a request with the pool manager for the verify setting, without any retries or redirects"""
+        import urllib3
+
+        return self.get_pool_manager(verify).request(
+            http_verb,
+            full_url,
+            body=body,
+            headers=headers,
+            timeout=urllib3.Timeout(total=timeout.total, connect=timeout.connect, read=timeout.read),
+            retries=False,
+            redirect=False,
+            preload_content=preload_content,
+        )
+
+    def close(self) -> None:
+        for pool_manager in self.pool_managers.values():
+            pool_manager.clear()
+        self.pool_managers = {}
+
+
+def _release_urllib3_response(response: Any) -> None:
+    """Release the connection of a streamed urllib3 response, which may not have been read to the end
+
+    urllib3 already releases the connection once the body has been read to the end. Otherwise, the rest of the body is still
+    waiting on the connection, so it is closed rather than returned to the pool as is (where the next request would read it),
+    which is also cheaper than draining a large body that is no longer wanted
+    """
+    response.close()
+    response.release_conn()
+
+
+class LoopbackTransport(Transport):
+    """In-memory transport which never touches the network, for tests and for benchmarking the overhead of the SDK itself
+
+    Args:
+        handler (callable, optional): Function called with (http_verb, full_url, body, headers) for each request, returning a TransportResponse.
+            If not provided, every request gets the same response. Streamed bodies are read into bytes before being passed to the handler
+        status (int, optional): Status code of the response when no handler is provided (default 200)
+        body (bytes, optional): Body of the response when no handler is provided (default b"{}")
+    """
+
+    def __init__(
+        self, handler: Optional[Callable[[str, str, bytes, Dict[str, str]], TransportResponse]] = None, status: int = 200, body: bytes = b"{}"
+    ):
+        self.handler = handler
+        self.response = TransportResponse(status, body)
+        self.request_count = 0
+
+    def send(
+        self,
+        http_verb: str,
+        full_url: str,
+        body: Union[bytes, streaming.SpooledBody],
+        headers: Dict[str, str],
+        timeout: timeouts.Timeout,
+        verify: bool,
+    ) -> TransportResponse:
+        self.request_count += 1
+        if isinstance(body, streaming.SpooledBody):
+            body = body.read()
+        if self.handler is not None:
+            return self.handler(http_verb, full_url, body, headers)
+        return self.response
@@ -16,7 +16,27 @@ if not TYPE_CHECKING:
 
 import mypy_extensions  # noqa: E402 Want to explicitly ensure not type checking before importing extensions
 
-request_response = mypy_extensions.TypedDict("request_response", {"status": int, "ok": bool, "response": Union[Dict[Any, Any], str]})
+from dragonchain_sdk import streaming  # noqa: E402 Only imported for typing
+from dragonchain_sdk import transports  # noqa: E402 Only imported for typing
+from dragonchain_sdk import async_helpers  # noqa: E402 Only imported for typing
+
+request_response = mypy_extensions.TypedDict(
+    "request_response",
+    {
+        "status": int,
+        "ok": bool,
+        "response": Union[
+            Dict[Any, Any],
+            str,
+            bytes,
+            int,
+            streaming.ResultStream,
+            transports.StreamedTransportResponse,
+            "async_helpers.AsyncResultStream",
+            "async_helpers.AsyncStreamedTransportResponse",
+        ],
+    },
+)
 custom_index_fields_type = mypy_extensions.TypedDict(
     "custom_index_fields_type", {"path": str, "field_name": str, "type": str, "options": Dict[str, Any]}
 )
@@ -8,6 +8,7 @@ USAGE="usage: run.sh [command]
 command
 unit         : run unit tests on the project
 integration  : run integration tests on the project
+benchmark    : run the performance benchmarks for the project
 coverage     : run the coverage report (only works after tests have been run)
 tests        : run all tests on the project, including a unittest coverage report
 lint         : run the linting and formatting checks against the project
@@ -34,6 +35,8 @@ elif [ "$1" = "unit" ]; then
     fi
 elif [ "$1" = "integration" ]; then
     python3 -m tests.integration.run
+elif [ "$1" = "benchmark" ]; then
+    python3 -m tests.benchmarks.run
 elif [ "$1" = "coverage" ]; then
     include=$(find ./dragonchain_sdk -path "*.py" | tr '\n' ',' | rev | cut -c 2- | rev)
     python3 -m coverage report -m --include="$include"
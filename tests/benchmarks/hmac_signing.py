@@ -0,0 +1,50 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare signatures per second of the precomputed signer against keying a new HMAC for every request, for each algorithm
+
+Run with: python3 -m tests.benchmarks.hmac_signing
+"""
+
+import sys
+import timeit
+import functools
+
+from dragonchain_sdk import credentials
+
+NUMBER = 20000
+TIMESTAMP = "2020-01-01T00:00:00.000000Z"
+BODIES = [("empty", "", b""), ("1KB", "application/json", b"x" * 1024)]
+
+
+def unoptimized_authorization(creds, path, content_type, content):
+    """Sign a request the way it was done before the signer existed, keying a new HMAC from the message string every time"""
+    message_string = creds.hmac_message_string("POST", path, TIMESTAMP, content_type, content)
+    return "DC1-HMAC-{} {}:{}".format(creds.algorithm, creds.auth_key_id, creds.bytes_to_b64_str(creds.create_hmac(creds.auth_key, message_string)))
+
+
+def signatures_per_second(func):
+    return NUMBER / min(timeit.repeat(func, number=NUMBER, repeat=3))
+
+
+def main():
+    algorithms = ["SHA256", "BLAKE2b512", "SHA3-256"] if sys.version_info[:2] >= (3, 6) else ["SHA256"]
+    print("{:<12} {:<8} {:>16} {:>16} {:>8}".format("algorithm", "body", "unoptimized/s", "signer/s", "speedup"))
+    for algorithm in algorithms:
+        creds = credentials.Credentials("benchmark", "key", "key_id", algorithm)
+        for name, content_type, content in BODIES:
+            before = signatures_per_second(functools.partial(unoptimized_authorization, creds, "/v1/transaction", content_type, content))
+            after = signatures_per_second(functools.partial(creds.get_authorization, "POST", "/v1/transaction", TIMESTAMP, content_type, content))
+            print("{:<12} {:<8} {:>16.0f} {:>16.0f} {:>7.2f}x".format(algorithm, name, before, after, after / before))
+
+
+if __name__ == "__main__":
+    main()
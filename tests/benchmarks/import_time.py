@@ -0,0 +1,59 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the time to import the SDK in a fresh interpreter with ``python -X importtime``
+
+Fails if importing the SDK loads any of the heavy HTTP libraries, which should only be imported on first use.
+
+Run with: python3 -m tests.benchmarks.import_time
+"""
+
+import sys
+import subprocess
+
+REPEAT = 5
+TOP = 10
+# Modules which must not be loaded by a plain "import dragonchain_sdk"
+LAZY_MODULES = ["requests", "urllib3", "aiohttp", "dragonchain_sdk.async_helpers"]
+
+
+def import_times():
+    """Import the SDK in a new interpreter, returning the cumulative import time (in microseconds) of each module it loaded"""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import dragonchain_sdk"], stderr=subprocess.PIPE, universal_newlines=True, check=True
+    ).stderr
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+        # Modules are listed after the modules they import, so anything before the last top level import (i.e. by site) isn't from the SDK
+        if len(name) - len(name.lstrip()) == 1 and name.strip() != "dragonchain_sdk":
+            times = {}
+    return times
+
+
+def main():
+    runs = [import_times() for _ in range(REPEAT)]
+    # Take the fastest run, to reduce noise from the rest of the system
+    fastest = min(runs, key=lambda times: times["dragonchain_sdk"])
+    print("{:<40} {:>16}".format("module", "cumulative (ms)"))
+    for name, cumulative in sorted(fastest.items(), key=lambda item: -item[1])[:TOP]:
+        print("{:<40} {:>16.2f}".format(name, cumulative / 1000))
+    loaded = [name for name in LAZY_MODULES if name in fastest]
+    if loaded:
+        print("\nREGRESSION: importing dragonchain_sdk loaded {}".format(", ".join(loaded)))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the cost of encoding, hashing (for the HMAC content hash) and decoding bodies of various sizes with each JSON codec
+
+Run with: python3 -m tests.benchmarks.json_codec
+"""
+
+import timeit
+import functools
+
+from dragonchain_sdk import codec
+from dragonchain_sdk import credentials
+
+# Number of transactions in each body, from a single transaction up to a full bulk request and a large query result
+SIZES = [1, 10, 100, 250, 1000]
+
+
+def make_body(count):
+    return [
+        {
+            "version": "1",
+            "txn_type": "benchmark",
+            "payload": {"index": i, "name": "item {}".format(i), "values": list(range(10))},
+            "tag": "n:{}".format(i),
+        }
+        for i in range(count)
+    ]
+
+
+def time_per_call(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main():
+    codecs = [codec.StandardJsonCodec()]
+    if codec.orjson is not None:
+        codecs.append(codec.OrjsonCodec())
+    creds = credentials.Credentials("benchmark", "key", "key_id", "SHA256")
+    print("{:<10} {:>8} {:>10} {:>12} {:>12} {:>12}".format("codec", "items", "bytes", "encode (us)", "hash (us)", "decode (us)"))
+    for size in SIZES:
+        body = make_body(size)
+        number = max(10, 10000 // size)
+        for json_codec in codecs:
+            data = json_codec.dumps(body)
+            encode = time_per_call(functools.partial(json_codec.dumps, body), number)
+            hashing = time_per_call(functools.partial(creds.hash_input, data), number)
+            decode = time_per_call(functools.partial(json_codec.loads, data), number)
+            print(
+                "{:<10} {:>8} {:>10} {:>12.1f} {:>12.1f} {:>12.1f}".format(
+                    json_codec.name, size, len(data), encode * 1000000, hashing * 1000000, decode * 1000000
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
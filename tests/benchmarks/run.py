@@ -0,0 +1,21 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from tests.benchmarks import hmac_signing
+from tests.benchmarks import import_time
+from tests.benchmarks import json_codec
+from tests.benchmarks import transport_overhead
+
+if __name__ == "__main__":
+    benchmarks = [import_time, json_codec, hmac_signing, transport_overhead]
+    for benchmark in benchmarks:
+        print("\n{}".format(benchmark.__name__))
+        benchmark.main()
@@ -0,0 +1,45 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the per-request overhead of the SDK itself (signing, encoding, decoding and response handling) without any network
+
+Run with: python3 -m tests.benchmarks.transport_overhead
+"""
+
+import timeit
+import functools
+
+import dragonchain_sdk
+from dragonchain_sdk import transports
+
+NUMBER = 2000
+TRANSACTION_RESPONSE = b'{"transaction_id": "a4f5c8e6-8e0b-4bb5-a4b7-53dd4a5b9ad2"}'
+
+
+def time_per_call(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main():
+    transport = transports.LoopbackTransport(body=TRANSACTION_RESPONSE)
+    client = dragonchain_sdk.create_client("benchmark", "key_id", "key", "https://benchmark.test", transport=transport)
+    cases = [
+        ("get_status", client.get_status),
+        ("get_transaction", functools.partial(client.get_transaction, "a4f5c8e6-8e0b-4bb5-a4b7-53dd4a5b9ad2")),
+        ("create_transaction", functools.partial(client.create_transaction, "benchmark", {"index": 1, "values": list(range(10))})),
+    ]
+    print("{:<20} {:>14}".format("operation", "overhead (us)"))
+    for name, func in cases:
+        print("{:<20} {:>14.1f}".format(name, time_per_call(func, NUMBER) * 1000000))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import unittest
 import importlib
+import concurrent.futures
 import inspect
 
 import dragonchain_sdk
+from dragonchain_sdk import retry
+from dragonchain_sdk import codec
 from dragonchain_sdk import exceptions
+from dragonchain_sdk import transports
+from dragonchain_sdk import timeouts
+from dragonchain_sdk import cache
 from tests import unit
 
 if unit.PY38:
@@ -52,6 +59,23 @@ class AsyncContextManagerMock(MagicMock):
         return self.aexit_return
 
 
+def response_context(**kwargs):
+    if unit.PY38:
+        context = AsyncMock()
+        context.__aenter__.return_value = MagicMock(**kwargs)
+        context.__aexit__.return_value = False
+        return context
+    return AsyncContextManagerMock(aenter_return=MagicMock(**kwargs), aexit_return=False)
+
+
+def loopback_request(handler=None, status=200, body=b"{}", retry_policy=retry.NO_RETRY, rate_limiter=None):
+    creds = async_helpers.credentials.Credentials("blah", "key", "key_id", "SHA256")
+    transport = async_helpers.AsyncLoopbackTransport(handler, status, body)
+    return async_helpers.AsyncRequest(
+        creds, "https://dummy.test", retry_policy=retry_policy, rate_limiter=rate_limiter, json_codec=codec.StandardJsonCodec(), transport=transport
+    )
+
+
 @unittest.skipUnless(dragonchain_sdk.ASYNC_SUPPORT, "Can't run tests without async support")
 class TestAsync(unittest.TestCase):
     @unittest.skipUnless(unit.CI_COVERAGE_VERSION, "Only run this test for code coverage purposes")
@@ -59,169 +83,656 @@ class TestAsync(unittest.TestCase):
     def test_type_checking(self):
         importlib.reload(async_helpers)
 
-    @patch("dragonchain_sdk.async_helpers.aiohttp")
-    @patch("dragonchain_sdk.async_helpers.dragonchain_sdk.create_client")
+    @patch("dragonchain_sdk.async_helpers.AsyncClient")
     @async_test
-    async def test_create_aio_client_passes_params_to_create_client(self, mock_create_client, mock_aiohttp):
-        await async_helpers.create_aio_client("blah", some="kwarg")
-        mock_create_client.assert_called_once_with("blah", some="kwarg")
+    async def test_create_aio_client_passes_params_to_async_client(self, mock_async_client):
+        await async_helpers.create_aio_client("blah", endpoint="thing", limit=5, limit_per_host=2, ttl_dns_cache=None, keepalive_timeout=3.0)
+        mock_async_client.assert_called_once_with(
+            "blah",
+            None,
+            None,
+            "thing",
+            True,
+            "SHA256",
+            limit=5,
+            limit_per_host=2,
+            ttl_dns_cache=None,
+            keepalive_timeout=3.0,
+            session=None,
+            retry_policy=None,
+            rate_limiter=None,
+            json_codec=None,
+            transport=None,
+            timeout=None,
+            lazy=False,
+            offload_threshold=65536,
+            offload_executor=None,
+            response_cache=None,
+        )
+        mock_async_client.return_value.request.get_session.assert_called_once()
 
-    @patch("dragonchain_sdk.async_helpers.aiohttp")
-    @patch("dragonchain_sdk.async_helpers.dragonchain_sdk.create_client")
+    @patch("dragonchain_sdk.async_helpers.aiohttp.TCPConnector", return_value="connector")
+    @patch("dragonchain_sdk.async_helpers.aiohttp.ClientSession", return_value="ok")
     @async_test
-    async def test_create_aio_client_sets_client_close_function(self, mock_create_client, mock_aiohttp):
-        mock_client = MagicMock()
-        mock_create_client.return_value = mock_client
-        await async_helpers.create_aio_client("blah", some="kwarg")
+    async def test_create_aio_client_sets_client_request_session(self, mock_session, mock_connector):
+        client = await async_helpers.create_aio_client("blah", auth_key_id="a", auth_key="b", endpoint="thing", limit=5, limit_per_host=2)
+        self.assertIsInstance(client, async_helpers.AsyncClient)
+        self.assertEqual(client.request.session, "ok")
+        mock_connector.assert_called_once_with(limit=5, limit_per_host=2, ttl_dns_cache=10, keepalive_timeout=15.0)
+        mock_session.assert_called_once_with(connector="connector")
+
+    @patch("dragonchain_sdk.credentials.configuration.get_dragonchain_id", return_value="blah")
+    @async_test
+    async def test_lazy_aio_client_discovers_on_warm(self, mock_get_id):
+        client = await async_helpers.create_aio_client(auth_key_id="a", auth_key="b", endpoint="https://dummy.test", lazy=True)
+        mock_get_id.assert_not_called()
+        await client.warm()
+        await client.warm()
+        mock_get_id.assert_called_once()
+        self.assertEqual(client.credentials.dragonchain_id, "blah")
+        self.assertIsInstance(client.request, async_helpers.AsyncRequest)
+        await client.close()
+
+    @patch("dragonchain_sdk.request.configuration.invalidate_endpoint")
+    @patch("dragonchain_sdk.request.configuration.get_endpoint", side_effect=["https://old.test", "https://new.test"])
+    @async_test
+    async def test_async_request_discovers_endpoint_again_after_connection_error(self, mock_get_endpoint, mock_invalidate):
+        handler = MagicMock(side_effect=[Exception("refused"), transports.TransportResponse(200, b"{}")])
+        async_request = loopback_request(handler)
+        async_request.update_endpoint()
         try:
-            self.assertTrue(inspect.iscoroutinefunction(mock_client.close))
-        except Exception as e:
-            self.fail(e)
+            await async_request.get("/v1/status")
+            self.fail("Expected ConnectionException")
+        except exceptions.ConnectionException:
+            pass
+        self.assertTrue((await async_request.get("/v1/status"))["ok"])
+        self.assertEqual(handler.call_args[0][1], "https://new.test/v1/status")
+        mock_invalidate.assert_called_once_with("blah", "https://old.test")
 
-    @patch("dragonchain_sdk.async_helpers.aiohttp.ClientSession", return_value="ok")
-    @patch("dragonchain_sdk.async_helpers.dragonchain_sdk.create_client")
+    @patch("dragonchain_sdk.credentials.configuration.get_dragonchain_id", return_value="blah")
     @async_test
-    async def test_create_aio_client_sets_client_request_session(self, mock_create_client, mock_aiohttp):
-        mock_client = MagicMock()
-        mock_create_client.return_value = mock_client
-        await async_helpers.create_aio_client("blah", some="kwarg")
-        self.assertEqual(mock_client.request.session, "ok")
+    async def test_lazy_aio_client_raises_if_used_before_warm(self, mock_get_id):
+        client = await async_helpers.create_aio_client(auth_key_id="a", auth_key="b", endpoint="https://dummy.test", lazy=True)
+        with self.assertRaises(RuntimeError):
+            await client.get_status()
+        self.assertRaises(RuntimeError, lambda: client.credentials)
+        mock_get_id.assert_not_called()
+        await client.warm()
+        client.request.transport = async_helpers.AsyncLoopbackTransport(body=b'{"a": 1}')
+        self.assertEqual((await client.get_status())["response"], {"a": 1})
+        await client.close()
+
+    @patch("dragonchain_sdk.credentials.configuration.get_dragonchain_id", return_value="blah")
+    @async_test
+    async def test_closing_unused_lazy_aio_client_skips_discovery(self, mock_get_id):
+        async with await async_helpers.create_aio_client(lazy=True):
+            pass
+        mock_get_id.assert_not_called()
+
+    @async_test
+    async def test_create_aio_client_uses_external_session(self):
+        session = aiohttp.ClientSession()
+        client = await async_helpers.create_aio_client("blah", auth_key_id="a", auth_key="b", endpoint="thing", session=session)
+        self.assertIs(client.request.session, session)
+        await client.close()
+        self.assertFalse(session.closed)
+        await session.close()
+
+    def test_async_request_raises_type_error(self):
+        creds = MagicMock(spec=async_helpers.credentials.Credentials)
+        self.assertRaises(TypeError, async_helpers.AsyncRequest, creds, "thing", limit="5")
+        self.assertRaises(TypeError, async_helpers.AsyncRequest, creds, "thing", limit_per_host="5")
+        self.assertRaises(TypeError, async_helpers.AsyncRequest, creds, "thing", ttl_dns_cache="5")
+        self.assertRaises(TypeError, async_helpers.AsyncRequest, creds, "thing", keepalive_timeout="5")
+        self.assertRaises(TypeError, async_helpers.AsyncRequest, creds, "thing", session="not a session")
+        self.assertRaises(TypeError, async_helpers.AsyncRequest, creds, "thing", offload_threshold="5")
+        self.assertRaises(TypeError, async_helpers.AsyncRequest, creds, "thing", offload_executor="not an executor")
+
+    def test_async_client_close_is_coroutine(self):
+        self.assertTrue(inspect.iscoroutinefunction(async_helpers.AsyncClient.close))
 
     @async_test
     async def test_close_client_closes_async_resources(self):
         mock_client = MagicMock()
-        mock_client.request.session.close.return_value = asyncio.Future()
-        mock_client.request.session.close.return_value.set_result("ok")
-        await async_helpers.client_close(mock_client)
-        # Check that it closes instantiated request ClientSession
-        mock_client.request.session.close.assert_called_once()
+        mock_client._request.close.return_value = asyncio.Future()
+        mock_client._request.close.return_value.set_result("ok")
+        await async_helpers.AsyncClient.close(mock_client)
+        mock_client._request.close.assert_called_once()
 
     @async_test
-    async def test_make_request_raises_connectionexception_error_on_request_failure(self):
+    async def test_close_request_closes_transport(self):
         mock_request = MagicMock()
-        mock_request._generate_request_data = MagicMock(return_value=(None, None, None))
-        mock_request.session.request.side_effect = Exception
+        mock_request.transport.close.return_value = asyncio.Future()
+        mock_request.transport.close.return_value.set_result(None)
+        await async_helpers.AsyncRequest.close(mock_request)
+        mock_request.transport.close.assert_called_once()
+
+    @async_test
+    async def test_close_transport_closes_owned_session(self):
+        mock_transport = MagicMock(owns_session=True)
+        mock_session = mock_transport.session
+        mock_session.close.return_value = asyncio.Future()
+        mock_session.close.return_value.set_result("ok")
+        await async_helpers.AiohttpTransport.close(mock_transport)
+        mock_session.close.assert_called_once()
+        self.assertIsNone(mock_transport.session)
+
+    @async_test
+    async def test_close_transport_does_not_close_external_session(self):
+        mock_transport = MagicMock(owns_session=False)
+        await async_helpers.AiohttpTransport.close(mock_transport)
+        mock_transport.session.close.assert_not_called()
+
+    @async_test
+    async def test_async_client_context_manager_closes(self):
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        async with client as c:
+            self.assertIs(c, client)
+            self.assertIsNotNone(client.request.session)
+        self.assertIsNone(client.request.session)
+
+    def test_async_client_raises_on_sync_context_manager(self):
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        with self.assertRaises(TypeError):
+            with client:
+                pass
+
+    @patch("dragonchain_sdk.async_helpers.AsyncRequest._make_request", new_callable=MagicMock)
+    @async_test
+    async def test_async_client_methods_are_awaitable(self, mock_make_request):
+        future = asyncio.Future()
+        future.set_result({"status": 200, "ok": True, "response": {}})
+        mock_make_request.return_value = future
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        self.assertEqual(await client.get_status(), {"status": 200, "ok": True, "response": {}})
+        mock_make_request.assert_called_once_with(http_verb="GET", path="/v1/status", verify=True, parse_response=True, raw=False)
+
+    @async_test
+    async def test_make_request_raises_connectionexception_error_on_request_failure(self):
+        request = loopback_request(MagicMock(side_effect=Exception))
         # Can't use self.assertRaises because of async limitations
         try:
-            await async_helpers._make_request(mock_request, "GET", "/transaction")
+            await request._make_request("GET", "/transaction")
         except exceptions.ConnectionException:
             return
         self.fail("Did not throw ConnectionException")
 
     @async_test
-    async def test_make_request_returns_ok_false_on_bad_response_status(self):
-        mock_request = MagicMock()
-        mock_request._generate_request_data = MagicMock(return_value=(None, None, None))
-        mock_return_json = asyncio.Future()
-        mock_return_json.set_result({"error": "some error"})
-        if unit.PY38:
-            mock_request.session.request.return_value = AsyncMock()
-            mock_request.session.request.return_value.__aenter__.return_value.status = 400
-            mock_request.session.request.return_value.__aenter__.return_value.json.return_value = mock_return_json.result()
-        else:
-            mock_request.session.request.return_value = AsyncContextManagerMock(
-                aenter_return=MagicMock(status=400, json=MagicMock(return_value=mock_return_json))
-            )
+    async def test_make_request_raises_connectionexception_error_on_bad_verb(self):
+        handler = MagicMock()
+        request = loopback_request(handler)
+        with self.assertRaises(exceptions.ConnectionException):
+            await request._make_request("BAD", "/transaction")
+        handler.assert_not_called()
+
+    @patch("dragonchain_sdk.async_helpers.asyncio.sleep", new_callable=MagicMock)
+    @async_test
+    async def test_make_request_retries_and_regenerates_request_data(self, mock_sleep):
+        sleep_future = asyncio.Future()
+        sleep_future.set_result(None)
+        mock_sleep.return_value = sleep_future
+        handler = MagicMock(
+            side_effect=[
+                transports.TransportResponse(503, b"", {"Retry-After": "1"}),
+                transports.TransportResponse(200, b'{"test": "object"}'),
+            ]
+        )
+        request = loopback_request(handler, retry_policy=retry.RetryPolicy())
+        request._generate_request_data = MagicMock(return_value=("url", b"", {}))
+        expected_response = {"status": 200, "ok": True, "response": {"test": "object"}}
+        self.assertEqual(await request._make_request("GET", "/transaction"), expected_response)
+        self.assertEqual(request._generate_request_data.call_count, 2)
+        self.assertEqual(handler.call_count, 2)
+        mock_sleep.assert_called_once_with(1.0)
+
+    @patch("dragonchain_sdk.async_helpers.asyncio.sleep", new_callable=MagicMock)
+    @async_test
+    async def test_make_request_waits_for_rate_limiter(self, mock_sleep):
+        sleep_future = asyncio.Future()
+        sleep_future.set_result(None)
+        mock_sleep.return_value = sleep_future
+        rate_limiter = MagicMock(spec=dragonchain_sdk.RateLimiter)
+        rate_limiter.reserve.return_value = 0.5
+        request = loopback_request(rate_limiter=rate_limiter)
+        await request._make_request("GET", "/v1/status")
+        rate_limiter.reserve.assert_called_once_with("/v1/status")
+        mock_sleep.assert_called_once_with(0.5)
+
+    @async_test
+    async def test_make_request_does_not_retry_post_by_default(self):
+        handler = MagicMock(side_effect=Exception)
+        request = loopback_request(handler, retry_policy=retry.RetryPolicy())
+        with self.assertRaises(exceptions.ConnectionException):
+            await request._make_request("POST", "/transaction")
+        handler.assert_called_once()
 
+    @async_test
+    async def test_make_request_returns_ok_false_on_bad_response_status(self):
+        request = loopback_request(status=400, body=b'{"error": "some error"}')
         expected_response = {"ok": False, "status": 400, "response": {"error": "some error"}}
-        self.assertEqual(await async_helpers._make_request(mock_request, "GET", "/transaction"), expected_response)
+        self.assertEqual(await request._make_request("GET", "/transaction"), expected_response)
 
     @async_test
     async def test_make_request_parse_json(self):
-        mock_request = MagicMock()
-        mock_request._generate_request_data = MagicMock(return_value=(None, None, None))
-        mock_return_json = asyncio.Future()
-        mock_return_json.set_result({"test": "object"})
-        if unit.PY38:
-            mock_request.session.request.return_value = AsyncMock()
-            mock_request.session.request.return_value.__aenter__.return_value.status = 200
-            mock_request.session.request.return_value.__aenter__.return_value.json.return_value = mock_return_json.result()
-        else:
-            mock_request.session.request.return_value = AsyncContextManagerMock(
-                aenter_return=MagicMock(status=200, json=MagicMock(return_value=mock_return_json))
-            )
-
+        request = loopback_request(body=b'{"test": "object"}')
         expected_response = {"ok": True, "status": 200, "response": {"test": "object"}}
-        self.assertEqual(await async_helpers._make_request(mock_request, "GET", "/transaction"), expected_response)
+        self.assertEqual(await request._make_request("GET", "/transaction"), expected_response)
 
     @async_test
     async def test_make_request_no_parse_json(self):
-        mock_request = MagicMock()
-        mock_request._generate_request_data = MagicMock(return_value=(None, None, None))
-        mock_return_text = asyncio.Future()
-        mock_return_text.set_result('{"test": "object"}')
-        if unit.PY38:
-            mock_request.session.request.return_value = AsyncMock()
-            mock_request.session.request.return_value.__aenter__.return_value.status = 200
-            mock_request.session.request.return_value.__aenter__.return_value.text.return_value = mock_return_text.result()
-        else:
-            mock_request.session.request.return_value = AsyncContextManagerMock(
-                aenter_return=MagicMock(status=200, text=MagicMock(return_value=mock_return_text))
-            )
-
+        request = loopback_request(body=b'{"test": "object"}')
         expected_response = {"ok": True, "status": 200, "response": '{"test": "object"}'}
-        self.assertEqual(await async_helpers._make_request(mock_request, "GET", "/transaction", parse_response=False), expected_response)
+        self.assertEqual(await request._make_request("GET", "/transaction", parse_response=False), expected_response)
 
     @async_test
-    async def test_make_request_raises_unexpectedresponseexception_error_on_no_context_raise(self):
-        mock_request = MagicMock()
-        mock_request._generate_request_data = MagicMock(return_value=(None, None, None))
-        mock_fail_json = asyncio.Future()
-        mock_fail_json.set_exception(RuntimeError("JSON Parse Error"))
+    async def test_make_request_raises_unexpectedresponseexception_error_on_parse_json_error(self):
+        request = loopback_request(body=b"not json")
+        with self.assertRaises(exceptions.UnexpectedResponseException):
+            await request._make_request("GET", "/transaction")
+
+    @async_test
+    async def test_make_request_does_not_wrap_unexpectedresponseexception_from_transport(self):
+        request = loopback_request(MagicMock(side_effect=exceptions.UnexpectedResponseException("bad")))
+        with self.assertRaises(exceptions.UnexpectedResponseException):
+            await request._make_request("GET", "/transaction")
+
+    @async_test
+    async def test_make_request_calls_transport_with_correct_params(self):
+        handler = MagicMock(return_value=transports.TransportResponse(200, b"{}"))
+        request = loopback_request(handler)
+        request._generate_request_data = MagicMock(return_value=("url", b"content", {"some": "headers"}))
+        await request._make_request("POST", "/transaction")
+        handler.assert_called_once_with("POST", "url", b"content", {"some": "headers"})
+
+    @async_test
+    async def test_make_request_encodes_large_bodies_in_offload_executor(self):
+        handler = MagicMock(return_value=transports.TransportResponse(200, b"{}"))
+        request = loopback_request(handler)
+        request.offload_threshold = 100
+        json_content = {"payload": "a" * 200}
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            request.offload_executor = executor
+            with patch.object(executor, "submit", wraps=executor.submit) as mock_submit:
+                await request._make_request("POST", "/transaction", json_content=json_content)
+            mock_submit.assert_called_once_with(async_helpers._encode_and_hash, request.json_codec, request.credentials.hash_method, json_content)
+        self.assertEqual(handler.call_args[0][2], b'{"payload":"' + b"a" * 200 + b'"}')
+
+    @async_test
+    async def test_make_request_encodes_small_bodies_on_event_loop(self):
+        request = loopback_request()
+        request.offload_executor = MagicMock(spec=concurrent.futures.Executor)
+        await request._make_request("POST", "/transaction", json_content={"payload": "small"})
+        request.offload_executor.submit.assert_not_called()
+
+    @async_test
+    async def test_offloaded_body_has_same_signature(self):
+        request = loopback_request()
+        json_content = {"payload": "a" * 200}
+        body = await request._encode_body(json_content)
+        request.offload_threshold = 100
+        self.assertEqual(await request._encode_body(json_content), body)
+        with patch("dragonchain_sdk.request.datetime") as mock_datetime:
+            mock_datetime.datetime.utcnow.return_value.isoformat.return_value = "2020-01-01T00:00:00"
+            expected = request._generate_request_data("POST", "/transaction", json_content=json_content)
+            self.assertEqual(request._generate_request_data("POST", "/transaction", json_content=json_content, body=body), expected)
+
+    @async_test
+    async def test_make_request_applies_timeout_and_deadline(self):
+        handler = MagicMock(return_value=transports.TransportResponse(200, b"{}"))
+        request = loopback_request(handler)
+        request.transport.loopback.send = MagicMock(wraps=request.transport.loopback.send)
+        await request.with_options(timeout=timeouts.Timeout(2, 10), deadline=5)._make_request("GET", "/transaction")
+        timeout = request.transport.loopback.send.call_args[0][4]
+        self.assertEqual(timeout.connect, 2)
+        self.assertLessEqual(timeout.read, 5)
+        with self.assertRaises(exceptions.DeadlineExceeded):
+            await request.with_options(deadline=-1)._make_request("GET", "/transaction")
+        handler.assert_called_once()
+
+    @async_test
+    async def test_make_request_probes_ejected_endpoints_in_background(self):
+        request = loopback_request()
+        request.update_endpoint(["https://a.test", "https://b.test"])
+        request.endpoint_pool.endpoints[0].ejected_until = 0.0
+        await request._make_request("GET", "/transaction")
+        self.assertTrue(request.endpoint_pool.endpoints[0].probing)
+        await asyncio.sleep(0)
+        self.assertIsNone(request.endpoint_pool.endpoints[0].ejected_until)
+        self.assertEqual(request.transport.request_count, 2)
+
+    def test_async_request_raises_type_error_on_sync_transport(self):
+        creds = MagicMock(spec=async_helpers.credentials.Credentials)
+        self.assertRaises(TypeError, async_helpers.AsyncRequest, creds, "thing", transport=transports.LoopbackTransport())
+
+    def test_async_request_without_aiohttp_transport_has_no_session(self):
+        request = loopback_request()
+        self.assertIsNone(request.session)
+        self.assertIsNone(request.get_session())
+
+    @async_test
+    async def test_aiohttp_transport_send_calls_session_request_with_correct_params(self):
+        transport = async_helpers.AiohttpTransport(session=MagicMock(spec=aiohttp.ClientSession))
+        read = asyncio.Future()
+        read.set_result(b"{}")
+        transport.session.request.return_value = response_context(status=201, headers={"a": "b"}, read=MagicMock(return_value=read))
+        response = await transport.send("POST", "url", b"content", {"some": "headers"}, timeouts.Timeout(5, 30, total=40), True)
+        transport.session.request.assert_called_once_with(
+            method="POST",
+            url="url",
+            data=b"content",
+            headers={"some": "headers"},
+            ssl=True,
+            timeout=aiohttp.ClientTimeout(total=40, sock_connect=5, sock_read=30),
+        )
+        self.assertEqual(response.status, 201)
+        self.assertEqual(response.body, b"{}")
+        self.assertEqual(response.headers, {"a": "b"})
+
+    @async_test
+    async def test_aiohttp_transport_raises_unexpectedresponseexception_error_on_no_context_raise(self):
+        transport = async_helpers.AiohttpTransport(session=MagicMock(spec=aiohttp.ClientSession))
         if unit.PY38:
-            mock_request.session.request.return_value = AsyncMock()
-            mock_request.session.request.return_value.__aenter__.return_value.status = 200
-            mock_request.session.request.return_value.__aenter__.return_value.json.side_effect = mock_fail_json.exception()
-            mock_request.session.request.return_value.__aexit__.return_value = True
+            transport.session.request.return_value = AsyncMock()
+            transport.session.request.return_value.__aenter__.return_value.read.side_effect = RuntimeError("Read Error")
+            transport.session.request.return_value.__aexit__.return_value = True
         else:
-            mock_request.session.request.return_value = AsyncContextManagerMock(
-                aenter_return=MagicMock(status=200, json=MagicMock(return_value=mock_fail_json)), aexit_return=True
+            read = asyncio.Future()
+            read.set_exception(RuntimeError("Read Error"))
+            transport.session.request.return_value = AsyncContextManagerMock(
+                aenter_return=MagicMock(status=200, read=MagicMock(return_value=read)), aexit_return=True
             )
+        with self.assertRaises(exceptions.UnexpectedResponseException):
+            await transport.send("GET", "url", b"", {}, timeouts.Timeout(), True)
+
+    @async_test
+    async def test_aiohttp_transport_send_stream_reads_incrementally(self):
+        transport = async_helpers.AiohttpTransport(session=MagicMock(spec=aiohttp.ClientSession))
+        reads = [b"a", b"b", b""]
+
+        async def read(size):
+            return reads.pop(0)
+
+        response = MagicMock(status=200, headers={}, content=MagicMock(read=read))
+        request = asyncio.Future()
+        request.set_result(response)
+        transport.session.request.return_value = request
+        streamed = await transport.send_stream("GET", "url", b"", {}, timeouts.Timeout(), True)
+        self.assertEqual(await streamed.read_chunk(), b"a")
+        self.assertEqual(await streamed.read(), b"b")
+        response.release.assert_called_once()
+
+    @async_test
+    async def test_get_results_stream_yields_results(self):
+        request = loopback_request(body=b'{"results": [{"a": 1, "b": 2}, {"a": 3}], "total": 2}')
+        response = await request.get_results_stream("/test", fields=["a"])
+        items = []
+        async with response["response"] as stream:
+            async for item in stream:
+                items.append(item)
+        self.assertEqual(items, [{"a": 1}, {"a": 3}])
+        self.assertEqual(response["response"].total, 2)
+
+    @async_test
+    async def test_get_results_stream_parses_error_response(self):
+        request = loopback_request(status=404, body=b'{"error": "not found"}')
+        self.assertEqual(await request.get_results_stream("/test"), {"status": 404, "ok": False, "response": {"error": "not found"}})
 
+    @async_test
+    async def test_get_stream_iterates_chunks(self):
+        request = loopback_request(body=b"\xff\x00")
+        chunks = []
+        async with (await request.get_stream("/test"))["response"] as stream:
+            async for chunk in stream:
+                chunks.append(chunk)
+        self.assertEqual(chunks, [b"\xff\x00"])
+
+    @async_test
+    async def test_async_download_smart_contract_object_writes_file_like(self):
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        client.request = loopback_request(body=b"\xff\x00")
+        destination = io.BytesIO()
+        response = await client.download_smart_contract_object("MyKey", destination, smart_contract_id="MyContract")
+        self.assertEqual(response, {"status": 200, "ok": True, "response": 2})
+        self.assertEqual(destination.getvalue(), b"\xff\x00")
+
+    @async_test
+    async def test_async_iter_transactions_prefetches_pages(self):
+        pages = [b'{"total": 3, "results": [1, 2]}', b'{"total": 3, "results": [3]}']
+        handler = MagicMock(side_effect=[transports.TransportResponse(200, page) for page in pages])
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        client.request = loopback_request(handler)
+        results = []
+        async with client.iter_transactions("txn_type", "q", page_size=2, max_page_size=2) as transactions:
+            async for transaction in transactions:
+                results.append(transaction)
+                if transaction == 1:
+                    await asyncio.sleep(0)
+                    self.assertEqual(handler.call_count, 2)
+        self.assertEqual(results, [1, 2, 3])
+        self.assertEqual(transactions.total, 3)
+        self.assertRaises(TypeError, iter, transactions)
+
+    @async_test
+    async def test_async_fetch_all_reassembles_pages_in_order(self):
+        def handler(http_verb, url, body, headers):
+            offset = int(url.split("offset=")[1].split("&")[0])
+            return transports.TransportResponse(200, codec.StandardJsonCodec().dumps({"total": 5, "results": list(range(5))[offset : offset + 2]}))
+
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        client.request = loopback_request(handler)
+        self.assertEqual(await client.iter_blocks("q", page_size=2, max_page_size=2).fetch_all(concurrency=2), [0, 1, 2, 3, 4])
+
+    @async_test
+    async def test_async_fetch_all_raises_when_total_changes(self):
+        pages = [b'{"total": 4, "results": [1, 2]}', b'{"total": 3, "results": [3]}']
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        client.request = loopback_request(MagicMock(side_effect=[transports.TransportResponse(200, page) for page in pages]))
         try:
-            await async_helpers._make_request(mock_request, "GET", "/transaction")
-        except exceptions.UnexpectedResponseException:
-            return
-        self.fail("Did not throw UnexpectedResponseException")
+            await client.iter_blocks("q", page_size=2, max_page_size=2).fetch_all()
+            self.fail("Expected QueryResultsChanged")
+        except exceptions.QueryResultsChanged:
+            pass
 
     @async_test
-    async def test_make_request_raises_unexpectedresponseexception_error_on_parse_json_error(self):
-        mock_request = MagicMock()
-        mock_request._generate_request_data = MagicMock(return_value=(None, None, None))
-        mock_fail_json = asyncio.Future()
-        mock_fail_json.set_exception(RuntimeError("JSON Parse Error"))
-        if unit.PY38:
-            mock_request.session.request.return_value = AsyncMock()
-            mock_request.session.request.return_value.__aenter__.return_value.status = 200
-            mock_request.session.request.return_value.__aenter__.return_value.json.side_effect = mock_fail_json.exception()
-            mock_request.session.request.return_value.__aexit__.return_value = False
-        else:
-            mock_request.session.request.return_value = AsyncContextManagerMock(
-                aenter_return=MagicMock(status=200, json=MagicMock(return_value=mock_fail_json)), aexit_return=False
-            )
+    async def test_async_scan_blocks_pages_by_last_value(self):
+        pages = [
+            b'{"results": [{"header": {"block_id": "1"}}, {"header": {"block_id": "2"}}]}',
+            b'{"results": [{"header": {"block_id": "2"}}, {"header": {"block_id": "3"}}]}',
+        ]
+        handler = MagicMock(side_effect=[transports.TransportResponse(200, page) for page in pages])
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        client.request = loopback_request(handler)
+        blocks = []
+        async for block in client.scan_blocks(page_size=2):
+            blocks.append(block["header"]["block_id"])
+        self.assertEqual(blocks, ["1", "2", "3"])
+        self.assertIn("offset=0&limit=3", handler.call_args[0][1])
 
+    @async_test
+    async def test_async_get_transactions_dedupes_and_reports_errors(self):
+        def handler(http_verb, url, body, headers):
+            if url.endswith("/bad"):
+                raise Exception("connection failed")
+            return transports.TransportResponse(200, codec.StandardJsonCodec().dumps({"id": url.rsplit("/", 1)[1]}))
+
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        client.request = loopback_request(handler)
+        results = await client.get_transactions(["a", "bad", "a"], concurrency=2)
+        self.assertEqual(results[0], {"status": 200, "ok": True, "response": {"id": "a"}})
+        self.assertIs(results[2], results[0])
+        self.assertIsInstance(results[1], exceptions.ConnectionException)
+        self.assertEqual(client.request.transport.request_count, 2)
+
+    @async_test
+    async def test_async_get_transaction_uses_response_cache(self):
+        response_cache = cache.ResponseCache(negative_ttl=0)
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing", response_cache=response_cache)
+        client.request = loopback_request(body=b'{"header": {"txn_id": "a", "block_id": "1"}}')
+        for _ in range(2):
+            self.assertEqual(await client.get_transaction("a"), {"status": 200, "ok": True, "response": {"header": {"txn_id": "a", "block_id": "1"}}})
+        client.request.transport.loopback.response = transports.TransportResponse(200, b'{"header": {"txn_id": "b"}}')
+        await client.get_transaction("b")
+        await client.get_transaction("b")
+        self.assertEqual(client.request.transport.request_count, 3)
+        self.assertEqual(response_cache.stats()["hits"], 1)
+
+    @async_test
+    async def test_async_get_verifications_returns_uncached_when_pending_check_fails(self):
+        def handler(http_verb, url, body, headers):
+            if "/pending/" in url:
+                raise Exception("connection reset")
+            return transports.TransportResponse(200, b"[{}]")
+
+        response_cache = cache.ResponseCache()
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing", response_cache=response_cache)
+        client.request = loopback_request(handler)
+        self.assertEqual(await client.get_verifications("1", level=2), {"status": 200, "ok": True, "response": [{}]})
+        self.assertEqual(response_cache.stats()["entries"], 0)
+
+    @async_test
+    async def test_async_iter_blocks_raises_on_failed_page(self):
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        client.request = loopback_request(status=400, body=b'{"error": "bad query"}')
+        blocks = client.iter_blocks("q")
         try:
-            await async_helpers._make_request(mock_request, "GET", "/transaction")
-        except exceptions.UnexpectedResponseException:
-            return
-        self.fail("Did not throw UnexpectedResponseException")
+            async for _ in blocks:
+                pass
+            self.fail("Expected DragonchainServiceException")
+        except exceptions.DragonchainServiceException:
+            pass
 
+    @patch("dragonchain_sdk.async_helpers.AsyncRequest.post")
     @async_test
-    async def test_make_request_calls_session_request_with_correct_params(self):
-        mock_request = MagicMock()
-        mock_request._generate_request_data = MagicMock(return_value=("url", b"content", {"some": "headers"}))
-        json = asyncio.Future()
-        json.set_result("")
-        if unit.PY38:
-            mock_request.session.request.return_value.__aenter__.return_value.status = 200
-            mock_request.session.request.return_value.__aenter__.return_value.json.return_value = json
-        else:
-            mock_request.session.request.return_value = AsyncContextManagerMock(
-                aenter_return=MagicMock(status=200, json=MagicMock(return_value=json))
-            )
+    async def test_async_create_bulk_transaction_without_chunking(self, mock_post):
+        future = asyncio.Future()
+        future.set_result("response")
+        mock_post.return_value = future
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        self.assertEqual(await client.create_bulk_transaction([{"transaction_type": "test", "payload": "a"}]), "response")
+        mock_post.assert_called_once_with("/v1/transaction_bulk", [{"version": "1", "txn_type": "test", "payload": "a"}])
+
+    @async_test
+    async def test_async_create_bulk_transaction_streams_body(self):
+        handler = MagicMock(return_value=transports.TransportResponse(200, b"{}"))
+        client = async_helpers.AsyncClient(
+            "blah", auth_key_id="a", auth_key="b", endpoint="https://dummy.test", transport=async_helpers.AsyncLoopbackTransport(handler)
+        )
+        await client.create_bulk_transaction([{"transaction_type": "test", "payload": "a"}] * 2, stream=True)
+        body = handler.call_args[0][2]
+        self.assertEqual(client.request.json_codec.loads(body), [{"version": "1", "txn_type": "test", "payload": "a"}] * 2)
+        self.assertEqual(handler.call_args[0][3]["Content-Length"], str(len(body)))
+
+    @patch("dragonchain_sdk.async_helpers.AsyncRequest.post_encoded")
+    @async_test
+    async def test_async_create_bulk_transaction_chunks_and_merges_in_order(self, mock_post):
+        async def fake_post(path, content):
+            chunk = codec.StandardJsonCodec().loads(content)
+            await asyncio.sleep(0.01 if chunk[0]["payload"] == "0" else 0)
+            return {"status": 207, "ok": True, "response": {"201": [item["payload"] for item in chunk], "400": []}}
+
+        mock_post.side_effect = fake_post
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        transactions = [{"transaction_type": "test", "payload": str(i)} for i in range(5)]
+        response = await client.create_bulk_transaction(transactions, chunk_size=2, concurrency=2)
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(response, {"status": 207, "ok": True, "response": {"201": ["0", "1", "2", "3", "4"], "400": []}})
 
-        await async_helpers._make_request(mock_request, "POST", "/transaction")
+    @patch("dragonchain_sdk.async_helpers.AsyncRequest.post_encoded")
+    @async_test
+    async def test_async_create_bulk_transaction_keeps_ids_when_a_chunk_fails(self, mock_post):
+        async def fake_post(path, content):
+            chunk = codec.StandardJsonCodec().loads(content)
+            if chunk[0]["payload"] == "2":
+                raise exceptions.ConnectionException("connection reset")
+            return {"status": 201, "ok": True, "response": {"201": [item["payload"] for item in chunk], "400": []}}
 
-        mock_request.session.request.assert_called_once_with(
-            method="POST", url="url", data=b"content", headers={"some": "headers"}, ssl=True, timeout=aiohttp.ClientTimeout(total=30)
+        mock_post.side_effect = fake_post
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        transactions = [{"transaction_type": "test", "payload": str(i)} for i in range(3)]
+        response = await client.create_bulk_transaction(transactions, chunk_size=2, concurrency=2)
+        self.assertEqual(
+            response, {"status": 207, "ok": False, "response": {"201": ["0", "1"], "400": [{"version": "1", "txn_type": "test", "payload": "2"}]}}
         )
+
+    @patch("dragonchain_sdk.async_helpers.AsyncRequest.post_encoded")
+    @async_test
+    async def test_async_bulk_writer_close_flushes_in_batches(self, mock_post):
+        async def fake_post(path, content):
+            bodies = codec.StandardJsonCodec().loads(content)
+            return {"status": 201, "ok": True, "response": {"201": ["id" + item["payload"] for item in bodies], "400": []}}
+
+        mock_post.side_effect = fake_post
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        writer = async_helpers.AsyncBulkWriter(client, max_count=2, linger=60)
+        futures = [await writer.submit("type", str(i)) for i in range(5)]
+        await writer.close()
+        self.assertEqual(await asyncio.gather(*futures), ["id0", "id1", "id2", "id3", "id4"])
+        self.assertEqual([len(codec.StandardJsonCodec().loads(c[0][1])) for c in mock_post.call_args_list], [2, 2, 1])
+        with self.assertRaises(RuntimeError):
+            await writer.submit("type", "a")
+
+    @patch("dragonchain_sdk.async_helpers.AsyncRequest.post_encoded")
+    @async_test
+    async def test_async_bulk_writer_flush_and_failures(self, mock_post):
+        async def fake_post(path, content):
+            bodies = codec.StandardJsonCodec().loads(content)
+            return {"status": 207, "ok": True, "response": {"201": ["id"], "400": [bodies[1]]}}
+
+        mock_post.side_effect = fake_post
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        async with async_helpers.AsyncBulkWriter(client, linger=60) as writer:
+            first = await writer.submit("type", "a")
+            second = await writer.submit("type", "b")
+            await writer.flush()
+            self.assertEqual(first.result(), "id")
+            self.assertIsInstance(second.exception(), exceptions.BulkTransactionFailure)
+
+    @patch("dragonchain_sdk.async_helpers.AsyncRequest.post_encoded")
+    @async_test
+    async def test_async_bulk_writer_skips_cancelled_futures(self, mock_post):
+        release = asyncio.Event()
+
+        async def fake_post(path, content):
+            bodies = codec.StandardJsonCodec().loads(content)
+            await release.wait()
+            return {"status": 201, "ok": True, "response": {"201": ["id" + item["payload"] for item in bodies], "400": []}}
+
+        mock_post.side_effect = fake_post
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        writer = async_helpers.AsyncBulkWriter(client, linger=60)
+        futures = [await writer.submit("type", payload) for payload in "abc"]
+        # Cancelled while buffered, so it is never sent
+        futures[0].cancel()
+        flush = asyncio.ensure_future(writer.flush())
+        while not mock_post.called:
+            await asyncio.sleep(0)
+        # Cancelled while its request is in flight (i.e. by asyncio.wait_for timing out)
+        futures[2].cancel()
+        release.set()
+        await flush
+        self.assertEqual(futures[1].result(), "idb")
+        self.assertEqual([item["payload"] for item in codec.StandardJsonCodec().loads(mock_post.call_args[0][1])], ["b", "c"])
+        later = await writer.submit("type", "d")
+        await writer.close()
+        self.assertEqual(later.result(), "idd")
+
+    @patch("dragonchain_sdk.async_helpers.AsyncRequest.post_encoded")
+    @async_test
+    async def test_async_bulk_writer_submit_waits_for_room(self, mock_post):
+        release = asyncio.Event()
+
+        async def fake_post(path, content):
+            bodies = codec.StandardJsonCodec().loads(content)
+            await release.wait()
+            return {"status": 201, "ok": True, "response": {"201": ["id"] * len(bodies), "400": []}}
+
+        mock_post.side_effect = fake_post
+        client = async_helpers.AsyncClient("blah", auth_key_id="a", auth_key="b", endpoint="thing")
+        writer = async_helpers.AsyncBulkWriter(client, max_count=1, linger=0, max_pending=1)
+        await writer.submit("type", "a")
+        await asyncio.sleep(0)
+        await writer.submit("type", "b")
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(writer.submit("type", "c"), 0.01)
+        release.set()
+        await writer.close()
@@ -0,0 +1,151 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import unittest
+
+from tests import unit
+from dragonchain_sdk import bulk_writer
+from dragonchain_sdk import exceptions
+from dragonchain_sdk import codec
+
+if unit.PY36:
+    from unittest.mock import MagicMock
+else:
+    from mock import MagicMock
+
+
+def posted(call):
+    return json.loads(call[0][1].decode("utf8"))
+
+
+def bulk_response(ids, failed=None):
+    return {"status": 207 if failed else 201, "ok": True, "response": {"201": ids, "400": failed or []}}
+
+
+class TestBulkWriter(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.request.json_codec = codec.StandardJsonCodec()
+        self.client.request.post_encoded.side_effect = lambda path, content: bulk_response(
+            ["id{}".format(b["payload"]) for b in json.loads(content.decode("utf8"))]
+        )
+
+    def test_initialization_raises_type_error(self):
+        self.assertRaises(TypeError, bulk_writer.BulkWriter, self.client, max_count="1")
+        self.assertRaises(TypeError, bulk_writer.BulkWriter, self.client, max_bytes="1")
+        self.assertRaises(TypeError, bulk_writer.BulkWriter, self.client, linger="1")
+        self.assertRaises(TypeError, bulk_writer.BulkWriter, self.client, max_pending="1")
+
+    def test_initialization_raises_value_error(self):
+        self.assertRaises(ValueError, bulk_writer.BulkWriter, self.client, max_count=0)
+        self.assertRaises(ValueError, bulk_writer.BulkWriter, self.client, max_count=251)
+        self.assertRaises(ValueError, bulk_writer.BulkWriter, self.client, max_bytes=0)
+        self.assertRaises(ValueError, bulk_writer.BulkWriter, self.client, linger=-1)
+        self.assertRaises(ValueError, bulk_writer.BulkWriter, self.client, max_pending=0)
+
+    def test_submit_raises_type_error(self):
+        with bulk_writer.BulkWriter(self.client) as writer:
+            self.assertRaises(TypeError, writer.submit, 1, "payload")
+
+    def test_close_flushes_buffer_in_batches_of_max_count(self):
+        writer = bulk_writer.BulkWriter(self.client, max_count=2, linger=60)
+        futures = [writer.submit("type", str(i), tag="tag") for i in range(5)]
+        writer.close()
+        self.assertEqual([f.result(0) for f in futures], ["id0", "id1", "id2", "id3", "id4"])
+        self.assertEqual([len(posted(c)) for c in self.client.request.post_encoded.call_args_list], [2, 2, 1])
+        self.assertEqual(self.client.request.post_encoded.call_args_list[0][0][0], "/v1/transaction_bulk")
+        self.assertEqual(
+            posted(self.client.request.post_encoded.call_args_list[0]),
+            [{"version": "1", "txn_type": "type", "payload": "0", "tag": "tag"}, {"version": "1", "txn_type": "type", "payload": "1", "tag": "tag"}],
+        )
+
+    def test_sends_after_linger(self):
+        with bulk_writer.BulkWriter(self.client, linger=0) as writer:
+            self.assertEqual(writer.submit("type", "a").result(5), "ida")
+
+    def test_flush_sends_without_waiting_for_linger(self):
+        with bulk_writer.BulkWriter(self.client, linger=60) as writer:
+            future = writer.submit("type", "a")
+            writer.flush()
+            self.assertEqual(future.result(0), "ida")
+
+    def test_batches_bounded_by_max_bytes(self):
+        # Each encoded transaction is 47 bytes plus a comma, so only 2 fit in a body of 100 bytes
+        writer = bulk_writer.BulkWriter(self.client, max_bytes=100, linger=60)
+        for i in range(3):
+            writer.submit("type", str(i))
+        writer.close()
+        self.assertEqual([len(posted(c)) for c in self.client.request.post_encoded.call_args_list], [2, 1])
+        # The body sent is exactly the size that was checked
+        self.assertTrue(all(len(c[0][1]) <= 100 for c in self.client.request.post_encoded.call_args_list))
+
+    def test_submit_raises_after_close(self):
+        writer = bulk_writer.BulkWriter(self.client)
+        writer.close()
+        self.assertRaises(RuntimeError, writer.submit, "type", "a")
+
+    def test_submit_blocks_when_buffer_is_full(self):
+        release = threading.Event()
+        self.client.request.post_encoded.side_effect = lambda path, content: release.wait() and bulk_response(["id"])
+        writer = bulk_writer.BulkWriter(self.client, max_count=1, linger=0, max_pending=1)
+        first = writer.submit("type", "a")
+        # Either the buffer or the in-flight request is holding the first transaction, so the buffer fills up
+        writer.submit("type", "b", timeout=5)
+        self.assertRaises(TimeoutError, writer.submit, "type", "c", timeout=0.01)
+        release.set()
+        writer.close()
+        self.assertEqual(first.result(0), "id")
+
+    def test_failed_request_sets_exception_on_every_future(self):
+        self.client.request.post_encoded.side_effect = exceptions.ConnectionException("boom")
+        writer = bulk_writer.BulkWriter(self.client)
+        futures = [writer.submit("type", "a"), writer.submit("type", "b")]
+        writer.close()
+        for future in futures:
+            self.assertIsInstance(future.exception(0), exceptions.ConnectionException)
+
+    def test_cancelled_future_is_skipped_without_stopping_writer(self):
+        writer = bulk_writer.BulkWriter(self.client, linger=60)
+        futures = [writer.submit("type", "a"), writer.submit("type", "b")]
+        self.assertTrue(futures[0].cancel())
+        writer.flush()
+        self.assertEqual(futures[1].result(0), "idb")
+        self.client.request.post_encoded.assert_called_once_with("/v1/transaction_bulk", b'[{"version":"1","txn_type":"type","payload":"b"}]')
+        later = writer.submit("type", "c")
+        writer.close()
+        self.assertEqual(later.result(0), "idc")
+
+    def test_submit_raises_if_background_thread_stopped(self):
+        writer = bulk_writer.BulkWriter(self.client)
+        writer.close()
+        writer._closed = False
+        self.assertRaises(RuntimeError, writer.submit, "type", "a")
+
+
+class TestCorrelateBulkResponse(unittest.TestCase):
+    def test_matches_ids_and_failures_in_order(self):
+        bodies = [{"payload": "a"}, {"payload": "b"}, {"payload": "c"}, {"payload": "d"}]
+        results = bulk_writer._correlate_bulk_response(bodies, bulk_response(["id1", "id2"], [{"payload": "b"}, {"payload": "d"}]))
+        self.assertEqual(results[0], "id1")
+        self.assertIsInstance(results[1], exceptions.BulkTransactionFailure)
+        self.assertEqual(results[2], "id2")
+        self.assertIsInstance(results[3], exceptions.BulkTransactionFailure)
+
+    def test_missing_ids_are_failures(self):
+        results = bulk_writer._correlate_bulk_response([{"payload": "a"}, {"payload": "b"}], bulk_response(["id1"]))
+        self.assertEqual(results[0], "id1")
+        self.assertIsInstance(results[1], exceptions.BulkTransactionFailure)
+
+    def test_rejected_request_fails_everything(self):
+        results = bulk_writer._correlate_bulk_response([{"payload": "a"}], {"status": 400, "ok": False, "response": "bad"})
+        self.assertIsInstance(results[0], exceptions.BulkTransactionFailure)
@@ -0,0 +1,87 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from tests import unit
+from dragonchain_sdk import cache
+from dragonchain_sdk import transports
+
+if unit.PY36:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+
+def response(size):
+    return transports.TransportResponse(200, b"x" * size)
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_initialization_raises_on_bad_params(self):
+        self.assertRaises(TypeError, cache.ResponseCache, max_bytes="1")
+        self.assertRaises(ValueError, cache.ResponseCache, max_bytes=0)
+        self.assertRaises(TypeError, cache.ResponseCache, negative_ttl="1")
+        self.assertRaises(ValueError, cache.ResponseCache, negative_ttl=-1)
+
+    def test_get_counts_hits_and_misses(self):
+        response_cache = cache.ResponseCache()
+        self.assertIsNone(response_cache.get("a"))
+        response_cache.put("a", response(3), immutable=True)
+        self.assertEqual(response_cache.get("a").body, b"xxx")
+        self.assertEqual(response_cache.stats(), {"hits": 1, "misses": 1, "hit_rate": 0.5, "evictions": 0, "entries": 1, "bytes": 3})
+
+    def test_put_evicts_least_recently_used_for_space(self):
+        response_cache = cache.ResponseCache(max_bytes=10)
+        response_cache.put("a", response(4), immutable=True)
+        response_cache.put("b", response(4), immutable=True)
+        response_cache.get("a")
+        response_cache.put("c", response(4), immutable=True)
+        self.assertIsNone(response_cache.get("b"))
+        self.assertIsNotNone(response_cache.get("a"))
+        self.assertIsNotNone(response_cache.get("c"))
+        self.assertEqual((response_cache.size, response_cache.evictions), (8, 1))
+
+    def test_put_replaces_entry_and_skips_oversized_responses(self):
+        response_cache = cache.ResponseCache(max_bytes=10)
+        response_cache.put("a", response(4), immutable=True)
+        response_cache.put("a", response(6), immutable=True)
+        response_cache.put("b", response(11), immutable=True)
+        self.assertEqual(response_cache.stats()["entries"], 1)
+        self.assertEqual(response_cache.size, 6)
+
+    @patch("dragonchain_sdk.cache.time.monotonic", return_value=100.0)
+    def test_mutable_responses_expire_after_negative_ttl(self, mock_monotonic):
+        response_cache = cache.ResponseCache(negative_ttl=5)
+        response_cache.put("a", response(1), immutable=False)
+        response_cache.put("b", response(1), immutable=True)
+        mock_monotonic.return_value = 104.0
+        self.assertIsNotNone(response_cache.get("a"))
+        mock_monotonic.return_value = 105.0
+        self.assertIsNone(response_cache.get("a"))
+        self.assertIsNotNone(response_cache.get("b"))
+        self.assertEqual(response_cache.size, 1)
+
+    def test_zero_negative_ttl_skips_mutable_responses(self):
+        response_cache = cache.ResponseCache(negative_ttl=0)
+        response_cache.put("a", response(1), immutable=False)
+        self.assertIsNone(response_cache.get("a"))
+
+    def test_invalidate_and_clear_remove_entries(self):
+        response_cache = cache.ResponseCache()
+        response_cache.put("a", response(1), immutable=True)
+        response_cache.put("b", response(2), immutable=True)
+        response_cache.invalidate("a")
+        response_cache.invalidate("missing")
+        self.assertEqual(response_cache.size, 2)
+        response_cache.clear()
+        self.assertEqual(response_cache.stats()["entries"], 0)
+        self.assertEqual(response_cache.size, 0)
@@ -9,14 +9,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import os
+import json
 import logging
 import unittest
 import importlib
+import tempfile
+import threading
 
 from tests import unit
 import dragonchain_sdk
 from dragonchain_sdk import dragonchain_client
+from dragonchain_sdk import exceptions
+from dragonchain_sdk import transports
+from dragonchain_sdk import codec
+from dragonchain_sdk import retry
 
 if unit.PY36:
     from unittest.mock import patch, MagicMock, ANY
@@ -35,7 +43,9 @@ class TestClientInitialization(unittest.TestCase):
     def test_create_client_initializes_correctly_from_module(self, mock_request, mock_creds):
         self.client = dragonchain_sdk.create_client()
         mock_creds.Credentials.assert_called_once_with(None, None, None, "SHA256")
-        mock_request.Request.assert_called_once_with(ANY, None, True)
+        mock_request.Request.assert_called_once_with(
+            ANY, None, True, pool_connections=10, pool_maxsize=10, retry_policy=None, rate_limiter=None, json_codec=None, transport=None, timeout=None
+        )
 
     @patch("dragonchain_sdk.logging")
     def test_set_stream_logger(self, mock_logging, mock_request, mock_creds):
@@ -74,14 +84,116 @@ class TestClientInitialization(unittest.TestCase):
     def test_client_initializes_correctly_no_params(self, mock_request, mock_creds):
         self.client = dragonchain_sdk.create_client()
         mock_creds.Credentials.assert_called_once_with(None, None, None, "SHA256")
-        mock_request.Request.assert_called_once_with(ANY, None, True)
+        mock_request.Request.assert_called_once_with(
+            ANY, None, True, pool_connections=10, pool_maxsize=10, retry_policy=None, rate_limiter=None, json_codec=None, transport=None, timeout=None
+        )
 
     def test_client_initializes_correctly_with_params(self, mock_request, mock_creds):
         self.client = dragonchain_client.Client(
             dragonchain_id="TestID", auth_key="Auth", auth_key_id="AuthID", verify=False, endpoint="endpoint", algorithm="SHA256"
         )
         mock_creds.Credentials.assert_called_once_with("TestID", "Auth", "AuthID", "SHA256")
-        mock_request.Request.assert_called_once_with(ANY, "endpoint", False)
+        mock_request.Request.assert_called_once_with(
+            ANY,
+            "endpoint",
+            False,
+            pool_connections=10,
+            pool_maxsize=10,
+            retry_policy=None,
+            rate_limiter=None,
+            json_codec=None,
+            transport=None,
+            timeout=None,
+        )
+
+    def test_create_client_passes_retry_policy(self, mock_request, mock_creds):
+        policy = dragonchain_sdk.RetryPolicy(max_attempts=5)
+        self.client = dragonchain_sdk.create_client(retry_policy=policy)
+        mock_request.Request.assert_called_once_with(
+            ANY,
+            None,
+            True,
+            pool_connections=10,
+            pool_maxsize=10,
+            retry_policy=policy,
+            rate_limiter=None,
+            json_codec=None,
+            transport=None,
+            timeout=None,
+        )
+
+    def test_create_client_shares_rate_limiter(self, mock_request, mock_creds):
+        limiter = dragonchain_sdk.RateLimiter(rate=10)
+        dragonchain_sdk.create_client(rate_limiter=limiter)
+        dragonchain_sdk.create_client(rate_limiter=limiter)
+        self.assertIs(mock_request.Request.call_args_list[0][1]["rate_limiter"], limiter)
+        self.assertIs(mock_request.Request.call_args_list[1][1]["rate_limiter"], limiter)
+
+    def test_create_client_passes_pool_params(self, mock_request, mock_creds):
+        self.client = dragonchain_sdk.create_client(pool_connections=2, pool_maxsize=50)
+        mock_request.Request.assert_called_once_with(
+            ANY, None, True, pool_connections=2, pool_maxsize=50, retry_policy=None, rate_limiter=None, json_codec=None, transport=None, timeout=None
+        )
+
+    def test_create_client_passes_timeout(self, mock_request, mock_creds):
+        dragonchain_sdk.create_client(timeout=dragonchain_sdk.Timeout(connect=2, read=10))
+        self.assertEqual(mock_request.Request.call_args[1]["timeout"], dragonchain_sdk.Timeout(connect=2, read=10))
+
+    def test_with_options_returns_view_sharing_client(self, mock_request, mock_creds):
+        self.client = dragonchain_sdk.create_client()
+        view = self.client.with_options(timeout=5, deadline=10)
+        self.client.request.with_options.assert_called_once_with(timeout=5, deadline=10)
+        self.assertIs(view.request, self.client.request.with_options.return_value)
+        self.assertIs(view.credentials, self.client.credentials)
+        self.assertIsNot(self.client.request, view.request)
+
+    def test_client_close_closes_request(self, mock_request, mock_creds):
+        self.client = dragonchain_sdk.create_client()
+        self.client.close()
+        self.client.request.close.assert_called_once()
+
+    def test_client_context_manager_closes_request(self, mock_request, mock_creds):
+        with dragonchain_sdk.create_client() as client:
+            self.assertIsInstance(client, dragonchain_client.Client)
+        client.request.close.assert_called_once()
+
+    def test_create_client_raises_type_error_with_bad_lazy(self, mock_request, mock_creds):
+        self.assertRaises(TypeError, dragonchain_sdk.create_client, lazy="yes")
+
+    def test_lazy_client_defers_discovery_until_first_use(self, mock_request, mock_creds):
+        client = dragonchain_sdk.create_client(lazy=True)
+        mock_creds.Credentials.assert_not_called()
+        mock_request.Request.assert_not_called()
+        self.assertIs(client.request, mock_request.Request.return_value)
+        self.assertIs(client.credentials, mock_creds.Credentials.return_value)
+        client.get_status()
+        mock_creds.Credentials.assert_called_once_with(None, None, None, "SHA256")
+        mock_request.Request.assert_called_once_with(
+            ANY, None, True, pool_connections=10, pool_maxsize=10, retry_policy=None, rate_limiter=None, json_codec=None, transport=None, timeout=None
+        )
+
+    def test_lazy_client_warm_discovers_once_between_threads(self, mock_request, mock_creds):
+        client = dragonchain_sdk.create_client(lazy=True)
+        threads = [threading.Thread(target=client.warm) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        mock_creds.Credentials.assert_called_once()
+        mock_request.Request.assert_called_once()
+
+    def test_lazy_client_retries_failed_discovery(self, mock_request, mock_creds):
+        mock_creds.Credentials.side_effect = [exceptions.DragonchainIdentityNotFound("not found"), MagicMock()]
+        client = dragonchain_sdk.create_client(lazy=True)
+        self.assertRaises(exceptions.DragonchainIdentityNotFound, client.warm)
+        client.warm()
+        self.assertEqual(mock_creds.Credentials.call_count, 2)
+        mock_request.Request.assert_called_once()
+
+    def test_closing_unused_lazy_client_skips_discovery(self, mock_request, mock_creds):
+        dragonchain_sdk.create_client(lazy=True).close()
+        mock_creds.Credentials.assert_not_called()
+        mock_request.Request.assert_not_called()
 
 
 @patch("dragonchain_sdk.dragonchain_client.request")
@@ -494,6 +606,70 @@ class TestClientMethods(unittest.TestCase):
         )
         self.client.request.get.assert_called_once_with("/v1/transaction?whatever")
 
+    def test_query_transactions_streams_results(self, mock_creds, mock_request):
+        mock_request.Request.return_value.generate_query_string.return_value = "?whatever"
+        self.client = dragonchain_sdk.create_client()
+        self.client.query_transactions("txn_type", "irrelevant_query", stream=True, fields=["header.txn_id"])
+        self.client.request.get_results_stream.assert_called_once_with("/v1/transaction?whatever", fields=["header.txn_id"])
+        self.client.request.get.assert_not_called()
+
+    def test_iter_transactions_requests_each_page(self, mock_creds, mock_request):
+        mock_request.Request.return_value.generate_query_string.return_value = "?whatever"
+        self.client = dragonchain_sdk.create_client()
+        self.client.request.get.return_value = {"status": 200, "ok": True, "response": {"total": 1, "results": [{"header": {}}]}}
+        results = self.client.iter_transactions("txn_type", "q", sort_by="timestamp", sort_ascending=False, offset=4, page_size=5)
+        self.assertEqual(list(results), [{"header": {}}])
+        self.client.request.generate_query_string.assert_called_once_with(
+            {
+                "transaction_type": "txn_type",
+                "q": "q",
+                "verbatim": False,
+                "offset": 4,
+                "limit": 5,
+                "id_only": False,
+                "sort_by": "timestamp",
+                "sort_asc": False,
+            }
+        )
+        self.client.request.get.assert_called_once_with("/v1/transaction?whatever")
+
+    def test_iter_transactions_raises_type_error(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.assertRaises(TypeError, self.client.iter_transactions, [], "q")
+        self.assertRaises(TypeError, self.client.iter_transactions, "txn_type", "q", verbatim="yes")
+        self.assertRaises(TypeError, self.client.iter_transactions, "txn_type", "q", max_results="10")
+
+    def test_scan_transactions_queries_range_sorted_by_key(self, mock_creds, mock_request):
+        mock_request.Request.return_value.generate_query_string.return_value = "?whatever"
+        self.client = dragonchain_sdk.create_client()
+        self.client.request.get.return_value = {"status": 200, "ok": True, "response": {"results": [{"header": {"txn_id": "a", "block_id": "5"}}]}}
+        results = self.client.scan_transactions("txn_type", "@tag:thing", key="block_id", start=5, page_size=10)
+        self.assertEqual(list(results), [{"header": {"txn_id": "a", "block_id": "5"}}])
+        self.client.request.generate_query_string.assert_called_once_with(
+            {
+                "transaction_type": "txn_type",
+                "q": "(@tag:thing) @block_id:[5 +inf]",
+                "verbatim": False,
+                "offset": 0,
+                "limit": 10,
+                "id_only": False,
+                "sort_by": "block_id",
+                "sort_asc": True,
+            }
+        )
+
+    def test_scan_transactions_raises_on_bad_params(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.assertRaises(TypeError, self.client.scan_transactions, [])
+        self.assertRaises(TypeError, self.client.scan_transactions, "txn_type", verbatim="yes")
+        self.assertRaises(ValueError, self.client.scan_transactions, "txn_type", key="tag")
+
+    def test_query_transactions_raises_on_bad_stream_params(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.assertRaises(TypeError, self.client.query_transactions, "txn_type", "q", stream="yes")
+        self.assertRaises(TypeError, self.client.query_transactions, "txn_type", "q", stream=True, fields="header")
+        self.assertRaises(ValueError, self.client.query_transactions, "txn_type", "q", fields=["header"])
+
     def test_query_transactions_adds_sort_by_when_provided(self, mock_creds, mock_request):
         mock_request.Request.return_value.generate_query_string.return_value = "?whatever"
         self.client = dragonchain_sdk.create_client()
@@ -544,6 +720,88 @@ class TestClientMethods(unittest.TestCase):
             ],
         )
 
+    def test_post_bulk_transaction_streams_body(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.assertRaises(TypeError, self.client.create_bulk_transaction, [], stream="yes")
+        self.client.create_bulk_transaction([{"transaction_type": "test", "payload": "a"}], stream=True)
+        self.client.request.post.assert_not_called()
+        path, items = self.client.request.post_stream.call_args[0]
+        self.assertEqual(path, "/v1/transaction_bulk")
+        self.assertEqual(list(items), [{"version": "1", "txn_type": "test", "payload": "a"}])
+
+    def test_post_bulk_transaction_posts_encoded_chunks_when_streaming(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.client.request.json_codec = codec.StandardJsonCodec()
+        self.client.request.post_encoded.return_value = {"status": 207, "ok": True, "response": {"201": ["a"], "400": []}}
+        self.client.create_bulk_transaction([{"transaction_type": "test", "payload": "a"}] * 3, chunk_size=2, stream=True)
+        self.assertEqual(self.client.request.post_encoded.call_count, 2)
+        self.client.request.post_stream.assert_not_called()
+        self.client.request.post.assert_not_called()
+
+    def test_post_bulk_transaction_raises_on_bad_chunking_params(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.assertRaises(TypeError, self.client.create_bulk_transaction, [], chunk_size="1")
+        self.assertRaises(ValueError, self.client.create_bulk_transaction, [], chunk_size=0)
+        self.assertRaises(ValueError, self.client.create_bulk_transaction, [], chunk_size=dragonchain_client.MAX_BULK_TRANSACTIONS + 1)
+        self.assertRaises(TypeError, self.client.create_bulk_transaction, [], max_chunk_bytes="1")
+        self.assertRaises(ValueError, self.client.create_bulk_transaction, [], max_chunk_bytes=0)
+        self.assertRaises(TypeError, self.client.create_bulk_transaction, [], chunk_size=1, concurrency="1")
+        self.assertRaises(ValueError, self.client.create_bulk_transaction, [], chunk_size=1, concurrency=0)
+
+    def test_post_bulk_transaction_chunks_and_merges_in_order(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.client.request.json_codec = codec.StandardJsonCodec()
+        transactions = [{"transaction_type": "test", "payload": str(i)} for i in range(5)]
+
+        def fake_post(path, content):
+            chunk = json.loads(content.decode("utf8"))
+            ids = [item["payload"] for item in chunk if item["payload"] != "3"]
+            failed = [item for item in chunk if item["payload"] == "3"]
+            return {"status": 207, "ok": True, "response": {"201": ids, "400": failed}}
+
+        self.client.request.post_encoded.side_effect = fake_post
+        response = self.client.create_bulk_transaction(transactions, chunk_size=2, concurrency=3)
+        self.assertEqual(self.client.request.post_encoded.call_count, 3)
+        self.assertEqual(
+            response,
+            {"status": 207, "ok": True, "response": {"201": ["0", "1", "2", "4"], "400": [{"version": "1", "txn_type": "test", "payload": "3"}]}},
+        )
+
+    def test_post_bulk_transaction_marks_rejected_chunk_as_failed(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.client.request.json_codec = codec.StandardJsonCodec()
+        self.client.request.post_encoded.side_effect = [
+            {"status": 207, "ok": True, "response": {"201": ["a"], "400": []}},
+            {"status": 413, "ok": False, "response": {"error": "too big"}},
+        ]
+        response = self.client.create_bulk_transaction(
+            [{"transaction_type": "test", "payload": "a"}, {"transaction_type": "test", "payload": "b"}], 1
+        )
+        self.assertEqual(
+            response, {"status": 207, "ok": False, "response": {"201": ["a"], "400": [{"version": "1", "txn_type": "test", "payload": "b"}]}}
+        )
+
+    def test_chunk_bulk_transaction_list_by_bytes(self, mock_creds, mock_request):
+        json_codec = codec.StandardJsonCodec()
+        post_data = [{"payload": "x" * 10} for _ in range(4)]  # Each item encodes to 24 bytes (+1 separator)
+        chunks = dragonchain_client._chunk_bulk_transaction_list(post_data, json_codec, max_chunk_bytes=60)
+        self.assertEqual(chunks, [(post_data[:2], json_codec.dumps(post_data[:2])), (post_data[2:], json_codec.dumps(post_data[2:]))])
+        self.assertTrue(all(len(content) <= 60 for _, content in chunks))
+        chunks = dragonchain_client._chunk_bulk_transaction_list(post_data, json_codec, max_chunk_bytes=1)
+        self.assertEqual([chunk for chunk, _ in chunks], [[item] for item in post_data])
+        chunks = dragonchain_client._chunk_bulk_transaction_list(post_data, json_codec, chunk_size=3)
+        self.assertEqual([chunk for chunk, _ in chunks], [post_data[:3], post_data[3:]])
+
+    def test_chunk_bulk_transaction_list_encodes_each_transaction_once(self, mock_creds, mock_request):
+        json_codec = MagicMock(**{"dumps.side_effect": codec.StandardJsonCodec().dumps})
+        dragonchain_client._chunk_bulk_transaction_list([{"payload": str(i)} for i in range(3)], json_codec, max_chunk_bytes=30)
+        self.assertEqual(json_codec.dumps.call_count, 3)
+
+    def test_chunk_bulk_transaction_list_defaults_to_bulk_limit(self, mock_creds, mock_request):
+        post_data = [{}] * 251
+        chunks = dragonchain_client._chunk_bulk_transaction_list(post_data, codec.StandardJsonCodec(), max_chunk_bytes=1000000000)
+        self.assertEqual([len(chunk) for chunk, _ in chunks], [250, 1])
+
     def test_create_transaction_throws_type_error(self, mock_creds, mock_request):
         self.client = dragonchain_sdk.create_client()
         self.assertRaises(TypeError, self.client.create_transaction, transaction_type=[], payload={})
@@ -589,6 +847,36 @@ class TestClientMethods(unittest.TestCase):
         self.client.get_transaction("Test")
         self.client.request.get.assert_called_once_with("/v1/transaction/Test")
 
+    def test_get_transactions_dedupes_and_keeps_order(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        error = exceptions.ConnectionException("error")
+
+        def get(path):
+            if path.endswith("/c"):
+                raise error
+            return {"status": 200, "ok": True, "response": path}
+
+        self.client.request.get.side_effect = get
+        results = self.client.get_transactions(["b", "a", "b", "c"], concurrency=2)
+        self.assertEqual(
+            results,
+            [
+                {"status": 200, "ok": True, "response": "/v1/transaction/b"},
+                {"status": 200, "ok": True, "response": "/v1/transaction/a"},
+                {"status": 200, "ok": True, "response": "/v1/transaction/b"},
+                error,
+            ],
+        )
+        self.assertEqual(self.client.request.get.call_count, 3)
+        self.assertEqual(self.client.get_transactions([]), [])
+
+    def test_get_transactions_raises_on_bad_params(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.assertRaises(TypeError, self.client.get_transactions, "a")
+        self.assertRaises(TypeError, self.client.get_transactions, ["a", 1])
+        self.assertRaises(TypeError, self.client.get_transactions, ["a"], concurrency="2")
+        self.assertRaises(ValueError, self.client.get_transactions, ["a"], concurrency=0)
+
     def test_query_blocks_calls_get_with_params(self, mock_creds, mock_request):
         mock_request.Request.return_value.generate_query_string.return_value = "?whatever"
         self.client = dragonchain_sdk.create_client()
@@ -596,6 +884,38 @@ class TestClientMethods(unittest.TestCase):
         self.client.request.generate_query_string.assert_called_once_with({"q": "irrelevant", "offset": 0, "limit": 10, "id_only": False})
         self.client.request.get.assert_called_once_with("/v1/block?whatever")
 
+    def test_query_blocks_streams_results(self, mock_creds, mock_request):
+        mock_request.Request.return_value.generate_query_string.return_value = "?whatever"
+        self.client = dragonchain_sdk.create_client()
+        self.client.query_blocks("irrelevant", stream=True)
+        self.client.request.get_results_stream.assert_called_once_with("/v1/block?whatever", fields=None)
+
+    def test_iter_blocks_requests_each_page(self, mock_creds, mock_request):
+        mock_request.Request.return_value.generate_query_string.return_value = "?whatever"
+        self.client = dragonchain_sdk.create_client()
+        self.client.request.get.side_effect = [
+            {"status": 200, "ok": True, "response": {"total": 3, "results": ["a", "b"]}},
+            {"status": 200, "ok": True, "response": {"total": 3, "results": ["c"]}},
+        ]
+        self.assertEqual(list(self.client.iter_blocks("irrelevant", ids_only=True, page_size=2, max_page_size=2, prefetch=False)), ["a", "b", "c"])
+        self.client.request.generate_query_string.assert_any_call({"q": "irrelevant", "id_only": True, "offset": 0, "limit": 2})
+        self.client.request.generate_query_string.assert_any_call({"q": "irrelevant", "id_only": True, "offset": 2, "limit": 1})
+        self.client.request.get.assert_called_with("/v1/block?whatever")
+
+    def test_iter_blocks_raises_type_error(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.assertRaises(TypeError, self.client.iter_blocks, [])
+        self.assertRaises(TypeError, self.client.iter_blocks, "q", page_size="10")
+
+    def test_scan_blocks_queries_range_sorted_by_key(self, mock_creds, mock_request):
+        mock_request.Request.return_value.generate_query_string.return_value = "?whatever"
+        self.client = dragonchain_sdk.create_client()
+        self.client.request.get.return_value = {"status": 200, "ok": True, "response": {"results": []}}
+        self.assertEqual(list(self.client.scan_blocks(end=100, ascending=False)), [])
+        self.client.request.generate_query_string.assert_called_once_with(
+            {"q": "@block_id:[-inf 100]", "offset": 0, "limit": 100, "id_only": False, "sort_by": "block_id", "sort_asc": False}
+        )
+
     def test_query_blocks_adds_sort_by_when_provided(self, mock_creds, mock_request):
         mock_request.Request.return_value.generate_query_string.return_value = "?whatever"
         self.client = dragonchain_sdk.create_client()
@@ -625,6 +945,14 @@ class TestClientMethods(unittest.TestCase):
         self.client.get_block("1234")
         self.client.request.get.assert_called_once_with("/v1/block/1234")
 
+    def test_get_blocks_calls_get_for_each_block(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.client.request.get.return_value = "response"
+        self.assertEqual(self.client.get_blocks(["1", "2"]), ["response", "response"])
+        self.client.request.get.assert_any_call("/v1/block/1")
+        self.client.request.get.assert_any_call("/v1/block/2")
+        self.assertRaises(TypeError, self.client.get_blocks, [1])
+
     def test_get_pending_verifications_throws_type_error(self, mock_creds, mock_request):
         self.client = dragonchain_sdk.create_client()
         self.assertRaises(TypeError, self.client.get_pending_verifications, [])
@@ -677,18 +1005,63 @@ class TestClientMethods(unittest.TestCase):
     def test_get_smart_contract_object_reads_env_and_calls_get(self, mock_creds, mock_request):
         self.client = dragonchain_sdk.create_client()
         self.client.get_smart_contract_object(key="MyKey")
-        self.client.request.get.assert_called_once_with("/v1/get/MyName/MyKey", parse_response=False)
+        self.client.request.get.assert_called_once_with("/v1/get/MyName/MyKey", parse_response=False, raw=False)
 
     @patch.dict(os.environ, {"SMART_CONTRACT_ID": "MyName"})
     def test_get_smart_contract_object_reads_env_and_calls_get_with_override(self, mock_creds, mock_request):
         self.client = dragonchain_sdk.create_client()
         self.client.get_smart_contract_object(smart_contract_id="Override", key="MyKey")
-        self.client.request.get.assert_called_once_with("/v1/get/Override/MyKey", parse_response=False)
+        self.client.request.get.assert_called_once_with("/v1/get/Override/MyKey", parse_response=False, raw=False)
 
     def test_get_smart_contract_object_calls_get(self, mock_creds, mock_request):
         self.client = dragonchain_sdk.create_client()
         self.client.get_smart_contract_object(key="MyKey", smart_contract_id="MyContract")
-        self.client.request.get.assert_called_once_with("/v1/get/MyContract/MyKey", parse_response=False)
+        self.client.request.get.assert_called_once_with("/v1/get/MyContract/MyKey", parse_response=False, raw=False)
+
+    def test_get_smart_contract_object_returns_bytes_when_raw(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.assertRaises(TypeError, self.client.get_smart_contract_object, key="MyKey", smart_contract_id="MyContract", raw="yes")
+        self.client.get_smart_contract_object(key="MyKey", smart_contract_id="MyContract", raw=True)
+        self.client.request.get.assert_called_once_with("/v1/get/MyContract/MyKey", parse_response=False, raw=True)
+
+    @patch.dict(os.environ, {"SMART_CONTRACT_ID": "MyName"})
+    def test_stream_smart_contract_object_calls_get_stream(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.assertRaises(TypeError, self.client.stream_smart_contract_object, key=[])
+        self.client.stream_smart_contract_object(key="MyKey")
+        self.client.request.get_stream.assert_called_once_with("/v1/get/MyName/MyKey")
+
+    def test_download_smart_contract_object_writes_file(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        release = MagicMock()
+        body = transports.StreamedTransportResponse(200, [b"\x00\xff", b"\x80"], release=release)
+        self.client.request.get_stream.return_value = {"status": 200, "ok": True, "response": body}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "object")
+            response = self.client.download_smart_contract_object("MyKey", path, smart_contract_id="MyContract")
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"\x00\xff\x80")
+            self.assertEqual(os.listdir(directory), ["object"])
+        self.assertEqual(response, {"status": 200, "ok": True, "response": 3})
+        self.client.request.get_stream.assert_called_once_with("/v1/get/MyContract/MyKey")
+        release.assert_called_once()
+
+    def test_download_smart_contract_object_writes_file_like(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        body = transports.StreamedTransportResponse(200, [b"abc"])
+        self.client.request.get_stream.return_value = {"status": 200, "ok": True, "response": body}
+        destination = io.BytesIO()
+        self.client.download_smart_contract_object("MyKey", destination, smart_contract_id="MyContract")
+        self.assertEqual(destination.getvalue(), b"abc")
+
+    def test_download_smart_contract_object_returns_error_without_writing(self, mock_creds, mock_request):
+        self.client = dragonchain_sdk.create_client()
+        self.assertRaises(TypeError, self.client.download_smart_contract_object, "MyKey", 1, smart_contract_id="MyContract")
+        error = {"status": 404, "ok": False, "response": {"error": "not found"}}
+        self.client.request.get_stream.return_value = error
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(self.client.download_smart_contract_object("MyKey", os.path.join(directory, "object"), "MyContract"), error)
+            self.assertEqual(os.listdir(directory), [])
 
     def test_list_smart_contract_objects_throws_type_error(self, mock_creds, mock_request):
         self.client = dragonchain_sdk.create_client()
@@ -1157,3 +1530,122 @@ class TestClientMethods(unittest.TestCase):
         self.client.sign_binance_transaction("name", 123, "0xaddress")
         params = {"version": "1", "amount": 123, "to_address": "0xaddress"}
         self.client.request.post.assert_called_once_with("/v1/interchains/binance/name/transaction", params)
+
+
+class TestClientDeadlines(unittest.TestCase):
+    def test_deadline_applies_to_every_chunk_of_bulk_transaction(self):
+        transport = transports.LoopbackTransport(body=b'{"201": ["id"], "400": []}')
+        client = dragonchain_sdk.create_client("id", "key_id", "key", "https://dummy.test", transport=transport)
+        transactions = [{"transaction_type": "test", "payload": str(i)} for i in range(3)]
+        with patch("dragonchain_sdk.timeouts.time.monotonic", return_value=100.0) as mock_monotonic:
+            view = client.with_options(deadline=5)
+
+            def expire_after_first_chunk(*args):
+                mock_monotonic.return_value = 106.0
+                return transports.TransportResponse(207, b'{"201": ["id"], "400": []}')
+
+            transport.handler = expire_after_first_chunk
+            response = view.create_bulk_transaction(transactions, chunk_size=1)
+        self.assertEqual(transport.request_count, 1)
+        # The id from the chunk which was sent is kept, and the chunks which missed the deadline are failed
+        self.assertEqual(
+            response,
+            {
+                "status": 207,
+                "ok": False,
+                "response": {
+                    "201": ["id"],
+                    "400": [{"version": "1", "txn_type": "test", "payload": "1"}, {"version": "1", "txn_type": "test", "payload": "2"}],
+                },
+            },
+        )
+
+    def test_bulk_transaction_raises_when_every_chunk_fails(self):
+        transport = transports.LoopbackTransport(handler=MagicMock(side_effect=Exception("connection refused")))
+        client = dragonchain_sdk.create_client("id", "key_id", "key", "https://dummy.test", transport=transport, retry_policy=retry.NO_RETRY)
+        transactions = [{"transaction_type": "test", "payload": str(i)} for i in range(2)]
+        self.assertRaises(exceptions.ConnectionException, client.create_bulk_transaction, transactions, chunk_size=1)
+
+
+class TestClientResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.bodies = {}
+        self.transport = transports.LoopbackTransport(self.handler)
+        self.response_cache = dragonchain_sdk.ResponseCache(negative_ttl=60)
+        self.client = dragonchain_sdk.create_client(
+            "id", "key_id", "key", "https://dummy.test", transport=self.transport, response_cache=self.response_cache
+        )
+
+    def handler(self, http_verb, url, body, headers):
+        path = url[len("https://dummy.test") :]
+        if path not in self.bodies:
+            return transports.TransportResponse(404, b'{"error": "not found"}')
+        return transports.TransportResponse(200, self.bodies[path])
+
+    def test_create_client_raises_type_error_with_bad_response_cache(self):
+        self.assertRaises(TypeError, dragonchain_sdk.create_client, "id", "key_id", "key", "https://dummy.test", response_cache={})
+
+    def test_get_transaction_caches_transaction_in_block(self):
+        self.bodies["/v1/transaction/a"] = b'{"header": {"txn_id": "a", "block_id": "1"}}'
+        first = self.client.get_transaction("a")
+        first["response"]["header"]["txn_id"] = "modified"
+        self.assertEqual(self.client.get_transaction("a"), {"status": 200, "ok": True, "response": {"header": {"txn_id": "a", "block_id": "1"}}})
+        self.assertEqual(self.transport.request_count, 1)
+        self.assertEqual(self.response_cache.stats()["hits"], 1)
+
+    def test_get_transaction_only_briefly_caches_pending_and_missing(self):
+        self.bodies["/v1/transaction/a"] = b'{"header": {"txn_id": "a"}}'
+        self.client.get_transaction("a")
+        self.client.get_transaction("b")
+        with patch("dragonchain_sdk.cache.time.monotonic", return_value=10**9):
+            self.client.get_transaction("a")
+            self.assertEqual(self.client.get_transaction("b")["status"], 404)
+        self.assertEqual(self.transport.request_count, 4)
+
+    def test_get_transaction_does_not_cache_errors(self):
+        self.transport.handler = lambda *args: transports.TransportResponse(401, b'{"error": "unauthorized"}')
+        self.client.get_transaction("a")
+        self.client.get_transaction("a")
+        self.assertEqual(self.transport.request_count, 2)
+        self.assertEqual(self.response_cache.stats()["entries"], 0)
+
+    def test_get_block_caches_block_for_each_chain(self):
+        self.bodies["/v1/block/1"] = b'{"header": {"block_id": "1"}}'
+        other = dragonchain_sdk.create_client(
+            "other", "key_id", "key", "https://dummy.test", transport=self.transport, response_cache=self.response_cache
+        )
+        self.client.get_block("1")
+        self.client.get_block("1")
+        other.get_block("1")
+        self.assertEqual(self.transport.request_count, 2)
+
+    def test_get_verifications_caches_final_level(self):
+        self.bodies["/v1/verifications/1?level=2"] = b'[{"header": {}}]'
+        self.bodies["/v1/verifications/pending/1"] = b'{"2": [], "3": ["chain"]}'
+        self.client.get_verifications("1", level=2)
+        self.client.get_verifications("1", level=2)
+        self.assertEqual(self.transport.request_count, 2)
+
+    def test_get_verifications_returns_uncached_when_pending_check_fails(self):
+        self.bodies["/v1/verifications/1?level=2"] = b'[{"header": {}}]'
+        handler = self.handler
+
+        def fail_pending(http_verb, url, body, headers):
+            if "/pending/" in url:
+                raise Exception("connection reset")
+            return handler(http_verb, url, body, headers)
+
+        self.transport.handler = fail_pending
+        self.client.request.retry_policy = retry.NO_RETRY
+        self.assertEqual(self.client.get_verifications("1", level=2), {"status": 200, "ok": True, "response": [{"header": {}}]})
+        self.assertEqual(self.response_cache.stats()["entries"], 0)
+
+    def test_get_verifications_does_not_cache_pending_levels(self):
+        self.bodies["/v1/verifications/1"] = b'{"2": [{}], "3": [{}], "4": [{}], "5": []}'
+        self.bodies["/v1/verifications/1?level=3"] = b"[]"
+        self.bodies["/v1/verifications/pending/1"] = b'{"2": [], "3": [], "4": [], "5": ["chain"]}'
+        self.response_cache.negative_ttl = 0
+        self.client.get_verifications("1")
+        self.client.get_verifications("1")
+        self.client.get_verifications("1", level=3)
+        self.assertEqual(self.transport.request_count, 6)
@@ -0,0 +1,96 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import datetime
+import unittest
+
+from tests import unit
+from dragonchain_sdk import codec
+
+if unit.PY36:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+SAMPLE = {"version": "1", "txn_type": "test", "payload": {"a": [1, 2, 3], "b": None, "c": True, "d": 1.5}, "tag": "some tag"}
+
+
+class TestStandardJsonCodec(unittest.TestCase):
+    def test_dumps_is_compact_utf8(self):
+        self.assertEqual(codec.StandardJsonCodec().dumps({"a": [1, "é"]}), b'{"a":[1,"\\u00e9"]}')
+
+    def test_loads_bytes(self):
+        self.assertEqual(codec.StandardJsonCodec().loads(b'{"a":[1,"\\u00e9"]}'), {"a": [1, "é"]})
+
+    def test_base_codec_is_abstract(self):
+        self.assertRaises(NotImplementedError, codec.JsonCodec().dumps, {})
+        self.assertRaises(NotImplementedError, codec.JsonCodec().loads, b"{}")
+
+
+@unittest.skipUnless(codec.orjson is not None, "orjson is not installed")
+class TestOrjsonCodec(unittest.TestCase):
+    def setUp(self):
+        self.codec = codec.OrjsonCodec()
+        self.standard = codec.StandardJsonCodec()
+
+    def test_dumps_is_byte_identical_to_standard_codec(self):
+        self.assertEqual(self.codec.dumps(SAMPLE), self.standard.dumps(SAMPLE))
+
+    def test_dumps_falls_back_for_non_ascii(self):
+        self.assertEqual(self.codec.dumps({"a": "é"}), b'{"a":"\\u00e9"}')
+
+    def test_dumps_falls_back_for_unsupported_input(self):
+        self.assertEqual(self.codec.dumps({1: 2**70}), b'{"1":1180591620717411303424}')
+
+    def test_dumps_encodes_types_the_standard_codec_rejects(self):
+        obj = {"at": datetime.date(2020, 1, 2)}
+        self.assertEqual(self.codec.dumps(obj), b'{"at":"2020-01-02"}')
+        self.assertRaises(TypeError, self.standard.dumps, obj)
+
+    def test_loads(self):
+        self.assertEqual(self.codec.loads(self.standard.dumps(SAMPLE)), SAMPLE)
+
+    def test_loads_keeps_integers_larger_than_64_bits(self):
+        for data in [b"123456789012345678901234567890", b"-9223372036854775809", b'{"a":[18446744073709551616]}']:
+            self.assertEqual(self.codec.loads(data), self.standard.loads(data))
+        self.assertEqual(self.codec.loads(b"123456789012345678901234567890"), 123456789012345678901234567890)
+
+    def test_loads_falls_back_for_numbers_orjson_rejects(self):
+        self.assertEqual(self.codec.loads(b'{"a":Infinity,"b":1e400,"c":-Infinity}'), {"a": float("inf"), "b": float("inf"), "c": float("-inf")})
+        self.assertTrue(math.isnan(self.codec.loads(b"[NaN]")[0]))
+
+    def test_loads_raises_for_invalid_json(self):
+        self.assertRaises(ValueError, self.codec.loads, b"{")
+
+
+class TestGetDefaultCodec(unittest.TestCase):
+    @patch("dragonchain_sdk.codec.orjson", None)
+    def test_standard_codec_without_orjson(self):
+        self.assertIsInstance(codec.get_default_codec(), codec.StandardJsonCodec)
+
+    @patch("dragonchain_sdk.codec.orjson", None)
+    def test_orjson_codec_raises_without_orjson(self):
+        self.assertRaises(RuntimeError, codec.OrjsonCodec)
+
+    @unittest.skipUnless(codec.orjson is not None, "orjson is not installed")
+    def test_orjson_codec_when_installed(self):
+        self.assertIsInstance(codec.get_default_codec(), codec.OrjsonCodec)
+
+
+class TestEstimateSize(unittest.TestCase):
+    def test_estimate_is_exact_for_simple_objects(self):
+        obj = {"key": "value", "list": ["abc", "def"]}
+        self.assertEqual(codec.estimate_size(obj), len(codec.StandardJsonCodec().dumps(obj)))
+
+    def test_estimate_scales_with_list_length(self):
+        self.assertEqual(codec.estimate_size([{"a": 1}] * 1000), 1 + 1000 * (codec.estimate_size({"a": 1}) + 1))
+        self.assertEqual(codec.estimate_size([]), 2)
@@ -10,8 +10,9 @@
 # limitations under the License.
 
 import os
+import shutil
+import tempfile
 import unittest
-import configparser
 
 import requests
 import requests_mock
@@ -19,6 +20,7 @@ import requests_mock
 from tests import unit
 from dragonchain_sdk import configuration
 from dragonchain_sdk import exceptions
+from dragonchain_sdk import endpoint_cache
 
 if unit.PY36:
     from unittest.mock import patch
@@ -29,6 +31,12 @@ config_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_con
 
 
 class TestPublicConfigMethods(unittest.TestCase):
+    def setUp(self):
+        # Keep resolved endpoints in memory only, so tests never touch the real cache file
+        patcher = patch("dragonchain_sdk.configuration._endpoint_cache", endpoint_cache.EndpointCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("dragonchain_sdk.configuration._get_credentials_as_smart_contract", return_value=("", ""))
     @patch("dragonchain_sdk.configuration._get_credentials_from_file", return_value=("", ""))
     @patch("dragonchain_sdk.configuration._get_credentials_from_environment", return_value=("", ""))
@@ -72,10 +80,11 @@ class TestPublicConfigMethods(unittest.TestCase):
         self.assertEqual("TestID", configuration.get_dragonchain_id())
         mock_path.assert_not_called()
 
-    @patch("dragonchain_sdk.configuration.configparser.ConfigParser")
-    def test_get_dragonchain_id_from_file(self, mock_configparser):
-        mock_configparser.return_value.get.return_value = "test"
-        self.assertEqual("test", configuration.get_dragonchain_id())
+    @patch("dragonchain_sdk.configuration._get_config_file_path", return_value=config_file)
+    def test_get_dragonchain_id_from_file(self, mock_path):
+        with patch.dict(os.environ):
+            os.environ.pop("DRAGONCHAIN_ID", None)
+            self.assertEqual("TestID", configuration.get_dragonchain_id())
 
     @patch("dragonchain_sdk.configuration._get_endpoint_from_environment", return_value="")
     @patch("dragonchain_sdk.configuration._get_endpoint_from_file", return_value="")
@@ -110,35 +119,68 @@ class TestPublicConfigMethods(unittest.TestCase):
         mock_get_file.assert_called_once_with("test")
         mock_get_remote.assert_called_once_with("test")
 
+    @patch("dragonchain_sdk.configuration._get_endpoint_from_environment", return_value="")
+    @patch("dragonchain_sdk.configuration._get_endpoint_from_file", return_value="")
+    @patch("dragonchain_sdk.configuration._get_endpoint_from_remote", return_value="thing")
+    def test_get_endpoint_caches_remote_endpoint(self, mock_get_remote, mock_get_file, mock_get_env):
+        self.assertEqual("thing", configuration.get_endpoint("test"))
+        self.assertEqual("thing", configuration.get_endpoint("test"))
+        mock_get_remote.assert_called_once_with("test")
+
+    @patch("dragonchain_sdk.configuration._get_endpoint_from_environment", return_value="")
+    @patch("dragonchain_sdk.configuration._get_endpoint_from_file", return_value="")
+    @patch("dragonchain_sdk.configuration._get_endpoint_from_remote", side_effect=["thing", "other"])
+    def test_invalidate_endpoint_resolves_again(self, mock_get_remote, mock_get_file, mock_get_env):
+        self.assertEqual("thing", configuration.get_endpoint("test"))
+        configuration.invalidate_endpoint("test", "thing")
+        self.assertEqual("other", configuration.get_endpoint("test"))
+        self.assertEqual(mock_get_remote.call_count, 2)
+
+    @patch("dragonchain_sdk.configuration._endpoint_cache", None)
+    @patch.dict(os.environ, {"DRAGONCHAIN_ENDPOINT_CACHE_FILE": "cache.json"})
+    def test_get_endpoint_cache_uses_path_from_environment(self):
+        cache = configuration.get_endpoint_cache()
+        self.assertEqual(cache.path, "cache.json")
+        self.assertIs(configuration.get_endpoint_cache(), cache)
+
+    @patch("dragonchain_sdk.configuration._endpoint_cache", None)
+    @patch("dragonchain_sdk.configuration._get_config_file_path", return_value=os.path.join("dir", "credentials"))
+    def test_get_endpoint_cache_defaults_to_next_to_credentials(self, mock_path):
+        with patch.dict(os.environ):
+            os.environ.pop("DRAGONCHAIN_ENDPOINT_CACHE_FILE", None)
+            self.assertEqual(configuration.get_endpoint_cache().path, os.path.join("dir", "endpoint_cache.json"))
+
+    def test_set_endpoint_cache(self):
+        cache = endpoint_cache.EndpointCache(ttl=5)
+        configuration.set_endpoint_cache(cache)
+        self.assertIs(configuration.get_endpoint_cache(), cache)
+        self.assertRaises(TypeError, configuration.set_endpoint_cache, "cache")
+
 
 class TestPrivateConfigMethods(unittest.TestCase):
     @patch("dragonchain_sdk.configuration._get_config_file_path", return_value=config_file)
     def test_gets_endpoint_from_config_file(self, mock_path):
         self.assertEqual("https://an.end.point", configuration._get_endpoint_from_file("TestID"))
 
-    @patch("dragonchain_sdk.configuration.configparser.ConfigParser")
-    def test_gets_endpoint_from_file_returns_empty_on_no_section(self, mock_configparser):
-        mock_configparser.return_value.get.side_effect = configparser.NoSectionError("test")
+    @patch("dragonchain_sdk.configuration._get_config_file_path", return_value=config_file)
+    def test_gets_endpoint_from_file_returns_empty_on_no_section(self, mock_path):
         self.assertEqual("", configuration._get_endpoint_from_file("test"))
 
-    @patch("dragonchain_sdk.configuration.configparser.ConfigParser")
-    def test_gets_endpoint_from_file_returns_empty_on_no_option(self, mock_configparser):
-        mock_configparser.return_value.get.side_effect = configparser.NoOptionError("test", "test")
-        self.assertEqual("", configuration._get_endpoint_from_file("test"))
+    @patch("dragonchain_sdk.configuration._get_config_file_path", return_value=config_file)
+    def test_gets_endpoint_from_file_returns_empty_on_no_option(self, mock_path):
+        self.assertEqual("", configuration._get_endpoint_from_file("default"))
 
     @patch("dragonchain_sdk.configuration._get_config_file_path", return_value=config_file)
     def test_gets_credentials_from_config_file(self, mock_path):
         self.assertEqual(("TestKeyId", "TestKey"), configuration._get_credentials_from_file("TestID"))
 
-    @patch("dragonchain_sdk.configuration.configparser.ConfigParser")
-    def test_gets_credentials_from_file_returns_empty_on_no_section(self, mock_configparser):
-        mock_configparser.return_value.get.side_effect = configparser.NoSectionError("test")
+    @patch("dragonchain_sdk.configuration._get_config_file_path", return_value=config_file)
+    def test_gets_credentials_from_file_returns_empty_on_no_section(self, mock_path):
         self.assertEqual(("", ""), configuration._get_credentials_from_file("test"))
 
-    @patch("dragonchain_sdk.configuration.configparser.ConfigParser")
-    def test_gets_credentials_from_file_returns_empty_on_no_option(self, mock_configparser):
-        mock_configparser.return_value.get.side_effect = configparser.NoOptionError("test", "test")
-        self.assertEqual(("", ""), configuration._get_credentials_from_file("test"))
+    @patch("dragonchain_sdk.configuration._get_config_file_path", return_value=config_file)
+    def test_gets_credentials_from_file_returns_empty_on_no_option(self, mock_path):
+        self.assertEqual(("", ""), configuration._get_credentials_from_file("default"))
 
     @patch.dict(os.environ, {"AUTH_KEY": "TestKey", "AUTH_KEY_ID": "TestKeyId"})
     def test_gets_credentials_from_environ(self):
@@ -158,11 +200,11 @@ class TestPrivateConfigMethods(unittest.TestCase):
         mock_open.side_effect = FileNotFoundError()
         self.assertEqual(("", ""), configuration._get_credentials_as_smart_contract())
 
-    @patch("dragonchain_sdk.configuration.requests.get", side_effect=requests.ConnectionError)
+    @patch("requests.get", side_effect=requests.ConnectionError)
     def test_gets_credentials_from_remote_raises_with_communication_error(self, mock_request):
         self.assertRaises(exceptions.MatchmakingException, configuration._get_endpoint_from_remote, "test")
 
-    @patch("dragonchain_sdk.configuration.requests.get", side_effect=Exception)
+    @patch("requests.get", side_effect=Exception)
     def test_gets_credentials_from_remote_raises_with_unknown_requests_error(self, mock_request):
         self.assertRaises(exceptions.MatchmakingException, configuration._get_endpoint_from_remote, "test")
 
@@ -198,3 +240,48 @@ class TestPrivateConfigMethods(unittest.TestCase):
         mock_home.assert_called_once()
         mock_expand.assert_not_called()
         mock_join.assert_called_once_with("home", ".dragonchain", "credentials")
+
+
+class TestConfigStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "credentials")
+        shutil.copy(config_file, self.path)
+
+    def test_read_indexes_sections(self):
+        sections = configuration.ConfigStore().read(self.path)
+        self.assertEqual(sections["default"], {"dragonchain_id": "TestID"})
+        self.assertEqual(sections["TestID"], {"auth_key": "TestKey", "auth_key_id": "TestKeyId", "endpoint": "https://an.end.point"})
+
+    def test_read_keeps_percent_signs_without_breaking_other_sections(self):
+        with open(self.path, "a") as f:
+            f.write("\n[abc]\nauth_key_id = ABC\nauth_key = sec%ret\n")
+        sections = configuration.ConfigStore().read(self.path)
+        self.assertEqual(sections["abc"]["auth_key"], "sec%ret")
+        self.assertEqual(sections["default"], {"dragonchain_id": "TestID"})
+        with patch("dragonchain_sdk.configuration._get_config_file_path", return_value=self.path), patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(configuration.get_dragonchain_id(), "TestID")
+            self.assertEqual(configuration._get_credentials_from_file("other"), ("", ""))
+            self.assertEqual(configuration._get_credentials_from_file("abc"), ("ABC", "sec%ret"))
+
+    def test_read_returns_empty_for_missing_file(self):
+        self.assertEqual(configuration.ConfigStore().read(os.path.join(self.directory, "missing")), {})
+
+    @patch("dragonchain_sdk.configuration.configparser.ConfigParser", wraps=configuration.configparser.ConfigParser)
+    def test_read_only_parses_unchanged_file_once(self, mock_configparser):
+        store = configuration.ConfigStore()
+        self.assertIs(store.read(self.path), store.read(self.path))
+        mock_configparser.assert_called_once()
+
+    def test_read_parses_again_when_file_changes(self):
+        store = configuration.ConfigStore()
+        store.read(self.path)
+        with open(self.path, "a") as f:
+            f.write("\n[OtherID]\nendpoint = https://other.end.point\n")
+        self.assertEqual(store.read(self.path)["OtherID"], {"endpoint": "https://other.end.point"})
+
+    def test_read_parses_again_for_different_file(self):
+        store = configuration.ConfigStore()
+        store.read(self.path)
+        self.assertEqual(store.read(os.path.join(self.directory, "missing")), {})
@@ -153,6 +153,63 @@ class TestCredentialsMethods(unittest.TestCase):
         kwargs = {"http_verb": "get", "path": "/chain/transaction", "timestamp": "2017-06-10T20:40:05.191023Z", "content_type": "", "content": ""}
         self.assertEqual(self.credentials.get_authorization(**kwargs), "DC1-HMAC-SHA256 TestKeyId:4RDAxss7zb3p0nZKzpCM3dNNb3UhdeIU6Aen1Jp84Eo=")
 
+    def test_get_authorization_matches_unoptimized_signature(self):
+        algorithms = ["SHA256", "BLAKE2b512", "SHA3-256"] if unit.PY36 else ["SHA256"]
+        for algorithm in algorithms:
+            self.credentials.update_algorithm(algorithm)
+            for content_type, content in [("", b""), ("application/json", b'{"a": "b"}'), ("application/json", '{"a": "é"}')]:
+                message = self.credentials.hmac_message_string("post", "/v1/transaction?x=1", "2017-06-10T20:40:05.191023Z", content_type, content)
+                expected = "DC1-HMAC-{} TestKeyId:{}".format(
+                    algorithm, self.credentials.bytes_to_b64_str(self.credentials.create_hmac("TestKey", message))
+                )
+                self.assertEqual(
+                    self.credentials.get_authorization("post", "/v1/transaction?x=1", "2017-06-10T20:40:05.191023Z", content_type, content), expected
+                )
+
+    def test_get_signer_is_reused_until_credentials_change(self):
+        signer = self.credentials.get_signer()
+        self.assertIs(self.credentials.get_signer(), signer)
+        self.credentials.auth_key = "OtherKey"
+        self.assertIsNot(self.credentials.get_signer(), signer)
+        self.assertEqual(self.credentials.get_signer().key, ("TestID", "OtherKey", "TestKeyId", "SHA256"))
+
+    def test_signer_copies_keyed_state(self):
+        signer = self.credentials.get_signer()
+        first = signer.sign("GET", "/v1/status", "2017-06-10T20:40:05.191023Z")
+        self.assertEqual(signer.sign("GET", "/v1/status", "2017-06-10T20:40:05.191023Z"), first)
+        self.assertEqual(signer.message("GET", "/v1/status", "t", "", b"").rsplit(b"\n", 1)[1], signer.empty_content_hash)
+
+    def test_get_authorization_with_precomputed_content_hash(self):
+        content = b'{"a": "b"}'
+        content_hash = credentials.hash_content(self.credentials.hash_method, content)
+        args = ("post", "/v1/transaction", "2017-06-10T20:40:05.191023Z", "application/json", content)
+        self.assertEqual(self.credentials.get_authorization(*args, content_hash=content_hash), self.credentials.get_authorization(*args))
+
+    @patch("dragonchain_sdk.credentials.logger")
+    def test_get_authorization_skips_debug_messages_when_disabled(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = False
+        self.credentials.get_authorization("GET", "/chain/transaction", "2017-06-10T20:40:05.191023Z")
+        mock_logger.debug.assert_not_called()
+
+    @patch("dragonchain_sdk.credentials.logger")
+    def test_get_authorization_logs_message_with_precomputed_content_hash(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
+        self.credentials.get_authorization(
+            "POST", "/v1/transaction", "2017-06-10T20:40:05.191023Z", "application/json", b"", content_hash=b"aGFzaA=="
+        )
+        messages = [call[0][0] for call in mock_logger.debug.call_args_list]
+        self.assertIn("HMAC message string:\nPOST\n/v1/transaction\nTestID\n2017-06-10T20:40:05.191023Z\napplication/json\naGFzaA==", messages)
+
+    @patch("dragonchain_sdk.credentials.logger")
+    def test_get_authorization_hashes_content_once_with_debug_messages(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = True
+        self.credentials.get_signer()
+        with patch("dragonchain_sdk.credentials.hash_content", wraps=credentials.hash_content) as mock_hash_content:
+            with patch.object(self.credentials, "hash_input") as mock_hash_input:
+                self.credentials.get_authorization("POST", "/v1/transaction", "2017-06-10T20:40:05.191023Z", "application/json", b'{"a": "b"}')
+        mock_hash_content.assert_called_once()
+        mock_hash_input.assert_not_called()
+
     @unittest.skipUnless(unit.PY36, "This only works on python 3.6 or greater")
     def test_get_authorization_blake2b(self):
         kwargs = {"http_verb": "get", "path": "/chain/transaction", "timestamp": "2017-06-10T20:40:05.191023Z", "content_type": "", "content": ""}
@@ -0,0 +1,119 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from tests import unit
+from dragonchain_sdk import endpoint_cache
+
+if unit.PY36:
+    from unittest.mock import MagicMock, patch
+else:
+    from mock import MagicMock, patch
+
+
+class TestEndpointCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "nested", "endpoint_cache.json")
+
+    def test_initialization_raises_type_error(self):
+        self.assertRaises(TypeError, endpoint_cache.EndpointCache, path=1234)
+        self.assertRaises(TypeError, endpoint_cache.EndpointCache, ttl="1")
+        self.assertRaises(TypeError, endpoint_cache.EndpointCache, stale_ttl="1")
+
+    def test_initialization_raises_value_error(self):
+        self.assertRaises(ValueError, endpoint_cache.EndpointCache, ttl=-1)
+        self.assertRaises(ValueError, endpoint_cache.EndpointCache, stale_ttl=-1)
+
+    def test_get_resolves_once_while_fresh(self):
+        cache = endpoint_cache.EndpointCache()
+        resolve = MagicMock(return_value="https://chain")
+        self.assertEqual(cache.get("id", resolve), "https://chain")
+        self.assertEqual(cache.get("id", resolve), "https://chain")
+        resolve.assert_called_once_with("id")
+
+    def test_get_raises_resolve_errors_without_entry(self):
+        cache = endpoint_cache.EndpointCache()
+        self.assertRaises(RuntimeError, cache.get, "id", MagicMock(side_effect=RuntimeError))
+
+    @patch("dragonchain_sdk.endpoint_cache.threading.Thread")
+    def test_get_serves_stale_entry_while_refreshing(self, mock_thread):
+        cache = endpoint_cache.EndpointCache(ttl=10, stale_ttl=100)
+        cache.put("id", "https://old")
+        cache._entries["id"]["resolved_at"] -= 50
+        resolve = MagicMock(return_value="https://new")
+        self.assertEqual(cache.get("id", resolve), "https://old")
+        self.assertEqual(cache.get("id", resolve), "https://old")
+        # Only one refresh at a time per chain
+        mock_thread.assert_called_once_with(target=cache._refresh, args=("id", resolve), daemon=True)
+        cache._refresh("id", resolve)
+        self.assertEqual(cache.get("id", resolve), "https://new")
+        self.assertEqual(cache._refreshing, set())
+
+    def test_failed_refresh_keeps_stale_entry(self):
+        cache = endpoint_cache.EndpointCache()
+        cache.put("id", "https://old")
+        cache._refreshing.add("id")
+        cache._refresh("id", MagicMock(side_effect=RuntimeError))
+        self.assertEqual(cache._entries["id"]["url"], "https://old")
+        self.assertEqual(cache._refreshing, set())
+
+    def test_get_resolves_again_when_expired(self):
+        cache = endpoint_cache.EndpointCache(ttl=10, stale_ttl=10)
+        cache.put("id", "https://old")
+        cache._entries["id"]["resolved_at"] -= 30
+        resolve = MagicMock(return_value="https://new")
+        self.assertEqual(cache.get("id", resolve), "https://new")
+        resolve.assert_called_once_with("id")
+
+    def test_entries_are_persisted_between_caches(self):
+        endpoint_cache.EndpointCache(path=self.path).put("id", "https://chain")
+        resolve = MagicMock()
+        self.assertEqual(endpoint_cache.EndpointCache(path=self.path).get("id", resolve), "https://chain")
+        resolve.assert_not_called()
+
+    def test_set_merges_entries_from_other_processes(self):
+        first = endpoint_cache.EndpointCache(path=self.path)
+        second = endpoint_cache.EndpointCache(path=self.path)
+        first.put("a", "https://a")
+        second.put("b", "https://b")
+        with open(self.path) as f:
+            entries = json.load(f)
+        self.assertEqual({key: value["url"] for key, value in entries.items()}, {"a": "https://a", "b": "https://b"})
+
+    def test_invalidate_removes_persisted_entry(self):
+        cache = endpoint_cache.EndpointCache(path=self.path)
+        cache.put("id", "https://chain")
+        cache.invalidate("id")
+        resolve = MagicMock(return_value="https://new")
+        self.assertEqual(endpoint_cache.EndpointCache(path=self.path).get("id", resolve), "https://new")
+        resolve.assert_called_once_with("id")
+
+    def test_invalidate_keeps_entry_for_a_different_url(self):
+        cache = endpoint_cache.EndpointCache()
+        cache.put("id", "https://new")
+        cache.invalidate("id", "https://old")
+        self.assertEqual(cache.get("id", MagicMock()), "https://new")
+        cache.invalidate("id", "https://new")
+        self.assertIsNone(cache._get_entry("id"))
+
+    def test_corrupt_file_is_ignored(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as f:
+            f.write('{"id": {"url": 1234}, "bad": ')
+        cache = endpoint_cache.EndpointCache(path=self.path)
+        self.assertEqual(cache.get("id", MagicMock(return_value="https://chain")), "https://chain")
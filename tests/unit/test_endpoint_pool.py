@@ -0,0 +1,88 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from tests import unit
+from dragonchain_sdk import endpoint_pool
+
+if unit.PY36:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+URLS = ["https://a.test", "https://b.test", "https://c.test"]
+
+
+class TestEndpointPool(unittest.TestCase):
+    def test_raises_with_bad_params(self):
+        self.assertRaises(TypeError, endpoint_pool.EndpointPool, "https://a.test")
+        self.assertRaises(TypeError, endpoint_pool.EndpointPool, [1])
+        self.assertRaises(ValueError, endpoint_pool.EndpointPool, [])
+        self.assertRaises(ValueError, endpoint_pool.EndpointPool, URLS, strategy="random")
+        self.assertRaises(TypeError, endpoint_pool.EndpointPool, URLS, eject_duration="1")
+        self.assertRaises(ValueError, endpoint_pool.EndpointPool, URLS, ewma_alpha=0)
+
+    def test_round_robin(self):
+        pool = endpoint_pool.EndpointPool(URLS)
+        chosen = []
+        for _ in range(4):
+            endpoint = pool.acquire()
+            chosen.append(endpoint.url)
+            pool.release(endpoint)
+        self.assertEqual(chosen, URLS + URLS[:1])
+
+    def test_least_outstanding(self):
+        pool = endpoint_pool.EndpointPool(URLS, strategy=endpoint_pool.LEAST_OUTSTANDING)
+        first = pool.acquire()
+        second = pool.acquire()
+        pool.release(first)
+        self.assertEqual(pool.acquire().url, "https://c.test")
+        self.assertEqual(pool.acquire().url, "https://a.test")
+        self.assertEqual(second.outstanding, 1)
+
+    def test_ewma_prefers_lowest_latency(self):
+        pool = endpoint_pool.EndpointPool(URLS, strategy=endpoint_pool.EWMA, ewma_alpha=0.5)
+        for endpoint, latency in zip(pool.endpoints, [0.3, 0.1, 0.2]):
+            endpoint.outstanding += 1
+            pool.release(endpoint, latency)
+        self.assertEqual(pool.acquire().url, "https://b.test")
+        pool.release(pool.endpoints[1], 0.5)
+        self.assertAlmostEqual(pool.endpoints[1].latency, 0.3)
+
+    @patch("dragonchain_sdk.endpoint_pool.time.monotonic", return_value=100.0)
+    def test_ejects_unhealthy_endpoint_until_probed(self, mock_monotonic):
+        pool = endpoint_pool.EndpointPool(URLS[:2], eject_duration=10)
+        endpoint = pool.acquire()
+        pool.release(endpoint, healthy=False)
+        self.assertEqual(endpoint.ejected_until, 110.0)
+        self.assertEqual([pool.acquire().url for _ in range(2)], ["https://b.test", "https://b.test"])
+        self.assertEqual(pool.take_due_probes(), [])
+        mock_monotonic.return_value = 111.0
+        self.assertEqual(pool.take_due_probes(), [endpoint])
+        # Still out of rotation while the probe is running
+        self.assertEqual(pool.take_due_probes(), [])
+        self.assertTrue(endpoint.is_ejected(111.0))
+        pool.probe_finished(endpoint, healthy=False)
+        self.assertEqual(endpoint.ejected_until, 121.0)
+        mock_monotonic.return_value = 122.0
+        pool.take_due_probes()
+        pool.probe_finished(endpoint, healthy=True)
+        self.assertIsNone(endpoint.ejected_until)
+        self.assertFalse(endpoint.is_ejected(122.0))
+
+    @patch("dragonchain_sdk.endpoint_pool.time.monotonic", return_value=100.0)
+    def test_falls_back_to_endpoint_due_soonest_when_all_ejected(self, mock_monotonic):
+        pool = endpoint_pool.EndpointPool(URLS[:2], eject_duration=10)
+        pool.release(pool.acquire(), healthy=False)
+        mock_monotonic.return_value = 105.0
+        pool.release(pool.acquire(), healthy=False)
+        self.assertEqual(pool.acquire().url, "https://a.test")
@@ -9,8 +9,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
 import unittest
 import importlib
+import subprocess
 
 import dragonchain_sdk
 from tests import unit
@@ -39,7 +41,22 @@ class TestAsyncImport(unittest.TestCase):
         importlib.reload(dragonchain_sdk)
         self.assertRaises(RuntimeError, dragonchain_sdk.create_aio_client)
 
+    @unittest.skipUnless(sys.version_info[:2] >= (3, 7), "Async attributes are only loaded lazily on python 3.7 or later")
+    def test_async_attributes_load_async_helpers(self):
+        from dragonchain_sdk import async_helpers
+
+        self.assertIs(dragonchain_sdk.AsyncClient, async_helpers.AsyncClient)
+        self.assertIs(dragonchain_sdk.AsyncBulkWriter, async_helpers.AsyncBulkWriter)
+        self.assertRaises(AttributeError, getattr, dragonchain_sdk, "NotAnAttribute")
+
     # Can't figure out how to mock an import error; If anyone can figure it out, feel free
     # def test_async_throws_runtime_error_without_aiohttp(self):
     #     importlib.reload(dragonchain_sdk)
     #     self.assertRaises(RuntimeError, dragonchain_sdk.create_aio_client)
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_does_not_load_http_libraries(self):
+        code = "import sys, dragonchain_sdk; print(sorted(m for m in ('requests', 'urllib3', 'aiohttp', 'dragonchain_sdk.async_helpers') if m in sys.modules))"
+        output = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True)
+        self.assertEqual(output.strip(), "[]")
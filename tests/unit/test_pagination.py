@@ -0,0 +1,277 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import threading
+import unittest
+
+from dragonchain_sdk import exceptions
+from dragonchain_sdk import pagination
+
+
+def page_of(results, total=None):
+    response = {"results": results}
+    if total is not None:
+        response["total"] = total
+    return {"status": 200, "ok": True, "response": response}
+
+
+def fetch_from(items, total=True):
+    calls = []
+
+    def fetch_page(offset, limit):
+        calls.append((offset, limit))
+        return page_of(items[offset : offset + limit], len(items) if total else None)
+
+    return fetch_page, calls
+
+
+def scan_index(rows, key="timestamp", flip_ties=False):
+    """Fake index which evaluates the range predicate of a scan query, recording (query, offset, limit, ascending) of each call
+
+    If flip_ties is set, results sharing a value come back in the opposite order on every other call.
+    """
+    calls = []
+
+    def fetch_page(query, offset, limit, ascending):
+        calls.append((query, offset, limit, ascending))
+        low, high = re.search(r"@" + key + r":\[(\S+) (\S+)\]", query).groups()
+
+        def in_range(value):
+            low_ok = low == "-inf" or (value > float(low[1:]) if low.startswith("(") else value >= float(low))
+            high_ok = high == "+inf" or (value < float(high[1:]) if high.startswith("(") else value <= float(high))
+            return low_ok and high_ok
+
+        tie_order = -1 if flip_ties and len(calls) % 2 == 0 else 1
+
+        def sort_key(row):
+            return int(row["header"][key]), tie_order * int(row["header"]["txn_id"])
+
+        matches = sorted((row for row in rows if in_range(int(row["header"][key]))), key=sort_key, reverse=not ascending)
+        return page_of(matches[offset : offset + limit], len(matches))
+
+    return fetch_page, calls
+
+
+def scan_rows(*timestamps):
+    return [{"header": {"txn_id": str(index), "timestamp": str(timestamp)}} for index, timestamp in enumerate(timestamps)]
+
+
+class TestPageSizer(unittest.TestCase):
+    def test_initialization_raises(self):
+        self.assertRaises(TypeError, pagination.PageSizer, page_size="10")
+        self.assertRaises(TypeError, pagination.PageSizer, max_page_size="10")
+        self.assertRaises(TypeError, pagination.PageSizer, target_time="1")
+        self.assertRaises(TypeError, pagination.PageSizer, max_page_bytes="1")
+        self.assertRaises(ValueError, pagination.PageSizer, page_size=0)
+        self.assertRaises(ValueError, pagination.PageSizer, page_size=20, max_page_size=10)
+        self.assertRaises(ValueError, pagination.PageSizer, target_time=0)
+
+    def test_grows_fast_full_pages_up_to_max(self):
+        sizer = pagination.PageSizer(page_size=100, max_page_size=300, target_time=1)
+        sizer.record(100, 0.1, 1000)
+        self.assertEqual(sizer.page_size, 200)
+        sizer.record(200, 0.1, 2000)
+        self.assertEqual(sizer.page_size, 300)
+
+    def test_does_not_grow_on_short_page(self):
+        sizer = pagination.PageSizer(page_size=100, target_time=1)
+        sizer.record(50, 0.1, 500)
+        self.assertEqual(sizer.page_size, 100)
+
+    def test_shrinks_slow_pages_down_to_min(self):
+        sizer = pagination.PageSizer(page_size=40, target_time=1)
+        sizer.record(40, 3, 400)
+        self.assertEqual(sizer.page_size, 20)
+        sizer.record(20, 3, 200)
+        sizer.record(10, 3, 100)
+        self.assertEqual(sizer.page_size, pagination.DEFAULT_MIN_PAGE_SIZE)
+
+    def test_caps_page_bytes(self):
+        sizer = pagination.PageSizer(page_size=100, target_time=1, max_page_bytes=5000)
+        sizer.record(100, 0.1, 100000)
+        self.assertEqual(sizer.page_size, 10)
+
+
+class TestPageIterator(unittest.TestCase):
+    def test_initialization_raises(self):
+        fetch_page, _ = fetch_from([])
+        self.assertRaises(TypeError, pagination.PageIterator, fetch_page, offset="0")
+        self.assertRaises(TypeError, pagination.PageIterator, fetch_page, max_results="1")
+        self.assertRaises(TypeError, pagination.PageIterator, fetch_page, prefetch="yes")
+        self.assertRaises(ValueError, pagination.PageIterator, fetch_page, offset=-1)
+
+    def test_iterates_every_page_until_total(self):
+        items = list(range(25))
+        fetch_page, calls = fetch_from(items)
+        results = pagination.PageIterator(fetch_page, page_size=10, max_page_size=10)
+        self.assertEqual(list(results), items)
+        self.assertEqual(calls, [(0, 10), (10, 10), (20, 5)])
+        self.assertEqual(results.total, 25)
+
+    def test_stops_on_short_page_without_total(self):
+        items = list(range(15))
+        fetch_page, calls = fetch_from(items, total=False)
+        self.assertEqual(list(pagination.PageIterator(fetch_page, page_size=10, max_page_size=10, prefetch=False)), items)
+        self.assertEqual(calls, [(0, 10), (10, 10)])
+
+    def test_respects_offset_and_max_results(self):
+        items = list(range(100))
+        fetch_page, calls = fetch_from(items)
+        self.assertEqual(list(pagination.PageIterator(fetch_page, offset=5, max_results=15, page_size=10, max_page_size=10)), items[5:20])
+        self.assertEqual(calls, [(5, 10), (15, 5)])
+
+    def test_prefetches_next_page_while_iterating(self):
+        fetched = threading.Event()
+        fetch_page, calls = fetch_from(list(range(20)))
+
+        def fetch_and_signal(offset, limit):
+            page = fetch_page(offset, limit)
+            if offset:
+                fetched.set()
+            return page
+
+        results = iter(pagination.PageIterator(fetch_and_signal, page_size=10, max_page_size=10))
+        self.assertEqual(next(results), 0)
+        self.assertTrue(fetched.wait(5))
+        self.assertEqual(calls, [(0, 10), (10, 10)])
+        self.assertEqual(list(results), list(range(1, 20)))
+
+    def test_does_not_prefetch_when_disabled(self):
+        fetch_page, calls = fetch_from(list(range(20)))
+        results = iter(pagination.PageIterator(fetch_page, page_size=10, max_page_size=10, prefetch=False))
+        self.assertEqual(next(results), 0)
+        self.assertEqual(calls, [(0, 10)])
+
+    def test_raises_on_failed_page(self):
+        results = pagination.PageIterator(lambda offset, limit: {"status": 400, "ok": False, "response": {"error": "bad query"}})
+        self.assertRaises(exceptions.DragonchainServiceException, list, results)
+
+    def test_raises_on_unexpected_response(self):
+        results = pagination.PageIterator(lambda offset, limit: {"status": 200, "ok": True, "response": {"total": 1}})
+        self.assertRaises(exceptions.UnexpectedResponseException, list, results)
+
+    def test_fetch_all_fetches_remaining_pages_concurrently_in_order(self):
+        items = list(range(95))
+        fetch_page, calls = fetch_from(items)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch_concurrently(offset, limit):
+            if offset:
+                barrier.wait()
+            return fetch_page(offset, limit)
+
+        results = pagination.PageIterator(fetch_concurrently, page_size=40, max_page_size=40)
+        self.assertEqual(results.fetch_all(concurrency=2), items)
+        self.assertEqual(sorted(calls), [(0, 40), (40, 40), (80, 15)])
+
+    def test_fetch_all_respects_max_results(self):
+        fetch_page, calls = fetch_from(list(range(100)))
+        self.assertEqual(pagination.PageIterator(fetch_page, max_results=25, page_size=10, max_page_size=10).fetch_all(), list(range(25)))
+        self.assertEqual(sorted(calls), [(0, 10), (10, 10), (20, 5)])
+
+    def test_fetch_all_pages_sequentially_without_total(self):
+        items = list(range(25))
+        fetch_page, calls = fetch_from(items, total=False)
+        self.assertEqual(pagination.PageIterator(fetch_page, page_size=10, max_page_size=10).fetch_all(), items)
+        self.assertEqual(calls, [(0, 10), (10, 10), (20, 10)])
+
+    def test_fetch_all_raises_when_total_changes(self):
+        pages = {0: page_of([1, 2], 4), 2: page_of([3, 4], 5)}
+        results = pagination.PageIterator(lambda offset, limit: pages[offset], page_size=2, max_page_size=2)
+        self.assertRaises(exceptions.QueryResultsChanged, results.fetch_all)
+
+    def test_fetch_all_raises_on_short_page(self):
+        pages = {0: page_of([1, 2], 4), 2: page_of([3], 4)}
+        results = pagination.PageIterator(lambda offset, limit: pages[offset], page_size=2, max_page_size=2)
+        self.assertRaises(exceptions.QueryResultsChanged, results.fetch_all)
+
+    def test_fetch_all_raises_on_bad_params(self):
+        fetch_page, _ = fetch_from(list(range(20)))
+        results = pagination.PageIterator(fetch_page, page_size=10, max_page_size=10)
+        self.assertRaises(TypeError, results.fetch_all, concurrency="2")
+        self.assertRaises(ValueError, results.fetch_all, concurrency=0)
+        next(iter(results))
+        self.assertRaises(ValueError, results.fetch_all)
+
+
+class TestRangeScan(unittest.TestCase):
+    def scan(self, rows, **kwargs):
+        fetch_page, calls = scan_index(rows, flip_ties=kwargs.pop("flip_ties", False))
+        scan = pagination.RangeScan(kwargs.pop("redisearch_query", "*"), "timestamp", "txn_id", **kwargs)
+        return [row["header"]["txn_id"] for row in pagination.RangeScanIterator(fetch_page, scan)], calls
+
+    def test_initialization_raises(self):
+        self.assertRaises(TypeError, pagination.RangeScan, "", "timestamp", "txn_id")
+        self.assertRaises(ValueError, pagination.RangeScan, "*", "tag", "txn_id")
+        self.assertRaises(TypeError, pagination.RangeScan, "*", "timestamp", "txn_id", start="1")
+        self.assertRaises(TypeError, pagination.RangeScan, "*", "timestamp", "txn_id", ascending="yes")
+        self.assertRaises(ValueError, pagination.RangeScan, "*", "timestamp", "txn_id", window=0)
+
+    def test_pages_by_last_value_without_growing_offsets(self):
+        ids, calls = self.scan(scan_rows(1, 2, 3, 4, 5), page_size=2)
+        self.assertEqual(ids, ["0", "1", "2", "3", "4"])
+        self.assertEqual(
+            calls,
+            [
+                ("@timestamp:[-inf +inf]", 0, 2, True),
+                ("@timestamp:[2 +inf]", 0, 3, True),
+                ("@timestamp:[4 +inf]", 0, 3, True),
+            ],
+        )
+
+    def test_dedupes_results_sharing_a_value_across_pages(self):
+        ids, _ = self.scan(scan_rows(1, 2, 2, 2, 2, 3), page_size=2)
+        self.assertEqual(sorted(ids), ["0", "1", "2", "3", "4", "5"])
+        self.assertEqual(len(ids), 6)
+
+    def test_dedupes_results_sharing_a_value_returned_in_a_different_order(self):
+        ids, calls = self.scan(scan_rows(1, 2, 2, 2, 2, 3), page_size=2, flip_ties=True)
+        self.assertEqual(sorted(ids), ["0", "1", "2", "3", "4", "5"])
+        self.assertEqual(len(ids), 6)
+        self.assertTrue(all(call[1] == 0 for call in calls))
+
+    def test_scans_descending_between_bounds(self):
+        ids, calls = self.scan(scan_rows(1, 2, 3, 4, 5), start=2, end=4, ascending=False, redisearch_query="@tag:thing")
+        self.assertEqual(ids, ["3", "2", "1"])
+        self.assertEqual(calls[0], ("(@tag:thing) @timestamp:[2 4]", 0, 100, False))
+
+    def test_splits_range_into_windows_after_resolving_bounds(self):
+        ids, calls = self.scan(scan_rows(3, 10, 11, 25), window=10)
+        self.assertEqual(ids, ["0", "1", "2", "3"])
+        self.assertEqual(
+            [call[0] for call in calls],
+            [
+                "@timestamp:[-inf +inf]",
+                "@timestamp:[3 +inf]",
+                "@timestamp:[3 (13]",
+                "@timestamp:[13 (23]",
+                "@timestamp:[23 25]",
+            ],
+        )
+
+    def test_splits_descending_range_into_windows(self):
+        ids, _ = self.scan(scan_rows(3, 10, 11, 25), start=0, end=30, window=10, ascending=False)
+        self.assertEqual(ids, ["3", "2", "1", "0"])
+
+    def test_stops_at_max_results(self):
+        ids, calls = self.scan(scan_rows(1, 2, 3, 4, 5), page_size=2, max_results=3)
+        self.assertEqual(ids, ["0", "1", "2"])
+        self.assertEqual(len(calls), 2)
+
+    def test_empty_range_with_windows(self):
+        self.assertEqual(self.scan([], window=10), ([], [("@timestamp:[-inf +inf]", 0, 1, True)]))
+
+    def test_raises_on_results_without_key(self):
+        fetch_page, _ = fetch_from([{"header": {}}])
+        scan = pagination.RangeScan("*", "timestamp", "txn_id")
+        results = pagination.RangeScanIterator(lambda query, offset, limit, ascending: fetch_page(offset, limit), scan)
+        self.assertRaises(exceptions.UnexpectedResponseException, list, results)
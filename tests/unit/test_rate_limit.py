@@ -0,0 +1,99 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from tests import unit
+from dragonchain_sdk import rate_limit
+
+if unit.PY36:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+
+@patch("dragonchain_sdk.rate_limit.time.monotonic", return_value=100.0)
+class TestTokenBucket(unittest.TestCase):
+    def test_initialization_raises_type_error(self, mock_time):
+        self.assertRaises(TypeError, rate_limit.TokenBucket, "1")
+        self.assertRaises(TypeError, rate_limit.TokenBucket, 1, burst=1.5)
+
+    def test_initialization_raises_value_error(self, mock_time):
+        self.assertRaises(ValueError, rate_limit.TokenBucket, 0)
+        self.assertRaises(ValueError, rate_limit.TokenBucket, 1, burst=0)
+
+    def test_burst_defaults_to_rate(self, mock_time):
+        self.assertEqual(rate_limit.TokenBucket(5).burst, 5)
+        self.assertEqual(rate_limit.TokenBucket(0.5).burst, 1)
+
+    def test_reserve_allows_burst_then_spaces_out_requests(self, mock_time):
+        bucket = rate_limit.TokenBucket(2, burst=2)
+        self.assertEqual([bucket.reserve() for _ in range(4)], [0, 0, 0.5, 1.0])
+
+    def test_reserve_refills_over_time(self, mock_time):
+        bucket = rate_limit.TokenBucket(2, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+        mock_time.return_value = 100.5
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0.5)
+
+    def test_refill_is_capped_at_burst(self, mock_time):
+        bucket = rate_limit.TokenBucket(2, burst=2)
+        mock_time.return_value = 1000.0
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0.5])
+
+    def test_cancel_gives_back_token(self, mock_time):
+        bucket = rate_limit.TokenBucket(2, burst=2)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0.5])
+        bucket.cancel()
+        self.assertEqual(bucket.reserve(), 0.5)
+        bucket.cancel()
+        bucket.cancel()
+        bucket.cancel()
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0.5])
+
+
+@patch("dragonchain_sdk.rate_limit.time.monotonic", return_value=100.0)
+class TestRateLimiter(unittest.TestCase):
+    def test_initialization_raises_errors(self, mock_time):
+        self.assertRaises(TypeError, rate_limit.RateLimiter, path_rates=[])
+        self.assertRaises(ValueError, rate_limit.RateLimiter, path_rates={"v1/transaction": (1, 1)})
+
+    def test_unlimited_by_default(self, mock_time):
+        limiter = rate_limit.RateLimiter()
+        self.assertEqual([limiter.reserve("/v1/status") for _ in range(100)], [0] * 100)
+
+    def test_global_bucket_applies_to_all_paths(self, mock_time):
+        limiter = rate_limit.RateLimiter(rate=1, burst=1)
+        self.assertEqual(limiter.reserve("/v1/status"), 0)
+        self.assertEqual(limiter.reserve("/v1/block/123"), 1.0)
+
+    def test_path_bucket_applies_to_matching_paths(self, mock_time):
+        limiter = rate_limit.RateLimiter(path_rates={"/v1/transaction": (1, 1), "/v1/transaction/abc": (10, 10)})
+        self.assertEqual(limiter.reserve("/v1/transaction?q=*"), 0)
+        self.assertEqual(limiter.reserve("/v1/transaction/def"), 1.0)
+        # The longest matching template is used
+        self.assertEqual(limiter.reserve("/v1/transaction/abc"), 0)
+        # A template only matches whole path segments
+        self.assertEqual(limiter.reserve("/v1/transaction_bulk"), 0)
+
+    def test_uses_longest_wait_of_global_and_path_buckets(self, mock_time):
+        limiter = rate_limit.RateLimiter(rate=10, burst=1, path_rates={"/v1/block": (1, 1)})
+        limiter.reserve("/v1/block/1")
+        self.assertEqual(limiter.reserve("/v1/block/2"), 1.0)
+        self.assertEqual(limiter.reserve("/v1/status"), 0.2)
+
+    def test_cancel_gives_back_global_and_path_tokens(self, mock_time):
+        limiter = rate_limit.RateLimiter(rate=1, burst=1, path_rates={"/v1/block": (1, 1)})
+        limiter.reserve("/v1/block/1")
+        limiter.cancel("/v1/block/1")
+        self.assertEqual(limiter.reserve("/v1/block/2"), 0)
@@ -16,6 +16,12 @@ import requests
 import requests_mock
 
 from tests import unit
+from dragonchain_sdk import retry
+from dragonchain_sdk import transports
+from dragonchain_sdk import timeouts
+from dragonchain_sdk import endpoint_pool
+from dragonchain_sdk import rate_limit
+from dragonchain_sdk import codec
 from dragonchain_sdk import request
 from dragonchain_sdk import credentials
 from dragonchain_sdk import exceptions
@@ -38,6 +44,8 @@ class TestRequestsInitialization(unittest.TestCase):
     def test_initialization_raises_type_error(self):
         self.assertRaises(TypeError, request.Request, "not a credentials service")
         self.assertRaises(TypeError, request.Request, self.creds, verify=[])
+        self.assertRaises(TypeError, request.Request, self.creds, endpoint="https://dummy.test", pool_connections="10")
+        self.assertRaises(TypeError, request.Request, self.creds, endpoint="https://dummy.test", pool_maxsize="10")
 
     @patch("dragonchain_sdk.request.configuration.get_endpoint", return_value="https://dummy.test")
     def test_initialized_correct(self, mock_get_endpoint):
@@ -45,6 +53,26 @@ class TestRequestsInitialization(unittest.TestCase):
         self.assertEqual(test_request.credentials, self.creds)
         self.assertEqual(test_request.endpoint, "https://dummy.test")
         self.assertTrue(test_request.verify)
+        self.assertIsInstance(test_request.transport.session, requests.Session)
+
+    def test_initialization_raises_type_error_with_bad_retry_policy(self):
+        self.assertRaises(TypeError, request.Request, self.creds, retry_policy=3)
+
+    def test_initialization_raises_type_error_with_bad_rate_limiter(self):
+        self.assertRaises(TypeError, request.Request, self.creds, rate_limiter=3)
+
+    def test_initialization_raises_type_error_with_bad_json_codec(self):
+        self.assertRaises(TypeError, request.Request, self.creds, json_codec="json")
+
+    def test_initialization_uses_default_retry_policy(self):
+        self.assertEqual(request.Request(self.creds, endpoint="https://dummy.test").retry_policy.methods, retry.DEFAULT_RETRY_METHODS)
+
+    def test_initialization_mounts_pooled_adapter(self):
+        test_request = request.Request(self.creds, endpoint="https://dummy.test", pool_connections=3, pool_maxsize=42)
+        adapter = test_request.transport.session.get_adapter("https://dummy.test")
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 42)
+        self.assertIs(test_request.transport.session.get_adapter("http://dummy.test"), adapter)
 
 
 class TestRequestsMethods(unittest.TestCase):
@@ -63,15 +91,47 @@ class TestRequestsMethods(unittest.TestCase):
         self.request.update_endpoint("https://newurl.com")
         self.assertEqual(self.request.endpoint, "https://newurl.com")
 
+    def test_close_closes_transport(self):
+        self.request.transport = MagicMock()
+        self.request.close()
+        self.request.transport.close.assert_called_once()
+
+    def test_context_manager_closes_transport(self):
+        self.request.transport = MagicMock()
+        with self.request as req:
+            self.assertIs(req, self.request)
+        self.request.transport.close.assert_called_once()
+
+    def test_update_endpoint_raises_value_error_with_no_endpoints(self):
+        self.assertRaises(ValueError, self.request.update_endpoint, [])
+
+    def test_update_endpoint_with_list_creates_pool(self):
+        self.request.update_endpoint(["https://a.test", "https://b.test"])
+        self.assertEqual(self.request.endpoint_pool.urls, ["https://a.test", "https://b.test"])
+        self.assertEqual(self.request.endpoint_pool.strategy, endpoint_pool.ROUND_ROBIN)
+        self.assertEqual(self.request.endpoint, "https://a.test")
+        self.request.update_endpoint("https://c.test")
+        self.assertIsNone(self.request.endpoint_pool)
+
     def test_update_endpoint_raises_type_error(self):
-        self.assertRaises(TypeError, self.request.update_endpoint, [])
+        self.assertRaises(TypeError, self.request.update_endpoint, [1234])
         self.assertRaises(TypeError, self.request.update_endpoint, {})
         self.assertRaises(TypeError, self.request.update_endpoint, 1234)
 
     @patch("dragonchain_sdk.request.Request._make_request", return_value="response")
     def test_get_calls_make_request(self, mock_request):
         self.assertEqual(self.request.get("/test"), "response")
-        mock_request.assert_called_once_with(http_verb="GET", path="/test", verify=True, parse_response=True)
+        mock_request.assert_called_once_with(http_verb="GET", path="/test", verify=True, parse_response=True, raw=False)
+
+    def test_get_raw_returns_body_bytes(self):
+        self.request.transport = transports.LoopbackTransport(body=b"\xff\x00")
+        self.assertEqual(self.request.get("/test", raw=True), {"status": 200, "ok": True, "response": b"\xff\x00"})
+
+    def test_get_stream_returns_chunks(self):
+        self.request.transport = transports.LoopbackTransport(body=b"\xff\x00")
+        response = self.request.get_stream("/test")
+        self.assertEqual((response["status"], response["ok"]), (200, True))
+        self.assertEqual(list(response["response"]), [b"\xff\x00"])
 
     @patch("dragonchain_sdk.request.Request._make_request", return_value="response")
     def test_put_calls_make_request(self, mock_request):
@@ -116,32 +176,32 @@ class TestRequestsMethods(unittest.TestCase):
         self.assertRaises(ValueError, self.request.get_requests_method, "PLACE")
 
     def test_get_request_method_returns_get(self):
-        self.assertEqual(self.request.get_requests_method("GET"), requests.get)
-        self.assertEqual(self.request.get_requests_method("get"), requests.get)
+        self.assertEqual(self.request.get_requests_method("GET"), self.request.transport.session.get)
+        self.assertEqual(self.request.get_requests_method("get"), self.request.transport.session.get)
 
     def test_get_request_method_returns_post(self):
-        self.assertEqual(self.request.get_requests_method("POST"), requests.post)
-        self.assertEqual(self.request.get_requests_method("post"), requests.post)
+        self.assertEqual(self.request.get_requests_method("POST"), self.request.transport.session.post)
+        self.assertEqual(self.request.get_requests_method("post"), self.request.transport.session.post)
 
     def test_get_request_method_returns_put(self):
-        self.assertEqual(self.request.get_requests_method("PUT"), requests.put)
-        self.assertEqual(self.request.get_requests_method("put"), requests.put)
+        self.assertEqual(self.request.get_requests_method("PUT"), self.request.transport.session.put)
+        self.assertEqual(self.request.get_requests_method("put"), self.request.transport.session.put)
 
     def test_get_request_method_returns_patch(self):
-        self.assertEqual(self.request.get_requests_method("PATCH"), requests.patch)
-        self.assertEqual(self.request.get_requests_method("patch"), requests.patch)
+        self.assertEqual(self.request.get_requests_method("PATCH"), self.request.transport.session.patch)
+        self.assertEqual(self.request.get_requests_method("patch"), self.request.transport.session.patch)
 
     def test_get_request_method_returns_delete(self):
-        self.assertEqual(self.request.get_requests_method("DELETE"), requests.delete)
-        self.assertEqual(self.request.get_requests_method("delete"), requests.delete)
+        self.assertEqual(self.request.get_requests_method("DELETE"), self.request.transport.session.delete)
+        self.assertEqual(self.request.get_requests_method("delete"), self.request.transport.session.delete)
 
     def test_get_request_method_returns_head(self):
-        self.assertEqual(self.request.get_requests_method("HEAD"), requests.head)
-        self.assertEqual(self.request.get_requests_method("head"), requests.head)
+        self.assertEqual(self.request.get_requests_method("HEAD"), self.request.transport.session.head)
+        self.assertEqual(self.request.get_requests_method("head"), self.request.transport.session.head)
 
     def test_get_request_method_returns_options(self):
-        self.assertEqual(self.request.get_requests_method("OPTIONS"), requests.options)
-        self.assertEqual(self.request.get_requests_method("options"), requests.options)
+        self.assertEqual(self.request.get_requests_method("OPTIONS"), self.request.transport.session.options)
+        self.assertEqual(self.request.get_requests_method("options"), self.request.transport.session.options)
 
     def test_generate_query_string_raises_type_error(self):
         self.assertRaises(TypeError, self.request.generate_query_string, [])
@@ -208,12 +268,191 @@ class TestRequestsMethods(unittest.TestCase):
             ),
         )
 
+    @patch("dragonchain_sdk.request.datetime.datetime", utcnow=MagicMock(return_value=MagicMock(isoformat=MagicMock(return_value="mock_time"))))
+    def test_generate_request_data_signs_bytes_from_json_codec(self, mock_time):
+        self.request.json_codec = MagicMock(spec=codec.JsonCodec)
+        self.request.json_codec.dumps.return_value = b'{"encoded":true}'
+        self.request.credentials.get_authorization = MagicMock(return_value="dummy_auth")
+        response = self.request._generate_request_data("POST", "/path", {"some": "content"})
+        self.request.json_codec.dumps.assert_called_once_with({"some": "content"})
+        self.request.credentials.get_authorization.assert_called_once_with("POST", "/path", "mock_timeZ", "application/json", b'{"encoded":true}')
+        self.assertEqual(response[1], b'{"encoded":true}')
+
+    @patch("dragonchain_sdk.request.datetime.datetime", utcnow=MagicMock(return_value=MagicMock(isoformat=MagicMock(return_value="mock_time"))))
+    def test_post_stream_sends_same_body_and_signature_as_post(self, mock_time):
+        handler = MagicMock(return_value=transports.TransportResponse(200, b"{}"))
+        self.request.transport = transports.LoopbackTransport(handler)
+        items = [{"payload": "x" * 100, "index": i} for i in range(1000)]
+        self.request.post("/test", items)
+        self.request.post_stream("/test", iter(items), spool_size=1024)
+        (_, _, posted, posted_headers), (_, _, streamed, streamed_headers) = [call[0] for call in handler.call_args_list]
+        self.assertEqual(streamed, posted)
+        self.assertEqual(streamed_headers.pop("Content-Length"), str(len(posted)))
+        self.assertEqual(streamed_headers, posted_headers)
+
+    @patch("dragonchain_sdk.request.datetime.datetime", utcnow=MagicMock(return_value=MagicMock(isoformat=MagicMock(return_value="mock_time"))))
+    def test_post_encoded_sends_same_body_and_signature_as_post(self, mock_time):
+        handler = MagicMock(return_value=transports.TransportResponse(200, b"{}"))
+        self.request.transport = transports.LoopbackTransport(handler)
+        items = [{"payload": "x", "index": i} for i in range(3)]
+        self.request.post("/test", items)
+        self.request.post_encoded("/test", self.request.json_codec.dumps(items))
+        (_, _, posted, posted_headers), (_, _, encoded, encoded_headers) = [call[0] for call in handler.call_args_list]
+        self.assertEqual((encoded, encoded_headers), (posted, posted_headers))
+
+    def test_get_results_stream_yields_results(self):
+        self.request.transport = transports.LoopbackTransport(body=b'{"total": 2, "results": [{"a": 1, "b": 2}, {"a": 3}]}')
+        response = self.request.get_results_stream("/test", fields=["a"])
+        self.assertEqual((response["status"], response["ok"]), (200, True))
+        self.assertEqual(list(response["response"]), [{"a": 1}, {"a": 3}])
+        self.assertEqual(response["response"].total, 2)
+
+    def test_get_results_stream_parses_error_response(self):
+        self.request.transport = transports.LoopbackTransport(status=404, body=b'{"error": "not found"}')
+        self.assertEqual(self.request.get_results_stream("/test"), {"status": 404, "ok": False, "response": {"error": "not found"}})
+
+    @patch("dragonchain_sdk.request.time.sleep")
+    def test_get_results_stream_releases_retried_responses(self, mock_sleep):
+        release = MagicMock()
+        self.request.transport = MagicMock()
+        self.request.transport.send_stream.side_effect = [
+            transports.StreamedTransportResponse(503, [b"{}"], release=release),
+            transports.StreamedTransportResponse(200, [b'{"results": [1]}']),
+        ]
+        self.assertEqual(list(self.request.get_results_stream("/test")["response"]), [1])
+        release.assert_called_once()
+
+    @patch("dragonchain_sdk.request.time.sleep")
+    def test_post_stream_rewinds_body_for_each_attempt(self, mock_sleep):
+        handler = MagicMock(side_effect=[transports.TransportResponse(503, b""), transports.TransportResponse(200, b"{}")])
+        self.request.transport = transports.LoopbackTransport(handler)
+        self.request.retry_policy = retry.RetryPolicy(methods=["POST"])
+        self.assertTrue(self.request.post_stream("/test", [1, 2, 3])["ok"])
+        self.assertEqual([call[0][2] for call in handler.call_args_list], [b"[1,2,3]", b"[1,2,3]"])
+
     @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("https://dummy.test/transaction", None, None))
-    @patch("dragonchain_sdk.request.Request.get_requests_method")
-    def test_make_request_raises_connectionexception_error_on_request_failure(self, mock_get_request, mock_gen_data):
-        mock_get_request.return_value = MagicMock(side_effect=Exception)
+    def test_make_request_raises_connectionexception_error_on_request_failure(self, mock_gen_data):
+        self.request.retry_policy = retry.NO_RETRY
+        self.request.transport = MagicMock()
+        self.request.transport.send.side_effect = Exception
+        self.assertRaises(exceptions.ConnectionException, self.request._make_request, "GET", "/transaction")
+        self.request.transport.send.assert_called_once()
+
+    @patch("dragonchain_sdk.request.configuration.invalidate_endpoint")
+    @patch("dragonchain_sdk.request.configuration.get_endpoint", return_value="https://dummy.test")
+    def test_make_request_invalidates_discovered_endpoint_on_connection_error(self, mock_get_endpoint, mock_invalidate):
+        self.request.update_endpoint()
+        self.request.retry_policy = retry.NO_RETRY
+        self.request.transport = MagicMock()
+        self.request.transport.send.side_effect = Exception
+        self.assertRaises(exceptions.ConnectionException, self.request._make_request, "GET", "/transaction")
+        mock_invalidate.assert_called_once_with("TestID", "https://dummy.test")
+
+    @patch("dragonchain_sdk.request.configuration.invalidate_endpoint")
+    @patch("dragonchain_sdk.request.configuration.get_endpoint", side_effect=["https://old.test", "https://new.test"])
+    def test_make_request_discovers_endpoint_again_after_connection_error(self, mock_get_endpoint, mock_invalidate):
+        self.request.update_endpoint()
+        self.request.retry_policy = retry.NO_RETRY
+        self.request.transport = MagicMock()
+        self.request.transport.send.side_effect = [Exception, transports.TransportResponse(200, b"{}")]
+        self.assertRaises(exceptions.ConnectionException, self.request._make_request, "GET", "/transaction")
+        self.assertTrue(self.request._make_request("GET", "/transaction")["ok"])
+        self.assertEqual(self.request.transport.send.call_args[0][1], "https://new.test/transaction")
+        self.assertEqual(mock_get_endpoint.call_count, 2)
+
+    @patch("dragonchain_sdk.request.configuration.invalidate_endpoint")
+    @patch("dragonchain_sdk.request.configuration.get_endpoint", side_effect=["https://old.test", exceptions.DragonchainIdentityNotFound("nope")])
+    def test_make_request_keeps_endpoint_if_discovering_again_fails(self, mock_get_endpoint, mock_invalidate):
+        self.request.update_endpoint()
+        self.request.retry_policy = retry.NO_RETRY
+        self.request.transport = MagicMock()
+        self.request.transport.send.side_effect = [Exception, transports.TransportResponse(200, b"{}")]
+        self.assertRaises(exceptions.ConnectionException, self.request._make_request, "GET", "/transaction")
+        self.assertTrue(self.request._make_request("GET", "/transaction")["ok"])
+        self.assertEqual(self.request.transport.send.call_args[0][1], "https://old.test/transaction")
+
+    @patch("dragonchain_sdk.request.configuration.invalidate_endpoint")
+    def test_make_request_keeps_explicit_endpoint_on_connection_error(self, mock_invalidate):
+        self.request.retry_policy = retry.NO_RETRY
+        self.request.transport = MagicMock()
+        self.request.transport.send.side_effect = Exception
         self.assertRaises(exceptions.ConnectionException, self.request._make_request, "GET", "/transaction")
-        mock_get_request.assert_called_once_with("GET")
+        mock_invalidate.assert_not_called()
+
+    @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("https://dummy.test/transaction", None, None))
+    def test_make_request_raises_connectionexception_error_on_bad_verb(self, mock_gen_data):
+        self.request.transport = MagicMock()
+        self.assertRaises(exceptions.ConnectionException, self.request._make_request, "PLACE", "/transaction")
+        self.request.transport.send.assert_not_called()
+
+    @patch("dragonchain_sdk.request.time.sleep")
+    @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("https://something/transaction", None, None))
+    def test_make_request_retries_retryable_status(self, mock_gen_data, mock_sleep):
+        with requests_mock.mock() as m:
+            m.get("https://something/transaction", [{"status_code": 503, "text": "{}"}, {"status_code": 200, "json": {"test": "object"}}])
+            self.assertEqual(self.request._make_request("GET", "/transaction"), {"ok": True, "status": 200, "response": {"test": "object"}})
+        # A new timestamp and signature are generated for every attempt
+        self.assertEqual(mock_gen_data.call_count, 2)
+        mock_sleep.assert_called_once()
+
+    @patch("dragonchain_sdk.request.time.sleep")
+    @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("https://something/transaction", None, None))
+    def test_make_request_honors_retry_after(self, mock_gen_data, mock_sleep):
+        with requests_mock.mock() as m:
+            m.get(
+                "https://something/transaction",
+                [{"status_code": 429, "text": "{}", "headers": {"Retry-After": "2"}}, {"status_code": 200, "json": {}}],
+            )
+            self.request._make_request("GET", "/transaction")
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("dragonchain_sdk.request.time.sleep")
+    @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("https://something/transaction", None, None))
+    def test_make_request_returns_last_response_when_attempts_exhausted(self, mock_gen_data, mock_sleep):
+        with requests_mock.mock() as m:
+            m.get("https://something/transaction", status_code=503, json={"error": "busy"})
+            self.assertEqual(self.request._make_request("GET", "/transaction"), {"ok": False, "status": 503, "response": {"error": "busy"}})
+            self.assertEqual(m.call_count, 3)
+
+    @patch("dragonchain_sdk.request.time.sleep")
+    @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("https://something/transaction", None, None))
+    def test_make_request_does_not_retry_post_by_default(self, mock_gen_data, mock_sleep):
+        with requests_mock.mock() as m:
+            m.post("https://something/transaction", exc=requests.exceptions.ConnectionError)
+            self.assertRaises(exceptions.ConnectionException, self.request._make_request, "POST", "/transaction")
+            self.assertEqual(m.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch("dragonchain_sdk.request.time.sleep")
+    @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("https://something/transaction", None, None))
+    def test_make_request_retries_post_when_opted_in(self, mock_gen_data, mock_sleep):
+        self.request.retry_policy = retry.RetryPolicy(methods=["GET", "POST"])
+        with requests_mock.mock() as m:
+            m.post("https://something/transaction", [{"exc": requests.exceptions.ConnectionError}, {"status_code": 201, "json": {}}])
+            self.assertEqual(self.request._make_request("POST", "/transaction"), {"ok": True, "status": 201, "response": {}})
+        mock_sleep.assert_called_once()
+
+    @patch("dragonchain_sdk.request.time.sleep")
+    @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("https://something/transaction", None, None))
+    def test_make_request_waits_for_rate_limiter(self, mock_gen_data, mock_sleep):
+        self.request.rate_limiter = MagicMock(spec=rate_limit.RateLimiter)
+        self.request.rate_limiter.reserve.side_effect = [0.0, 0.25]
+        with requests_mock.mock() as m:
+            m.get("https://something/transaction", status_code=200, json={})
+            self.request._make_request("GET", "/transaction")
+            mock_sleep.assert_not_called()
+            self.request._make_request("GET", "/transaction")
+        mock_sleep.assert_called_once_with(0.25)
+        self.request.rate_limiter.reserve.assert_called_with("/transaction")
+
+    @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("https://something/transaction", None, None))
+    def test_make_request_decodes_with_json_codec(self, mock_gen_data):
+        self.request.json_codec = MagicMock(spec=codec.JsonCodec)
+        self.request.json_codec.loads.return_value = {"decoded": True}
+        with requests_mock.mock() as m:
+            m.get("https://something/transaction", status_code=200, content=b'{"raw":true}')
+            self.assertEqual(self.request._make_request("GET", "/transaction")["response"], {"decoded": True})
+        self.request.json_codec.loads.assert_called_once_with(b'{"raw":true}')
 
     @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("https://something/transaction", None, None))
     def test_make_request_returns_ok_false_on_bad_response_status(self, mock_gen_data):
@@ -238,17 +477,194 @@ class TestRequestsMethods(unittest.TestCase):
             self.assertEqual(self.request._make_request("GET", "/transaction", parse_response=False), expected_response)
 
     @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("https://something/transaction", None, None))
-    @patch("dragonchain_sdk.request.Request.get_requests_method")
-    def test_make_request_raises_unexpectedresponseexception_error_on_parse_json_error(self, mock_get_request, mock_gen_data):
-        mock_get_request.return_value.return_value.json.side_effect = RuntimeError("JSON Parse Error")
-        mock_get_request.return_value.return_value.status_code = 200
+    def test_make_request_raises_unexpectedresponseexception_error_on_parse_json_error(self, mock_gen_data):
+        self.request.transport = transports.LoopbackTransport(body=b"not json")
         self.assertRaises(exceptions.UnexpectedResponseException, self.request._make_request, "GET", "/transaction")
 
     @patch("dragonchain_sdk.request.Request._generate_request_data", return_value=("dummy_url", b"some content", {"some": "headers"}))
-    @patch("dragonchain_sdk.request.Request.get_requests_method")
-    def test_make_request_calls_requests_with_correct_params(self, mock_get_requests, mock_gen_data):
-        self.request.credentials.get_authorization = MagicMock(return_value="dummy_auth")
-        mock_request = MagicMock()
-        mock_get_requests.return_value = mock_request
+    def test_make_request_calls_transport_with_correct_params(self, mock_gen_data):
+        self.request.transport = MagicMock()
+        self.request.transport.send.return_value = transports.TransportResponse(200, b"{}")
         self.request._make_request("POST", "/transaction", json_content={"some": "data"})
-        mock_request.assert_called_once_with(data=b"some content", headers={"some": "headers"}, timeout=30, url="dummy_url", verify=True)
+        self.request.transport.send.assert_called_once_with("POST", "dummy_url", b"some content", {"some": "headers"}, timeouts.Timeout(), True)
+
+    def test_make_request_uses_per_call_timeout(self):
+        self.request = request.Request(self.creds, endpoint="https://dummy.test", timeout=timeouts.Timeout(2, 5))
+        self.request.transport = MagicMock()
+        self.request.transport.send.return_value = transports.TransportResponse(200, b"{}")
+        self.request._make_request("GET", "/transaction")
+        self.assertEqual(self.request.transport.send.call_args[0][4], timeouts.Timeout(2, 5))
+        self.request._make_request("GET", "/transaction", timeout=1)
+        self.assertEqual(self.request.transport.send.call_args[0][4], timeouts.Timeout(1, 1))
+
+    def test_with_options_shares_transport(self):
+        view = self.request.with_options(timeout=3, deadline=10)
+        self.assertIs(view.transport, self.request.transport)
+        self.assertEqual(view.timeout, timeouts.Timeout(3, 3))
+        self.assertIsInstance(view.deadline, timeouts.Deadline)
+        self.assertIsNone(self.request.deadline)
+        self.assertEqual(self.request.timeout, timeouts.Timeout())
+
+    def test_make_request_clamps_timeout_to_deadline(self):
+        self.request.transport = MagicMock()
+        self.request.transport.send.return_value = transports.TransportResponse(200, b"{}")
+        self.request.with_options(deadline=timeouts.Deadline(5))._make_request("GET", "/transaction")
+        timeout = self.request.transport.send.call_args[0][4]
+        self.assertLessEqual(timeout.connect, 5)
+        self.assertLessEqual(timeout.read, 5)
+        self.assertLessEqual(timeout.total, 5)
+
+    def test_make_request_raises_deadline_exceeded_without_sending_after_deadline(self):
+        self.request.transport = MagicMock()
+        with self.assertRaises(exceptions.DeadlineExceeded):
+            self.request.with_options(deadline=timeouts.Deadline(-1))._make_request("GET", "/transaction")
+        self.request.transport.send.assert_not_called()
+
+    @patch("dragonchain_sdk.request.time.sleep")
+    def test_make_request_does_not_retry_past_deadline(self, mock_sleep):
+        self.request.transport = transports.LoopbackTransport(status=503)
+        self.request.retry_policy = retry.RetryPolicy(backoff_base=10, backoff_cap=10)
+        with patch("dragonchain_sdk.retry.random.uniform", return_value=10):
+            response = self.request.with_options(deadline=5)._make_request("GET", "/transaction")
+        self.assertEqual(response["status"], 503)
+        self.assertEqual(self.request.transport.request_count, 1)
+        mock_sleep.assert_not_called()
+
+    def test_make_request_raises_deadline_exceeded_when_rate_limited_past_deadline(self):
+        self.request.rate_limiter = MagicMock(spec=rate_limit.RateLimiter)
+        self.request.rate_limiter.reserve.return_value = 10.0
+        self.assertRaises(exceptions.DeadlineExceeded, self.request.with_options(deadline=5)._make_request, "GET", "/transaction")
+        self.request.rate_limiter.cancel.assert_called_once_with("/transaction")
+
+    def test_make_request_past_deadline_does_not_use_up_rate_limit(self):
+        self.request.rate_limiter = rate_limit.RateLimiter(rate=1, burst=1)
+        self.request.transport = transports.LoopbackTransport()
+        view = self.request.with_options(deadline=5)
+        view.deadline.expires_at = 0
+        self.assertRaises(exceptions.DeadlineExceeded, view._make_request, "GET", "/transaction")
+        self.assertEqual(self.request.rate_limiter.reserve("/transaction"), 0)
+
+    @patch("dragonchain_sdk.timeouts.time.monotonic")
+    def test_make_request_raises_deadline_exceeded_on_failure_after_deadline(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        view = self.request.with_options(deadline=5)
+        view.transport = MagicMock()
+
+        def time_out(*args):
+            mock_monotonic.return_value = 106.0
+            raise requests.exceptions.ReadTimeout("timed out")
+
+        view.transport.send.side_effect = time_out
+        self.assertRaises(exceptions.DeadlineExceeded, view._make_request, "GET", "/transaction")
+
+    def test_make_request_balances_between_endpoints(self):
+        self.request.update_endpoint(["https://a.test", "https://b.test"])
+        self.request.transport = MagicMock()
+        self.request.transport.send.return_value = transports.TransportResponse(200, b"{}")
+        self.request._make_request("GET", "/v1/status")
+        self.request._make_request("GET", "/v1/status")
+        urls = [call[0][1] for call in self.request.transport.send.call_args_list]
+        self.assertEqual(urls, ["https://a.test/v1/status", "https://b.test/v1/status"])
+        self.assertEqual([endpoint.outstanding for endpoint in self.request.endpoint_pool.endpoints], [0, 0])
+
+    @patch("dragonchain_sdk.request.time.sleep")
+    def test_make_request_ejects_failing_endpoint_and_retries_on_another(self, mock_sleep):
+        self.request.update_endpoint(["https://a.test", "https://b.test"])
+
+        def handler(http_verb, full_url, body, headers):
+            return transports.TransportResponse(503 if full_url.startswith("https://a.test") else 200, b"{}")
+
+        self.request.transport = transports.LoopbackTransport(handler)
+        self.assertEqual(self.request._make_request("GET", "/transaction")["status"], 200)
+        ejected = [endpoint.url for endpoint in self.request.endpoint_pool.endpoints if endpoint.ejected_until is not None]
+        self.assertEqual(ejected, ["https://a.test"])
+
+    def test_make_request_ejects_endpoint_on_connection_error(self):
+        self.request.update_endpoint(["https://a.test", "https://b.test"])
+        self.request.transport = MagicMock()
+        self.request.transport.send.side_effect = requests.exceptions.ConnectionError
+        self.assertRaises(exceptions.ConnectionException, self.request._make_request, "POST", "/transaction")
+        self.assertIsNotNone(self.request.endpoint_pool.endpoints[0].ejected_until)
+        self.assertEqual(self.request.endpoint_pool.endpoints[0].outstanding, 0)
+
+    @patch("dragonchain_sdk.request.threading.Thread")
+    def test_make_request_starts_probes_of_due_endpoints(self, mock_thread):
+        self.request.update_endpoint(["https://a.test", "https://b.test"])
+        pool = self.request.endpoint_pool
+        pool.endpoints[0].ejected_until = 0.0
+        self.request.transport = transports.LoopbackTransport()
+        self.request._make_request("GET", "/transaction")
+        mock_thread.assert_called_once_with(target=self.request._probe_endpoint, args=(pool.endpoints[0],), daemon=True)
+        mock_thread.return_value.start.assert_called_once()
+        self.assertTrue(pool.endpoints[0].probing)
+
+    def test_probe_endpoint_readmits_healthy_endpoint(self):
+        self.request.update_endpoint(["https://a.test", "https://b.test"])
+        pool = self.request.endpoint_pool
+        pool.endpoints[0].ejected_until = 0.0
+        pool.take_due_probes()
+        self.request.transport = MagicMock()
+        self.request.transport.send.return_value = transports.TransportResponse(200, b"{}")
+        self.request._probe_endpoint(pool.endpoints[0])
+        self.assertEqual(self.request.transport.send.call_args[0][:2], ("GET", "https://a.test/v1/status"))
+        self.assertIsNone(pool.endpoints[0].ejected_until)
+
+    def test_probe_endpoint_keeps_unhealthy_endpoint_ejected(self):
+        self.request.update_endpoint(["https://a.test", "https://b.test"])
+        pool = self.request.endpoint_pool
+        pool.endpoints[0].ejected_until = 0.0
+        pool.take_due_probes()
+        self.request.transport = MagicMock()
+        self.request.transport.send.side_effect = requests.exceptions.ConnectionError
+        self.request._probe_endpoint(pool.endpoints[0])
+        self.assertGreater(pool.endpoints[0].ejected_until, 0.0)
+        self.assertFalse(pool.endpoints[0].probing)
+
+
+class TestRequestLogging(unittest.TestCase):
+    def setUp(self):
+        self.creds = credentials.Credentials(dragonchain_id="TestID", auth_key="TestKey", auth_key_id="TestKeyId")
+        self.request = request.Request(self.creds, endpoint="https://dummy.test", transport=transports.LoopbackTransport(body=b'{"a": 1}'))
+
+    def test_get_path_template_replaces_ids(self):
+        self.assertEqual(request.get_path_template("/v1/transaction/a4f5c8e6-8e0b-4bb5-a4b7-53dd4a5b9ad2"), "/v1/transaction/{}")
+        self.assertEqual(request.get_path_template("/v1/block/123456?q=thing"), "/v1/block/{}")
+        self.assertEqual(request.get_path_template("/v1/contract/txn_type/banana"), "/v1/contract/txn_type/banana")
+        self.assertEqual(request.get_path_template("/v1/transaction-type/"), "/v1/transaction-type/")
+
+    @patch("dragonchain_sdk.request.logger")
+    def test_generate_request_data_skips_debug_messages_when_disabled(self, mock_logger):
+        mock_logger.isEnabledFor.return_value = False
+        self.request._make_request("POST", "/v1/transaction", json_content={"a": "b"})
+        mock_logger.debug.assert_not_called()
+
+    def test_generate_request_data_truncates_large_bodies_in_debug_messages(self):
+        body = {"a": "b" * 5000}
+        with self.assertLogs("dragonchain_sdk.request", "DEBUG") as logs:
+            self.request._generate_request_data("POST", "/v1/transaction", json_content=body)
+        expected = "... ({} bytes)".format(len(self.request.json_codec.dumps(body)))
+        self.assertTrue(any(line.endswith(expected) for line in logs.output))
+
+    def test_make_request_emits_access_record_when_enabled(self):
+        request_bytes = len(self.request.json_codec.dumps({"a": "b"}))
+        with self.assertLogs("dragonchain_sdk.access", "INFO") as logs:
+            self.request._make_request("POST", "/v1/transaction/abc123?x=1", json_content={"a": "b"})
+        self.assertEqual(len(logs.records), 1)
+        record = logs.records[0]
+        self.assertEqual((record.http_verb, record.path_template, record.status), ("POST", "/v1/transaction/{}", 200))
+        self.assertEqual((record.request_bytes, record.response_bytes, record.attempts), (request_bytes, 8, 1))
+        self.assertGreaterEqual(record.latency, 0)
+        self.assertTrue(record.getMessage().startswith("POST /v1/transaction/{{}} 200 {}B/8B ".format(request_bytes)))
+
+    def test_make_request_emits_access_record_without_response(self):
+        self.request.transport = MagicMock(**{"send.side_effect": requests.exceptions.ConnectionError})
+        self.request.retry_policy = retry.RetryPolicy(max_attempts=1)
+        with self.assertLogs("dragonchain_sdk.access", "INFO") as logs:
+            self.assertRaises(exceptions.ConnectionException, self.request._make_request, "GET", "/v1/status")
+        self.assertIsNone(logs.records[0].status)
+
+    @patch("dragonchain_sdk.request.access_logger")
+    def test_make_request_skips_access_record_when_disabled(self, mock_access_logger):
+        mock_access_logger.isEnabledFor.return_value = False
+        self.request._make_request("GET", "/v1/status")
+        mock_access_logger.info.assert_not_called()
@@ -0,0 +1,78 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import email.utils
+import unittest
+
+from tests import unit
+from dragonchain_sdk import retry
+
+if unit.PY36:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_initialization_raises_type_error(self):
+        self.assertRaises(TypeError, retry.RetryPolicy, max_attempts="3")
+        self.assertRaises(TypeError, retry.RetryPolicy, backoff_base="1")
+        self.assertRaises(TypeError, retry.RetryPolicy, backoff_cap="1")
+        self.assertRaises(TypeError, retry.RetryPolicy, respect_retry_after="yes")
+
+    def test_initialization_raises_value_error(self):
+        self.assertRaises(ValueError, retry.RetryPolicy, max_attempts=0)
+        self.assertRaises(ValueError, retry.RetryPolicy, backoff_base=-1)
+
+    @patch("dragonchain_sdk.retry.random.uniform", side_effect=lambda low, high: high)
+    def test_backoff_is_exponential_and_capped(self, mock_uniform):
+        policy = retry.RetryPolicy(backoff_base=1, backoff_cap=5)
+        self.assertEqual([policy.get_backoff(attempt) for attempt in range(1, 6)], [1, 2, 4, 5, 5])
+
+    def test_backoff_has_full_jitter(self):
+        policy = retry.RetryPolicy(backoff_base=1, backoff_cap=5)
+        for _ in range(100):
+            self.assertTrue(0 <= policy.get_backoff(2) <= 2)
+
+    def test_get_retry_delay_only_retries_allowed_methods(self):
+        policy = retry.RetryPolicy()
+        self.assertIsNotNone(policy.get_retry_delay("get", 1))
+        self.assertIsNotNone(policy.get_retry_delay("DELETE", 1))
+        self.assertIsNone(policy.get_retry_delay("POST", 1))
+        self.assertIsNotNone(retry.RetryPolicy(methods=["post"]).get_retry_delay("POST", 1))
+
+    def test_get_retry_delay_stops_after_max_attempts(self):
+        policy = retry.RetryPolicy(max_attempts=2)
+        self.assertIsNotNone(policy.get_retry_delay("GET", 1))
+        self.assertIsNone(policy.get_retry_delay("GET", 2))
+        self.assertIsNone(retry.NO_RETRY.get_retry_delay("GET", 1))
+
+    def test_get_retry_delay_only_retries_retryable_statuses(self):
+        policy = retry.RetryPolicy()
+        self.assertIsNotNone(policy.get_retry_delay("GET", 1, 503))
+        self.assertIsNone(policy.get_retry_delay("GET", 1, 500))
+        self.assertIsNone(policy.get_retry_delay("GET", 1, 200))
+
+    def test_get_retry_delay_uses_retry_after_seconds(self):
+        self.assertEqual(retry.RetryPolicy().get_retry_delay("GET", 1, 429, "3"), 3.0)
+
+    def test_get_retry_delay_uses_retry_after_date(self):
+        with patch("dragonchain_sdk.retry.time.time", return_value=1000000000):
+            date = email.utils.formatdate(1000000004, usegmt=True)
+            self.assertEqual(retry.RetryPolicy().get_retry_delay("GET", 1, 503, date), 4.0)
+
+    def test_get_retry_delay_gives_up_when_retry_after_exceeds_cap(self):
+        self.assertIsNone(retry.RetryPolicy(backoff_cap=10).get_retry_delay("GET", 1, 503, "60"))
+
+    @patch("dragonchain_sdk.retry.random.uniform", return_value=0.5)
+    def test_get_retry_delay_ignores_bad_or_unwanted_retry_after(self, mock_uniform):
+        self.assertEqual(retry.RetryPolicy().get_retry_delay("GET", 1, 503, "soon"), 0.5)
+        self.assertEqual(retry.RetryPolicy(respect_retry_after=False).get_retry_delay("GET", 1, 503, "3"), 0.5)
@@ -0,0 +1,198 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import json
+import hashlib
+import tempfile
+import unittest
+
+from tests import unit
+from dragonchain_sdk import codec
+from dragonchain_sdk import credentials
+from dragonchain_sdk import exceptions
+from dragonchain_sdk import streaming
+from dragonchain_sdk import transports
+
+if unit.PY36:
+    from unittest.mock import MagicMock
+else:
+    from mock import MagicMock
+
+
+class TestEncodeJsonArray(unittest.TestCase):
+    def setUp(self):
+        self.codec = codec.StandardJsonCodec()
+
+    def test_encoding_is_identical_to_codec(self):
+        for items in [[], [1], [{"a": "b"}, "c", None], [{"payload": "x" * 1000, "index": i} for i in range(200)]]:
+            with streaming.encode_json_array(iter(items), self.codec, hashlib.sha256) as body:
+                encoded = self.codec.dumps(items)
+                self.assertEqual(len(body), len(encoded))
+                self.assertEqual(body.content_hash, credentials.hash_content(hashlib.sha256, encoded))
+                self.assertEqual(body.read(), encoded)
+
+    def test_large_body_is_spooled_to_file(self):
+        items = [{"payload": "x" * 1000}] * 200
+        with streaming.encode_json_array(items, self.codec, hashlib.sha256, spool_size=1024) as body:
+            self.assertTrue(body.file._rolled)
+            self.assertEqual(b"".join(body), self.codec.dumps(items))
+
+    def test_small_body_stays_in_memory(self):
+        with streaming.encode_json_array([1, 2, 3], self.codec, hashlib.sha256) as body:
+            self.assertFalse(body.file._rolled)
+
+    def test_rewind_allows_reading_again(self):
+        with streaming.encode_json_array([1, 2, 3], self.codec, hashlib.sha256) as body:
+            self.assertEqual(body.read(), b"[1,2,3]")
+            self.assertEqual(body.read(), b"")
+            body.rewind()
+            self.assertEqual(body.read(), b"[1,2,3]")
+
+    def test_encoding_error_closes_body(self):
+        def items():
+            yield 1
+            raise TypeError("bad item")
+
+        self.assertRaises(TypeError, streaming.encode_json_array, items(), self.codec, hashlib.sha256)
+
+    def test_spooled_body_raises_type_error(self):
+        self.assertRaises(TypeError, streaming.SpooledBody, hashlib.sha256, spool_size="1")
+
+
+RESPONSE = {
+    "total": 4,
+    "results": [{"header": {"txn_id": 'a"b,}]', "tag": "t"}, "payload": 'x{[,\\"'}, [1, [2]], "s", None],
+    "other": {"nested": [1, {"a": "]"}]},
+}
+
+
+def feed_in_chunks(parser, data, size):
+    items = []
+    for i in range(0, len(data), size):
+        items.extend(parser.feed(data[i : i + size]))
+    return items
+
+
+class TestJsonArrayParser(unittest.TestCase):
+    def setUp(self):
+        self.codec = codec.StandardJsonCodec()
+        self.data = json.dumps(RESPONSE, indent=2).encode("utf8")
+
+    def test_parses_items_split_across_any_chunks(self):
+        for size in [1, 2, 3, 7, 64, len(self.data)]:
+            parser = streaming.JsonArrayParser(self.codec)
+            self.assertEqual(feed_in_chunks(parser, self.data, size), RESPONSE["results"])
+            self.assertEqual(parser.close(), {"total": 4, "other": RESPONSE["other"]})
+
+    def test_items_are_returned_as_soon_as_they_are_complete(self):
+        parser = streaming.JsonArrayParser(self.codec)
+        self.assertEqual(parser.feed(b'{"results": [{"a": 1}, {"b"'), [{"a": 1}])
+        self.assertEqual(parser.feed(b": 2}]"), [{"b": 2}])
+        self.assertEqual(parser.feed(b', "total": 2}'), [])
+        self.assertEqual(parser.close(), {"total": 2})
+
+    def test_discards_parsed_bytes(self):
+        parser = streaming.JsonArrayParser(self.codec)
+        parser.feed(b'{"results": [' + b",".join([b'{"payload": "' + b"x" * 1000 + b'"}'] * 100))
+        self.assertLess(len(parser._buffer), 1100)
+
+    def test_projection_keeps_only_requested_fields(self):
+        parser = streaming.JsonArrayParser(self.codec, fields=["header.txn_id", "missing"])
+        self.assertEqual(parser.feed(self.data), [{"header": {"txn_id": 'a"b,}]'}}, [1, [2]], "s", None])
+
+    def test_projection_skips_decoding_other_fields(self):
+        json_codec = MagicMock(wraps=self.codec)
+        parser = streaming.JsonArrayParser(json_codec, fields=["header"])
+        parser.feed(b'{"results": [{"header": {"a": 1}, "payload": {"big": [1, 2, 3]}}]}')
+        decoded = [call[0][0] for call in json_codec.loads.call_args_list]
+        self.assertIn(b' {"a": 1}', decoded)
+        self.assertFalse(any(b"big" in data for data in decoded))
+
+    def test_other_array_key(self):
+        parser = streaming.JsonArrayParser(self.codec, key="other")
+        self.assertEqual(parser.feed(b'{"results": [1, 2], "other": [3]}'), [3])
+        self.assertEqual(parser.close(), {"results": [1, 2]})
+
+    def test_raises_on_bad_json(self):
+        self.assertRaises(exceptions.UnexpectedResponseException, streaming.JsonArrayParser(self.codec).feed, b"[1, 2]")
+        self.assertRaises(exceptions.UnexpectedResponseException, streaming.JsonArrayParser(self.codec).feed, b'{"a": 1} {')
+        parser = streaming.JsonArrayParser(self.codec)
+        parser.feed(b'{"results": [1')
+        self.assertRaises(exceptions.UnexpectedResponseException, parser.close)
+
+    def test_raises_type_error(self):
+        self.assertRaises(TypeError, streaming.JsonArrayParser, self.codec, key=1)
+        self.assertRaises(TypeError, streaming.JsonArrayParser, self.codec, fields="header")
+        self.assertRaises(TypeError, streaming.JsonArrayParser, self.codec, fields=[1])
+
+    def test_get_projection(self):
+        self.assertIsNone(streaming.get_projection(None))
+        self.assertEqual(streaming.get_projection(["a.b", "a.c", "d"]), {"a": {"b": None, "c": None}, "d": None})
+        self.assertEqual(streaming.get_projection(["a", "a.b"]), {"a": None})
+        self.assertEqual(streaming.get_projection(["a.b", "a"]), {"a": None})
+
+
+class TestResultStream(unittest.TestCase):
+    def test_iterates_items_and_releases_connection(self):
+        release = MagicMock()
+        data = json.dumps(RESPONSE).encode("utf8")
+        response = transports.StreamedTransportResponse(200, [data[:10], data[10:]], release=release)
+        stream = streaming.ResultStream(response, streaming.JsonArrayParser(codec.StandardJsonCodec()))
+        self.assertEqual(list(stream), RESPONSE["results"])
+        self.assertEqual(stream.total, 4)
+        release.assert_called_once()
+
+    def test_close_releases_connection_before_end(self):
+        release = MagicMock()
+        response = transports.StreamedTransportResponse(200, [b'{"results": [1, 2, 3]', b"}"], release=release)
+        with streaming.ResultStream(response, streaming.JsonArrayParser(codec.StandardJsonCodec())) as stream:
+            self.assertEqual(next(iter(stream)), 1)
+        release.assert_called_once()
+        self.assertIsNone(stream.total)
+
+
+class TestDownload(unittest.TestCase):
+    def test_raises_type_error(self):
+        self.assertRaises(TypeError, streaming.Download, 1)
+
+    def test_replaces_path_once_written(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "object")
+            with open(path, "wb") as f:
+                f.write(b"old")
+            with streaming.Download(path) as download:
+                download.write(b"ab")
+                download.write(b"c")
+                with open(path, "rb") as f:
+                    self.assertEqual(f.read(), b"old")
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"abc")
+            self.assertEqual(download.size, 3)
+            self.assertEqual(os.listdir(directory), ["object"])
+
+    def test_removes_partial_file_on_error(self):
+        with tempfile.TemporaryDirectory() as directory:
+            try:
+                with streaming.Download(os.path.join(directory, "object")) as download:
+                    download.write(b"ab")
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_writes_file_like_without_closing(self):
+        destination = io.BytesIO()
+        with streaming.Download(destination) as download:
+            download.write(b"abc")
+        self.assertEqual(destination.getvalue(), b"abc")
+        self.assertFalse(destination.closed)
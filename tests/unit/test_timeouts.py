@@ -0,0 +1,70 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from tests import unit
+from dragonchain_sdk import timeouts
+from dragonchain_sdk import exceptions
+
+if unit.PY36:
+    from unittest.mock import patch
+else:
+    from mock import patch
+
+
+class TestTimeout(unittest.TestCase):
+    def test_defaults(self):
+        timeout = timeouts.Timeout()
+        self.assertEqual((timeout.connect, timeout.read, timeout.total), (30.0, 30.0, None))
+
+    def test_raises_with_bad_params(self):
+        self.assertRaises(TypeError, timeouts.Timeout, connect="1")
+        self.assertRaises(TypeError, timeouts.Timeout, read="1")
+        self.assertRaises(ValueError, timeouts.Timeout, total=-1)
+
+    def test_clamp(self):
+        self.assertEqual(timeouts.Timeout(2, 30).clamp(5), timeouts.Timeout(2, 5, total=5))
+        self.assertEqual(timeouts.Timeout(None, None, total=10).clamp(5), timeouts.Timeout(5, 5, total=5))
+
+    def test_get_timeout(self):
+        self.assertEqual(timeouts.get_timeout(None), timeouts.Timeout())
+        self.assertEqual(timeouts.get_timeout(3), timeouts.Timeout(3, 3))
+        timeout = timeouts.Timeout(1, 2)
+        self.assertIs(timeouts.get_timeout(timeout), timeout)
+        self.assertRaises(TypeError, timeouts.get_timeout, "3")
+
+
+class TestDeadline(unittest.TestCase):
+    @patch("dragonchain_sdk.timeouts.time.monotonic", return_value=100.0)
+    def test_remaining(self, mock_monotonic):
+        deadline = timeouts.Deadline(5)
+        self.assertEqual(deadline.remaining(), 5.0)
+        self.assertFalse(deadline.expired)
+        mock_monotonic.return_value = 103.5
+        self.assertEqual(deadline.check(), 1.5)
+        mock_monotonic.return_value = 106.0
+        self.assertEqual(deadline.remaining(), 0.0)
+        self.assertTrue(deadline.expired)
+        self.assertRaises(exceptions.DeadlineExceeded, deadline.check)
+
+    def test_raises_with_bad_params(self):
+        self.assertRaises(TypeError, timeouts.Deadline, "5")
+
+    def test_get_deadline(self):
+        self.assertIsNone(timeouts.get_deadline(None))
+        self.assertIsInstance(timeouts.get_deadline(5), timeouts.Deadline)
+        deadline = timeouts.Deadline(5)
+        self.assertIs(timeouts.get_deadline(deadline), deadline)
+        self.assertRaises(TypeError, timeouts.get_deadline, "5")
+
+    def test_deadline_exceeded_is_connection_exception(self):
+        self.assertTrue(issubclass(exceptions.DeadlineExceeded, exceptions.ConnectionException))
@@ -0,0 +1,172 @@
+# Copyright 2020 Dragonchain, Inc. or its affiliates. All Rights Reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import unittest
+
+from tests import unit
+from dragonchain_sdk import transports
+from dragonchain_sdk import timeouts
+from dragonchain_sdk import streaming
+from dragonchain_sdk import codec
+
+if unit.PY36:
+    from unittest.mock import MagicMock, patch, ANY
+else:
+    from mock import MagicMock, patch, ANY
+
+
+class TestStreamedTransportResponse(unittest.TestCase):
+    def test_read_chunk_skips_empty_chunks(self):
+        response = transports.StreamedTransportResponse(200, [b"a", b"", b"b"])
+        self.assertEqual([response.read_chunk(), response.read_chunk(), response.read_chunk()], [b"a", b"b", b""])
+
+    def test_read_reads_rest_and_releases_once(self):
+        release = MagicMock()
+        response = transports.StreamedTransportResponse(200, [b"a", b"b"], release=release)
+        self.assertEqual(response.read(), b"ab")
+        response.close()
+        release.assert_called_once()
+
+    def test_iterating_yields_chunks_and_releases(self):
+        release = MagicMock()
+        self.assertEqual(list(transports.StreamedTransportResponse(200, [b"a", b"", b"b"], release=release)), [b"a", b"b"])
+        release.assert_called_once()
+
+    def test_context_manager_releases_before_end(self):
+        release = MagicMock()
+        with transports.StreamedTransportResponse(200, [b"a", b"b"], release=release) as response:
+            self.assertEqual(next(iter(response)), b"a")
+        release.assert_called_once()
+
+    def test_base_transport_send_stream_falls_back_to_send(self):
+        response = transports.LoopbackTransport(body=b"body").send_stream("GET", "url", b"", {}, timeouts.Timeout(), True)
+        self.assertEqual((response.status, response.read()), (200, b"body"))
+
+
+class TestTransportResponse(unittest.TestCase):
+    def test_text_decodes_body(self):
+        self.assertEqual(transports.TransportResponse(200, "é".encode("utf8")).text, "é")
+
+    def test_headers_default_to_empty(self):
+        self.assertEqual(transports.TransportResponse(200, b"").headers, {})
+
+    def test_base_transport_is_abstract(self):
+        self.assertRaises(NotImplementedError, transports.Transport().send, "GET", "url", b"", {}, timeouts.Timeout(), True)
+
+
+class TestRequestsTransport(unittest.TestCase):
+    def test_initialization_raises_type_error(self):
+        self.assertRaises(TypeError, transports.RequestsTransport, pool_connections="10")
+        self.assertRaises(TypeError, transports.RequestsTransport, pool_maxsize="10")
+
+    def test_initialization_mounts_pooled_adapter(self):
+        transport = transports.RequestsTransport(pool_connections=2, pool_maxsize=50)
+        adapter = transport.session.get_adapter("https://thing")
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 50)
+
+    def test_send_calls_session_request_with_correct_params(self):
+        transport = transports.RequestsTransport()
+        transport.session = MagicMock(**{"request.return_value": MagicMock(status_code=201, content=b"{}", headers={"a": "b"})})
+        response = transport.send("POST", "url", b"content", {"some": "headers"}, timeouts.Timeout(5, 30), False)
+        transport.session.request.assert_called_once_with("POST", "url", data=b"content", headers={"some": "headers"}, timeout=(5, 30), verify=False)
+        self.assertEqual(response.status, 201)
+        self.assertEqual(response.body, b"{}")
+        self.assertEqual(response.headers, {"a": "b"})
+
+    def test_send_stream_requests_streamed_response(self):
+        transport = transports.RequestsTransport()
+        transport.session = MagicMock(**{"request.return_value": MagicMock(status_code=200, headers={})})
+        transport.session.request.return_value.iter_content.return_value = iter([b"a", b"b"])
+        response = transport.send_stream("GET", "url", b"", {}, timeouts.Timeout(5, 30), True)
+        transport.session.request.assert_called_once_with("GET", "url", data=b"", headers={}, timeout=(5, 30), verify=True, stream=True)
+        self.assertEqual(response.read(), b"ab")
+        transport.session.request.return_value.close.assert_called_once()
+
+    def test_close_closes_session(self):
+        transport = transports.RequestsTransport()
+        transport.session = MagicMock()
+        transport.close()
+        transport.session.close.assert_called_once()
+
+
+class TestUrllib3Transport(unittest.TestCase):
+    def test_initialization_raises_type_error(self):
+        self.assertRaises(TypeError, transports.Urllib3Transport, pool_connections="10")
+        self.assertRaises(TypeError, transports.Urllib3Transport, pool_maxsize="10")
+
+    @patch("urllib3.PoolManager")
+    def test_get_pool_manager_caches_per_verify_setting(self, mock_pool_manager):
+        transport = transports.Urllib3Transport(pool_connections=2, pool_maxsize=50)
+        self.assertIs(transport.get_pool_manager(True), transport.get_pool_manager(True))
+        transport.get_pool_manager(False)
+        mock_pool_manager.assert_any_call(num_pools=2, maxsize=50, cert_reqs="CERT_REQUIRED", ca_certs=ANY)
+        mock_pool_manager.assert_any_call(num_pools=2, maxsize=50, cert_reqs="CERT_NONE")
+        self.assertEqual(mock_pool_manager.call_count, 2)
+
+    @patch("urllib3.PoolManager")
+    def test_send_calls_pool_manager_without_retries(self, mock_pool_manager):
+        mock_pool_manager.return_value.request.return_value = MagicMock(status=200, data=b"{}", headers={})
+        response = transports.Urllib3Transport().send("GET", "url", b"", {"some": "headers"}, timeouts.Timeout(5, 30, total=40), True)
+        mock_pool_manager.return_value.request.assert_called_once_with(
+            "GET", "url", body=b"", headers={"some": "headers"}, timeout=ANY, retries=False, redirect=False, preload_content=True
+        )
+        timeout = mock_pool_manager.return_value.request.call_args[1]["timeout"]
+        self.assertEqual((timeout.connect_timeout, timeout.read_timeout, timeout.total), (5, 30, 40))
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.body, b"{}")
+
+    @patch("urllib3.PoolManager")
+    def test_send_stream_does_not_preload_content(self, mock_pool_manager):
+        mock_pool_manager.return_value.request.return_value = MagicMock(status=200, headers={}, **{"stream.return_value": iter([b"{}"])})
+        response = transports.Urllib3Transport().send_stream("GET", "url", b"", {}, timeouts.Timeout(), True)
+        self.assertFalse(mock_pool_manager.return_value.request.call_args[1]["preload_content"])
+        self.assertEqual(response.read(), b"{}")
+        mock_pool_manager.return_value.request.return_value.release_conn.assert_called_once()
+
+    @patch("urllib3.PoolManager")
+    def test_abandoned_stream_closes_connection_before_releasing_it(self, mock_pool_manager):
+        raw = MagicMock(status=200, headers={}, **{"stream.return_value": iter([b"[1,", b"2]"])})
+        mock_pool_manager.return_value.request.return_value = raw
+        response = transports.Urllib3Transport().send_stream("GET", "url", b"", {}, timeouts.Timeout(), True)
+        self.assertEqual(response.read_chunk(), b"[1,")
+        response.close()
+        self.assertEqual([call[0] for call in raw.method_calls if call[0] in ("close", "release_conn")], ["close", "release_conn"])
+
+    @patch("urllib3.PoolManager")
+    def test_close_clears_pool_managers(self, mock_pool_manager):
+        transport = transports.Urllib3Transport()
+        transport.get_pool_manager(True)
+        transport.close()
+        mock_pool_manager.return_value.clear.assert_called_once()
+        self.assertEqual(transport.pool_managers, {})
+
+
+class TestLoopbackTransport(unittest.TestCase):
+    def test_send_returns_fixed_response(self):
+        transport = transports.LoopbackTransport(status=404, body=b'{"error": "not found"}')
+        response = transport.send("GET", "url", b"", {}, timeouts.Timeout(), True)
+        self.assertEqual(response.status, 404)
+        self.assertEqual(response.body, b'{"error": "not found"}')
+        self.assertEqual(transport.request_count, 1)
+
+    def test_send_reads_streamed_body(self):
+        handler = MagicMock(return_value=transports.TransportResponse(200, b"{}"))
+        with streaming.encode_json_array([1, 2], codec.StandardJsonCodec(), hashlib.sha256) as body:
+            transports.LoopbackTransport(handler).send("POST", "url", body, {}, timeouts.Timeout(), True)
+        handler.assert_called_once_with("POST", "url", b"[1,2]", {})
+
+    def test_send_calls_handler(self):
+        handler = MagicMock(return_value=transports.TransportResponse(201, b"{}"))
+        transport = transports.LoopbackTransport(handler)
+        self.assertIs(transport.send("POST", "url", b"content", {"some": "headers"}, timeouts.Timeout(), True), handler.return_value)
+        handler.assert_called_once_with("POST", "url", b"content", {"some": "headers"})